@@ -2,6 +2,22 @@
 # 2020 R1
 SetScriptVersion(Version="20.1.164")
 
+import os
+import re
+import json
+import math
+import random
+import time
+import zlib
+import struct
+import shutil
+import hashlib
+import zipfile
+import fnmatch
+import threading
+from datetime import date
+from datetime import datetime
+
 class Mesh_Properties:
     '''
     Mesh_Properties object stores the name and directory of the exported .CAS file containing the mesh.
@@ -10,13 +26,15 @@ class Mesh_Properties:
     ---------------------
     CAS_name : Name of .CAS file containing the mesh. Does not include file extension. [str]
     CAS_dir : Directory containing the .CAS file with the name as indicated in CAS_name. [str]
+    staged_dir : Directory of the local scratch copy of the .CAS file, or None if it is read from CAS_dir. [str]
     '''
     
-    def __init__(self, CAS_name = None, CAS_dir = None, body_size = None):
+    def __init__(self, CAS_name = None, CAS_dir = None, body_size = None, staged_dir = None):
         '''Define instance variables.'''
         self.CAS_name = CAS_name
         self.CAS_dir = CAS_dir
         self.body_size = body_size
+        self.staged_dir = staged_dir
     
     def __str__(self):
         '''Print properties of Mesh_Properties object.'''
@@ -89,6 +107,9 @@ class Simulation_Results:
     mom_roll : Total aerodynamic moment experienced about x axis in Newton-metres. [str]
     mom_pitch : Total aerodynamic moment experienced about y axis in Newton-metres. [str]
     mom_yaw : Total aerodynamic moment experienced about z axis in Newton-metres. [str]
+    cop : Center of pressure at x=0 m. [str]
+    monitor_stats : Trailing-window statistics of each report file monitor, keyed by monitor name. [dict of Monitor_Statistics]
+    stop_reason : Reason for which the Fluent simulation stopped iterating. [str]
     '''
     
     def __init__(self, convergence = None, iterations = None, drag_tot = None, drag_comp = None, lift_tot = None, lift_comp = None, f_left = None, f_right = None, mom_roll = None, mom_pitch = None, mom_yaw = None, cop = None):
@@ -105,6 +126,8 @@ class Simulation_Results:
         self.mom_pitch = mom_pitch
         self.mom_yaw = mom_yaw
         self.cop = cop
+        self.monitor_stats = {}
+        self.stop_reason = None
 
 class Simulation:
     '''
@@ -117,15 +140,19 @@ class Simulation:
     dimension : Instance of Dimension_Properties object.
     workflow : Instance of Workflow_Properties object.
     results : Instance of Simulation_Results object.
+    system_index : Index of the Fluent system of the simulation in the Workbench project, or None if its results were restored from the result cache. [int]
+    cache_key : Key of the simulation in the result cache. [str]
     '''
     
-    def __init__(self, sim_name = None, mesh = None, dimension = None, workflow = None, results = None):
+    def __init__(self, sim_name = None, mesh = None, dimension = None, workflow = None, results = None, system_index = None, cache_key = None):
         '''Define instance variables.'''
         self.sim_name = sim_name
         self.mesh = mesh
         self.dimension = dimension
         self.workflow = workflow
         self.results = results
+        self.system_index = system_index
+        self.cache_key = cache_key
 
     def __str__(self):
         '''Print properties of Simulation object.'''
@@ -141,18 +168,464 @@ class Project:
     proj_dir : Directory in which the ANSYS Workbench project should be stored. [str]
     results_dir : Directory in which the numerical and post-processing results should be stored. [str]
     processes : Number of processes to use during simulations. [int]
+    stats_window : Number of trailing iterations over which monitor statistics are computed. [int]
+    min_iterations : Minimum number of iterations before the drag and lift convergence criteria may stop a simulation. [int]
+    max_iterations : Maximum number of iterations of a simulation. [int]
+    conv_criterion : Relative change of drag and lift below which a simulation is considered converged. [float]
+    conv_window : Number of previous iterations over which the relative change of drag and lift is considered. [int]
+    stall_timeout : Number of minutes without transcript growth after which a running simulation is considered hung. [float]
+    budget_rate : Wall-clock budget of a simulation in minutes per 100 MB of .CAS file. [float]
+    restart_attempts : Maximum number of restarts of a hung simulation. [int]
+    autosave_frequency : Number of iterations between autosaved data files. [int]
+    autosave_kept : Number of most recent autosaved data files kept on disk. [int]
+    resume : Specification of whether an existing project is resumed rather than set up again. [bool]
+    cache_dir : Directory of the result cache shared between projects, or None if results are not cached. [str]
+    cache_limit : Size limit of the result cache in GB. [float]
+    cache_data : Specification of whether Fluent case and data files are stored in the result cache. [bool]
+    warm_start : Specification of whether simulations are initialised from the nearest previously solved case. [bool]
+    initialization : Initialization strategy (Standard, Hybrid or FMG) of each body type, with the key "" for all body types. [dict]
+    hybrid_iterations : Number of iterations of hybrid initialization. [int]
+    scratch_dir : Local scratch directory on which meshes are staged and the Workbench project is run, or None to work on the configured directories directly. [str]
+    scratch_limit : Size limit of the staged meshes in the local scratch directory in GB. [float]
+    staging_threads : Number of threads copying meshes to and project files from the local scratch directory. [int]
+    sync_dir : Configured project directory to which the project files are synchronised when working on the local scratch directory. [str]
+    write_behind_enabled : Specification of whether results are written to a spool on the local scratch directory and uploaded to the results directory in the background. [bool]
+    upload_threads : Number of threads uploading results from the spool. [int]
+    upload_retries : Number of times a failed upload is retried. [int]
+    write_behind : Instance of Write_Behind class uploading the spool to the configured results directory, or None if results are written to it directly.
+    retention : Retention policy applied to the Fluent files of each simulation after post-processing. Either All, Final or Results. [str]
+    queue_dir : Shared directory of the job queue through which worker daemons on other machines solve the simulations, or None to solve them in Workbench. [str]
+    blowup_factor : Factor above its lowest value at which a residual is considered to have blown up. [float]
+    reversed_flow_fraction : Percentage of the faces of a boundary with reversed flow above which an iteration counts towards a hopeless simulation. [float]
+    reversed_flow_window : Number of consecutive iterations with reversed flow above the fraction after which a simulation is considered hopeless. [int]
+    mesh_cache_dir : Local directory of the mesh cache, or None if prepared meshes are not cached. [str]
+    mesh_cache_limit : Size limit of the mesh cache in GB. [float]
     '''
 
-    def __init__(self, proj_name = None, proj_dir = None, results_dir = None, processes = None):
+    def __init__(self, proj_name = None, proj_dir = None, results_dir = None, processes = None, stats_window = None, min_iterations = None, max_iterations = None, conv_criterion = None, conv_window = None, stall_timeout = None, budget_rate = None, restart_attempts = None, autosave_frequency = None, autosave_kept = None, resume = None, cache_dir = None, cache_limit = None, cache_data = None, warm_start = None, initialization = None, hybrid_iterations = None, scratch_dir = None, scratch_limit = None, staging_threads = None, sync_dir = None, write_behind_enabled = None, upload_threads = None, upload_retries = None, write_behind = None, retention = None, queue_dir = None, blowup_factor = None, reversed_flow_fraction = None, reversed_flow_window = None, mesh_cache_dir = None, mesh_cache_limit = None):
         '''Define instance variables.'''
         self.proj_name = proj_name
         self.proj_dir = proj_dir
         self.results_dir = results_dir
         self.processes = processes
+        self.stats_window = stats_window
+        self.min_iterations = min_iterations
+        self.max_iterations = max_iterations
+        self.conv_criterion = conv_criterion
+        self.conv_window = conv_window
+        self.stall_timeout = stall_timeout
+        self.budget_rate = budget_rate
+        self.restart_attempts = restart_attempts
+        self.autosave_frequency = autosave_frequency
+        self.autosave_kept = autosave_kept
+        self.resume = resume #Either True or False
+        self.cache_dir = cache_dir
+        self.cache_limit = cache_limit #Stored in GB
+        self.cache_data = cache_data #Either True or False
+        self.warm_start = warm_start #Either True or False
+        self.initialization = initialization
+        self.hybrid_iterations = hybrid_iterations
+        self.scratch_dir = scratch_dir
+        self.scratch_limit = scratch_limit #Stored in GB
+        self.staging_threads = staging_threads
+        self.sync_dir = sync_dir
+        self.write_behind_enabled = write_behind_enabled #Either True or False
+        self.upload_threads = upload_threads
+        self.upload_retries = upload_retries
+        self.write_behind = write_behind
+        self.retention = retention
+        self.queue_dir = queue_dir
+        self.blowup_factor = blowup_factor
+        self.reversed_flow_fraction = reversed_flow_fraction
+        self.reversed_flow_window = reversed_flow_window
+        self.mesh_cache_dir = mesh_cache_dir
+        self.mesh_cache_limit = mesh_cache_limit #Stored in GB
 
     def __str__(self):
         '''Print properties of Project object'''
-        return("\n--------PROJECT PROPERTIES--------\nProject name: {}\nProject directory: {}\nResults directory: {}\nProcesses: {}".format(self.proj_name, self.proj_dir, self.results_dir, self.processes))
+        return("\n--------PROJECT PROPERTIES--------\nProject name: {}\nProject directory: {}\nResults directory: {}\nProcesses: {}\nStatistics window: {}\nIterations: {} to {}\nConvergence criterion: {} over {} iterations\nWatchdog: {} min stall timeout, {} min per 100 MB, {} restarts\nAutosave: every {} iterations, {} files kept\nResume: {}\nResult cache: {} ({} GB, data files: {})\nWarm start: {}\nInitialization: {} ({} hybrid iterations)\nLocal scratch: {} ({} GB, {} threads)\nWrite-behind: {} ({} threads, {} retries)\nRetention: {}\nQueue: {}\nDivergence: residuals above {} times their lowest, reversed flow on more than {}% of the faces of a boundary for {} iterations\nMesh cache: {} ({} GB)".format(self.proj_name, self.proj_dir, self.results_dir, self.processes, self.stats_window, self.min_iterations, self.max_iterations, self.conv_criterion, self.conv_window, self.stall_timeout, self.budget_rate, self.restart_attempts, self.autosave_frequency, self.autosave_kept, self.resume, self.cache_dir, self.cache_limit, self.cache_data, self.warm_start, self.initialization, self.hybrid_iterations, self.scratch_dir, self.scratch_limit, self.staging_threads, self.write_behind_enabled, self.upload_threads, self.upload_retries, self.retention, self.queue_dir, self.blowup_factor, self.reversed_flow_fraction, self.reversed_flow_window, self.mesh_cache_dir, self.mesh_cache_limit))
+
+class Monitor_Statistics:
+    '''
+    Monitor_Statistics object stores the statistics of a report file monitor over the trailing window of iterations.
+
+    Instance Variables
+    ---------------------
+    samples : Number of iterations in the window. [int]
+    mean : Mean of the monitor over the window. [float]
+    std_dev : Sample standard deviation of the monitor over the window. [float]
+    minimum : Minimum of the monitor over the window. [float]
+    maximum : Maximum of the monitor over the window. [float]
+    eff_samples : Number of effectively independent samples after autocorrelation correction. [float]
+    ci_half_width : Half-width of the 95% confidence interval of the mean, corrected for autocorrelation. [float]
+    '''
+
+    def __init__(self, samples = None, mean = None, std_dev = None, minimum = None, maximum = None, eff_samples = None, ci_half_width = None):
+        '''Define instance variables.'''
+        self.samples = samples
+        self.mean = mean
+        self.std_dev = std_dev
+        self.minimum = minimum
+        self.maximum = maximum
+        self.eff_samples = eff_samples
+        self.ci_half_width = ci_half_width
+
+    def __str__(self):
+        '''Print properties of Monitor_Statistics object.'''
+        return "\n----MONITOR STATISTICS----\nSamples: {} ({:.1f} effective)\nMean: {} +/- {}\nStd. dev.: {}\nRange: {} to {}".format(self.samples, self.eff_samples, self.mean, self.ci_half_width, self.std_dev, self.minimum, self.maximum)
+
+class Transcript_Monitor:
+    '''
+    Transcript_Monitor object stores the state of the incremental scan of a running Fluent simulation's transcript for divergence.
+
+    Instance Variables
+    ---------------------
+    path : Path to the Solution.trn transcript of the simulation. [str]
+    offset : Number of bytes of the transcript already scanned. [int]
+    buffer : Incomplete last line of the transcript awaiting the rest of its text. [str]
+    residual_min : Lowest value reached by each residual column so far. [list of float]
+    iteration : Latest iteration of the transcript. [int]
+    reversed_flow : Iterations within the trailing window with reversed flow above the fraction. [list of int]
+    reason : Divergence signature detected in the transcript, or None while the simulation is healthy. [str]
+    blowup_factor : Factor above its lowest value at which a residual is considered to have blown up. [float]
+    reversed_flow_fraction : Percentage of the faces of a boundary with reversed flow above which an iteration counts towards a hopeless simulation. [float]
+    reversed_flow_window : Number of consecutive iterations with reversed flow above the fraction after which the simulation is considered hopeless. [int]
+    '''
+
+    def __init__(self, path = None, blowup_factor = 1000.0, reversed_flow_fraction = 25.0, reversed_flow_window = 50):
+        '''Define instance variables.'''
+        self.path = path
+        self.offset = 0
+        self.buffer = ""
+        self.residual_min = []
+        self.iteration = 0
+        self.reversed_flow = []
+        self.reason = None
+        self.blowup_factor = blowup_factor
+        self.reversed_flow_fraction = reversed_flow_fraction
+        self.reversed_flow_window = reversed_flow_window
+
+    def __str__(self):
+        '''Print properties of Transcript_Monitor object.'''
+        return "\n----TRANSCRIPT MONITOR----\nTranscript: {}\nBytes scanned: {}\nReversed flow iterations in window: {}\nDivergence: {}".format(self.path, self.offset, len(self.reversed_flow), self.reason)
+
+class Solver_Watchdog:
+    '''
+    Solver_Watchdog object stores the liveness and wall-clock state of a Fluent simulation observed by solver_watchdog.
+
+    Instance Variables
+    ---------------------
+    transcript : Path to the Solution.trn transcript of the simulation. [str]
+    fluent_dir : Path to the Fluent working directory of the simulation. [str]
+    budget : Wall-clock budget of the simulation in seconds. [float]
+    status : One of "Waiting", "Running", "Finished" or "Killed". [str]
+    start_time : Time at which the simulation was first seen running. [float]
+    last_size : Size of the transcript at the previous poll in bytes. [int]
+    last_growth : Time at which the transcript last grew. [float]
+    attempts : Number of restarts performed. [int]
+    reason : Reason for which the simulation was last killed. [str]
+    '''
+
+    def __init__(self, transcript = None, fluent_dir = None, budget = None):
+        '''Define instance variables.'''
+        self.transcript = transcript
+        self.fluent_dir = fluent_dir
+        self.budget = budget
+        self.status = "Waiting"
+        self.start_time = None
+        self.last_size = 0
+        self.last_growth = None
+        self.attempts = 0
+        self.reason = None
+
+    def __str__(self):
+        '''Print properties of Solver_Watchdog object.'''
+        return "\n----SOLVER WATCHDOG----\nTranscript: {}\nStatus: {}\nBudget: {} s\nRestarts: {}\nReason: {}".format(self.transcript, self.status, self.budget, self.attempts, self.reason)
+
+class Warm_Start:
+    '''
+    Class which contains the previously solved case a simulation is initialised from.
+
+    Instance Variables
+    ---------------------
+    case_path : Path to the case file of the solved case. [str]
+    data_path : Path to the data file of the solved case. [str]
+    velocity : Velocity of the solved case in m/s. [float]
+    same_mesh : Specification of whether the solved case uses the same mesh as the simulation. [bool]
+    description : Description of the solved case for the run report. [str]
+    method : Solution method of the solved case, K-W or T-SST. [str]
+    '''
+
+    def __init__(self, case_path = None, data_path = None, velocity = None, same_mesh = None, description = None, method = None):
+        '''Define instance variables.'''
+        self.case_path = case_path
+        self.data_path = data_path
+        self.velocity = velocity
+        self.same_mesh = same_mesh
+        self.description = description
+        self.method = method
+
+    def __str__(self):
+        return("\n----WARM START----\nCase: {}\nData: {}\nVelocity: {} m/s\nSame mesh: {}".format(self.case_path, self.data_path, self.velocity, self.same_mesh))
+
+class Write_Behind:
+    '''
+    Class which uploads files written to a local spool directory to a destination directory in background threads.
+
+    Instance Variables
+    ---------------------
+    spool_dir : Local directory the files are written to. [str]
+    destination : Directory the files are uploaded to. [str]
+    threads : Number of upload threads. [int]
+    retries : Number of times a failed upload is retried. [int]
+    copy_function : Function of a source and destination path copying a file and returning its digest, or None if the copy failed. [function]
+    pending : Paths of the files waiting to be uploaded, relative to the spool directory. [list]
+    uploaded : Size and modification time of each uploaded file, keyed by relative path. [dict]
+    failed : Relative paths of the files which could not be uploaded. [list]
+    size : Total size of the uploaded files in bytes. [int]
+    closing : Specification of whether the upload threads finish once the pending files are uploaded. [bool]
+    condition : Condition variable guarding the pending files.
+    workers : Upload threads. [list]
+    '''
+
+    def __init__(self, spool_dir = None, destination = None, threads = None, retries = None, copy_function = None):
+        '''Define instance variables.'''
+        self.spool_dir = spool_dir
+        self.destination = destination
+        self.threads = threads
+        self.retries = retries
+        self.copy_function = copy_function
+        self.pending = []
+        self.uploaded = {}
+        self.failed = []
+        self.size = 0
+        self.closing = False
+        self.condition = threading.Condition()
+        self.workers = []
+
+    def __str__(self):
+        return("\n----WRITE-BEHIND----\nSpool: {}\nDestination: {}\nThreads: {}\nRetries: {}\nPending: {}\nUploaded: {} files\nFailed: {} files".format(self.spool_dir, self.destination, self.threads, self.retries, len(self.pending), len(self.uploaded), len(self.failed)))
+
+class Archive_Job:
+    '''
+    Class which contains a Workbench project to be archived and the state of its archive.
+
+    Instance Variables
+    ---------------------
+    proj_dir : Directory containing the Workbench project. [str]
+    proj_name : Name of the Workbench project, without the .wbpj extension. [str]
+    cycle : Cycle folder of the archive. [str]
+    series : Design series folder of the archive. [str]
+    archive_name : Name of the archived project, without the .wbpz extension. [str]
+    local_path : Path to the archive built on local disk. [str]
+    dest_path : Path to the archive at the destination. [str]
+    status : Either Waiting, Built, Uploaded or Failed. [str]
+    uploaded : Number of bytes uploaded for the archive. [int]
+    '''
+
+    def __init__(self, proj_dir = None, proj_name = None, cycle = None, series = None, archive_name = None, local_path = None, dest_path = None, status = "Waiting", uploaded = 0):
+        '''Define instance variables.'''
+        self.proj_dir = proj_dir
+        self.proj_name = proj_name
+        self.cycle = cycle
+        self.series = series
+        self.archive_name = archive_name
+        self.local_path = local_path
+        self.dest_path = dest_path
+        self.status = status
+        self.uploaded = uploaded
+
+    def __str__(self):
+        return("\n----ARCHIVE JOB----\nProject: {}/{}.wbpj\nLocal archive: {}\nDestination: {}\nStatus: {}".format(self.proj_dir, self.proj_name, self.local_path, self.dest_path, self.status))
+
+class Archive_Properties:
+    '''
+    Class which contains the settings of a batch of archives.
+
+    Instance Variables
+    ---------------------
+    dest_root : Root directory of the archive, containing the cycle folders. [str]
+    build_dir : Local directory the archives are built in before upload. [str]
+    uploads : Number of archives uploaded at once. [int]
+    bandwidth : Total upload bandwidth limit in MB/s, or None for no limit. [float]
+    chunk_size : Size of the chunks an archive is uploaded in, in bytes. [int]
+    retries : Number of times a failed upload is retried. [int]
+    log_path : Path to the CSV log of the batch. [str]
+    threads : Number of threads compressing members of archives built without Workbench. [int]
+    backend : Either WBPZ, storing each project as a .wbpz archive, or Chunks, storing each project as a manifest of deduplicated chunks. [str]
+    catalogue_path : Path to the local SQLite archive catalogue, or None if it is not updated. [str]
+    '''
+
+    def __init__(self, dest_root = None, build_dir = None, uploads = None, bandwidth = None, chunk_size = 8 * 1024 ** 2, retries = 3, log_path = None, threads = 4, backend = "WBPZ", catalogue_path = None):
+        '''Define instance variables.'''
+        self.dest_root = dest_root
+        self.build_dir = build_dir
+        self.uploads = uploads
+        self.bandwidth = bandwidth
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.log_path = log_path
+        self.threads = threads
+        self.backend = backend
+        self.catalogue_path = catalogue_path
+
+    def __str__(self):
+        return("\n----ARCHIVE PROPERTIES----\nDestination root: {}\nBuild directory: {}\nConcurrent uploads: {}\nBandwidth limit: {} MB/s\nChunk size: {} MB\nRetries: {}\nLog: {}\nCompression threads: {}\nBackend: {}\nCatalogue: {}".format(self.dest_root, self.build_dir, self.uploads, self.bandwidth, self.chunk_size // 1024 ** 2, self.retries, self.log_path, self.threads, self.backend, self.catalogue_path))
+
+class Bandwidth_Throttle:
+    '''
+    Class which limits the total rate at which several threads copy data.
+
+    Instance Variables
+    ---------------------
+    rate : Bandwidth limit in bytes per second, or None for no limit. [float]
+    next_time : Time at which the next chunk may be copied. [float]
+    lock : Lock guarding next_time.
+    '''
+
+    def __init__(self, rate = None):
+        '''Define instance variables.'''
+        self.rate = rate
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def __str__(self):
+        return("\n----BANDWIDTH THROTTLE----\nRate: {} B/s".format(self.rate))
+
+class Runtime_Model:
+    '''
+    Runtime_Model object holds a model of the wall-clock time of Fluent solves fitted to the runtime history: seconds per iteration as a linear function of the cells per process, scaled for each solution method, and the iterations to convergence of each body type and solution method.
+
+    Instance Variables
+    ---------------------
+    intercept : Seconds per iteration independent of the mesh. [float]
+    slope : Seconds per iteration per million cells per process. [float]
+    method_factors : Factor on the seconds per iteration of each solution method. [dict]
+    iterations : Median iterations to convergence of each body type and solution method, keyed by "HB K-W" etc. [dict]
+    samples : Number of solves the model is fitted to. [int]
+    '''
+
+    def __init__(self, intercept = 0.5, slope = 1.5, method_factors = None, iterations = None, samples = 0):
+        '''Define instance variables.'''
+        if method_factors == None:
+            method_factors = {}
+        if iterations == None:
+            iterations = {}
+        self.intercept = intercept
+        self.slope = slope
+        self.method_factors = method_factors
+        self.iterations = iterations
+        self.samples = samples
+
+    def __str__(self):
+        return("\n----RUNTIME MODEL----\nSeconds per iteration: {:.3f} + {:.3f} per million cells per process\nMethod factors: {}\nIterations: {}\nSamples: {}".format(self.intercept, self.slope, self.method_factors, self.iterations, self.samples))
+
+class Scaling_Profile:
+    '''
+    Scaling_Profile object holds the strong scaling of Fluent on a machine, calibrated with short solves of a representative mesh at several process counts. The seconds per iteration are fitted as a serial part, a parallel part which is divided between the processes and grows with the cells of the mesh, and a communication overhead which grows with the processes: Amdahl's law for the calibration mesh, extended to other meshes as in Gustafson's law.
+
+    Instance Variables
+    ---------------------
+    host : Name of the machine calibrated. [str]
+    cores : Physical cores of the machine. [int]
+    memory_gb : Memory of the machine in GB. [float]
+    cells : Cells of the calibration mesh. [int]
+    serial : Seconds per iteration which are not parallelised. [float]
+    parallel : Seconds per iteration divided between the processes, for the calibration mesh. [float]
+    overhead : Seconds per iteration added by each process. [float]
+    memory_per_million : Memory in GB taken by a simulation per million cells. [float]
+    samples : Measured process counts and seconds per iteration. [list]
+    '''
+
+    def __init__(self, host = None, cores = 1, memory_gb = 8.0, cells = 1000000, serial = 0.0, parallel = 1.0, overhead = 0.0, memory_per_million = 2.0, samples = None):
+        '''Define instance variables.'''
+        if samples == None:
+            samples = []
+        self.host = host
+        self.cores = cores
+        self.memory_gb = memory_gb
+        self.cells = cells
+        self.serial = serial
+        self.parallel = parallel
+        self.overhead = overhead
+        self.memory_per_million = memory_per_million
+        self.samples = samples
+
+    def __str__(self):
+        return("\n----SCALING PROFILE----\nHost: {}\nCores: {}\nMemory: {} GB\nCalibration mesh: {} cells\nSeconds per iteration: {:.4f} + {:.4f} / processes + {:.4f} x processes\nSamples: {}".format(self.host, self.cores, self.memory_gb, self.cells, self.serial, self.parallel, self.overhead, len(self.samples)))
+
+class Fluent_Journal:
+    '''
+    Fluent_Journal object stands in for a Workbench Setup container when Fluent is run without Workbench, recording the commands sent to it into a journal which a batch Fluent process runs.
+
+    Instance Variables
+    ---------------------
+    commands : Commands sent to Fluent, in order. [list of str]
+    '''
+
+    def __init__(self, commands = None):
+        '''Define instance variables.'''
+        if commands == None:
+            commands = []
+        self.commands = commands
+
+    def SendCommand(self, Command = None):
+        '''Record a command in the same way a Workbench Setup container sends it.'''
+        self.commands.append(Command)
+
+    def __str__(self):
+        return("\n----FLUENT JOURNAL----\n{} commands".format(len(self.commands)))
+
+class Workbench_Backend:
+    '''
+    Workbench_Backend object carries out project operations with the scripting functions of the running Workbench session. It is the backend used inside Workbench; Fake_Backend of fake_backend.py takes its place to run the workflow without Ansys.
+
+    Instance Variables
+    ---------------------
+    None
+    '''
+
+    def __init__(self):
+        '''Define instance variables.'''
+
+    def GetTemplate(self, TemplateName = None):
+        '''Return the Workbench template of the given name.'''
+        return(GetTemplate(TemplateName=TemplateName))
+
+    def GetSystem(self, Name = None):
+        '''Return the Workbench system of the given name.'''
+        return(GetSystem(Name=Name))
+
+    def GetDesignPoint(self, Name = None):
+        '''Return the Workbench design point of the given name.'''
+        return(Parameters.GetDesignPoint(Name=Name))
+
+    def UpdateAllDesignPoints(self, DesignPoints = None):
+        '''Update the given design points, solving every Fluent system which is out of date.'''
+        return(UpdateAllDesignPoints(DesignPoints=DesignPoints))
+
+    def Save(self, FilePath = None, Overwrite = True):
+        '''Save the project, to a new path if one is given.'''
+        if FilePath == None:
+            return(Save(Overwrite=Overwrite))
+        return(Save(FilePath=FilePath, Overwrite=Overwrite))
+
+    def Open(self, FilePath = None):
+        '''Open an existing project.'''
+        return(Open(FilePath=FilePath))
+
+    def Archive(self, FilePath = None, IncludeExternalImportedFiles = True):
+        '''Archive the open project to a .wbpz file.'''
+        return(Archive(FilePath=FilePath, IncludeExternalImportedFiles=IncludeExternalImportedFiles))
+
+    def Set(self, **properties):
+        '''Build a Workbench property set.'''
+        return(Set(**properties))
+
+    def __str__(self):
+        return("\n----WORKBENCH BACKEND----\nWorkbench scripting session")
+
+workbench = Workbench_Backend()
 
 def param_extract(input_file):
     '''
@@ -215,7 +688,7 @@ def param_extract(input_file):
           velocity = float(line[5])
 
         sim_workflow = Workflow_Properties(line[4], velocity, CG_bool, post_bool, streamlines_bool)
-        sim_param = Simulation(line[0], sim_mesh, sim_dimensions, sim_workflow, Simulation_Results())
+        sim_param = Simulation(line[0], sim_mesh, sim_dimensions, sim_workflow, Simulation_Results(), len(output_list))
 
         output_list.append(sim_param)
 
@@ -239,10 +712,95 @@ def proj_param_extract(line):
         Instance of Project class containing parameters of Workbench project.
     '''
 
-    proj_param = Project(line[15], line[16], line[17], line[18])
+    resume_bool = csv_entry(line, 29, "N") in ["Y", "y"]
+    cache_data_bool = csv_entry(line, 32, "N") in ["Y", "y"]
+    warm_start_bool = csv_entry(line, 33, "N") in ["Y", "y"]
+    write_behind_bool = csv_entry(line, 39, "N") in ["Y", "y"]
+
+    proj_param = Project(line[15], line[16], line[17], line[18], int(csv_entry(line, 19, 100)), int(csv_entry(line, 20, 100)), int(csv_entry(line, 21, 600)), float(csv_entry(line, 22, 0.0001)), int(csv_entry(line, 23, 50)), float(csv_entry(line, 24, 30)), float(csv_entry(line, 25, 60)), int(csv_entry(line, 26, 1)), int(csv_entry(line, 27, 50)), int(csv_entry(line, 28, 3)), resume_bool, csv_entry(line, 30), float(csv_entry(line, 31, 50)), cache_data_bool, warm_start_bool, initialization_strategies(csv_entry(line, 34, "Standard")), int(csv_entry(line, 35, 10)), csv_entry(line, 36), float(csv_entry(line, 37, 100)), int(csv_entry(line, 38, 4)), None, write_behind_bool, int(csv_entry(line, 40, 2)), int(csv_entry(line, 41, 3)), None, retention_policy(csv_entry(line, 42, "All")), csv_entry(line, 43), float(csv_entry(line, 44, 1000)), float(csv_entry(line, 45, 25)), int(csv_entry(line, 46, 50)), csv_entry(line, 47), float(csv_entry(line, 48, 50)))
 
     return(proj_param)
 
+def retention_policy(entry):
+    '''
+    Parses the retention policy entered in the project parameters.
+    Str -> Str
+
+    Parameters
+    ---------------------
+    entry : str
+        Retention policy entered in the CSV file.
+
+    Returns
+    ---------------------
+    policy : str
+        Either "All", "Final" or "Results". Unrecognised entries keep all files.
+    '''
+
+    for policy in ["Final", "Results"]:
+        if entry.strip().lower() == policy.lower():
+            return(policy)
+
+    return("All")
+
+def initialization_strategies(entry):
+    '''
+    Parses the initialization strategy entry of the project parameters, either a single strategy for all body types (e.g. "Hybrid") or one strategy per body type (e.g. "FB:Hybrid HB:FMG").
+    Str -> Dict
+
+    Parameters
+    ---------------------
+    entry : str
+        Initialization strategy entry of the CSV file.
+
+    Returns
+    ---------------------
+    strategies : dict
+        Dictionary of strategies (Standard, Hybrid or FMG) keyed by body type, with the key "" for all other body types.
+    '''
+
+    names = {"standard": "Standard", "hybrid": "Hybrid", "fmg": "FMG"}
+    strategies = {"": "Standard"}
+
+    for item in entry.split():
+        if ":" in item:
+            (body, strategy) = item.split(":", 1)
+        else:
+            (body, strategy) = ("", item)
+        strategies[body.upper()] = names.get(strategy.lower(), "Standard")
+
+    return(strategies)
+
+def csv_entry(line, index, default = None):
+    '''
+    Returns the stripped entry of a split CSV line, or a default value if the column is missing or left blank.
+    List, int -> Str
+
+    Parameters
+    ---------------------
+    line : List
+        List containing strings of a split CSV line.
+    index : int
+        Index of the column to be read.
+    default : any
+        Value returned if the column is missing or blank.
+
+    Returns
+    ---------------------
+    entry : str
+        Stripped entry of the column, or default.
+    '''
+
+    if index >= len(line):
+        return(default)
+
+    entry = line[index].strip()
+
+    if entry == "":
+        return(default)
+
+    return(entry)
+
 def initialize_project(project):
     '''
     Initializes ANSYS Workbench project.
@@ -258,7 +816,7 @@ def initialize_project(project):
     '''
     proj_directory = project.proj_dir.replace(os.sep, '/')
 
-    Save(
+    workbench.Save(
       FilePath="{}/{}.wbpj".format(proj_directory, project.proj_name),
       Overwrite=True)
 
@@ -317,18 +875,18 @@ def results_dir_check(path, name, post, streamlines, status):
     if post:
         media_dir = os.path.join(sim_path, "Media Files")
         if (os.path.exists(media_dir) == False):
-            os.mkdir(media_dir)
-        media_subdir = ["\\3D Cp Contour", "\\Pressure Contour", "\\TKE Contour", "\\Wall Shear Streamline"]
+            os.makedirs(media_dir)
+        media_subdir = ["3D Cp Contour", "Pressure Contour", "TKE Contour", "Wall Shear Streamline"]
 
         for subdir in media_subdir:
-            if (os.path.exists(media_dir + subdir) == False):
-                os.mkdir(media_dir + subdir)
+            if (os.path.exists(os.path.join(media_dir, subdir)) == False):
+                os.mkdir(os.path.join(media_dir, subdir))
         if streamlines:
-            if (os.path.exists(media_dir + "\\Streamline Animations")) == False:
-                os.mkdir(media_dir + "\\Streamline Animations")
+            if (os.path.exists(os.path.join(media_dir, "Streamline Animations"))) == False:
+                os.mkdir(os.path.join(media_dir, "Streamline Animations"))
     return
 
-def fluent_sim_setup(sim_list, processes):
+def fluent_sim_setup(sim_list, proj_params):
     '''
     Checks solution method to be used and runs appropriate Fluent module setup.
 
@@ -336,31 +894,88 @@ def fluent_sim_setup(sim_list, processes):
     ---------------------
     sim_list : list
         List containing instances of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
 
     Returns
     ---------------------
     None
     '''
     
-    komega = ["komega", "k-omega", "k-w", "kw"]
-    tsst = ["t-sst", "tsst"]
-
     # design_points = []
 
-    for i in range(len(sim_list)):
-        sim = sim_list[i]
-        if sim.workflow.sol_method.lower() in komega:
-            komega_setup(sim, processes)
-        elif sim.workflow.sol_method.lower() in tsst:
-            tsst_setup(sim, processes)
+    staging_prefetch(sim_list, proj_params)
+
+    system_index = 0
+
+    for sim in runtime_order(sim_list, proj_params):
+        if simulation_setup(sim, system_index, sim_list, proj_params):
+            system_index += 1
     
     
-    Save(Overwrite=True)
-    designPoint1 = Parameters.GetDesignPoint(Name="0")
-    backgroundSession1 = UpdateAllDesignPoints(DesignPoints = [designPoint1])
+    workbench.Save(Overwrite=True)
+    project_summary_write(sim_list, proj_params)
+    runtime_report([sim for sim in sim_list if sim.system_index != None], proj_params)
+    staging_sync(proj_params)
+    if system_index > 0:
+        designPoint1 = workbench.GetDesignPoint(Name="0")
+        backgroundSession1 = workbench.UpdateAllDesignPoints(DesignPoints = [designPoint1])
     return
 
-def komega_setup(simulation, processes):
+def simulation_setup(simulation, system_index, sim_list, proj_params):
+    '''
+    Leaves a simulation whose Fluent files were pruned by the retention policy without a Fluent system, restores the results of a simulation from the result cache if an identical case was solved before, and otherwise sets it up in a new Fluent system with the appropriate solution method, warm-started from the nearest previously solved case if enabled.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    system_index : int
+        Index of the Fluent system to be created for the simulation.
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    created : bool
+        Boolean variable indicating whether a Fluent system was created.
+    '''
+
+    komega = ["komega", "k-omega", "k-w", "kw"]
+    tsst = ["t-sst", "tsst"]
+
+    if ledger_pruned(ledger_load(proj_params), simulation, proj_params):
+        simulation.system_index = None
+        run_report_write(proj_params, simulation.sim_name, "Pruned", "Fluent files pruned by the retention policy; results kept from the ledger")
+        return(False)
+
+    if result_cache_restore(simulation, proj_params):
+        return(False)
+
+    simulation.system_index = system_index
+
+    warm_start = None
+    if proj_params.warm_start:
+        warm_start = warm_start_source(simulation, sim_list, proj_params)
+
+    if simulation.workflow.sol_method.lower() in komega:
+        komega_setup(simulation, system_index, proj_params, warm_start)
+    elif simulation.workflow.sol_method.lower() in tsst:
+        tsst_setup(simulation, system_index, proj_params, warm_start)
+
+    data = {"system_index": system_index, "cache_key": simulation.cache_key, "initialization": initialization_strategy(simulation, proj_params)}
+    if warm_start != None:
+        data["initialization"] = "Warm Start"
+        data["warm_start"] = warm_start.description
+        run_report_write(proj_params, simulation.sim_name, "Warm Start", warm_start.description)
+
+    ledger_record(proj_params, simulation, "setup", data)
+
+    return(True)
+
+def komega_setup(simulation, index, proj_params, warm_start = None):
     '''
     Performs setup of Fluent module with K-W solution method.
 
@@ -368,29 +983,27 @@ def komega_setup(simulation, processes):
     ---------------------
     simulation : Simulation object
         Instance of Simulation object.
-    processes : int
-        Integer containing number of parallel processes to use in simulation.
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    warm_start : Warm_Start object
+        Instance of Warm_Start class describing the solved case to initialise from, or None for a standard initialization.
 
     Returns
     ---------------------
     None
     '''
     
-    template1 = GetTemplate(TemplateName="FLUENT")
+    template1 = workbench.GetTemplate(TemplateName="FLUENT")
     system1 = template1.CreateSystem()
     system1.DisplayText = simulation.sim_name
     setup1 = system1.GetContainer(ComponentName="Setup")
     fluentLauncherSettings1 = setup1.GetFluentLauncherSettings()
-    fluentLauncherSettings1.SetEntityProperties(Properties=Set(Dimension="ThreeD", EnvPath={}, RunParallel=True, NumberOfProcessors=processes))
+    fluentLauncherSettings1.SetEntityProperties(Properties=workbench.Set(Dimension="ThreeD", EnvPath={}, RunParallel=True, NumberOfProcessors=proj_params.processes))
     setup1.Edit()
-    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"MenuBar*ImportSubMenu*Case...\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"{}/{}.cas\") \"All Case Files (*.cas* *.msh* *.MSH* )\")".format((simulation.mesh.CAS_dir.replace(os.sep, '/')), simulation.mesh.CAS_name))
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "General*Table1*ButtonBox1(Mesh)*PushButton1(Scale)")')
-    setup1.SendCommand(Command="(cx-gui-do cx-set-list-selections \"Scale Mesh*Table1*Table2(Scaling)*DropDownList2(Mesh Was Created In)\" '( 3))")
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Scale Mesh*Table1*Table2(Scaling)*DropDownList2(Mesh Was Created In)")')
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Scale Mesh*Table1*Table2(Scaling)*PushButton4(Scale)")')
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Scale Mesh*PanelButtons*PushButton1(Close)")')
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "General*Table1*ButtonBox1(Mesh)*PushButton3(Check)")')
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "General*Table1*ButtonBox1(Mesh)*PushButton5(Report Quality)")')
+    warm_start_write(setup1, index, proj_params, warm_start)
+    mesh_setup(setup1, simulation, proj_params)
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Setup|Models|Viscous (SST k-omega)"))')
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Setup|Models|Viscous (SST k-omega)"))(cx-gui-do cx-activate-item "NavigationPane*List_Tree1")')
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Setup|Models|Viscous (SST k-omega)"))(cx-gui-do cx-activate-item "Viscous Model*PanelButtons*PushButton1(OK)")')
@@ -437,25 +1050,27 @@ def komega_setup(simulation, processes):
     setup1.SendCommand(Command='(cx-gui-do cx-set-text-entry "Lift Report Definition*Table1*TextEntry3(Name)" "lift")(cx-gui-do cx-activate-item "Lift Report Definition*Table1*TextEntry3(Name)")')
     setup1.SendCommand(Command="(cx-gui-do cx-set-toggle-button2 \"Lift Report Definition*Table1*Table2*ToggleBox1(Report Output Type)*Drag Force\" #t)(cx-gui-do cx-activate-item \"Lift Report Definition*Table1*Table2*ToggleBox1(Report Output Type)*Drag Force\")(cx-gui-do cx-set-list-selections \"Lift Report Definition*Table1*Table2*List2(Wall Zones)\" '( 0))(cx-gui-do cx-activate-item \"Lift Report Definition*Table1*Table2*List2(Wall Zones)\")(cx-gui-do cx-set-real-entry-list \"Lift Report Definition*Table1*Table1*Table2(Force Vector)*RealEntry2(Y)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Lift Report Definition*Table1*Table1*Table2(Force Vector)*RealEntry3(Z)\" '( 1))(cx-gui-do cx-set-toggle-button2 \"Lift Report Definition*Table1*Table1*Table5(Create)*CheckButton1(Report File)\" #t)(cx-gui-do cx-activate-item \"Lift Report Definition*Table1*Table1*Table5(Create)*CheckButton1(Report File)\")(cx-gui-do cx-set-toggle-button2 \"Lift Report Definition*Table1*Table1*Table5(Create)*CheckButton2(Report Plot)\" #t)(cx-gui-do cx-activate-item \"Lift Report Definition*Table1*Table1*Table5(Create)*CheckButton2(Report Plot)\")(cx-gui-do cx-set-toggle-button2 \"Lift Report Definition*Table1*Table1*CheckButton6(Create Output Parameter)\" #t)(cx-gui-do cx-activate-item \"Lift Report Definition*Table1*Table1*CheckButton6(Create Output Parameter)\")(cx-gui-do cx-activate-item \"Report Definitions*PanelButtons*PushButton1(Close)\")")
     setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Lift Report Definition*PanelButtons*PushButton1(OK)")')
+    convergence_setup(setup1, proj_params)
+    abort_setup(setup1, index, proj_params)
+    autosave_setup(setup1, index, proj_params)
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Solution|Run Calculation"))')
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Solution|Run Calculation"))(cx-gui-do cx-activate-item "NavigationPane*List_Tree1")')
     setup1.SendCommand(Command="(cx-gui-do cx-set-list-tree-selections \"NavigationPane*List_Tree1\" (list \"Solution|Run Calculation\"))(cx-gui-do cx-set-list-selections \"Run Calculation*Table1*Table2(Pseudo Transient Settings)*Table1(Fluid Time Scale)*Table1*DropDownList2(Length Scale Method)\" '( 2))")
     setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Run Calculation*Table1*Table2(Pseudo Transient Settings)*Table1(Fluid Time Scale)*Table1*DropDownList2(Length Scale Method)")')
     setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Run Calculation*Table1*Table2(Pseudo Transient Settings)*Table1(Fluid Time Scale)*Table3*RealEntry3(Length Scale)\" '( {}))(cx-gui-do cx-activate-item \"Run Calculation*Table1*Table2(Pseudo Transient Settings)*Table1(Fluid Time Scale)*Table3*RealEntry3(Length Scale)\")".format(simulation.dimension.length))
-    setup1.SendCommand(Command='(cx-gui-do cx-set-integer-entry "Run Calculation*Table1*Table3(Parameters)*Table1*Table1*IntegerEntry1(Number of Iterations)" 600)(cx-gui-do cx-activate-item "Run Calculation*Table1*Table3(Parameters)*Table1*Table1*IntegerEntry1(Number of Iterations)")')
+    setup1.SendCommand(Command='(cx-gui-do cx-set-integer-entry "Run Calculation*Table1*Table3(Parameters)*Table1*Table1*IntegerEntry1(Number of Iterations)" {})(cx-gui-do cx-activate-item "Run Calculation*Table1*Table3(Parameters)*Table1*Table1*IntegerEntry1(Number of Iterations)")'.format(proj_params.max_iterations))
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Solution|Initialization"))')
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Solution|Initialization"))(cx-gui-do cx-activate-item "NavigationPane*List_Tree1")')
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Solution|Initialization"))')
     setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Solution Initialization*Table1*Frame11*PushButton2(Initialize)")')
-    setup1.SendCommand(Command="/mesh/repair-improve/allow-repair-at-boundaries yes")
-    setup1.SendCommand(Command="/mesh/repair-improve/include-local-polyhedra-conversion-in-repair yes")
-    setup1.SendCommand(Command="/mesh/repair-improve/repair")
+    initialization_setup(setup1, simulation, proj_params, warm_start)
+    warm_start_read(setup1, index, proj_params, warm_start)
     setup1.SendCommand(Command='(cx-gui-do cx-activate-item "MenuBar*FileMenu*Close Fluent")')
-    Save(Overwrite=True)
+    workbench.Save(Overwrite=True)
 
     return
 
-def tsst_setup(simulation, processes):
+def tsst_setup(simulation, index, proj_params, warm_start = None):
     '''
     Performs setup of Fluent module with T-SST solution method.
 
@@ -463,29 +1078,27 @@ def tsst_setup(simulation, processes):
     ---------------------
     simulation : Simulation object
         Instance of Simulation object.
-    processes : int
-        Integer containing number of parallel processes to use in simulation.
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    warm_start : Warm_Start object
+        Instance of Warm_Start class describing the solved case to initialise from, or None for a standard initialization.
 
     Returns
     ---------------------
     None
     '''
     
-    template1 = GetTemplate(TemplateName="FLUENT")
+    template1 = workbench.GetTemplate(TemplateName="FLUENT")
     system1 = template1.CreateSystem()
     system1.DisplayText = simulation.sim_name
     setup1 = system1.GetContainer(ComponentName="Setup")
     fluentLauncherSettings1 = setup1.GetFluentLauncherSettings()
-    fluentLauncherSettings1.SetEntityProperties(Properties=Set(Dimension="ThreeD", EnvPath={}, RunParallel=True, NumberOfProcessors=processes))
+    fluentLauncherSettings1.SetEntityProperties(Properties=workbench.Set(Dimension="ThreeD", EnvPath={}, RunParallel=True, NumberOfProcessors=proj_params.processes))
     setup1.Edit()
-    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"MenuBar*ImportSubMenu*Case...\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"{}/{}.cas\") \"All Case Files (*.cas* *.msh* *.MSH* )\")".format((simulation.mesh.CAS_dir.replace(os.sep, '/')), simulation.mesh.CAS_name))
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "General*Table1*ButtonBox1(Mesh)*PushButton1(Scale)")')
-    setup1.SendCommand(Command="(cx-gui-do cx-set-list-selections \"Scale Mesh*Table1*Table2(Scaling)*DropDownList2(Mesh Was Created In)\" '( 3))")
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Scale Mesh*Table1*Table2(Scaling)*DropDownList2(Mesh Was Created In)")')
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Scale Mesh*Table1*Table2(Scaling)*PushButton4(Scale)")')
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Scale Mesh*PanelButtons*PushButton1(Close)")')
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "General*Table1*ButtonBox1(Mesh)*PushButton3(Check)")')
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "General*Table1*ButtonBox1(Mesh)*PushButton5(Report Quality)")')
+    warm_start_write(setup1, index, proj_params, warm_start)
+    mesh_setup(setup1, simulation, proj_params)
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Setup|Models|Viscous (SST k-omega)"))')
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Setup|Models|Viscous (SST k-omega)"))(cx-gui-do cx-activate-item "NavigationPane*List_Tree1")')
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Setup|Models|Viscous (SST k-omega)"))(cx-gui-do cx-set-toggle-button2 "Viscous Model*Table1*ToggleBox1(Model)*Transition SST (4 eqn)" #t)(cx-gui-do cx-activate-item "Viscous Model*Table1*ToggleBox1(Model)*Transition SST (4 eqn)")(cx-gui-do cx-activate-item "Viscous Model*PanelButtons*PushButton1(OK)")')
@@ -533,1868 +1146,6638 @@ def tsst_setup(simulation, processes):
     setup1.SendCommand(Command='(cx-gui-do cx-set-text-entry "Lift Report Definition*Table1*TextEntry3(Name)" "lift")(cx-gui-do cx-activate-item "Lift Report Definition*Table1*TextEntry3(Name)")')
     setup1.SendCommand(Command="(cx-gui-do cx-set-toggle-button2 \"Lift Report Definition*Table1*Table2*ToggleBox1(Report Output Type)*Drag Force\" #t)(cx-gui-do cx-activate-item \"Lift Report Definition*Table1*Table2*ToggleBox1(Report Output Type)*Drag Force\")(cx-gui-do cx-set-list-selections \"Lift Report Definition*Table1*Table2*List2(Wall Zones)\" '( 0))(cx-gui-do cx-activate-item \"Lift Report Definition*Table1*Table2*List2(Wall Zones)\")(cx-gui-do cx-set-real-entry-list \"Lift Report Definition*Table1*Table1*Table2(Force Vector)*RealEntry2(Y)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Lift Report Definition*Table1*Table1*Table2(Force Vector)*RealEntry3(Z)\" '( 1))(cx-gui-do cx-set-toggle-button2 \"Lift Report Definition*Table1*Table1*Table5(Create)*CheckButton1(Report File)\" #t)(cx-gui-do cx-activate-item \"Lift Report Definition*Table1*Table1*Table5(Create)*CheckButton1(Report File)\")(cx-gui-do cx-set-toggle-button2 \"Lift Report Definition*Table1*Table1*Table5(Create)*CheckButton2(Report Plot)\" #t)(cx-gui-do cx-activate-item \"Lift Report Definition*Table1*Table1*Table5(Create)*CheckButton2(Report Plot)\")(cx-gui-do cx-set-toggle-button2 \"Lift Report Definition*Table1*Table1*CheckButton6(Create Output Parameter)\" #t)(cx-gui-do cx-activate-item \"Lift Report Definition*Table1*Table1*CheckButton6(Create Output Parameter)\")(cx-gui-do cx-activate-item \"Report Definitions*PanelButtons*PushButton1(Close)\")")
     setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Lift Report Definition*PanelButtons*PushButton1(OK)")')
+    convergence_setup(setup1, proj_params)
+    abort_setup(setup1, index, proj_params)
+    autosave_setup(setup1, index, proj_params)
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Solution|Run Calculation"))')
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Solution|Run Calculation"))(cx-gui-do cx-activate-item "NavigationPane*List_Tree1")')
     setup1.SendCommand(Command="(cx-gui-do cx-set-list-tree-selections \"NavigationPane*List_Tree1\" (list \"Solution|Run Calculation\"))(cx-gui-do cx-set-list-selections \"Run Calculation*Table1*Table2(Pseudo Transient Settings)*Table1(Fluid Time Scale)*Table1*DropDownList2(Length Scale Method)\" '( 2))")
     setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Run Calculation*Table1*Table2(Pseudo Transient Settings)*Table1(Fluid Time Scale)*Table1*DropDownList2(Length Scale Method)")')
     setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Run Calculation*Table1*Table2(Pseudo Transient Settings)*Table1(Fluid Time Scale)*Table3*RealEntry3(Length Scale)\" '( {}))(cx-gui-do cx-activate-item \"Run Calculation*Table1*Table2(Pseudo Transient Settings)*Table1(Fluid Time Scale)*Table3*RealEntry3(Length Scale)\")".format(simulation.dimension.length))
-    setup1.SendCommand(Command='(cx-gui-do cx-set-integer-entry "Run Calculation*Table1*Table3(Parameters)*Table1*Table1*IntegerEntry1(Number of Iterations)" 600)(cx-gui-do cx-activate-item "Run Calculation*Table1*Table3(Parameters)*Table1*Table1*IntegerEntry1(Number of Iterations)")')
+    setup1.SendCommand(Command='(cx-gui-do cx-set-integer-entry "Run Calculation*Table1*Table3(Parameters)*Table1*Table1*IntegerEntry1(Number of Iterations)" {})(cx-gui-do cx-activate-item "Run Calculation*Table1*Table3(Parameters)*Table1*Table1*IntegerEntry1(Number of Iterations)")'.format(proj_params.max_iterations))
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Solution|Initialization"))')
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Solution|Initialization"))(cx-gui-do cx-activate-item "NavigationPane*List_Tree1")')
     setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Solution|Initialization"))')
     setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Solution Initialization*Table1*Frame11*PushButton2(Initialize)")')
-    setup1.SendCommand(Command="/mesh/repair-improve/allow-repair-at-boundaries yes")
-    setup1.SendCommand(Command="/mesh/repair-improve/include-local-polyhedra-conversion-in-repair yes")
-    setup1.SendCommand(Command="/mesh/repair-improve/repair")
+    initialization_setup(setup1, simulation, proj_params, warm_start)
+    warm_start_read(setup1, index, proj_params, warm_start)
     setup1.SendCommand(Command='(cx-gui-do cx-activate-item "MenuBar*FileMenu*Close Fluent")')
-    Save(Overwrite=True)
+    workbench.Save(Overwrite=True)
 
     return
 
-def completion_status(sim_list, proj_params):
+def initialization_strategy(simulation, proj_params):
     '''
-    Detects if entire workbench project has finished running simulations.
+    Returns the initialization strategy of a simulation for its body type.
+    Simulation, Project -> Str
 
     Parameters
     ---------------------
-    sim_list : List 
-        List containing Simulation objects.
+    simulation : Simulation object
+        Instance of Simulation object.
     proj_params : Project object
         Instance of Project class containing project parameters.
 
     Returns
     ---------------------
-    None
+    strategy : str
+        Either "Standard", "Hybrid" or "FMG".
     '''
 
-    wb_files_dir = os.path.join(proj_params.proj_dir, proj_params.proj_name + "_files")
+    strategies = proj_params.initialization
 
-    last_sim_index = len(sim_list)-1
+    return(strategies.get("{}".format(simulation.mesh.body_size).upper(), strategies.get("", "Standard")))
 
-    complete = 0
+def initialization_setup(setup, simulation, proj_params, warm_start = None):
+    '''
+    Re-initialises the flow field of a Fluent simulation with hybrid or full-multigrid (FMG) initialization after the mesh has been repaired. The standard initialization is kept for the Standard strategy and for warm-started simulations.
 
-    if last_sim_index == 0:
-        flu_dir = "FLU"
-    else:
-        flu_dir = "FLU-{}".format(last_sim_index)
+    Parameters
+    ---------------------
+    setup : Workbench Setup container
+        Setup container of the Fluent system being set up.
+    simulation : Simulation object
+        Instance of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    warm_start : Warm_Start object
+        Instance of Warm_Start class, or None.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if warm_start != None:
+        return
+
+    strategy = initialization_strategy(simulation, proj_params)
+
+    if strategy == "Hybrid":
+        setup.SendCommand(Command="/solve/initialize/hybrid-init-options/general-settings/iter-count {}".format(proj_params.hybrid_iterations))
+        setup.SendCommand(Command="/solve/initialize/hyb-initialization yes")
+    elif strategy == "FMG":
+        setup.SendCommand(Command="/solve/initialize/initialize-flow yes")
+        setup.SendCommand(Command="/solve/initialize/fmg-initialization yes")
 
-    last_sim_dir = "{}\\progress_files\\dp0\\{}\\Fluent\\Solution.trn".format(wb_files_dir, flu_dir)
-    while complete == 0:
-        if os.path.isfile(last_sim_dir):
-            complete = 1
-        else:
-            time.sleep(60)
-    
     return
 
-def convergence_status(sim_list, proj_params):
+def initialization_summary(sim_list, proj_params):
     '''
-    Performs batch detection of convergence status on all simulations in sim_list.
+    Writes the mean number of iterations to convergence of each initialization strategy and body type to the project's run report.
 
     Parameters
     ---------------------
-    sim_list : List 
+    sim_list : List
         List containing Simulation objects.
     proj_params : Project object
         Instance of Project class containing project parameters.
 
     Returns
     ---------------------
-    sim_list : List 
-        List containing Simulation objects.
+    None
     '''
-    
-    wb_files_dir = os.path.join(proj_params.proj_dir, proj_params.proj_name + "_files").replace(os.sep, '/')
 
-    for i in range(len(sim_list)):
-        if i==0:
-            flu_dir = "FLU"
-        else:
-            flu_dir = "FLU-{}".format(i)
-        status_file = open("{}/progress_files/dp0/{}/Fluent/Solution.trn".format(wb_files_dir, flu_dir), 'r')
-        if "solution is converged" in status_file.read():
-            sim_list[i].results.convergence = "Converged"
-        else:
-            sim_list[i].results.convergence = "Diverged or Error"
-    
-    return(sim_list)
+    ledger = ledger_load(proj_params)
+    groups = {}
 
-def results_extract(sim_list, proj_params):
+    for simulation in sim_list:
+        if ledger_done(ledger, simulation, "converge", proj_params) == False:
+            continue
+        data = ledger[(simulation.sim_name, "converge")]["data"]
+        if (data.get("convergence") != "Converged") or (data.get("iterations") == None):
+            continue
+        group = (simulation.mesh.body_size, data.get("initialization", "Standard"))
+        groups.setdefault(group, []).append(data["iterations"])
+
+    for (body, strategy) in sorted(groups):
+        iterations = groups[(body, strategy)]
+        run_report_write(proj_params, "", "Initialization Summary", "{} {}: mean of {:.0f} iterations to convergence over {} simulations".format(body, strategy, float(sum(iterations)) / len(iterations), len(iterations)))
+
+    return
+
+def warm_start_source(simulation, sim_list, proj_params):
     '''
-    Performs batch execution of fluent_results_export on simulations that have converged.
+    Finds the previously solved case nearest to a simulation, from the solved simulations of the project and the case and data files stored in the result cache. Only cases with the same solution method and body type are considered; cases on the same mesh are preferred, followed by the closest velocity. Every simulation of a run is set up, and its source chosen, before any is solved, so the simulations of the project are only sources once solved by an earlier run, e.g. when the project is resumed; a fresh project warm-starts from the result cache alone.
 
     Parameters
     ---------------------
-    sim_list : List 
+    simulation : Simulation object
+        Instance of Simulation object.
+    sim_list : List
         List containing Simulation objects.
     proj_params : Project object
         Instance of Project class containing project parameters.
 
+    Returns
+    ---------------------
+    warm_start : Warm_Start object
+        Instance of Warm_Start class, or None if no solved case is available.
+    '''
+
+    target_mesh = mesh_digest(simulation)
+    target_method = solution_method(simulation)
+    candidates = []
+
+    for other in sim_list:
+        if (other is simulation) or (other.system_index == None):
+            continue
+        if (solution_method(other) != target_method) or (other.mesh.body_size != simulation.mesh.body_size):
+            continue
+        fluent_dir = solve_dir(other.system_index, proj_params)
+        if (solve_state(other.system_index, proj_params) != "Solved") or os.path.isfile("{}/minerva-abort.txt".format(fluent_dir)):
+            continue
+        case_path = latest_case_file(fluent_dir)
+        data_path = latest_data_file(fluent_dir)
+        if (case_path != None) and (data_path != None):
+            candidates.append(Warm_Start(case_path, data_path, float(other.workflow.velocity), mesh_digest(other) == target_mesh, "{} in {}".format(other.sim_name, proj_params.proj_name), target_method))
+
+    if proj_params.cache_dir != None:
+        results_cache = os.path.join(proj_params.cache_dir, "Results")
+        if os.path.isdir(results_cache):
+            for entry_name in os.listdir(results_cache):
+                entry_path = os.path.join(results_cache, entry_name, "results.json")
+                data_dir = os.path.join(results_cache, entry_name, "Data").replace(os.sep, '/')
+                if (os.path.isfile(entry_path) == False) or (os.path.isdir(data_dir) == False):
+                    continue
+                with open(entry_path, 'r') as entry_file:
+                    entry = json.load(entry_file)
+                if (entry.get("sol_method") != target_method) or (entry.get("body_size") != simulation.mesh.body_size):
+                    continue
+                case_path = latest_case_file(data_dir)
+                data_path = latest_data_file(data_dir)
+                if (case_path != None) and (data_path != None):
+                    candidates.append(Warm_Start(case_path, data_path, float(entry["velocity"]), entry.get("mesh_digest") == target_mesh, "{} in {} (result cache)".format(entry["sim_name"], entry["project"]), target_method))
+
+    if len(candidates) == 0:
+        return(None)
+
+    velocity = float(simulation.workflow.velocity)
+    candidates.sort(key = lambda candidate: (candidate.same_mesh == False, abs(candidate.velocity - velocity)))
+    warm_start = candidates[0]
+
+    if warm_start.same_mesh:
+        mesh_note = "same mesh"
+    else:
+        mesh_note = "different mesh"
+    warm_start.description = "Initialised by interpolation from {} at {} m/s ({})".format(warm_start.description, warm_start.velocity, mesh_note)
+
+    return(warm_start)
+
+def warm_start_write(setup, index, proj_params, warm_start):
+    '''
+    Reads the solved case of a warm start into a Fluent session and writes its solution to an interpolation file in the Fluent working directory of the simulation. Must be called before the mesh of the simulation is imported.
+
+    Parameters
+    ---------------------
+    setup : Workbench Setup container
+        Setup container of the Fluent system being set up.
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    warm_start : Warm_Start object
+        Instance of Warm_Start class, or None.
+
     Returns
     ---------------------
     None
     '''
-    for i in range(len(sim_list)):
-        if sim_list[i].results.convergence == "Converged":
-            fluent_results_export(sim_list[i], i, proj_params)
-            sim_list[i] = fluent_results_aggregator(sim_list[i], i, proj_params)
-    
-    results_formatter(sim_list, proj_params)
+
+    if warm_start == None:
+        return
+
+    fields = "pressure x-velocity y-velocity z-velocity turb-kinetic-energy specific-diss-rate"
+    if warm_start.method == "T-SST":
+        fields += " intermit retheta"
+
+    setup.SendCommand(Command='/file/read-case "{}"'.format(warm_start.case_path))
+    setup.SendCommand(Command='/file/read-data "{}"'.format(warm_start.data_path))
+    setup.SendCommand(Command='/file/interpolate/write-data "{}/warm-start.ip" * () {} ()'.format(solve_dir(index, proj_params), fields))
 
     return
 
-def fluent_results_export(simulation, index, proj_params):
+def warm_start_read(setup, index, proj_params, warm_start):
     '''
-    Exports results from a given Fluent simulation into .txt files.
+    Interpolates the solution written by warm_start_write onto the mesh of the simulation, replacing the standard initialization.
 
     Parameters
     ---------------------
-    simulation : Simulation object
-        Instance of Simulation object.
+    setup : Workbench Setup container
+        Setup container of the Fluent system being set up.
     index : int
-        Integer of current index of converged simulation.
+        Integer of index of simulation in list of simulations.
     proj_params : Project object
         Instance of Project class containing project parameters.
+    warm_start : Warm_Start object
+        Instance of Warm_Start class, or None.
 
     Returns
     ---------------------
     None
     '''
 
-    if index==0:
-        module = "FLU"
-        flu_dir = "FLU"
-    else:
-        module = "FLU {}".format(index)
-        flu_dir = "FLU-{}".format(index)
-    
-    raw_results_dir = os.path.join(proj_params.results_dir, simulation.sim_name + "\\Raw Results").replace(os.sep, '/')
-    wb_files_dir = os.path.join(proj_params.proj_dir, proj_params.proj_name + "_files").replace(os.sep, '/')
-    
-    system1 = GetSystem(Name=module)
-    solution1 = system1.GetContainer(ComponentName="Solution")
-    solution1.Edit()
-    setup1 = system1.GetContainer(ComponentName="Setup")
-    setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Results|Reports|Forces"))')
-    setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Results|Reports|Forces"))(cx-gui-do cx-activate-item "NavigationPane*List_Tree1")')
-    setup1.SendCommand(Command="(cx-gui-do cx-set-list-tree-selections \"NavigationPane*List_Tree1\" (list \"Results|Reports|Forces\"))(cx-gui-do cx-set-list-selections \"Force Reports*List2(Wall Zones)\" '( 0 2))(cx-gui-do cx-activate-item \"Force Reports*List2(Wall Zones)\")(cx-gui-do cx-set-list-selections \"Force Reports*List2(Wall Zones)\" '( 0))(cx-gui-do cx-activate-item \"Force Reports*List2(Wall Zones)\")")
-    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"{}/drag{}.txt\") \"All Files (*)\")".format(raw_results_dir, index))
-    setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame1(Direction Vector)*RealEntry1(X)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame1(Direction Vector)*RealEntry3(Z)\" '( 1))")
-    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"lift{}.txt\") \"All Files (*)\")".format(index))
-    setup1.SendCommand(Command="(cx-gui-do cx-set-toggle-button2 \"Force Reports*Table1*ToggleBox1(Options)*Moments\" #t)(cx-gui-do cx-activate-item \"Force Reports*Table1*ToggleBox1(Options)*Moments\")(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame2(Moment Center)*RealEntry1(X)\" '({}))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame2(Moment Center)*RealEntry2(Y)\" '({}))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame2(Moment Center)*RealEntry3(Z)\" '({}))".format(simulation.dimension.CG_X, simulation.dimension.CG_Y, simulation.dimension.CG_Z))
-    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"roll_moment{}.txt\") \"All Files (*)\")".format(index))
-    setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry1(X)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry2(Y)\" '( 1))")
-    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"pitch_moment{}.txt\") \"All Files (*)\")".format(index))
-    setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry2(Y)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry3(Z)\" '( 1))")
-    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"yaw_moment{}.txt\") \"All Files (*)\")".format(index))
-    setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry3(Z)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry1(X)\" '( 1))(cx-gui-do cx-set-toggle-button2 \"Force Reports*Table1*ToggleBox1(Options)*Forces\" #t)(cx-gui-do cx-activate-item \"Force Reports*Table1*ToggleBox1(Options)*Forces\")(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame1(Direction Vector)*RealEntry3(Z)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame1(Direction Vector)*RealEntry2(Y)\" '( -1))")
-    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"force_left{}.txt\") \"All Files (*)\")".format(index))
-    setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame1(Direction Vector)*RealEntry2(Y)\" '( 1))")
-    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"force_right{}.txt\") \"All Files (*)\")".format(index))
-    setup1.SendCommand(Command='(cx-gui-do cx-set-toggle-button2 "Force Reports*Table1*ToggleBox1(Options)*Center of Pressure" #t)(cx-gui-do cx-activate-item "Force Reports*Table1*ToggleBox1(Options)*Center of Pressure")')
-    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"cp_x_0m_{}.txt\") \"All Files (*)\")".format(index))
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Force Reports*PanelButtons*PushButton2(Cancel)")')
-    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "MenuBar*FileMenu*Close Fluent")')
-    
-    
-    iter_file = open("{}/dp0/{}/Fluent/drag-rfile.out".format(wb_files_dir, flu_dir), 'r')
-    iter_lines = iter_file.readlines()
-    iter_data = iter_lines[len(iter_lines)-1]
-    
+    if warm_start == None:
+        return
 
-    output = open("{}/iter{}.txt".format(raw_results_dir, index), 'w')
-    output.write(iter_data)
-    output.close()
-    iter_file.close()
+    setup.SendCommand(Command='/file/interpolate/read-data "{}/warm-start.ip" * ()'.format(solve_dir(index, proj_params)))
 
     return
 
-def fluent_results_aggregator(simulation, index, proj_params):
+def mesh_setup(setup, simulation, proj_params):
     '''
-    Aggregates exported fluent results and imports into their Simulation_Results object.
+    Imports the mesh of a simulation into a Fluent session, scaled from millimetres, checked and repaired. If a mesh cache directory is given, the prepared mesh is stored in the mesh cache once per unique .CAS file, and later simulations read the prepared case directly instead of repeating the scale, check and repair steps.
 
     Parameters
     ---------------------
+    setup : Workbench Setup container
+        Setup container of the Fluent system being set up.
     simulation : Simulation object
         Instance of Simulation object.
-    index : int
-        Integer of current index of converged simulation.
     proj_params : Project object
         Instance of Project class containing project parameters.
 
     Returns
     ---------------------
+    None
+    '''
+
+    prepared_path = mesh_cache_lookup(simulation, proj_params)
+
+    if prepared_path != None:
+        setup.SendCommand(Command='/file/read-case "{}"'.format(prepared_path))
+        return
+
+    import_dir = simulation.mesh.CAS_dir
+    if simulation.mesh.staged_dir != None:
+        import_dir = simulation.mesh.staged_dir
+
+    setup.SendCommand(Command="(cx-gui-do cx-activate-item \"MenuBar*ImportSubMenu*Case...\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"{}/{}.cas\") \"All Case Files (*.cas* *.msh* *.MSH* )\")".format((import_dir.replace(os.sep, '/')), simulation.mesh.CAS_name))
+    setup.SendCommand(Command='(cx-gui-do cx-activate-item "General*Table1*ButtonBox1(Mesh)*PushButton1(Scale)")')
+    setup.SendCommand(Command="(cx-gui-do cx-set-list-selections \"Scale Mesh*Table1*Table2(Scaling)*DropDownList2(Mesh Was Created In)\" '( 3))")
+    setup.SendCommand(Command='(cx-gui-do cx-activate-item "Scale Mesh*Table1*Table2(Scaling)*DropDownList2(Mesh Was Created In)")')
+    setup.SendCommand(Command='(cx-gui-do cx-activate-item "Scale Mesh*Table1*Table2(Scaling)*PushButton4(Scale)")')
+    setup.SendCommand(Command='(cx-gui-do cx-activate-item "Scale Mesh*PanelButtons*PushButton1(Close)")')
+    setup.SendCommand(Command='(cx-gui-do cx-activate-item "General*Table1*ButtonBox1(Mesh)*PushButton3(Check)")')
+    setup.SendCommand(Command='(cx-gui-do cx-activate-item "General*Table1*ButtonBox1(Mesh)*PushButton5(Report Quality)")')
+    setup.SendCommand(Command="/mesh/repair-improve/allow-repair-at-boundaries yes")
+    setup.SendCommand(Command="/mesh/repair-improve/include-local-polyhedra-conversion-in-repair yes")
+    setup.SendCommand(Command="/mesh/repair-improve/repair")
+
+    mesh_cache_store(setup, simulation, proj_params)
+
+    return
+
+def mesh_cache_key(simulation):
+    '''
+    Computes the mesh cache key of a simulation from the contents of its .CAS file and the preparation steps applied to it.
+    Simulation -> Str
+
+    Parameters
+    ---------------------
     simulation : Simulation object
         Instance of Simulation object.
+
+    Returns
+    ---------------------
+    key : str
+        SHA-1 hex digest identifying the prepared mesh, or None if the .CAS file cannot be found.
     '''
 
-    raw_results_dir = os.path.join(proj_params.results_dir, simulation.sim_name + "\\Raw Results").replace(os.sep, '/')
+    source_key = mesh_digest(simulation)
 
-    cop_file = open("{}/cp_x_0m_{}.txt".format(raw_results_dir, index), 'r')
-    drag_file = open("{}/drag{}.txt".format(raw_results_dir, index), 'r')
-    lift_file = open("{}/lift{}.txt".format(raw_results_dir, index), 'r')
-    iter_file = open("{}/iter{}.txt".format(raw_results_dir, index), 'r')
-    f_left_file = open("{}/force_left{}.txt".format(raw_results_dir, index), 'r')
-    f_right_file = open("{}/force_right{}.txt".format(raw_results_dir, index), 'r')
-    pitch_file = open("{}/pitch_moment{}.txt".format(raw_results_dir, index), 'r')
-    roll_file = open("{}/roll_moment{}.txt".format(raw_results_dir, index), 'r')
-    yaw_file = open("{}/yaw_moment{}.txt".format(raw_results_dir, index), 'r')
+    if source_key == None:
+        return(None)
 
-    cop_all_data = cop_file.readlines()
-    drag_all_data = drag_file.readlines()
-    lift_all_data = lift_file.readlines()
-    iter_all_data = iter_file.readlines()
-    f_left_all_data = f_left_file.readlines()
-    f_right_all_data = f_right_file.readlines()
-    pitch_all_data = pitch_file.readlines()
-    roll_all_data = roll_file.readlines()
-    yaw_all_data = yaw_file.readlines()
+    inputs = [source_key, "scale mm", "check", "repair at boundaries", "local polyhedra conversion"]
 
-    # cop values are on line 5
-    # drag values are on line 13
-    # lift values are on line 13
-    # iter values are on line 1
-    # f_left values are on line 13
-    # f_right values are on line 13
-    # pitch moment values are on line 13
-    # roll moment values are on line 13
-    # yaw moment values are on line 13
+    return(hashlib.sha1("|".join(inputs).encode("utf-8")).hexdigest())
 
-    cop_line_data = cop_all_data[4].split()
-    drag_line_data = drag_all_data[12].split()
-    lift_line_data = lift_all_data[12].split()
-    iter_line_data = iter_all_data[0].split()
-    f_left_line_data = f_left_all_data[12].split()
-    f_right_line_data = f_right_all_data[12].split()
-    pitch_line_data = pitch_all_data[12].split()
-    roll_line_data = roll_all_data[12].split()
-    yaw_line_data = yaw_all_data[12].split()
+def mesh_cache_lookup(simulation, proj_params):
+    '''
+    Finds the prepared case of a simulation's mesh in the mesh cache, marking it as recently used.
 
-    cop_values = str(cop_line_data[1]) + " " + str(cop_line_data[2])
-    drag_comp_values = str(drag_line_data[1]) + " " + str(drag_line_data[2])
-    drag_tot_value = str(drag_line_data[3])
-    lift_comp_values = str(lift_line_data[1] + " " + lift_line_data[2])
-    lift_tot_value = str(lift_line_data[3])
-    iter_value = str(iter_line_data[0])
-    f_left_value = str(f_left_line_data[3])
-    f_right_value = str(f_right_line_data[3])
-    pitch_value = str(pitch_line_data[3])
-    roll_value = str(roll_line_data[3])
-    yaw_value =str(yaw_line_data[3])
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
 
-    simulation.results.iterations = iter_value
-    simulation.results.drag_tot = drag_tot_value
-    simulation.results.drag_comp = drag_comp_values
-    simulation.results.lift_tot = lift_tot_value
-    simulation.results.lift_comp = lift_comp_values
-    simulation.results.f_left = f_left_value
-    simulation.results.f_right = f_right_value
+    Returns
+    ---------------------
+    prepared_path : str
+        Path to the prepared case file, or None if the mesh is not cached.
+    '''
 
-    if simulation.workflow.cg == True:
-      simulation.results.mom_roll = roll_value
-      simulation.results.mom_pitch = pitch_value
-      simulation.results.mom_yaw = yaw_value
-    else:
-      simulation.results.mom_roll = 0
-      simulation.results.mom_pitch = 0
-      simulation.results.mom_yaw = 0
-    simulation.results.cop = cop_values
+    if proj_params.mesh_cache_dir == None:
+        return(None)
 
-    return(simulation)
+    key = mesh_cache_key(simulation)
 
-def results_formatter(sim_list, proj_params):
-    export_directory = proj_params.results_dir.replace(os.sep, '/')
+    if key == None:
+        return(None)
 
-    current_date = date.today().strftime("%d/%m/%Y")
+    entry_dir = os.path.join(proj_params.mesh_cache_dir, key).replace(os.sep, '/')
+    prepared_path = "{}/prepared.cas.gz".format(entry_dir)
 
-    with open("{}/{} Simulation Results.csv".format(export_directory, proj_params.proj_name), 'w') as csvfile:
-        csvfile.write('Simulation Name,.CAS File Name,Date,Number of Iterations,A. Drag [N] (Total),B. Drag [N]: Pressure + Viscous,A. Lift [N] (Total),B. Lift [N]: Pressure + Viscous,Force Left [N] (Total),Force Right [N] (Total),"Roll Moment [N-m] (axis = [1,0,0])","Pitch Moment [N-m] (axis = [0,1,0])","Yaw Moment [N-m] (axis = [0,0,1])",Center of Pressure (x=0 [m]),Status\n')
-        for i in range(len(sim_list)):
-            simulation = sim_list[i]
-            if simulation.results.convergence == "Converged":
-                csvfile.write("{},{},{},{},{},{},{},{},{},{},{},{},{},{},{}\n".format(simulation.sim_name, simulation.mesh.CAS_name, current_date, simulation.results.iterations, simulation.results.drag_tot, simulation.results.drag_comp, simulation.results.lift_tot, simulation.results.lift_comp, simulation.results.f_left, simulation.results.f_right, simulation.results.mom_roll, simulation.results.mom_pitch, simulation.results.mom_yaw, simulation.results.cop, simulation.results.convergence))
-            else:
-                csvfile.write("{},{},{},,,,,,,,,,,,{}\n".format(simulation.sim_name, simulation.mesh.CAS_name, current_date, simulation.results.convergence))
-        csvfile.close()
+    if (os.path.isfile("{}/mesh.json".format(entry_dir)) == False) or (os.path.isfile(prepared_path) == False):
+        return(None)
 
-    return
+    os.utime("{}/mesh.json".format(entry_dir), None)
 
-def post_processing(sim_list, proj_params):
-    stream = []
+    return(prepared_path)
 
-    for i in range(len(sim_list)):
-        if sim_list[i].workflow.post == True:
-            post_plots(sim_list[i], i, proj_params)
-            if sim_list[i].workflow.streamlines == True:
-                stream.append(i)
+def mesh_cache_store(setup, simulation, proj_params):
+    '''
+    Writes the prepared case of a simulation's mesh from its Fluent session into the mesh cache, then evicts the least recently used meshes beyond the size limit. Must be called after the mesh is repaired and before any models or boundary conditions are set.
 
-    for j in range(len(stream)):
-      simulation = sim_list[stream[j]]
-      if simulation.mesh.body_size == "FB":
-        post_streamlines_fb(simulation, j, proj_params)
-      if simulation.mesh.body_size == "HB":
-        post_streamlines_hb(simulation, j, proj_params)
+    Parameters
+    ---------------------
+    setup : Workbench Setup container
+        Setup container of the Fluent system being set up.
+    simulation : Simulation object
+        Instance of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if proj_params.mesh_cache_dir == None:
+        return
+
+    key = mesh_cache_key(simulation)
+
+    if key == None:
+        return
+
+    entry_dir = os.path.join(proj_params.mesh_cache_dir, key)
+
+    if os.path.isdir(entry_dir):
+        return
+
+    staging_dir = entry_dir + ".{}.tmp".format(os.getpid())
+    os.makedirs(staging_dir)
+
+    setup.SendCommand(Command='/file/write-case "{}/prepared.cas.gz"'.format(staging_dir.replace(os.sep, '/')))
+
+    if os.path.isfile(os.path.join(staging_dir, "prepared.cas.gz")) == False:
+        shutil.rmtree(staging_dir)
+        return
+
+    with open(os.path.join(staging_dir, "mesh.json"), 'w') as entry_file:
+        json.dump({"CAS_name": simulation.mesh.CAS_name, "CAS_dir": simulation.mesh.CAS_dir, "mesh_digest": mesh_digest(simulation)}, entry_file)
+
+    try:
+        os.rename(staging_dir, entry_dir)
+    except OSError:
+        shutil.rmtree(staging_dir)
+
+    cache_evict(proj_params.mesh_cache_dir, proj_params.mesh_cache_limit * 1024 ** 3, "mesh.json")
 
     return
 
-def post_plots(simulation, index, proj_params):
-    sim_path = os.path.join(proj_params.results_dir, simulation.sim_name)
-    media_dir = os.path.join(sim_path, "Media Files")
-    cp_dir = os.path.join(media_dir, "3D Cp Contour")
-    pressure_dir = os.path.join(media_dir, "Pressure Contour")
-    tke_dir = os.path.join(media_dir, "TKE Contour")
-    wallshear_dir = os.path.join(media_dir, "Wall Shear Streamline")
-    
-    
-    if index == 0:
-        module = "FLU"
-    else:
-        module = "FLU {}".format(index)
+def convergence_setup(setup, proj_params):
+    '''
+    Defines convergence conditions on the drag and lift report definitions of an open Fluent setup, such that the simulation stops once both have settled.
 
-    template1 = GetTemplate(TemplateName="Results")
-    system1 = GetSystem(Name=module)
-    system2 = template1.CreateSystem(
-        Position="Right",
-        RelativeTo=system1)
-    solutionComponent1 = system1.GetComponent(Name="Solution")
-    resultsComponent1 = system2.GetComponent(Name="Results")
-    solutionComponent1.TransferData(TargetComponent=resultsComponent1)
-    results1 = system2.GetContainer(ComponentName="Results")
-    results1.Edit()
-    results1.SendCommand(Command="""VIEW:View 1
-      Light Angle = 50, 110
-    END
+    Parameters
+    ---------------------
+    setup : Setup container
+        Fluent setup container of the system being set up.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
 
-    VIEW:View 2
-      Light Angle = 50, 110
-    END
+    Returns
+    ---------------------
+    None
+    '''
 
-    VIEW:View 3
-      Light Angle = 50, 110
-    END
+    for report in ["drag", "lift"]:
+        setup.SendCommand(Command="/solve/convergence-conditions/conv-reports/add {0}-convergence report-defs {0} stop-criterion {1} initial-values-to-ignore {2} previous-values-to-consider {3} print yes active yes quit quit".format(report, proj_params.conv_criterion, proj_params.min_iterations, proj_params.conv_window))
+    setup.SendCommand(Command="/solve/convergence-conditions/condition 1")
+    setup.SendCommand(Command="/solve/convergence-conditions/frequency 1")
 
-    VIEW:View 4
-      Light Angle = 50, 110
-    END
+    return
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >show /DATA READER/CASE:Case {}/BOUNDARY:car, view=/VIEW:View 1""".format(simulation.sim_name))
-    results1.SendCommand(Command="> autolegend plot=/CONTOUR:TKE Contour, view=VIEW:View 1")
-    results1.SendCommand(Command="""CONTOUR:TKE Contour
-    Apply Instancing Transform = On
-    Clip Contour = Off
-    Colour Map = Default Colour Map
-    Colour Scale = Logarithmic
-    Colour Variable = Turbulence Kinetic Energy
-    Colour Variable Boundary Values = Conservative
-    Constant Contour Colour = Off
-    Contour Range = Global
-    Culling Mode = No Culling
-    Domain List = /DOMAIN GROUP:All Domains
-    Draw Contours = Off
-    Font = Sans Serif
-    Fringe Fill = On
-    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
-    Lighting = On
-    Line Colour = 0, 0, 0
-    Line Colour Mode = Default
-    Line Width = 1
-    Location List = car
-    Max = 0.0 [m^2 s^-2]
-    Min = 0.0 [m^2 s^-2]
-    Number of Contours = 5000
-    Show Numbers = Off
-    Specular Lighting = On
-    Surface Drawing = Smooth Shading
-    Text Colour = 0, 0, 0
-    Text Colour Mode = Default
-    Text Height = 0.024
-    Transparency = 0.0
-    Use Face Values = On
-    Value List = 0 [m^2 s^-2],1 [m^2 s^-2]
-      OBJECT VIEW TRANSFORM:
-      Apply Reflection = Off
-      Apply Rotation = Off
-      Apply Scale = Off
-      Apply Translation = Off
-      END
-    END""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="> autolegend plot=/CONTOUR:Pressure Contour, view=VIEW:View 1")
-    results1.SendCommand(Command="""CONTOUR:Pressure Contour
-    Apply Instancing Transform = On
-    Clip Contour = Off
-    Colour Map = Default Colour Map
-    Colour Scale = Linear
-    Colour Variable = Pressure
-    Colour Variable Boundary Values = Conservative
-    Constant Contour Colour = Off
-    Contour Range = Global
-    Culling Mode = No Culling
-    Domain List = /DOMAIN GROUP:All Domains
-    Draw Contours = Off
-    Font = Sans Serif
-    Fringe Fill = On
-    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
-    Lighting = On
-    Line Colour = 0, 0, 0
-    Line Colour Mode = Default
-    Line Width = 1
-    Location List = car
-    Max = 0.0 [Pa]
-    Min = 0.0 [Pa]
-    Number of Contours = 5000
-    Show Numbers = Off
-    Specular Lighting = On
-    Surface Drawing = Smooth Shading
-    Text Colour = 0, 0, 0
-    Text Colour Mode = Default
-    Text Height = 0.024
-    Transparency = 0.0
-    Use Face Values = On
-    Value List = 0 [Pa],1 [Pa]
-      OBJECT VIEW TRANSFORM:
-      Apply Reflection = Off
-      Apply Rotation = Off
-      Apply Scale = Off
-      Apply Translation = Off
-      END
-    END""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="> autolegend plot=/STREAMLINE:Wall Shear Streamline, view=VIEW:View 1")
-    results1.SendCommand(Command="""STREAMLINE:Wall Shear Streamline
-    Absolute Tolerance = 0.0 [m]
-    Apply Instancing Transform = On
-    Colour = 0, 0, 1
-    Colour Map = Default Colour Map
-    Colour Mode = Constant
-    Colour Scale = Linear
-    Colour Variable = Wall Shear
-    Colour Variable Boundary Values = Conservative
-    Cross Periodics = On
-    Culling Mode = No Culling
-    Domain List = /DOMAIN GROUP:All Domains
-    Draw Faces = On
-    Draw Lines = Off
-    Draw Streams = On
-    Draw Symbols = Off
-    Grid Tolerance = 0.01
-    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
-    Lighting = On
-    Line Width = 1
-    Location List = car
-    Locator Sampling Method = Equally Spaced
-    Max = 0.0 [Pa]
-    Maximum Number of Items = 25
-    Min = 0.0 [Pa]
-    Number of Samples = 500
-    Number of Sides = 8
-    Range = Global
-    Reduction Factor = 1.0
-    Reduction or Max Number = Max Number
-    Sample Spacing = 0.1
-    Sampling Aspect Ratio = 1
-    Sampling Grid Angle = 0 [degree]
-    Seed Point Type = Equally Spaced Samples
-    Simplify Geometry = Off
-    Specular Lighting = On
-    Stream Drawing Mode = Line
-    Stream Initial Direction = 0 , 0 , 0 
-    Stream Size = 1.0
-    Stream Symbol = Ball
-    Streamline Direction = Forward
-    Streamline Maximum Periods = 20
-    Streamline Maximum Segments = 10000
-    Streamline Maximum Time = 0.0 [s]
-    Streamline Type = Surface Streamline
-    Streamline Width = 2
-    Surface Drawing = Smooth Shading
-    Surface Streamline Direction = Forward and Backward
-    Symbol Size = 1.0
-    Symbol Start Time = 10.0 [s]
-    Symbol Stop Time = -10.0 [s]
-    Symbol Time Interval = 1.0 [s]
-    Tolerance Mode = Grid Relative
-    Transparency = 0.0
-    Variable = Wall Shear
-    Variable Boundary Values = Conservative
-      OBJECT VIEW TRANSFORM:
-      Apply Reflection = Off
-      Apply Rotation = Off
-      Apply Scale = Off
-      Apply Translation = Off
-      Principal Axis = Z
-      Reflection Plane Option = XY Plane
-      Rotation Angle = 0.0 [degree]
-      Rotation Axis From = 0 [m], 0 [m], 0 [m]
-      Rotation Axis To = 0 [m], 0 [m], 0 [m]
-      Rotation Axis Type = Principal Axis
-      Scale Vector = 1 , 1 , 1 
-      Translation Vector = 0 [m], 0 [m], 0 [m]
-      X = 0.0 [m]
-      Y = 0.0 [m]
-      Z = 0.0 [m]
-      END
-    END""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""LIBRARY:
-      CEL:
-        EXPRESSIONS:
-          Cp Expr = (Pressure - Reference Pressure ) / (0.5 * areaAve(Density)@inlet * areaAve(Velocity)@inlet^2)
-        END
-      END
-    END
+def abort_setup(setup, index, proj_params):
+    '''
+    Points the checkpoint-and-exit file of an open Fluent setup to its working directory, such that a run can be stopped by creating the file with solver_abort.
 
-    EXPRESSION EVALUATOR:
-      Evaluated Expression = Cp Expr
-    END
+    Parameters
+    ---------------------
+    setup : Setup container
+        Fluent setup container of the system being set up.
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
 
-    > forceupdate EXPRESSION EVALUATOR""")
-    results1.SendCommand(Command="""USER SCALAR VARIABLE:Cp Var
-    Boundary Values = Conservative
-    Calculate Global Range = On
-    Expression = Cp Expr
-    Recipe = Expression
-    Variable to Copy = Pressure
-    Variable to Gradient = Pressure
-    END""")
-    results1.SendCommand(Command="> autolegend plot=/CONTOUR:Cp Contour, view=VIEW:View 1")
-    results1.SendCommand(Command="""CONTOUR:Cp Contour
-    Apply Instancing Transform = On
-    Clip Contour = Off
-    Colour Map = Default Colour Map
-    Colour Scale = Linear
-    Colour Variable = Cp Var
-    Colour Variable Boundary Values = Conservative
-    Constant Contour Colour = Off
-    Contour Range = Local
-    Culling Mode = No Culling
-    Domain List = /DOMAIN GROUP:All Domains
-    Draw Contours = Off
-    Font = Sans Serif
-    Fringe Fill = On
-    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
-    Lighting = On
-    Line Colour = 0, 0, 0
-    Line Colour Mode = Default
-    Line Width = 1
-    Location List = car
-    Max = 0.0
-    Min = 0.0
-    Number of Contours = 5000
-    Show Numbers = Off
-    Specular Lighting = On
-    Surface Drawing = Smooth Shading
-    Text Colour = 0, 0, 0
-    Text Colour Mode = Default
-    Text Height = 0.024
-    Transparency = 0.0
-    Use Face Values = On
-    Value List = 0,1
-      OBJECT VIEW TRANSFORM:
-      Apply Reflection = Off
-      Apply Rotation = Off
-      Apply Scale = Off
-      Apply Translation = Off
-      Principal Axis = Z
-      Reflection Plane Option = XY Plane
-      Rotation Angle = 0.0 [degree]
-      Rotation Axis From = 0 [m], 0 [m], 0 [m]
-      Rotation Axis To = 0 [m], 0 [m], 0 [m]
-      Rotation Axis Type = Principal Axis
-      Scale Vector = 1 , 1 , 1 
-      Translation Vector = 0 [m], 0 [m], 0 [m]
-      X = 0.0 [m]
-      Y = 0.0 [m]
-      Z = 0.0 [m]
-      END
-    END""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="> autolegend plot=/ISOSURFACE:Y 0 Plane, view=VIEW:View 1")
-    results1.SendCommand(Command="""ISOSURFACE:Y 0 Plane
-    Apply Instancing Transform = On
-    Apply Texture = Off
-    Blend Texture = On
-    Colour = 0.75, 0.75, 0.75
-    Colour Map = Default Colour Map
-    Colour Mode = Use Plot Variable
-    Colour Scale = Linear
-    Colour Variable = Y
-    Colour Variable Boundary Values = Conservative
-    Culling Mode = No Culling
-    Domain List = /DOMAIN GROUP:All Domains
-    Draw Faces = On
-    Draw Lines = Off
-    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
-    Lighting = On
-    Line Colour = 0, 0, 0
-    Line Colour Mode = Default
-    Line Width = 1
-    Max = 0.0 [m]
-    Min = 0.0 [m]
-    Range = Global
-    Render Edge Angle = 0 [degree]
-    Specular Lighting = On
-    Surface Drawing = Smooth Shading
-    Texture Angle = 0
-    Texture Direction = 0 , 1 , 0 
-    Texture File =  
-    Texture Material = Metal
-    Texture Position = 0 , 0 
-    Texture Scale = 1
-    Texture Type = Predefined
-    Tile Texture = Off
-    Transform Texture = Off
-    Transparency = 0.0
-    Value = 0.0 [m]
-    Variable = Y
-    Variable Boundary Values = Conservative
-      OBJECT VIEW TRANSFORM:
-      Apply Reflection = Off
-      Apply Rotation = Off
-      Apply Scale = Off
-      Apply Translation = Off
-      Principal Axis = Z
-      Reflection Plane Option = XY Plane
-      Rotation Angle = 0.0 [degree]
-      Rotation Axis From = 0 [m], 0 [m], 0 [m]
-      Rotation Axis To = 0 [m], 0 [m], 0 [m]
-      Rotation Axis Type = Principal Axis
-      Scale Vector = 1 , 1 , 1 
-      Translation Vector = 0 [m], 0 [m], 0 [m]
-      X = 0.0 [m]
-      Y = 0.0 [m]
-      Z = 0.0 [m]
-      END
-    END""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /ISOSURFACE:Y 0 Plane, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /ISOSURFACE:Y 0 Plane, view=/VIEW:View 1""")
-    results1.SendCommand(Command="> autolegend plot=/POLYLINE:Centerline Polyline, view=VIEW:View 1")
-    results1.SendCommand(Command="""POLYLINE:Centerline Polyline
-    Apply Instancing Transform = On
-    Boundary List = car
-    Colour = 0, 1, 0
-    Colour Map = Default Colour Map
-    Colour Mode = Variable
-    Colour Scale = Linear
-    Colour Variable = Cp Var
-    Colour Variable Boundary Values = Conservative
-    Contour Level = 1
-    Domain List = /DOMAIN GROUP:All Domains
-    Input File =  
-    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
-    Line Width = 15
-    Location = /ISOSURFACE:Y 0 Plane
-    Max = 0.0
-    Min = 0.0
-    Option = Boundary Intersection
-    Range = Global
-      OBJECT VIEW TRANSFORM:
-      Apply Reflection = Off
-      Apply Rotation = Off
-      Apply Scale = Off
-      Apply Translation = Off
-      Principal Axis = Z
-      Reflection Plane Option = XY Plane
-      Rotation Angle = 0.0 [degree]
-      Rotation Axis From = 0 [m], 0 [m], 0 [m]
-      Rotation Axis To = 0 [m], 0 [m], 0 [m]
-      Rotation Axis Type = Principal Axis
-      Scale Vector = 1 , 1 , 1 
-      Translation Vector = 0 [m], 0 [m], 0 [m]
-      X = 0.0 [m]
-      Y = 0.0 [m]
-      Z = 0.0 [m]
-      END
-    END""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /POLYLINE:Centerline Polyline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /POLYLINE:Centerline Polyline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""CHART:Cp vs X Coord
-    Chart Axes Font = Tahoma, 10, False, False, False, False
-    Chart Axes Titles Font = Tahoma, 10, True, False, False, False
-    Chart Grid Line Width = 1
-    Chart Horizontal Grid = On
-    Chart Legend = On
-    Chart Legend Font = Tahoma, 8, False, False, False, False
-    Chart Legend Inside = Outside Chart
-    Chart Legend Justification = Center
-    Chart Legend Position = Bottom
-    Chart Legend Width Height = 0.2 , 0.4 
-    Chart Legend X Justification = Right
-    Chart Legend XY Position = 0.73 , 0.275 
-    Chart Legend Y Justification = Center
-    Chart Line Width = 2
-    Chart Lines Order = Series 1,Chart Line 1
-    Chart Minor Grid = Off
-    Chart Minor Grid Line Width = 1
-    Chart Symbol Size = 4
-    Chart Title = Cp vs X Coordinate
-    Chart Title Font = Tahoma, 12, True, False, False, False
-    Chart Title Visibility = On
-    Chart Type = XY
-    Chart Vertical Grid = On
-    Chart X Axis Automatic Number Formatting = On
-    Chart X Axis Label = X Axis <units>
-    Chart X Axis Number Format = %10.3e
-    Chart Y Axis Automatic Number Formatting = On
-    Chart Y Axis Label = Y Axis <units>
-    Chart Y Axis Number Format = %10.3e
-    Default Chart X Variable = X
-    Default Chart Y Variable = Cp Var
-    Default Difference Line Calculation = From Points
-    Default Histogram Y Axis Weighting = None
-    Default Time Chart Variable = Pressure
-    Default Time Chart X Expression = Time
-    Default Time Variable Absolute Value = Off
-    Default Time Variable Boundary Values = Conservative
-    Default X Variable Absolute Value = Off
-    Default X Variable Boundary Values = Conservative
-    Default Y Variable Absolute Value = Off
-    Default Y Variable Boundary Values = Conservative
-    FFT Full Input Range = On
-    FFT Max = 0.0
-    FFT Min = 0.0
-    FFT Subtract Mean = Off
-    FFT Window Type = Hanning
-    FFT X Function = Frequency
-    FFT Y Function = Power Spectral Density
-    Histogram Automatic Divisions = Automatic
-    Histogram Divisions = -1.0,1.0
-    Histogram Divisions Count = 10
-    Histogram Y Axis Value = Count
-    Is FFT Chart = Off
-    Max X = 1.0
-    Max Y = 1.0
-    Min X = -1.0
-    Min Y = -1.0
-    Use Data For X Axis Labels = On
-    Use Data For Y Axis Labels = On
-    X Axis Automatic Range = On
-    X Axis Inverted = Off
-    X Axis Logarithmic Scaling = Off
-    Y Axis Automatic Range = On
-    Y Axis Inverted = Off
-    Y Axis Logarithmic Scaling = Off
-      CHART SERIES:Series 1
-      Chart Line Custom Data Selection = Off
-      Chart Line Filename =  
-      Chart Series Type = Regular
-      Location = /POLYLINE:Centerline Polyline
-      Monitor Data Filename =  
-      Monitor Data Source = Case
-      Monitor Data X Variable Absolute Value = Off
-      Monitor Data Y Variable Absolute Value = Off
-      Operating Point Data Case = Case {}
-      Operating Point Data Filename =  
-      Operating Point Data Source = File
-      Series Name = Series 1
-      Time Chart Expression = Time
-      Time Chart Type = Point
-        CHART LINE:Chart Line 1
-        Auto Chart Line Colour = On
-        Auto Chart Symbol Colour = On
-        Chart FFT Line Type = Bars
-        Chart Line Colour = 1.0, 0.0, 0.0
-        Chart Line Style = Automatic
-        Chart Line Type = Lines
-        Chart Line Visibility = On
-        Chart Symbol Colour = 0.0, 1.0, 0.0
-        Chart Symbol Style = Automatic
-        Fill Area = On
-        Fill Area Options = Automatic
-        Is Valid = True
-        Line Name = Series 1
-        Use Automatic Line Naming = On
-        END
-      END
-      OBJECT REPORT OPTIONS:
-          Report Caption = Pressure coefficient along centerline of car by distance along X axis from nose of car
-      END
-    END""".format(simulation.sim_name))
-    results1.SendCommand(Command=">chart print, Chart Name = /CHART:Cp vs X Coord, filename = {}/Cp vs X Coord.png, x size = 2000, y size = 2000, format = png, factor = 1.83074".format(media_dir))
-    results1.SendCommand(Command="> report hideItem=/CHART:Cp vs X Coord")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /WIREFRAME:Wireframe, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.655433
-        Pan = -0.0111499, -0.372659
-        Rotation Quaternion = -0.707107, 0, 0, 0.707107
-        
-      END
+    Returns
+    ---------------------
+    None
+    '''
 
-    END
+    if index==0:
+        flu_dir = "FLU"
+    else:
+        flu_dir = "FLU-{}".format(index)
 
-    > update
-    HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Contour 01 Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(cp_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Pressure Contour 01 Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(pressure_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/TKE Contour 01 Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(tke_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Wall Shear Streamline 01 Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(wallshear_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.512924
-        Pan = 0, 0
-        Rotation Quaternion = -4.32978e-17, 0.707107, 0.707107, 4.32978e-17
-        
-      END
+    wb_files_dir = os.path.join(proj_params.proj_dir, proj_params.proj_name + "_files").replace(os.sep, '/')
 
-    END
+    setup.SendCommand(Command="(rpsetvar 'checkpoint/exit-filename \"{}/dp0/{}/Fluent/exit-fluent\")".format(wb_files_dir, flu_dir))
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.689005
-        Pan = -0.0972085, -0.337592
-        Rotation Quaternion = -4.32978e-17, 0.707107, 0.707107, 4.32978e-17
-        
-      END
+    return
 
-    END
+def autosave_setup(setup, index, proj_params):
+    '''
+    Enables periodic autosave of the data file of an open Fluent setup into its working directory, keeping only the most recent files.
 
-    > update
-    HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Contour 02 Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(cp_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Pressure Contour 02 Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(pressure_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename ={}/TKE Contour 02 Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(tke_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Wall Shear Streamline 02 Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(wallshear_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 1.59745
-        Pan = 0, 0
-        Rotation Quaternion = -0.5, 0.5, 0.5, 0.5
-        
-      END
+    Parameters
+    ---------------------
+    setup : Setup container
+        Fluent setup container of the system being set up.
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
 
-    END
+    Returns
+    ---------------------
+    None
+    '''
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Contour 03 Front.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(cp_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Pressure Contour 03 Front.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(pressure_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/TKE Contour 03 Front.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(tke_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Wall Shear Streamline 03 Front.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(wallshear_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 1.59745
-        Pan = 0, 0
-        Rotation Quaternion = -0.5, -0.5, -0.5, 0.5
-        
-      END
+    setup.SendCommand(Command='/file/auto-save/root-name "{}/autosave"'.format(solve_dir(index, proj_params)))
+    setup.SendCommand(Command="/file/auto-save/data-frequency {}".format(proj_params.autosave_frequency))
+    setup.SendCommand(Command="/file/auto-save/case-frequency if-case-is-modified")
+    setup.SendCommand(Command="/file/auto-save/retain-most-recent-files yes")
+    setup.SendCommand(Command="/file/auto-save/max-files {}".format(proj_params.autosave_kept))
 
-    END
+    return
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Contour 04 Rear.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(cp_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Pressure Contour 04 Rear.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(pressure_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/TKE Contour 04 Rear.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(tke_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Wall Shear Streamline 04 Rear.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(wallshear_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.609706
-        Pan = 0, 0
-        Rotation Quaternion = 0, 0, 0, 1
-        
-      END
+def fluent_sim_resume(sim_list, proj_params):
+    '''
+    Reopens an existing Workbench project and brings each simulation to completion without repeating finished work: simulations never set up are set up, partially solved simulations continue from their newest checkpoint, and solved simulations, including those whose Fluent files were pruned by the retention policy, are left alone. The design point is only updated if a simulation remains to be solved.
 
-    END
+    Parameters
+    ---------------------
+    sim_list : list
+        List containing instances of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.624948
-        Pan = -0.141048, -0.546109
-        Rotation Quaternion = 0, 0, 0, 1
-        
-      END
+    Returns
+    ---------------------
+    None
+    '''
 
-    END
+    proj_directory = proj_params.proj_dir.replace(os.sep, '/')
 
-    > update
-    HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Contour 05 Top.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(cp_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Pressure Contour 05 Top.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(pressure_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/TKE Contour 05 Top.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(tke_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Wall Shear Streamline 05 Top.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(wallshear_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.640572
-        Pan = -0.079174, -0.550776
-        Rotation Quaternion = 1, 4.47035e-08, -6.12324e-17, 1.44757e-24
-        
-      END
+    workbench.Open(FilePath="{}/{}.wbpj".format(proj_directory, proj_params.proj_name))
 
-    END
+    ledger = ledger_load(proj_params)
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Contour 06 Bottom.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(cp_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Pressure Contour 06 Bottom.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(pressure_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/TKE Contour 06 Bottom.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(tke_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Wall Shear Streamline 06 Bottom.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(wallshear_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.640572
-        Pan = -0.079174, -0.550776
-        Rotation Quaternion = 0.611682, -0.00437015, -0.0498028, -0.789522
-        
-      END
+    staging_prefetch(sim_list, proj_params)
 
-    END
+    next_index = 0
+    for sim in sim_list:
+        if (sim.system_index != None) and os.path.isdir(solve_dir(sim.system_index, proj_params)):
+            next_index = max(next_index, sim.system_index + 1)
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.707071
-        Pan = 0.0309811, -0.313254
-        Rotation Quaternion = 0.16889, 0.490153, 0.833347, -0.191657
-        
-      END
+    for sim in sim_list:
+        if ledger_pruned(ledger, sim, proj_params):
+            state = "Pruned"
+        elif ledger_done(ledger, sim, "solve", proj_params):
+            state = "Solved"
+        elif sim.system_index == None:
+            state = "Not Set Up"
+        else:
+            state = solve_state(sim.system_index, proj_params)
+        run_report_write(proj_params, sim.sim_name, "Resume", state)
+        if state == "Not Set Up":
+            if simulation_setup(sim, next_index, sim_list, proj_params):
+                next_index += 1
+        elif state == "Partial":
+            fluent_dir = solve_dir(sim.system_index, proj_params)
+            watchdog = Solver_Watchdog(fluent_dir.replace("_files/dp0/", "_files/progress_files/dp0/") + "/Solution.trn", fluent_dir)
+            if checkpoint_watch(sim, sim.system_index, proj_params, watchdog, latest_data_file(fluent_dir)) == False:
+                run_report_write(proj_params, sim.sim_name, "Killed", watchdog.reason)
+
+    workbench.Save(Overwrite=True)
+    ledger = ledger_load(proj_params)
+    pending = [sim for sim in sim_list if (ledger_done(ledger, sim, "solve", proj_params) == False) and (ledger_pruned(ledger, sim, proj_params) == False)]
+    runtime_report([sim for sim in pending if sim.system_index != None], proj_params)
+    staging_sync(proj_params)
+    if len(pending) > 0:
+        designPoint1 = workbench.GetDesignPoint(Name="0")
+        backgroundSession1 = workbench.UpdateAllDesignPoints(DesignPoints = [designPoint1])
+    return
 
-    END
+def solve_dir(index, proj_params):
+    '''
+    Returns the Fluent working directory of a simulation within the Workbench project files.
+    Int, Project -> Str
 
-    > update
-    HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Contour 07 Top Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(cp_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Pressure Contour 07 Top Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(pressure_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/TKE Contour 07 Top Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(tke_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Wall Shear Streamline 07 Top Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(wallshear_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.656586
-        Pan = 0.154765, -0.404108
-        Rotation Quaternion = -0.466997, 0.0118956, -0.123012, 0.87557
-        
-      END
+    Parameters
+    ---------------------
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
 
-    END
+    Returns
+    ---------------------
+    fluent_dir : str
+        Path to the Fluent working directory of the simulation.
+    '''
 
-    VIEW:View 1
-      Light Angle = 90.0881, 104.046
-    END
+    if index==0:
+        flu_dir = "FLU"
+    else:
+        flu_dir = "FLU-{}".format(index)
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Contour 08 Top Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(cp_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Pressure Contour 08 Top Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(pressure_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/TKE Contour 08 Top Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(tke_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Wall Shear Streamline 08 Top Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(wallshear_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.671819
-        Pan = 0.00328224, -0.331506
-        Rotation Quaternion = -0.863355, 0.0798891, -0.128229, 0.481439
-        
-      END
+    wb_files_dir = os.path.join(proj_params.proj_dir, proj_params.proj_name + "_files").replace(os.sep, '/')
 
-    END
+    return("{}/dp0/{}/Fluent".format(wb_files_dir, flu_dir))
 
-    VIEW:View 1
-      Light Angle = 126.207, 83.4066
-    END
+def solve_state(index, proj_params):
+    '''
+    Determines how far a simulation of an existing Workbench project has progressed.
+    Int, Project -> Str
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.671819
-        Pan = -0.0328224, -0.246168
-        Rotation Quaternion = -0.866455, 0.0319442, -0.101365, 0.487802
-        
-      END
+    Parameters
+    ---------------------
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
 
-    END
+    Returns
+    ---------------------
+    state : str
+        "Not Set Up" if the simulation has no Fluent directory, "Solved" if it converged, reached the maximum number of iterations or was aborted, "Partial" if it stopped part-way with a checkpoint, and "Set Up" otherwise.
+    '''
 
-    > update
-    HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Contour 09 Bottom Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(cp_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Pressure Contour 09 Bottom Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(pressure_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/TKE Contour 09 Bottom Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(tke_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="> autolegend plot=/STREAMLINE:Wall Shear Streamline, view=VIEW:View 1")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Wall Shear Streamline 09 Bottom Left.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(wallshear_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.671819
-        Pan = -0.0328224, -0.246168
-        Rotation Quaternion = -0.0665846, -0.813088, -0.53828, 0.211405
-        
-      END
+    fluent_dir = solve_dir(index, proj_params)
 
-    END
+    if os.path.isdir(fluent_dir) == False:
+        return("Not Set Up")
 
-    VIEW:View 1
-      Light Angle = 95.0494, 82.0174
-    END
+    if os.path.isfile("{}/minerva-abort.txt".format(fluent_dir)):
+        return("Solved")
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.671819
-        Pan = -0.0328224, -0.246168
-        Rotation Quaternion = -0.0149095, -0.854263, -0.494958, 0.15814
-        
-      END
+    transcript = fluent_dir.replace("/dp0/", "/progress_files/dp0/") + "/Solution.trn"
+    if os.path.isfile(transcript):
+        with open(transcript, 'r') as status_file:
+            if "solution is converged" in status_file.read():
+                return("Solved")
 
-    END
+    rfile_path = "{}/drag-rfile.out".format(fluent_dir)
+    if os.path.isfile(rfile_path):
+        (iterations, histories) = monitor_history_read(rfile_path)
+        if (len(iterations) > 0) and (iterations[-1] >= proj_params.max_iterations):
+            return("Solved")
 
-    VIEW:View 1
-      Light Angle = 89.0957, 75.2699
-    END
+    if latest_data_file(fluent_dir) != None:
+        return("Partial")
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Contour 10 Bottom Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(cp_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Pressure Contour 10 Bottom Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(pressure_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/TKE Contour 10 Bottom Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(tke_dir))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Wall Shear Streamline 10 Bottom Right.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(wallshear_dir))
-    results1.SendCommand(Command="> report showItem=/CHART:Cp vs X Coord")
-    results1.SendCommand(Command="""EXPORT:
-     Export File = {}/Cp vs X Coord.csv
-     Export Chart Name = Cp vs X Coord
-     Overwrite = On
-    END
-    >export chart""".format(media_dir))
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.512924
-        Pan = 0, 0
-        Rotation Quaternion = -0.707107, 0, 0, 0.707107
-        
-      END
+    return("Set Up")
 
-    END
+def checkpoint_prune(fluent_dir, kept):
+    '''
+    Deletes all but the most recent autosaved data files, and their case files, of a Fluent working directory.
 
-    > update
-    # Sending visibility action from ViewUtilities
-    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /DATA READER/CASE:Case {}/BOUNDARY:car, view=/VIEW:View 1""".format(simulation.sim_name))
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /POLYLINE:Centerline Polyline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.656586
-        Pan = 0.0997342, -0.360136
-        Rotation Quaternion = -0.707107, 0, 0, 0.707107
-        
-      END
+    Parameters
+    ---------------------
+    fluent_dir : str
+        Path to the Fluent working directory of the simulation.
+    kept : int
+        Number of most recent autosaved data files to keep.
 
-    END
+    Returns
+    ---------------------
+    None
+    '''
 
-    > update
-    HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Centerline Polyline.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(media_dir))
-    results1.SendCommand(Command=">setPreferences Viewer Background Colour Type = Solid, Viewer Background Image File =  , Viewer Background Colour = 0&0&0, Global Text Colour = 1&1&1")
-    results1.SendCommand(Command="""HARDCOPY:
-    Antialiasing = On
-    Hardcopy Filename = {}/Cp Centerline Polyline Black.png
-    Hardcopy Format = png
-    Hardcopy Tolerance = 0.0001
-    Image Height = 4000
-    Image Scale = 100
-    Image Width = 8000
-    JPEG Image Quality = 80
-    Screen Capture = Off
-    Use Screen Size = Off
-    White Background = Off
-    END
-    >print""".format(media_dir))
-    results1.SendCommand(Command=">setPreferences Viewer Background Type = Colour, Viewer Background Colour Type = Top-Bottom Gradient, Viewer Background Colour = 0.42&0.55&0.871, Viewer Background Colour 2 = 1&1&1, Global Text Colour = 0&0&0, Global Edge Colour = 0&0&0")
-    results1.Exit()
+    checkpoints = []
 
-    return
+    for file_name in os.listdir(fluent_dir):
+        if file_name.startswith("autosave") and (".dat" in file_name):
+            checkpoints.append("{}/{}".format(fluent_dir, file_name))
 
-def post_streamlines_fb(simulation, index, proj_params):
-    if index==0:
-        module = "Post"
-    else:
-        module = "Post {}".format(index)
+    checkpoints.sort(key = os.path.getmtime, reverse = True)
 
-    sim_path = os.path.join(proj_params.results_dir, simulation.sim_name)
-    media_dir = os.path.join(sim_path, "Media Files")
-    animate_dir = os.path.join(media_dir, "Streamline Animations")
-    
-    system1 = GetSystem(Name=module)
-    results1 = system1.GetContainer(ComponentName="Results")
-    results1.Edit()
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >hide /POLYLINE:Centerline Polyline, view=/VIEW:View 1""")
-    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
-    >show /DATA READER/CASE:Case {}/BOUNDARY:car, view=/VIEW:View 1""".format(simulation.sim_name))
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 2.45395, 0, 0.584167
-        Scale = 0.656586
-        Pan = 0.0997342, -0.360136
-        Rotation Quaternion = -0.555856, 0.2474, 0.348336, 0.713069
-        
-      END
+    for data_path in checkpoints[kept:]:
+        os.remove(data_path)
+        case_path = data_path.replace(".dat", ".cas")
+        if os.path.isfile(case_path):
+            os.remove(case_path)
 
-    END
+    return
 
-    VIEW:View 1
-      Light Angle = 101.003, 125.876
-    END
+def checkpoint_continue(index, proj_params, data_path):
+    '''
+    Opens a simulation in Fluent and iterates up to the maximum number of iterations, continuing from a checkpoint data file or from a fresh initialization if none is given.
 
-    > update
-    > autolegend plot=/ISOSURFACE:Isosurface Y 0, view=VIEW:View 1""")
-    results1.SendCommand(Command="""ISOSURFACE:Isosurface Y 0
-    Apply Instancing Transform = On
-    Apply Texture = Off
+    Parameters
+    ---------------------
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    data_path : str
+        Path to the data file to continue from, or None.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if index==0:
+        module = "FLU"
+    else:
+        module = "FLU {}".format(index)
+
+    system1 = workbench.GetSystem(Name=module)
+    solution1 = system1.GetContainer(ComponentName="Solution")
+    solution1.Edit()
+    setup1 = system1.GetContainer(ComponentName="Setup")
+    if data_path == None:
+        setup1.SendCommand(Command="/solve/initialize/initialize-flow yes")
+        iterations = proj_params.max_iterations
+    else:
+        checkpoint_prune(os.path.dirname(data_path), proj_params.autosave_kept)
+        setup1.SendCommand(Command='/file/read-data "{}"'.format(data_path))
+        iterations = max(proj_params.max_iterations - data_file_iteration(data_path), 1)
+    setup1.SendCommand(Command="/solve/iterate {}".format(iterations))
+    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "MenuBar*FileMenu*Close Fluent")')
+
+    return
+
+def completion_status(sim_list, proj_params):
+    '''
+    Detects if entire workbench project has finished running simulations.
+
+    Parameters
+    ---------------------
+    sim_list : List 
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    ledger = ledger_load(proj_params)
+    if [sim for sim in sim_list if (ledger_done(ledger, sim, "solve", proj_params) == False) and (ledger_pruned(ledger, sim, proj_params) == False)] == []:
+        return
+
+    wb_files_dir = os.path.join(proj_params.proj_dir, proj_params.proj_name + "_files")
+
+    systems = solver_systems(sim_list)
+
+    last_sim_index = len(systems)-1
+
+    if last_sim_index < 0:
+        return
+
+    if last_sim_index == 0:
+        flu_dir = "FLU"
+    else:
+        flu_dir = "FLU-{}".format(last_sim_index)
+
+    last_sim_dir = os.path.join(wb_files_dir, "progress_files", "dp0", flu_dir, "Fluent", "Solution.trn")
+
+    monitors = []
+    watchdogs = []
+    for i in range(len(systems)):
+        if i==0:
+            monitor_dir = "FLU"
+        else:
+            monitor_dir = "FLU-{}".format(i)
+        transcript = "{}/progress_files/dp0/{}/Fluent/Solution.trn".format(wb_files_dir.replace(os.sep, '/'), monitor_dir)
+        monitors.append(Transcript_Monitor(transcript, proj_params.blowup_factor, proj_params.reversed_flow_fraction, proj_params.reversed_flow_window))
+        watchdogs.append(Solver_Watchdog(transcript, "{}/dp0/{}/Fluent".format(wb_files_dir.replace(os.sep, '/'), monitor_dir), solver_budget(systems[i], proj_params)))
+
+    if solver_monitor(monitors, watchdogs, systems, list(range(len(systems))), proj_params, lambda: os.path.isfile(last_sim_dir) == False, runtime_model(proj_params)):
+        run_report_write(proj_params, "", "Watchdog", "No simulation active for {} minutes, stopped waiting".format(proj_params.stall_timeout))
+
+    ledger = ledger_load(proj_params)
+
+    for i in range(len(watchdogs)):
+        solver_restart(systems[i], i, proj_params, watchdogs[i])
+        ended = transcript_ended(watchdogs[i].transcript, proj_params) or os.path.isfile("{}/minerva-abort.txt".format(watchdogs[i].fluent_dir))
+        if ended and (ledger_done(ledger, systems[i], "solve", proj_params) == False):
+            ledger_record(proj_params, systems[i], "solve")
+            runtime_record(systems[i], i, proj_params, proj_params.processes)
+
+    staging_sync(proj_params)
+    
+    return
+
+def solver_systems(sim_list):
+    '''
+    Returns the simulations which have a Fluent system in the Workbench project, ordered such that the position of each simulation is the index of its Fluent system.
+    List -> List
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+
+    Returns
+    ---------------------
+    systems : List
+        List containing the Simulation objects with a Fluent system.
+    '''
+
+    systems = [simulation for simulation in sim_list if simulation.system_index != None]
+    systems.sort(key = lambda simulation: simulation.system_index)
+
+    return(systems)
+
+def mesh_path(simulation):
+    '''
+    Returns the path of the .CAS file of a simulation, whichever of the .cas, .cas.gz and .cas.h5 extensions it has.
+    Simulation -> Str
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+
+    Returns
+    ---------------------
+    cas_path : str
+        Path to the .CAS file, or None if it cannot be found.
+    '''
+
+    for extension in [".cas", ".cas.gz", ".cas.h5"]:
+        cas_path = os.path.join(simulation.mesh.CAS_dir, simulation.mesh.CAS_name + extension)
+        if os.path.isfile(cas_path):
+            return(cas_path)
+
+    return(None)
+
+def mesh_size(simulation):
+    '''
+    Returns the size of the .CAS file of a simulation, used to scale its wall-clock budget.
+    Simulation -> Int
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+
+    Returns
+    ---------------------
+    size : int
+        Size of the .CAS file in bytes, or 0 if it cannot be found.
+    '''
+
+    cas_path = mesh_path(simulation)
+
+    if cas_path == None:
+        return(0)
+
+    return(os.path.getsize(cas_path))
+
+def mesh_cells(simulation):
+    '''
+    Returns the number of cells of the mesh of a simulation, read from the cell declaration near the start of its .CAS file, or estimated from the size of the file if the declaration cannot be read.
+    Simulation -> Int
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+
+    Returns
+    ---------------------
+    cells : int
+        Number of cells, or 0 if the .CAS file cannot be found.
+    '''
+
+    cas_path = mesh_path(simulation)
+
+    if cas_path == None:
+        return(0)
+
+    with open(cas_path, 'rb') as cas_file:
+        header = cas_file.read(64 * 1024).decode("latin-1")
+
+    match = re.search("\\(12 \\(0 ([0-9a-fA-F]+) ([0-9a-fA-F]+) 0", header)
+    if match != None:
+        return(int(match.group(2), 16) - int(match.group(1), 16) + 1)
+
+    return(os.path.getsize(cas_path) // 250)
+
+def transcript_timing(transcript):
+    '''
+    Reads the progress of a Fluent transcript: the latest iteration, and the seconds per iteration from the estimated time remaining which Fluent prints with the iterations remaining on every residual line.
+    Str -> Tuple
+
+    Parameters
+    ---------------------
+    transcript : str
+        Path to the Solution.trn transcript.
+
+    Returns
+    ---------------------
+    iteration : int
+        Latest iteration, or 0 if none has been written.
+    seconds_per_iteration : float
+        Median seconds per iteration, or None if Fluent has not estimated it.
+    finished : bool
+        Boolean variable indicating whether the transcript shows that the solve has ended.
+    '''
+
+    iteration = 0
+    rates = []
+    finished = False
+
+    if os.path.isfile(transcript) == False:
+        return(iteration, None, finished)
+
+    with open(transcript, 'r') as transcript_file:
+        for line in transcript_file:
+            entries = line.split()
+            if (len(entries) > 3) and entries[0].isdigit() and entries[-1].isdigit() and (re.match("^\\d+:\\d\\d:\\d\\d$", entries[-2]) != None):
+                iteration = int(entries[0])
+                remaining = int(entries[-1])
+                (hours, minutes, seconds) = [int(part) for part in entries[-2].split(":")]
+                if remaining > 0:
+                    rates.append((3600 * hours + 60 * minutes + seconds) / float(remaining))
+            elif ("solution is converged" in line) or ("Divergence detected" in line) or line.startswith("Error"):
+                finished = True
+
+    if len(rates) == 0:
+        return(iteration, None, finished)
+
+    rates.sort()
+
+    return(iteration, rates[len(rates) // 2], finished)
+
+def runtime_history_path(proj_params):
+    '''
+    Returns the path to the runtime history, which is kept in the result cache directory so that it is shared by every project using the cache, or in the results directory of the project otherwise.
+    Project -> Str
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    path : str
+        Path to the append-only JSON runtime history.
+    '''
+
+    if proj_params.cache_dir != None:
+        return(os.path.join(proj_params.cache_dir, "Runtime History.jsonl"))
+
+    return(os.path.join(proj_params.results_dir, "{} Runtime History.jsonl".format(proj_params.proj_name)))
+
+def runtime_record(simulation, index, proj_params, processes, wall_seconds = None):
+    '''
+    Appends the runtime of a solved simulation to the runtime history: its cells, body type, solution method and processes, and the iterations, seconds per iteration and wall-clock time of the solve.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    index : int
+        Index of the Fluent working directory of the simulation.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    processes : int
+        Number of Fluent processes the simulation was solved with.
+    wall_seconds : float
+        Measured wall-clock time of the solve, or None to estimate it from the transcript.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    fluent_dir = solve_dir(index, proj_params)
+    transcript = fluent_dir.replace("_files/dp0/", "_files/progress_files/dp0/") + "/Solution.trn"
+    (iteration, seconds_per_iteration, finished) = transcript_timing(transcript)
+
+    rfile_path = "{}/drag-rfile.out".format(fluent_dir)
+    if os.path.isfile(rfile_path):
+        iteration = len(monitor_history_read(rfile_path)[0])
+
+    if iteration == 0:
+        return
+
+    if (wall_seconds != None) and (seconds_per_iteration == None):
+        seconds_per_iteration = wall_seconds / float(iteration)
+    if seconds_per_iteration == None:
+        return
+    if wall_seconds == None:
+        wall_seconds = seconds_per_iteration * iteration
+
+    converged = False
+    if os.path.isfile(transcript):
+        with open(transcript, 'r') as transcript_file:
+            converged = "solution is converged" in transcript_file.read()
+
+    sample = {"time": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), "project": proj_params.proj_name, "simulation": simulation.sim_name, "cells": mesh_cells(simulation),
+              "body_size": simulation.mesh.body_size, "sol_method": solution_method(simulation), "processes": int(processes), "iterations": iteration,
+              "converged": converged, "seconds_per_iteration": seconds_per_iteration, "wall_seconds": wall_seconds}
+
+    history_path = runtime_history_path(proj_params)
+    if os.path.exists(os.path.dirname(history_path)) == False:
+        os.makedirs(os.path.dirname(history_path))
+
+    with open(history_path, 'a') as history_file:
+        history_file.write(json.dumps(sample) + "\n")
+
+    return
+
+def runtime_model(proj_params):
+    '''
+    Fits a runtime model to the runtime history by least squares. With no history, a rule of thumb of 0.5 s plus 1.5 s per million cells per process per iteration is used, and each simulation is expected to run to the maximum number of iterations.
+    Project -> Runtime_Model
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    model : Runtime_Model object
+        Instance of Runtime_Model class.
+    '''
+
+    samples = []
+    history_path = runtime_history_path(proj_params)
+
+    if os.path.isfile(history_path):
+        with open(history_path, 'r') as history_file:
+            for line in history_file:
+                try:
+                    sample = json.loads(line)
+                except ValueError:
+                    continue
+                if (sample.get("cells", 0) > 0) and (sample.get("processes", 0) > 0):
+                    samples.append(sample)
+
+    model = Runtime_Model(samples = len(samples))
+
+    if len(samples) == 0:
+        return(model)
+
+    loads = [sample["cells"] / 1.0e6 / sample["processes"] for sample in samples]
+    rates = [sample["seconds_per_iteration"] for sample in samples]
+    mean_load = sum(loads) / len(loads)
+    mean_rate = sum(rates) / len(rates)
+    spread = sum([(load - mean_load) ** 2 for load in loads])
+
+    if spread > 0:
+        model.slope = sum([(loads[i] - mean_load) * (rates[i] - mean_rate) for i in range(len(samples))]) / spread
+        model.intercept = mean_rate - model.slope * mean_load
+    if (spread == 0) or (model.slope <= 0) or (model.intercept < 0):
+        model.intercept = 0.0
+        model.slope = sum(rates) / max(sum(loads), 1e-9)
+
+    for method in set([sample["sol_method"] for sample in samples]):
+        ratios = sorted([rates[i] / (model.intercept + model.slope * loads[i]) for i in range(len(samples)) if samples[i]["sol_method"] == method])
+        model.method_factors[method] = ratios[len(ratios) // 2]
+
+    for key in set(["{} {}".format(sample["body_size"], sample["sol_method"]) for sample in samples if sample["converged"]]):
+        counts = sorted([sample["iterations"] for sample in samples if sample["converged"] and ("{} {}".format(sample["body_size"], sample["sol_method"]) == key)])
+        model.iterations[key] = counts[len(counts) // 2]
+
+    return(model)
+
+def runtime_predict(model, simulation, proj_params, processes = None):
+    '''
+    Predicts the iterations and wall-clock time of a simulation with a runtime model.
+    Runtime_Model, Simulation, Project -> Tuple
+
+    Parameters
+    ---------------------
+    model : Runtime_Model object
+        Instance of Runtime_Model class.
+    simulation : Simulation object
+        Instance of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    processes : int
+        Number of Fluent processes, or None for the processes of the project.
+
+    Returns
+    ---------------------
+    iterations : int
+        Predicted iterations to convergence.
+    seconds_per_iteration : float
+        Predicted seconds per iteration.
+    seconds : float
+        Predicted wall-clock time of the solve.
+    '''
+
+    if processes == None:
+        processes = proj_params.processes
+
+    method = solution_method(simulation)
+    load = mesh_cells(simulation) / 1.0e6 / max(int(processes), 1)
+    seconds_per_iteration = (model.intercept + model.slope * load) * model.method_factors.get(method, 1.0)
+
+    iterations = model.iterations.get("{} {}".format(simulation.mesh.body_size, method), proj_params.max_iterations)
+    iterations = min(max(iterations, proj_params.min_iterations), proj_params.max_iterations)
+
+    return(iterations, seconds_per_iteration, iterations * seconds_per_iteration)
+
+def runtime_order(runs, proj_params, policy = "SJF"):
+    '''
+    Orders simulations for solving by their predicted runtime: shortest job first, which finishes the most simulations soonest, or longest job first, which packs concurrent solves into the shortest batch.
+
+    Parameters
+    ---------------------
+    runs : List
+        List of Simulation objects, or of tuples whose first item is a Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    policy : str
+        Either "SJF" for shortest job first, "LPT" for longest job first, or "CSV" to keep the order of the CSV file.
+
+    Returns
+    ---------------------
+    ordered : List
+        List of the runs in the order in which they are solved.
+    '''
+
+    if policy == "CSV":
+        return(list(runs))
+
+    model = runtime_model(proj_params)
+
+    def predicted(run):
+        if isinstance(run, tuple):
+            run = run[0]
+        return(runtime_predict(model, run, proj_params)[2])
+
+    return(sorted(runs, key = predicted, reverse = (policy == "LPT")))
+
+def runtime_report(sim_list, proj_params, concurrent = 1, processes = None):
+    '''
+    Writes the predicted runtime of every simulation which is not yet solved and the estimated finish of the batch to the run report before the simulations are launched. Concurrent solves are packed longest first onto the solver slots.
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects to be solved.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    concurrent : int
+        Number of simulations solved at once.
+    processes : int
+        Number of Fluent processes of each simulation, or None for the processes of the project.
+
+    Returns
+    ---------------------
+    batch_seconds : float
+        Predicted wall-clock time of the batch.
+    '''
+
+    if len(sim_list) == 0:
+        return(0.0)
+
+    model = runtime_model(proj_params)
+    slots = [0.0] * max(int(concurrent), 1)
+    predictions = []
+
+    for simulation in sim_list:
+        (iterations, seconds_per_iteration, seconds) = runtime_predict(model, simulation, proj_params, processes)
+        predictions.append(seconds)
+        run_report_write(proj_params, simulation.sim_name, "Runtime Prediction", "{} iterations at {:.1f} s per iteration: {:.0f} min".format(iterations, seconds_per_iteration, seconds / 60))
+
+    for seconds in sorted(predictions, reverse = True):
+        slots[slots.index(min(slots))] += seconds
+
+    batch_seconds = max(slots)
+    finish = datetime.fromtimestamp(time.time() + batch_seconds).strftime("%Y-%m-%d %H:%M")
+    run_report_write(proj_params, "", "Batch ETA", "{} simulations, {} at once: {:.1f} h, finishing around {} (model fitted to {} solves)".format(len(sim_list), len(slots), batch_seconds / 3600, finish, model.samples))
+
+    return(batch_seconds)
+
+def runtime_eta_write(sim_list, proj_params, model):
+    '''
+    Writes the live estimated finish of each simulation and of the batch to the ETA CSV of the project in the results directory, from the progress of each transcript: simulations which are running are expected to reach their predicted iterations at the rate Fluent reports, and simulations which have not started at their predicted rate. Simulations are assumed to be solved one after another, or as many at once as are running.
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects with Fluent systems.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    model : Runtime_Model object
+        Instance of Runtime_Model class.
+
+    Returns
+    ---------------------
+    remaining : float
+        Estimated seconds until the batch is finished.
+    '''
+
+    rows = []
+    waiting = 0.0
+    running = []
+
+    for simulation in sim_list:
+        if simulation.system_index == None:
+            continue
+        transcript = solve_dir(simulation.system_index, proj_params).replace("_files/dp0/", "_files/progress_files/dp0/") + "/Solution.trn"
+        (iterations, seconds_per_iteration, seconds) = runtime_predict(model, simulation, proj_params)
+        (iteration, rate, finished) = transcript_timing(transcript)
+        if finished or (iteration >= proj_params.max_iterations):
+            rows.append([simulation.sim_name, "Finished", iteration, iterations, 0.0])
+            continue
+        if os.path.isfile(transcript) == False:
+            waiting += seconds
+            rows.append([simulation.sim_name, "Waiting", 0, iterations, seconds])
+            continue
+        if rate == None:
+            rate = seconds_per_iteration
+        left = max(iterations - iteration, 0) * rate
+        running.append(left)
+        rows.append([simulation.sim_name, "Running", iteration, iterations, left])
+
+    remaining = max(running + [0.0]) + waiting / max(len(running), 1)
+
+    eta_path = os.path.join(proj_params.results_dir, "{} ETA.csv".format(proj_params.proj_name))
+    with open(eta_path, 'w') as eta_file:
+        eta_file.write("Simulation Name,Status,Iteration,Predicted Iterations,Remaining [min],Estimated Finish\n")
+        for row in rows + [["Batch", "", "", "", remaining]]:
+            row.append(datetime.fromtimestamp(time.time() + row[4]).strftime("%Y-%m-%d %H:%M"))
+            row[4] = "{:.1f}".format(row[4] / 60)
+            eta_file.write(",".join(["{}".format(entry) for entry in row]) + "\n")
+
+    return(remaining)
+
+def solver_monitor(monitors, watchdogs, sim_list, indices, proj_params, waiting, model = None):
+    '''
+    Watches running simulations every minute until they are no longer waited for: their transcripts are scanned for divergence by divergence_monitor, and their liveness and wall-clock budgets are tracked by solver_watchdog. Used both for the first attempt of every simulation and for each restart.
+
+    Parameters
+    ---------------------
+    monitors : List
+        List containing a Transcript_Monitor object for each simulation.
+    watchdogs : List
+        List containing a Solver_Watchdog object for each simulation.
+    sim_list : List
+        List containing the Simulation objects watched.
+    indices : List
+        List containing the index of the Fluent system of each simulation.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    waiting : function
+        Function of no arguments returning whether the simulations are still waited for.
+    model : Runtime_Model object
+        Instance of Runtime_Model class with which the ETA CSV is updated, or None.
+
+    Returns
+    ---------------------
+    stalled : bool
+        Boolean variable indicating whether waiting stopped because no simulation was active for the stall timeout.
+    '''
+
+    last_activity = time.time()
+
+    while waiting():
+        if model != None:
+            runtime_eta_write(sim_list, proj_params, model)
+        divergence_monitor(monitors, proj_params, indices)
+        if solver_watchdog(watchdogs, sim_list, proj_params):
+            last_activity = time.time()
+        elif time.time() - last_activity > 60 * proj_params.stall_timeout:
+            return(True)
+        for second in range(60):
+            if waiting() == False:
+                break
+            time.sleep(1)
+
+    return(False)
+
+def solver_budget(simulation, proj_params, transcript = None, iterations = None):
+    '''
+    Returns the wall-clock budget of a solve. A solve continuing a simulation whose transcript shows its seconds per iteration is given twice the time its remaining iterations take at that rate. Otherwise the budget is scaled with the size of the .CAS file, and a simulation whose .CAS file cannot be found is given the budget of a 100 MB .CAS file. The budget is never shorter than the stall timeout.
+    Simulation, Project -> Float
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    transcript : str
+        Path to the transcript of an earlier attempt of the simulation, or None.
+    iterations : int
+        Number of iterations of the solve, or None for the maximum number of iterations.
+
+    Returns
+    ---------------------
+    budget : float
+        Wall-clock budget in seconds.
+    '''
+
+    if iterations == None:
+        iterations = proj_params.max_iterations
+
+    if transcript != None:
+        seconds_per_iteration = transcript_timing(transcript)[1]
+        if seconds_per_iteration != None:
+            return(60 * max(proj_params.stall_timeout, 2 * iterations * seconds_per_iteration / 60.0))
+
+    size = mesh_size(simulation)
+    if size == 0:
+        size = 100 * 1024 ** 2
+
+    return(60 * max(proj_params.stall_timeout, proj_params.budget_rate * size / (100 * 1024 ** 2)))
+
+def transcript_ended(transcript, proj_params, offset = 0):
+    '''
+    Checks whether the text of a transcript after the given offset shows that a solve ended: it converged, was stopped by divergence or an error, or reached the maximum number of iterations.
+    Str, Project -> Bool
+
+    Parameters
+    ---------------------
+    transcript : str
+        Path to the Solution.trn transcript.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    offset : int
+        Number of bytes of the transcript written before the solve.
+
+    Returns
+    ---------------------
+    ended : bool
+        Boolean variable indicating whether the solve ended.
+    '''
+
+    if os.path.isfile(transcript) == False:
+        return(False)
+
+    if os.path.getsize(transcript) < offset:
+        offset = 0
+
+    with open(transcript, 'rb') as transcript_file:
+        transcript_file.seek(offset)
+        text = transcript_file.read().decode("utf-8", "replace")
+
+    iteration = 0
+
+    for line in text.split("\n"):
+        entries = line.split()
+        if ("solution is converged" in line) or ("Divergence detected" in line) or line.startswith("Error"):
+            return(True)
+        if (len(entries) > 3) and entries[0].isdigit() and entries[-1].isdigit() and (re.match("^\\d+:\\d\\d:\\d\\d$", entries[-2]) != None):
+            iteration = max(iteration, int(entries[0]))
+
+    return(iteration >= proj_params.max_iterations)
+
+def checkpoint_watch(simulation, index, proj_params, watchdog, data_path):
+    '''
+    Continues a simulation with checkpoint_continue in a background thread, watched by solver_monitor as on its first attempt, such that a continuation which hangs is killed once it stalls or exceeds its budget instead of blocking the journal. The budget is taken from the rate of the earlier attempt where its transcript shows one.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    watchdog : Solver_Watchdog object
+        Instance of Solver_Watchdog object of the simulation, whose status is set to "Finished" or "Killed".
+    data_path : str
+        Path to the data file to continue from, or None.
+
+    Returns
+    ---------------------
+    finished : bool
+        Boolean variable indicating whether the transcript shows that the continuation ended.
+    '''
+
+    offset = 0
+    if os.path.isfile(watchdog.transcript):
+        offset = os.path.getsize(watchdog.transcript)
+
+    iterations = proj_params.max_iterations
+    if data_path != None:
+        iterations = max(proj_params.max_iterations - data_file_iteration(data_path), 1)
+
+    watchdog.budget = solver_budget(simulation, proj_params, watchdog.transcript, iterations)
+    watchdog.status = "Waiting"
+    watchdog.reason = None
+    watchdog.last_size = offset
+
+    monitor = Transcript_Monitor(watchdog.transcript, proj_params.blowup_factor, proj_params.reversed_flow_fraction, proj_params.reversed_flow_window)
+    monitor.offset = offset
+    errors = []
+
+    def run():
+        try:
+            checkpoint_continue(index, proj_params, data_path)
+        except Exception as error:
+            errors.append("{}".format(error))
+
+    thread = threading.Thread(target = run)
+    thread.daemon = True
+    thread.start()
+
+    if solver_monitor([monitor], [watchdog], [simulation], [index], proj_params, lambda: (watchdog.status != "Killed") and thread.is_alive()):
+        watchdog.status = "Killed"
+        watchdog.reason = "Fluent not active for {} minutes".format(proj_params.stall_timeout)
+
+    if watchdog.status == "Killed":
+        thread.join(60 * proj_params.stall_timeout)
+        return(False)
+
+    if (monitor.reason != None) or transcript_ended(watchdog.transcript, proj_params, offset):
+        watchdog.status = "Finished"
+        return(True)
+
+    watchdog.status = "Killed"
+    watchdog.reason = "Continuation ended before the solution finished"
+    if len(errors) > 0:
+        watchdog.reason = "Continuation failed: {}".format(errors[0])
+
+    return(False)
+
+def solver_watchdog(watchdogs, sim_list, proj_params):
+    '''
+    Tracks transcript growth and process liveness of every simulation and kills those that have stalled, died or exceeded their wall-clock budget.
+
+    Parameters
+    ---------------------
+    watchdogs : List
+        List containing a Solver_Watchdog object for each simulation, in simulation order.
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    active : bool
+        Boolean variable indicating whether any simulation is running.
+    '''
+
+    now = time.time()
+    active = False
+
+    for i in range(len(watchdogs)):
+        watchdog = watchdogs[i]
+        processes = fluent_processes(watchdog.fluent_dir)
+
+        if len(processes) == 0:
+            if watchdog.status == "Running":
+                watchdog.status = "Finished"
+                run_report_write(proj_params, sim_list[i].sim_name, "Finished", "Solver exited after {:.0f} s".format(now - watchdog.start_time))
+            continue
+
+        active = True
+
+        if watchdog.status != "Running":
+            watchdog.status = "Running"
+            watchdog.start_time = now
+            watchdog.last_growth = now
+            run_report_write(proj_params, sim_list[i].sim_name, "Started", "Wall-clock budget {:.0f} s".format(watchdog.budget))
+
+        if os.path.isfile(watchdog.transcript) and (os.path.getsize(watchdog.transcript) != watchdog.last_size):
+            watchdog.last_size = os.path.getsize(watchdog.transcript)
+            watchdog.last_growth = now
+
+        reason = None
+        if [pid for (cleanup, pid) in processes if process_alive(pid)] == []:
+            reason = "Solver process died"
+        elif now - watchdog.last_growth > 60 * proj_params.stall_timeout:
+            reason = "Transcript stalled for {} minutes".format(proj_params.stall_timeout)
+        elif now - watchdog.start_time > watchdog.budget:
+            reason = "Wall-clock budget of {:.0f} s exceeded".format(watchdog.budget)
+
+        if reason != None:
+            for (cleanup, pid) in processes:
+                solver_kill(cleanup)
+            watchdog.status = "Killed"
+            watchdog.reason = reason
+            run_report_write(proj_params, sim_list[i].sim_name, "Killed", reason)
+
+    return(active)
+
+def fluent_processes(fluent_dir):
+    '''
+    Finds the Fluent sessions running in a working directory from the cleanup scripts Fluent writes on start-up and removes on exit.
+    Str -> List
+
+    Parameters
+    ---------------------
+    fluent_dir : str
+        Path to the Fluent working directory of the simulation.
+
+    Returns
+    ---------------------
+    processes : list
+        List containing a tuple of the cleanup script path and host process ID of each running Fluent session.
+    '''
+
+    processes = []
+
+    if os.path.isdir(fluent_dir) == False:
+        return(processes)
+
+    for file_name in os.listdir(fluent_dir):
+        match = re.match("cleanup-fluent-.*-(\\d+)\\.(bat|sh)$", file_name)
+        if match:
+            processes.append(("{}/{}".format(fluent_dir, file_name), int(match.group(1))))
+
+    return(processes)
+
+def process_alive(pid):
+    '''
+    Checks whether a process with a given process ID is running on this machine.
+    Int -> Bool
+
+    Parameters
+    ---------------------
+    pid : int
+        Process ID.
+
+    Returns
+    ---------------------
+    alive : bool
+        Boolean variable indicating whether the process is running.
+    '''
+
+    if os.name == "nt":
+        tasks = os.popen('tasklist /FI "PID eq {}" /NH'.format(pid)).read()
+        return(str(pid) in tasks)
+
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return(False)
+
+    return(True)
+
+def solver_kill(cleanup_path):
+    '''
+    Kills every process of a Fluent session by running the cleanup script Fluent wrote for it.
+
+    Parameters
+    ---------------------
+    cleanup_path : str
+        Path to the cleanup-fluent script of the session.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if os.name == "nt":
+        os.system('"{}"'.format(cleanup_path.replace('/', os.sep)))
+    else:
+        os.system('sh "{}"'.format(cleanup_path))
+
+    if os.path.isfile(cleanup_path):
+        os.remove(cleanup_path)
+
+    return
+
+def latest_data_file(fluent_dir):
+    '''
+    Finds the most recently written Fluent data file in a working directory.
+    Str -> Str
+
+    Parameters
+    ---------------------
+    fluent_dir : str
+        Path to the Fluent working directory of the simulation.
+
+    Returns
+    ---------------------
+    data_path : str
+        Path to the newest .dat, .dat.gz or .dat.h5 file, or None if there is none.
+    '''
+
+    data_path = None
+
+    if os.path.isdir(fluent_dir) == False:
+        return(data_path)
+
+    for file_name in os.listdir(fluent_dir):
+        if file_name.endswith(".dat") or file_name.endswith(".dat.gz") or file_name.endswith(".dat.h5"):
+            path = "{}/{}".format(fluent_dir, file_name)
+            if (data_path == None) or (os.path.getmtime(path) > os.path.getmtime(data_path)):
+                data_path = path
+
+    return(data_path)
+
+def latest_case_file(fluent_dir):
+    '''
+    Finds the most recently written Fluent case file in a working directory.
+    Str -> Str
+
+    Parameters
+    ---------------------
+    fluent_dir : str
+        Path to the Fluent working directory of the simulation.
+
+    Returns
+    ---------------------
+    case_path : str
+        Path to the newest .cas, .cas.gz or .cas.h5 file, or None if there is none.
+    '''
+
+    case_path = None
+
+    if os.path.isdir(fluent_dir) == False:
+        return(case_path)
+
+    for file_name in os.listdir(fluent_dir):
+        if file_name.endswith(".cas") or file_name.endswith(".cas.gz") or file_name.endswith(".cas.h5"):
+            path = "{}/{}".format(fluent_dir, file_name)
+            if (case_path == None) or (os.path.getmtime(path) > os.path.getmtime(case_path)):
+                case_path = path
+
+    return(case_path)
+
+def data_file_iteration(data_path):
+    '''
+    Reads the iteration number from the name of a Fluent autosave data file, e.g. FFF-1-00250.dat.gz.
+    Str -> Int
+
+    Parameters
+    ---------------------
+    data_path : str
+        Path to the data file.
+
+    Returns
+    ---------------------
+    iteration : int
+        Iteration at which the data file was written, or 0 if the name does not contain it.
+    '''
+
+    match = re.search("(\\d+)\\.dat", os.path.basename(data_path))
+
+    if match:
+        return(int(match.group(1)))
+
+    return(0)
+
+def solver_restart(simulation, index, proj_params, watchdog):
+    '''
+    Restarts a simulation killed by solver_watchdog from its most recent data file, or from a fresh initialization if none was saved, until it finishes or runs out of attempts. Each restart is watched by checkpoint_watch, and only counts as finished once its transcript shows that the solve ended.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    watchdog : Solver_Watchdog object
+        Instance of Solver_Watchdog object of the simulation.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if watchdog.status != "Killed":
+        return
+
+    while (watchdog.status == "Killed") and (watchdog.attempts < proj_params.restart_attempts):
+        watchdog.attempts += 1
+        data_path = latest_data_file(watchdog.fluent_dir)
+
+        if data_path == None:
+            run_report_write(proj_params, simulation.sim_name, "Restarted", "Attempt {} from initialization".format(watchdog.attempts))
+        else:
+            run_report_write(proj_params, simulation.sim_name, "Restarted", "Attempt {} from {}".format(watchdog.attempts, os.path.basename(data_path)))
+
+        if checkpoint_watch(simulation, index, proj_params, watchdog, data_path):
+            run_report_write(proj_params, simulation.sim_name, "Finished", "Restart attempt {} completed".format(watchdog.attempts))
+
+    if watchdog.status == "Killed":
+        with open("{}/minerva-abort.txt".format(watchdog.fluent_dir), 'w') as abort_file:
+            abort_file.write("{} after {} restarts".format(watchdog.reason, watchdog.attempts))
+        run_report_write(proj_params, simulation.sim_name, "Failed", "{} after {} restarts".format(watchdog.reason, watchdog.attempts))
+
+    workbench.Save(Overwrite=True)
+
+    return
+
+def ledger_path(proj_params):
+    '''
+    Returns the path of the project's run ledger in the results directory.
+    Project -> Str
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    path : str
+        Path to the append-only JSON ledger of the project.
+    '''
+
+    return("{}/{} Ledger.jsonl".format(proj_params.results_dir.replace(os.sep, '/'), proj_params.proj_name))
+
+def simulation_fingerprint(simulation, proj_params, stage):
+    '''
+    Computes a fingerprint of the inputs on which a pipeline stage of a simulation depends, such that a change to any of them invalidates the stage.
+    Simulation, Project, Str -> Str
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    stage : str
+        One of "setup", "solve", "converge", "export", "aggregate" or "post".
+
+    Returns
+    ---------------------
+    fingerprint : str
+        SHA-1 hex digest of the stage inputs.
+    '''
+
+    cas_path = mesh_path(simulation)
+
+    if cas_path == None:
+        mesh_stamp = "missing"
+    else:
+        mesh_stamp = "{} {}".format(os.path.getsize(cas_path), int(os.path.getmtime(cas_path)))
+
+    inputs = [simulation.sim_name, simulation.mesh.CAS_name, simulation.mesh.CAS_dir, mesh_stamp, simulation.mesh.body_size,
+              simulation.workflow.sol_method, simulation.workflow.velocity, simulation.dimension.area, simulation.dimension.length,
+              simulation.dimension.CG_X, simulation.dimension.CG_Y, simulation.dimension.CG_Z, simulation.workflow.cg,
+              proj_params.min_iterations, proj_params.max_iterations, proj_params.conv_criterion, proj_params.conv_window]
+
+    if stage == "aggregate":
+        inputs.append(proj_params.stats_window)
+
+    if stage == "post":
+        inputs = inputs + [simulation.workflow.post, simulation.workflow.streamlines]
+
+    return(hashlib.sha1("|".join(["{}".format(entry) for entry in inputs]).encode("utf-8")).hexdigest())
+
+def ledger_load(proj_params):
+    '''
+    Reads the project's run ledger into the latest entry of each simulation and stage.
+    Project -> Dict
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    ledger : dict
+        Dictionary of ledger entries keyed by (simulation name, stage). Each entry holds its "stage", "fingerprint", "time", "data" and its position "seq" in the ledger.
+    '''
+
+    ledger = {}
+
+    if os.path.isfile(ledger_path(proj_params)) == False:
+        return(ledger)
+
+    with open(ledger_path(proj_params), 'r') as ledger_file:
+        seq = 0
+        for line in ledger_file:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            seq += 1
+            entry["seq"] = seq
+            ledger[(entry["simulation"], entry["stage"])] = entry
+
+    return(ledger)
+
+def ledger_record(proj_params, simulation, stage, data = None):
+    '''
+    Appends the completion of a pipeline stage of a simulation, with the fingerprint of its inputs, to the project's run ledger.
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    simulation : Simulation object
+        Instance of Simulation object.
+    stage : str
+        One of "setup", "solve", "converge", "export", "aggregate", "post" or "retention".
+    data : dict
+        Stage outputs needed to skip the stage on a later run, e.g. the convergence status or extracted results.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if (os.path.exists(proj_params.results_dir) == False):
+        os.makedirs(proj_params.results_dir)
+
+    entry = {"time": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), "simulation": simulation.sim_name, "stage": stage,
+             "fingerprint": simulation_fingerprint(simulation, proj_params, stage), "data": data}
+
+    with open(ledger_path(proj_params), 'a') as ledger_file:
+        ledger_file.write(json.dumps(entry) + "\n")
+
+    results_upload(proj_params, ledger_path(proj_params))
+
+    return
+
+def ledger_done(ledger, simulation, stage, proj_params):
+    '''
+    Checks whether a pipeline stage of a simulation is recorded in the ledger with unchanged inputs, after the stage it depends on. Each stage depends on the one before it in the order setup, solve, converge, export, aggregate, post and retention, with post left out of the order for simulations which are not post-processed, such that redoing a stage invalidates every later stage.
+    Dict, Simulation, Str, Project -> Bool
+
+    Parameters
+    ---------------------
+    ledger : dict
+        Dictionary of ledger entries returned by ledger_load.
+    simulation : Simulation object
+        Instance of Simulation object.
+    stage : str
+        One of "setup", "solve", "converge", "export", "aggregate", "post" or "retention".
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    done : bool
+        Boolean variable indicating whether the stage may be skipped.
+    '''
+
+    entry = ledger.get((simulation.sim_name, stage))
+
+    if entry == None:
+        return(False)
+
+    if entry["fingerprint"] != simulation_fingerprint(simulation, proj_params, stage):
+        return(False)
+
+    stages = ["setup", "solve", "converge", "export", "aggregate", "post", "retention"]
+    if simulation.workflow.post != True:
+        stages.remove("post")
+    if stages.index(stage) == 0:
+        return(True)
+
+    predecessor = stages[stages.index(stage) - 1]
+    if ledger_done(ledger, simulation, predecessor, proj_params) == False:
+        return(False)
+
+    return(entry["seq"] >= ledger[(simulation.sim_name, predecessor)]["seq"])
+
+def ledger_complete(sim_list, proj_params, stage):
+    '''
+    Checks whether a pipeline stage is recorded in the ledger with unchanged inputs for every simulation.
+    List, Project, Str -> Bool
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    stage : str
+        One of "setup", "solve", "converge", "export", "aggregate" or "post".
+
+    Returns
+    ---------------------
+    complete : bool
+        Boolean variable indicating whether the stage may be skipped for the whole project.
+    '''
+
+    ledger = ledger_load(proj_params)
+
+    for simulation in sim_list:
+        if ledger_done(ledger, simulation, stage, proj_params) == False:
+            return(False)
+
+    return(True)
+
+def ledger_pruned(ledger, simulation, proj_params):
+    '''
+    Checks whether the Fluent files of a simulation were pruned by retention_apply. A pruned simulation is finished, and is neither set up nor solved again, since its case and data files may no longer exist.
+    Dict, Simulation, Project -> Bool
+
+    Parameters
+    ---------------------
+    ledger : dict
+        Dictionary of ledger entries returned by ledger_load.
+    simulation : Simulation object
+        Instance of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    pruned : bool
+        Boolean variable indicating whether the simulation was pruned.
+    '''
+
+    entry = ledger.get((simulation.sim_name, "retention"))
+
+    if entry == None:
+        return(False)
+
+    return(entry["fingerprint"] == simulation_fingerprint(simulation, proj_params, "retention"))
+
+def results_record(results):
+    '''
+    Converts the extracted values of a Simulation_Results object into a dictionary that can be stored in the ledger.
+    Simulation_Results -> Dict
+
+    Parameters
+    ---------------------
+    results : Simulation_Results object
+        Instance of Simulation_Results object.
+
+    Returns
+    ---------------------
+    data : dict
+        Dictionary of the extracted values and monitor statistics.
+    '''
+
+    data = {}
+
+    for name in ["iterations", "drag_tot", "drag_comp", "lift_tot", "lift_comp", "f_left", "f_right", "mom_roll", "mom_pitch", "mom_yaw", "cop"]:
+        data[name] = getattr(results, name)
+
+    data["monitor_stats"] = {}
+    for name in results.monitor_stats:
+        data["monitor_stats"][name] = results.monitor_stats[name].__dict__
+
+    return(data)
+
+def results_restore(results, data):
+    '''
+    Restores the extracted values of a Simulation_Results object from a dictionary produced by results_record.
+
+    Parameters
+    ---------------------
+    results : Simulation_Results object
+        Instance of Simulation_Results object to be filled in.
+    data : dict
+        Dictionary of the extracted values and monitor statistics.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    for name in data:
+        if name != "monitor_stats":
+            setattr(results, name, data[name])
+
+    for name in data.get("monitor_stats", {}):
+        stats = Monitor_Statistics()
+        stats.__dict__.update(data["monitor_stats"][name])
+        results.monitor_stats[name] = stats
+
+    return
+
+def ledger_systems(sim_list, proj_params):
+    '''
+    Assigns the Fluent system index and result cache key recorded at setup in the project's run ledger to each simulation.
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    ledger = ledger_load(proj_params)
+
+    for simulation in sim_list:
+        if ledger_done(ledger, simulation, "setup", proj_params):
+            data = ledger[(simulation.sim_name, "setup")]["data"]
+            if data != None:
+                simulation.system_index = data.get("system_index", simulation.system_index)
+                simulation.cache_key = data.get("cache_key")
+
+    return
+
+def file_digest(path):
+    '''
+    Computes the SHA-1 digest of the contents of a file, reading it in chunks.
+    Str -> Str
+
+    Parameters
+    ---------------------
+    path : str
+        Path to the file.
+
+    Returns
+    ---------------------
+    digest : str
+        SHA-1 hex digest of the file contents.
+    '''
+
+    digest = hashlib.sha1()
+
+    with open(path, 'rb') as digest_file:
+        chunk = digest_file.read(1024 ** 2)
+        while chunk:
+            digest.update(chunk)
+            chunk = digest_file.read(1024 ** 2)
+
+    return(digest.hexdigest())
+
+mesh_digests = {}
+
+def mesh_digest(simulation):
+    '''
+    Returns the SHA-1 digest of the contents of the .CAS file of a simulation. Digests are remembered by path, size and modification time, since the same mesh is usually shared by many simulations.
+    Simulation -> Str
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+
+    Returns
+    ---------------------
+    digest : str
+        SHA-1 hex digest of the .CAS file, or None if it cannot be found.
+    '''
+
+    cas_path = mesh_path(simulation)
+
+    if cas_path == None:
+        return(None)
+
+    stamp = (cas_path, os.path.getsize(cas_path), os.path.getmtime(cas_path))
+
+    if stamp not in mesh_digests:
+        mesh_digests[stamp] = file_digest(cas_path)
+
+    return(mesh_digests[stamp])
+
+def solution_method(simulation):
+    '''
+    Returns the normalised name of the solution method of a simulation.
+    Simulation -> Str
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+
+    Returns
+    ---------------------
+    sol_method : str
+        Either "K-W" or "T-SST".
+    '''
+
+    komega = ["komega", "k-omega", "k-w", "kw"]
+
+    if simulation.workflow.sol_method.lower() in komega:
+        return("K-W")
+
+    return("T-SST")
+
+def result_cache_key(simulation, proj_params):
+    '''
+    Computes the result cache key of a simulation from the contents of its .CAS file and every parameter which affects the solution.
+    Simulation, Project -> Str
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    key : str
+        SHA-1 hex digest identifying the solved case, or None if the .CAS file cannot be found.
+    '''
+
+    mesh_key = mesh_digest(simulation)
+
+    if mesh_key == None:
+        return(None)
+
+    inputs = [mesh_key, simulation.mesh.body_size, solution_method(simulation), simulation.workflow.velocity,
+              simulation.dimension.area, simulation.dimension.length, simulation.workflow.cg,
+              simulation.dimension.CG_X, simulation.dimension.CG_Y, simulation.dimension.CG_Z,
+              proj_params.min_iterations, proj_params.max_iterations, proj_params.conv_criterion, proj_params.conv_window]
+
+    return(hashlib.sha1("|".join(["{}".format(entry) for entry in inputs]).encode("utf-8")).hexdigest())
+
+def result_cache_restore(simulation, proj_params):
+    '''
+    Looks up a simulation in the result cache and, on a hit, restores its raw results, monitor histories and extracted results into the results directory and records its solve in the run ledger. The cache holds no media files, so a simulation to be post-processed is always a miss and is solved in a Fluent system that CFD-Post can open.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    hit : bool
+        Boolean variable indicating whether the simulation was found in the result cache.
+    '''
+
+    if (proj_params.cache_dir == None) or (simulation.workflow.post == True):
+        return(False)
+
+    if simulation.cache_key == None:
+        simulation.cache_key = result_cache_key(simulation, proj_params)
+
+    if simulation.cache_key == None:
+        return(False)
+
+    entry_dir = os.path.join(proj_params.cache_dir, "Results", simulation.cache_key)
+    entry_path = os.path.join(entry_dir, "results.json")
+
+    if os.path.isfile(entry_path) == False:
+        return(False)
+
+    with open(entry_path, 'r') as entry_file:
+        entry = json.load(entry_file)
+    os.utime(entry_path, None)
+
+    raw_results_dir = os.path.join(proj_params.results_dir, simulation.sim_name, "Raw Results")
+    if (os.path.exists(raw_results_dir) == False):
+        os.makedirs(raw_results_dir)
+    for file_name in os.listdir(os.path.join(entry_dir, "Raw Results")):
+        shutil.copyfile(os.path.join(entry_dir, "Raw Results", file_name), os.path.join(raw_results_dir, file_name))
+
+    simulation.system_index = None
+    simulation.results.convergence = entry["convergence"]
+    simulation.results.stop_reason = "{} (restored from result cache)".format(entry["stop_reason"])
+    results_restore(simulation.results, entry["results"])
+    simulation.results.monitor_stats = {}
+    simulation = monitor_statistics(simulation, raw_results_dir, proj_params)
+
+    ledger = ledger_load(proj_params)
+    if ledger_done(ledger, simulation, "export", proj_params) == False:
+        ledger_record(proj_params, simulation, "setup", {"system_index": None, "cache_key": simulation.cache_key})
+        ledger_record(proj_params, simulation, "solve")
+        ledger_record(proj_params, simulation, "converge", {"convergence": simulation.results.convergence, "stop_reason": simulation.results.stop_reason})
+        ledger_record(proj_params, simulation, "export")
+    ledger_record(proj_params, simulation, "aggregate", results_record(simulation.results))
+    run_report_write(proj_params, simulation.sim_name, "Cache Hit", "Results of {} {} restored from result cache entry {}".format(entry["sim_name"], entry["project"], simulation.cache_key))
+
+    return(True)
+
+def result_cache_store(simulation, proj_params):
+    '''
+    Stores the raw results, monitor histories, extracted results and optionally the final data file of a converged simulation in the result cache, then evicts the least recently used entries beyond the size limit.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if (proj_params.cache_dir == None) or (simulation.results.convergence != "Converged"):
+        return
+
+    if simulation.cache_key == None:
+        simulation.cache_key = result_cache_key(simulation, proj_params)
+
+    if simulation.cache_key == None:
+        return
+
+    entry_dir = os.path.join(proj_params.cache_dir, "Results", simulation.cache_key)
+
+    if os.path.isdir(entry_dir):
+        return
+
+    staging_dir = entry_dir + ".{}.tmp".format(os.getpid())
+    os.makedirs(os.path.join(staging_dir, "Raw Results"))
+
+    raw_results_dir = os.path.join(proj_params.results_dir, simulation.sim_name, "Raw Results")
+    for file_name in os.listdir(raw_results_dir):
+        stored_name = re.sub("_?{}\\.txt$".format(simulation.system_index), ".txt", file_name)
+        shutil.copyfile(os.path.join(raw_results_dir, file_name), os.path.join(staging_dir, "Raw Results", stored_name))
+
+    if proj_params.cache_data and (simulation.system_index != None):
+        case_path = latest_case_file(solve_dir(simulation.system_index, proj_params))
+        data_path = latest_data_file(solve_dir(simulation.system_index, proj_params))
+        if (case_path != None) and (data_path != None):
+            os.makedirs(os.path.join(staging_dir, "Data"))
+            shutil.copyfile(case_path, os.path.join(staging_dir, "Data", os.path.basename(case_path)))
+            shutil.copyfile(data_path, os.path.join(staging_dir, "Data", os.path.basename(data_path)))
+
+    entry = {"sim_name": simulation.sim_name, "project": proj_params.proj_name, "CAS_name": simulation.mesh.CAS_name,
+             "mesh_digest": mesh_digest(simulation), "body_size": simulation.mesh.body_size,
+             "sol_method": solution_method(simulation), "velocity": simulation.workflow.velocity,
+             "convergence": simulation.results.convergence, "stop_reason": simulation.results.stop_reason,
+             "results": results_record(simulation.results)}
+    with open(os.path.join(staging_dir, "results.json"), 'w') as entry_file:
+        json.dump(entry, entry_file)
+
+    try:
+        os.rename(staging_dir, entry_dir)
+    except OSError:
+        shutil.rmtree(staging_dir)
+
+    cache_evict(os.path.join(proj_params.cache_dir, "Results"), proj_params.cache_limit * 1024 ** 3, "results.json")
+
+    return
+
+def directory_size(path):
+    '''
+    Returns the total size of all files within a directory and its sub-directories.
+    Str -> Int
+
+    Parameters
+    ---------------------
+    path : str
+        Path to the directory.
+
+    Returns
+    ---------------------
+    size : int
+        Total size of the files in bytes.
+    '''
+
+    size = 0
+
+    for (root, dirs, files) in os.walk(path):
+        for file_name in files:
+            size += os.path.getsize(os.path.join(root, file_name))
+
+    return(size)
+
+def cache_evict(cache_dir, limit, marker):
+    '''
+    Deletes the least recently used cache entries until the cache is within its size limit. Entries are ordered by the time their marker file was last written or used.
+
+    Parameters
+    ---------------------
+    cache_dir : str
+        Directory containing one sub-directory per cache entry.
+    limit : float
+        Size limit of the cache in bytes.
+    marker : str
+        Name of the file marking a complete cache entry, touched whenever the entry is used.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    entries = []
+    total = 0
+
+    for entry_name in os.listdir(cache_dir):
+        entry_path = os.path.join(cache_dir, entry_name, marker)
+        if os.path.isfile(entry_path):
+            size = directory_size(os.path.join(cache_dir, entry_name))
+            entries.append((os.path.getmtime(entry_path), size, os.path.join(cache_dir, entry_name)))
+            total += size
+
+    entries.sort()
+
+    for (last_used, size, entry_dir) in entries:
+        if total <= limit:
+            break
+        shutil.rmtree(entry_dir)
+        total -= size
+
+    return
+
+staging_threads = []
+
+def project_open(sim_list, proj_params):
+    '''
+    Prepares a project read by param_extract for the workflow: the Workbench project is moved onto the local scratch directory if one is given, results are written behind through a spool if enabled, and each simulation is assigned the Fluent system and result cache key recorded at its setup in the run ledger. A project opened with project_open is closed with staging_flush.
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    staging_project(proj_params)
+
+    results_spool(proj_params)
+
+    ledger_systems(sim_list, proj_params)
+
+    return
+
+def staging_project(proj_params):
+    '''
+    Moves the Workbench project of a project with a local scratch directory onto the scratch directory, remembering the configured project directory to synchronise to. If the project only exists in the configured directory, for instance when resuming on another machine, it is first copied to the scratch directory. Projects solved through a job queue stay in the configured directory, which the workers write to.
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if (proj_params.scratch_dir == None) or (proj_params.sync_dir != None) or (proj_params.queue_dir != None):
+        return
+
+    local_dir = os.path.join(proj_params.scratch_dir, "Projects", proj_params.proj_name)
+
+    if os.path.isfile(os.path.join(local_dir, proj_params.proj_name + ".wbpj")) == False:
+        if os.path.isfile(os.path.join(proj_params.proj_dir, proj_params.proj_name + ".wbpj")):
+            directory_mirror(proj_params.proj_dir, local_dir, proj_params.staging_threads)
+
+    if os.path.exists(local_dir) == False:
+        os.makedirs(local_dir)
+
+    proj_params.sync_dir = proj_params.proj_dir
+    proj_params.proj_dir = local_dir
+
+    return
+
+def file_copy_verified(source, destination):
+    '''
+    Copies a file through a temporary file, computing the SHA-1 digest of the source while it is read, and only moves the copy into place once its own digest matches.
+    Str, Str -> Str
+
+    Parameters
+    ---------------------
+    source : str
+        Path to the file to be copied.
+    destination : str
+        Path to the copy.
+
+    Returns
+    ---------------------
+    digest : str
+        SHA-1 hex digest of the copied file, or None if the copy could not be verified.
+    '''
+
+    partial = destination + ".partial"
+    digest = hashlib.sha1()
+
+    if os.path.exists(os.path.dirname(destination)) == False:
+        try:
+            os.makedirs(os.path.dirname(destination))
+        except OSError:
+            pass
+
+    with open(source, 'rb') as source_file:
+        with open(partial, 'wb') as partial_file:
+            chunk = source_file.read(1024 ** 2)
+            while chunk:
+                digest.update(chunk)
+                partial_file.write(chunk)
+                chunk = source_file.read(1024 ** 2)
+
+    if file_digest(partial) != digest.hexdigest():
+        os.remove(partial)
+        return(None)
+
+    if os.path.exists(destination):
+        os.remove(destination)
+    os.rename(partial, destination)
+    os.utime(destination, (time.time(), os.path.getmtime(source)))
+
+    return(digest.hexdigest())
+
+def parallel_map(function, items, threads):
+    '''
+    Calls a function on every item of a list using a fixed number of threads.
+
+    Parameters
+    ---------------------
+    function : function
+        Function of one argument.
+    items : List
+        List of arguments.
+    threads : int
+        Number of threads.
+
+    Returns
+    ---------------------
+    results : List
+        List of the return values, in the order of the items.
+    '''
+
+    results = [None] * len(items)
+    pending = list(range(len(items)))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if len(pending) == 0:
+                    return
+                index = pending.pop(0)
+            try:
+                results[index] = function(items[index])
+            except (IOError, OSError):
+                results[index] = None
+
+    workers = [threading.Thread(target = worker) for i in range(max(min(threads, len(items)), 1))]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    return(results)
+
+def staging_prefetch(sim_list, proj_params):
+    '''
+    Copies the .CAS files of all simulations to the local scratch directory in parallel before setup, verifying each copy, and points the simulations at the staged copies. Copies made by earlier runs are reused if the source is unchanged and the copy still matches its recorded digest.
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if proj_params.scratch_dir == None:
+        return
+
+    sources = {}
+
+    for simulation in sim_list:
+        cas_path = mesh_path(simulation)
+        if cas_path != None:
+            sources.setdefault(cas_path, []).append(simulation)
+
+    def stage(cas_path):
+        stamp = (cas_path, os.path.getsize(cas_path), os.path.getmtime(cas_path))
+        stamp_key = hashlib.sha1("{}|{}|{}".format(*stamp).encode("utf-8")).hexdigest()
+        entry_dir = os.path.join(proj_params.scratch_dir, "Meshes", stamp_key)
+        staged_path = os.path.join(entry_dir, os.path.basename(cas_path))
+        entry_path = os.path.join(entry_dir, "staged.json")
+        if os.path.isfile(entry_path) and os.path.isfile(staged_path):
+            with open(entry_path, 'r') as entry_file:
+                entry = json.load(entry_file)
+            if file_digest(staged_path) == entry["digest"]:
+                os.utime(entry_path, None)
+                mesh_digests[stamp] = entry["digest"]
+                return(entry_dir)
+        digest = file_copy_verified(cas_path, staged_path)
+        if digest == None:
+            return(None)
+        with open(entry_path, 'w') as entry_file:
+            json.dump({"source": cas_path, "digest": digest}, entry_file)
+        mesh_digests[stamp] = digest
+        return(entry_dir)
+
+    paths = sorted(sources)
+    staged = parallel_map(stage, paths, proj_params.staging_threads)
+
+    for (cas_path, entry_dir) in zip(paths, staged):
+        for simulation in sources[cas_path]:
+            simulation.mesh.staged_dir = entry_dir
+        if entry_dir == None:
+            run_report_write(proj_params, sources[cas_path][0].sim_name, "Staging Failed", "{} could not be copied to the local scratch directory and is read from its configured directory".format(cas_path))
+
+    cache_evict(os.path.join(proj_params.scratch_dir, "Meshes"), proj_params.scratch_limit * 1024 ** 3, "staged.json")
+
+    return
+
+def directory_mirror(source_dir, destination_dir, threads, newer_only = False):
+    '''
+    Copies every file of a directory tree which is missing or differs in size or modification time at the destination, verifying each copy. Files which cannot be read, for instance because Fluent holds them open, are left for the next mirror.
+
+    Parameters
+    ---------------------
+    source_dir : str
+        Directory to be copied.
+    destination_dir : str
+        Directory to copy to.
+    threads : int
+        Number of threads copying files.
+    newer_only : bool
+        Specification of whether only files missing at the destination, or modified more recently at the source than at the destination, are copied.
+
+    Returns
+    ---------------------
+    copied : int
+        Number of files copied.
+    size : int
+        Total size of the files copied in bytes.
+    failed : int
+        Number of files which could not be copied.
+    '''
+
+    pending = []
+
+    for (root, dirs, files) in os.walk(source_dir):
+        for file_name in files:
+            if file_name.endswith(".partial"):
+                continue
+            source = os.path.join(root, file_name)
+            destination = os.path.join(destination_dir, os.path.relpath(source, source_dir))
+            if os.path.isfile(destination) and newer_only and (int(os.path.getmtime(source)) <= int(os.path.getmtime(destination))):
+                continue
+            if os.path.isfile(destination) and (newer_only == False) and (os.path.getsize(destination) == os.path.getsize(source)) and (int(os.path.getmtime(destination)) == int(os.path.getmtime(source))):
+                continue
+            pending.append((source, destination))
+
+    digests = parallel_map(lambda item: file_copy_verified(item[0], item[1]), pending, threads)
+
+    copied = len([digest for digest in digests if digest != None])
+    size = sum([os.path.getsize(item[1]) for (item, digest) in zip(pending, digests) if digest != None])
+
+    return(copied, size, len(pending) - copied)
+
+def staging_sync(proj_params):
+    '''
+    Starts synchronising the Workbench project from the local scratch directory back to the configured project directory in a background thread. Synchronisations run one after another, and the result of each is written to the project's run report.
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if proj_params.sync_dir == None:
+        return
+
+    previous = None
+    if len(staging_threads) > 0:
+        previous = staging_threads[-1]
+
+    def sync():
+        if previous != None:
+            previous.join()
+        (copied, size, failed) = directory_mirror(proj_params.proj_dir, proj_params.sync_dir, proj_params.staging_threads)
+        if copied + failed > 0:
+            run_report_write(proj_params, "", "Sync", "{} files ({:.1f} MB) copied to {}; {} files left for the next sync".format(copied, size / 1024.0 ** 2, proj_params.sync_dir, failed))
+
+    thread = threading.Thread(target = sync)
+    thread.daemon = True
+    thread.start()
+    staging_threads.append(thread)
+
+    return
+
+def staging_flush(proj_params):
+    '''
+    Synchronises the Workbench project back to the configured project directory one final time and waits for all synchronisations and result uploads to finish.
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    staging_sync(proj_params)
+
+    while len(staging_threads) > 0:
+        staging_threads.pop(0).join()
+
+    failed = write_behind_flush(proj_params.write_behind)
+    if len(failed) > 0:
+        run_report_write(proj_params, "", "Upload Failed", "{} files could not be uploaded to {} and remain in {}: {}".format(len(failed), proj_params.write_behind.destination, proj_params.write_behind.spool_dir, " ".join(failed)))
+    proj_params.write_behind = None
+
+    return
+
+def write_behind_start(spool_dir, destination, threads, retries, copy_function = None):
+    '''
+    Creates a Write_Behind object for a destination directory and starts its upload threads.
+
+    Parameters
+    ---------------------
+    spool_dir : str
+        Local directory the files are written to.
+    destination : str
+        Directory the files are uploaded to.
+    threads : int
+        Number of upload threads.
+    retries : int
+        Number of times a failed upload is retried.
+    copy_function : function
+        Function copying a file, file_copy_verified if None.
+
+    Returns
+    ---------------------
+    write_behind : Write_Behind object
+        Instance of Write_Behind class.
+    '''
+
+    if copy_function == None:
+        copy_function = file_copy_verified
+
+    write_behind = Write_Behind(spool_dir, destination, threads, retries, copy_function)
+
+    for i in range(max(threads, 1)):
+        worker = threading.Thread(target = write_behind_worker, args = (write_behind,))
+        worker.daemon = True
+        worker.start()
+        write_behind.workers.append(worker)
+
+    return(write_behind)
+
+def write_behind_submit(write_behind, path):
+    '''
+    Queues a file, or every changed file within a directory, of the spool directory for upload. Files which are already queued are not queued again, since the upload copies their latest contents.
+
+    Parameters
+    ---------------------
+    write_behind : Write_Behind object
+        Instance of Write_Behind class, or None.
+    path : str
+        Path to a file or directory within the spool directory.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if (write_behind == None) or (os.path.exists(path) == False):
+        return
+
+    if os.path.isdir(path):
+        paths = [os.path.join(root, file_name) for (root, dirs, files) in os.walk(path) for file_name in files]
+    else:
+        paths = [path]
+
+    with write_behind.condition:
+        for file_path in paths:
+            if file_path.endswith(".partial"):
+                continue
+            relative = os.path.relpath(file_path, write_behind.spool_dir)
+            stamp = (os.path.getsize(file_path), os.path.getmtime(file_path))
+            if (relative in write_behind.pending) or (write_behind.uploaded.get(relative) == stamp):
+                continue
+            write_behind.pending.append(relative)
+        write_behind.condition.notify_all()
+
+    return
+
+def write_behind_worker(write_behind):
+    '''
+    Uploads queued files of a Write_Behind object until it is closed, verifying each copy and retrying failed uploads with an increasing delay.
+
+    Parameters
+    ---------------------
+    write_behind : Write_Behind object
+        Instance of Write_Behind class.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    while True:
+        with write_behind.condition:
+            while (len(write_behind.pending) == 0) and (write_behind.closing == False):
+                write_behind.condition.wait()
+            if len(write_behind.pending) == 0:
+                return
+            relative = write_behind.pending.pop(0)
+
+        source = os.path.join(write_behind.spool_dir, relative)
+        stamp = None
+        digest = None
+
+        for attempt in range(write_behind.retries + 1):
+            if attempt > 0:
+                time.sleep(2 ** (attempt - 1))
+            try:
+                stamp = (os.path.getsize(source), os.path.getmtime(source))
+                digest = write_behind.copy_function(source, os.path.join(write_behind.destination, relative))
+            except (IOError, OSError):
+                digest = None
+            if digest != None:
+                break
+
+        with write_behind.condition:
+            if digest != None:
+                write_behind.uploaded[relative] = stamp
+                write_behind.size += stamp[0]
+                if relative in write_behind.failed:
+                    write_behind.failed.remove(relative)
+            elif relative not in write_behind.failed:
+                write_behind.failed.append(relative)
+
+def write_behind_flush(write_behind):
+    '''
+    Queues every changed file of the spool directory, waits until all files are uploaded and stops the upload threads. Acts as the barrier after which the destination directory is complete.
+
+    Parameters
+    ---------------------
+    write_behind : Write_Behind object
+        Instance of Write_Behind class, or None.
+
+    Returns
+    ---------------------
+    failed : List
+        Relative paths of the files which could not be uploaded.
+    '''
+
+    if write_behind == None:
+        return([])
+
+    write_behind_submit(write_behind, write_behind.spool_dir)
+
+    with write_behind.condition:
+        write_behind.closing = True
+        write_behind.condition.notify_all()
+
+    for worker in write_behind.workers:
+        worker.join()
+
+    return(write_behind.failed)
+
+def results_spool(proj_params):
+    '''
+    Redirects the results of a project with write-behind enabled to a spool on the local scratch directory, and starts uploading the spool to the configured results directory in the background. Files which only exist in the results directory, such as the ledger of an earlier run, or which were changed there since they were last spooled, for instance by resuming the project on another machine, are first copied to the spool. Projects solved through a job queue write their results directly, since the journal and every worker share the results directory.
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if (proj_params.write_behind_enabled == False) or (proj_params.scratch_dir == None) or (proj_params.write_behind != None) or (proj_params.queue_dir != None):
+        return
+
+    spool_dir = os.path.join(proj_params.scratch_dir, "Results", proj_params.proj_name)
+
+    if os.path.isdir(proj_params.results_dir):
+        directory_mirror(proj_params.results_dir, spool_dir, proj_params.upload_threads, True)
+
+    if os.path.exists(spool_dir) == False:
+        os.makedirs(spool_dir)
+
+    proj_params.write_behind = write_behind_start(spool_dir, proj_params.results_dir, proj_params.upload_threads, proj_params.upload_retries)
+    proj_params.results_dir = spool_dir
+
+    return
+
+def results_upload(proj_params, path):
+    '''
+    Queues a file or directory of the results for upload to the configured results directory if write-behind is enabled.
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    path : str
+        Path to a file or directory within the results directory.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    write_behind_submit(proj_params.write_behind, path)
+
+    return
+
+def run_report_write(proj_params, sim_name, event, detail):
+    '''
+    Appends a timestamped event to the run report CSV of the project in the results directory.
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    sim_name : str
+        Name of the simulation the event concerns. Empty for project-wide events.
+    event : str
+        Short name of the event.
+    detail : str
+        Description of the event.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if (os.path.exists(proj_params.results_dir) == False):
+        os.makedirs(proj_params.results_dir)
+
+    report_path = "{}/{} Run Report.csv".format(proj_params.results_dir.replace(os.sep, '/'), proj_params.proj_name)
+    new_report = (os.path.isfile(report_path) == False)
+
+    with open(report_path, 'a') as report:
+        if new_report:
+            report.write("Timestamp,Simulation Name,Event,Detail\n")
+        report.write("{},{},{},{}\n".format(datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), sim_name, event, detail.replace(",", ";")))
+
+    results_upload(proj_params, report_path)
+
+    return
+
+def divergence_monitor(monitors, proj_params, indices = None):
+    '''
+    Scans the new text of every running simulation's transcript and aborts the simulations in which a divergence signature appears.
+
+    Parameters
+    ---------------------
+    monitors : List
+        List containing a Transcript_Monitor object for each simulation, in simulation order.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    indices : List
+        List containing the index of the Fluent system of each monitor, or None if the monitors are in system order.
+
+    Returns
+    ---------------------
+    aborted : List
+        List containing the indices of the simulations aborted during this scan.
+    '''
+
+    aborted = []
+
+    if indices == None:
+        indices = list(range(len(monitors)))
+
+    for i in range(len(monitors)):
+        monitor = monitors[i]
+        if (monitor.reason == None) and os.path.isfile(monitor.path):
+            if transcript_poll(monitor) != None:
+                solver_abort(indices[i], proj_params, monitor.reason)
+                aborted.append(indices[i])
+
+    return(aborted)
+
+def transcript_poll(monitor):
+    '''
+    Reads the text appended to a transcript since the previous poll and scans each complete line for divergence signatures.
+    Transcript_Monitor -> Str
+
+    Parameters
+    ---------------------
+    monitor : Transcript_Monitor object
+        Instance of Transcript_Monitor object of the transcript to be scanned.
+
+    Returns
+    ---------------------
+    reason : str
+        Divergence signature detected in the transcript, or None if the simulation is healthy.
+    '''
+
+    if os.path.getsize(monitor.path) < monitor.offset:
+        monitor.offset = 0
+        monitor.buffer = ""
+
+    with open(monitor.path, 'rb') as transcript:
+        transcript.seek(monitor.offset)
+        data = transcript.read()
+        monitor.offset = transcript.tell()
+
+    lines = (monitor.buffer + data.decode("utf-8", "replace")).split("\n")
+    monitor.buffer = lines.pop()
+
+    for line in lines:
+        if monitor.reason == None:
+            monitor.reason = divergence_signature(monitor, line)
+
+    return(monitor.reason)
+
+def divergence_signature(monitor, line):
+    '''
+    Checks a single transcript line for floating point exceptions, NaN residuals, residual blow-up and excessive reversed flow. Fluent warns of reversed flow once per boundary and iteration, so iterations are counted rather than warnings: a simulation is only considered hopeless once reversed flow on more than the fraction of the faces of a boundary has lasted for every iteration of the window, such that a case with a steady small region of reversed flow at the outlet is not stopped. Warnings which give neither the faces of the boundary nor the area are not counted.
+    Transcript_Monitor, Str -> Str
+
+    Parameters
+    ---------------------
+    monitor : Transcript_Monitor object
+        Instance of Transcript_Monitor object holding the residual and reversed flow history of the transcript.
+    line : str
+        Line of the transcript.
+
+    Returns
+    ---------------------
+    reason : str
+        Divergence signature found in the line, or None.
+    '''
+
+    lower_line = line.lower()
+
+    if "floating point exception" in lower_line:
+        return("Floating point exception")
+
+    if "divergence detected" in lower_line:
+        return("Divergence detected in AMG solver")
+
+    if "reversed flow" in lower_line:
+        fraction = None
+        match = re.search("(\\d+) faces? \\(out of (\\d+)\\)", lower_line)
+        if (match != None) and (int(match.group(2)) > 0):
+            fraction = 100.0 * int(match.group(1)) / int(match.group(2))
+        match = re.search("\\(([\\d.]+)% area\\)", lower_line)
+        if match != None:
+            fraction = float(match.group(1))
+        if (fraction != None) and (fraction > monitor.reversed_flow_fraction) and (monitor.iteration not in monitor.reversed_flow):
+            monitor.reversed_flow = [iteration for iteration in monitor.reversed_flow if iteration > monitor.iteration - monitor.reversed_flow_window] + [monitor.iteration]
+            if len(monitor.reversed_flow) >= monitor.reversed_flow_window:
+                return("Reversed flow on more than {}% of the faces of a boundary for {} iterations".format(monitor.reversed_flow_fraction, monitor.reversed_flow_window))
+        return(None)
+
+    entries = line.split()
+
+    if (len(entries) < 3) or (entries[0].isdigit() == False):
+        return(None)
+
+    monitor.iteration = int(entries[0])
+
+    residuals = []
+    for entry in entries[1:]:
+        if ":" in entry:
+            break
+        if ("nan" in entry.lower()) or ("inf" in entry.lower()):
+            return("NaN residual at iteration {}".format(entries[0]))
+        try:
+            residuals.append(float(entry))
+        except ValueError:
+            return(None)
+
+    for j in range(len(residuals)):
+        if j >= len(monitor.residual_min):
+            monitor.residual_min.append(residuals[j])
+        elif residuals[j] > monitor.blowup_factor * monitor.residual_min[j]:
+            return("Residual blow-up at iteration {}".format(entries[0]))
+        else:
+            monitor.residual_min[j] = min(monitor.residual_min[j], residuals[j])
+
+    return(None)
+
+def solver_abort(index, proj_params, reason):
+    '''
+    Stops a running Fluent simulation by creating the checkpoint-and-exit file defined in abort_setup, and records the reason in its working directory.
+
+    Parameters
+    ---------------------
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    reason : str
+        Divergence signature for which the simulation is aborted.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if index==0:
+        flu_dir = "FLU"
+    else:
+        flu_dir = "FLU-{}".format(index)
+
+    wb_files_dir = os.path.join(proj_params.proj_dir, proj_params.proj_name + "_files").replace(os.sep, '/')
+    fluent_dir = "{}/dp0/{}/Fluent".format(wb_files_dir, flu_dir)
+
+    if (os.path.exists(fluent_dir) == False):
+        os.makedirs(fluent_dir)
+
+    with open("{}/minerva-abort.txt".format(fluent_dir), 'w') as abort_file:
+        abort_file.write(reason)
+
+    with open("{}/exit-fluent".format(fluent_dir), 'w') as exit_file:
+        exit_file.write("")
+
+    return
+
+def convergence_status(sim_list, proj_params):
+    '''
+    Performs batch detection of convergence status on all simulations in sim_list.
+
+    Parameters
+    ---------------------
+    sim_list : List 
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    sim_list : List 
+        List containing Simulation objects.
+    '''
+    
+    wb_files_dir = os.path.join(proj_params.proj_dir, proj_params.proj_name + "_files").replace(os.sep, '/')
+
+    ledger = ledger_load(proj_params)
+    updated = False
+
+    for i in range(len(sim_list)):
+        if ledger_done(ledger, sim_list[i], "converge", proj_params):
+            data = ledger[(sim_list[i].sim_name, "converge")]["data"]
+            sim_list[i].results.convergence = data["convergence"]
+            sim_list[i].results.stop_reason = data["stop_reason"]
+            continue
+        if sim_list[i].system_index == None:
+            continue
+        if sim_list[i].system_index==0:
+            flu_dir = "FLU"
+        else:
+            flu_dir = "FLU-{}".format(sim_list[i].system_index)
+        status_file = open("{}/progress_files/dp0/{}/Fluent/Solution.trn".format(wb_files_dir, flu_dir), 'r')
+        if "solution is converged" in status_file.read():
+            sim_list[i].results.convergence = "Converged"
+        else:
+            sim_list[i].results.convergence = "Diverged or Error"
+        status_file.close()
+        sim_list[i].results.stop_reason = stop_reason("{}/dp0/{}/Fluent".format(wb_files_dir, flu_dir), sim_list[i].results.convergence, proj_params)
+        initialization = "Standard"
+        if ledger_done(ledger, sim_list[i], "setup", proj_params) and (ledger[(sim_list[i].sim_name, "setup")]["data"] != None):
+            initialization = ledger[(sim_list[i].sim_name, "setup")]["data"].get("initialization", "Standard")
+        iterations = None
+        if os.path.isfile("{}/dp0/{}/Fluent/drag-rfile.out".format(wb_files_dir, flu_dir)):
+            iterations = len(monitor_history_read("{}/dp0/{}/Fluent/drag-rfile.out".format(wb_files_dir, flu_dir))[0])
+        run_report_write(proj_params, sim_list[i].sim_name, "Iterations", "{} initialization of {} body: {} iterations; {}".format(initialization, sim_list[i].mesh.body_size, iterations, sim_list[i].results.stop_reason))
+        ledger_record(proj_params, sim_list[i], "converge", {"convergence": sim_list[i].results.convergence, "stop_reason": sim_list[i].results.stop_reason, "initialization": initialization, "iterations": iterations})
+        updated = True
+
+    if updated:
+        initialization_summary(sim_list, proj_params)
+    
+    return(sim_list)
+
+def monitor_converged(values, criterion, window, min_iterations):
+    '''
+    Checks whether the relative change of a monitor has remained below the convergence criterion over the last window of iterations.
+    List, float, int, int -> Bool
+
+    Parameters
+    ---------------------
+    values : list
+        List of floats containing the monitor history.
+    criterion : float
+        Relative change below which the monitor is considered converged.
+    window : int
+        Number of previous iterations over which the relative change is considered.
+    min_iterations : int
+        Minimum number of iterations before the monitor may be considered converged.
+
+    Returns
+    ---------------------
+    converged : bool
+        Boolean variable indicating whether the monitor has converged.
+    '''
+
+    if (len(values) < min_iterations) or (len(values) < window + 1):
+        return(False)
+
+    latest = values[-1]
+
+    if latest == 0:
+        return(False)
+
+    for value in values[-(window + 1):-1]:
+        if abs(latest - value) / abs(latest) > criterion:
+            return(False)
+
+    return(True)
+
+def stop_reason(fluent_dir, convergence, proj_params):
+    '''
+    Determines why a Fluent simulation stopped iterating from its convergence status and drag and lift report files.
+
+    Parameters
+    ---------------------
+    fluent_dir : str
+        Path to the Fluent working directory of the simulation containing its report files.
+    convergence : str
+        Convergence status of the simulation.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    reason : str
+        Reason for which the simulation stopped iterating.
+    '''
+
+    abort_path = "{}/minerva-abort.txt".format(fluent_dir)
+
+    if os.path.isfile(abort_path):
+        with open(abort_path, 'r') as abort_file:
+            return("Aborted: {}".format(abort_file.read().strip()))
+
+    histories = []
+
+    for report in ["drag", "lift"]:
+        rfile_path = "{}/{}-rfile.out".format(fluent_dir, report)
+        if os.path.isfile(rfile_path):
+            (iterations, report_histories) = monitor_history_read(rfile_path)
+            histories.append(report_histories.get(report, []))
+
+    if len(histories) == 0:
+        return("No monitor data")
+
+    iterations = len(histories[0])
+
+    if convergence == "Converged":
+        for values in histories:
+            if monitor_converged(values, proj_params.conv_criterion, proj_params.conv_window, proj_params.min_iterations) == False:
+                return("Residual criteria met at iteration {}".format(iterations))
+        return("Drag and lift criteria met at iteration {}".format(iterations))
+    elif iterations >= proj_params.max_iterations:
+        return("Maximum of {} iterations reached".format(proj_params.max_iterations))
+    else:
+        return("Stopped at iteration {}".format(iterations))
+
+def results_extract(sim_list, proj_params):
+    '''
+    Performs batch execution of fluent_results_export on simulations that have converged.
+
+    Parameters
+    ---------------------
+    sim_list : List 
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+    ledger = ledger_load(proj_params)
+
+    for i in range(len(sim_list)):
+        if sim_list[i].results.convergence == "Converged":
+            if ledger_done(ledger, sim_list[i], "aggregate", proj_params):
+                results_restore(sim_list[i].results, ledger[(sim_list[i].sim_name, "aggregate")]["data"])
+            elif sim_list[i].system_index == None:
+                if result_cache_restore(sim_list[i], proj_params) == False:
+                    run_report_write(proj_params, sim_list[i].sim_name, "Cache Miss", "Result cache entry {} is no longer available".format(sim_list[i].cache_key))
+            else:
+                if ledger_done(ledger, sim_list[i], "export", proj_params) == False:
+                    if ledger_done(ledger, sim_list[i], "setup", proj_params) and (ledger[(sim_list[i].sim_name, "setup")]["data"] != None) and ledger[(sim_list[i].sim_name, "setup")]["data"].get("batch", False):
+                        raw_results_collect(sim_list[i], sim_list[i].system_index, proj_params)
+                    else:
+                        fluent_results_export(sim_list[i], sim_list[i].system_index, proj_params)
+                    ledger_record(proj_params, sim_list[i], "export")
+                raw_results_dir = os.path.join(proj_params.results_dir, sim_list[i].sim_name, "Raw Results")
+                sim_list[i] = fluent_results_aggregator(sim_list[i], sim_list[i].system_index, proj_params)
+                sim_list[i] = monitor_statistics(sim_list[i], raw_results_dir, proj_params)
+                ledger_record(proj_params, sim_list[i], "aggregate", results_record(sim_list[i].results))
+                result_cache_store(sim_list[i], proj_params)
+    
+    results_formatter(sim_list, proj_params)
+    project_summary_write(sim_list, proj_params)
+
+    results_upload(proj_params, proj_params.results_dir)
+    staging_sync(proj_params)
+
+    return
+
+def fluent_results_export(simulation, index, proj_params):
+    '''
+    Exports results from a given Fluent simulation into .txt files.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    index : int
+        Integer of current index of converged simulation.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if index==0:
+        module = "FLU"
+        flu_dir = "FLU"
+    else:
+        module = "FLU {}".format(index)
+        flu_dir = "FLU-{}".format(index)
+    
+    raw_results_dir = os.path.join(proj_params.results_dir, simulation.sim_name, "Raw Results").replace(os.sep, '/')
+    wb_files_dir = os.path.join(proj_params.proj_dir, proj_params.proj_name + "_files").replace(os.sep, '/')
+    
+    system1 = workbench.GetSystem(Name=module)
+    solution1 = system1.GetContainer(ComponentName="Solution")
+    solution1.Edit()
+    setup1 = system1.GetContainer(ComponentName="Setup")
+    setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Results|Reports|Forces"))')
+    setup1.SendCommand(Command='(cx-gui-do cx-set-list-tree-selections "NavigationPane*List_Tree1" (list "Results|Reports|Forces"))(cx-gui-do cx-activate-item "NavigationPane*List_Tree1")')
+    setup1.SendCommand(Command="(cx-gui-do cx-set-list-tree-selections \"NavigationPane*List_Tree1\" (list \"Results|Reports|Forces\"))(cx-gui-do cx-set-list-selections \"Force Reports*List2(Wall Zones)\" '( 0 2))(cx-gui-do cx-activate-item \"Force Reports*List2(Wall Zones)\")(cx-gui-do cx-set-list-selections \"Force Reports*List2(Wall Zones)\" '( 0))(cx-gui-do cx-activate-item \"Force Reports*List2(Wall Zones)\")")
+    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"{}/drag{}.txt\") \"All Files (*)\")".format(raw_results_dir, index))
+    setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame1(Direction Vector)*RealEntry1(X)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame1(Direction Vector)*RealEntry3(Z)\" '( 1))")
+    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"lift{}.txt\") \"All Files (*)\")".format(index))
+    setup1.SendCommand(Command="(cx-gui-do cx-set-toggle-button2 \"Force Reports*Table1*ToggleBox1(Options)*Moments\" #t)(cx-gui-do cx-activate-item \"Force Reports*Table1*ToggleBox1(Options)*Moments\")(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame2(Moment Center)*RealEntry1(X)\" '({}))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame2(Moment Center)*RealEntry2(Y)\" '({}))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame2(Moment Center)*RealEntry3(Z)\" '({}))".format(simulation.dimension.CG_X, simulation.dimension.CG_Y, simulation.dimension.CG_Z))
+    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"roll_moment{}.txt\") \"All Files (*)\")".format(index))
+    setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry1(X)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry2(Y)\" '( 1))")
+    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"pitch_moment{}.txt\") \"All Files (*)\")".format(index))
+    setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry2(Y)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry3(Z)\" '( 1))")
+    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"yaw_moment{}.txt\") \"All Files (*)\")".format(index))
+    setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry3(Z)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame3(Moment Axis)*RealEntry1(X)\" '( 1))(cx-gui-do cx-set-toggle-button2 \"Force Reports*Table1*ToggleBox1(Options)*Forces\" #t)(cx-gui-do cx-activate-item \"Force Reports*Table1*ToggleBox1(Options)*Forces\")(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame1(Direction Vector)*RealEntry3(Z)\" '( 0))(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame1(Direction Vector)*RealEntry2(Y)\" '( -1))")
+    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"force_left{}.txt\") \"All Files (*)\")".format(index))
+    setup1.SendCommand(Command="(cx-gui-do cx-set-real-entry-list \"Force Reports*Table1*Frame2*Frame1(Direction Vector)*RealEntry2(Y)\" '( 1))")
+    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"force_right{}.txt\") \"All Files (*)\")".format(index))
+    setup1.SendCommand(Command='(cx-gui-do cx-set-toggle-button2 "Force Reports*Table1*ToggleBox1(Options)*Center of Pressure" #t)(cx-gui-do cx-activate-item "Force Reports*Table1*ToggleBox1(Options)*Center of Pressure")')
+    setup1.SendCommand(Command="(cx-gui-do cx-activate-item \"Force Reports*PanelButtons*PushButton4(Write)\")(cx-gui-do cx-set-file-dialog-entries \"Select File\" '( \"cp_x_0m_{}.txt\") \"All Files (*)\")".format(index))
+    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "Force Reports*PanelButtons*PushButton2(Cancel)")')
+    setup1.SendCommand(Command='(cx-gui-do cx-activate-item "MenuBar*FileMenu*Close Fluent")')
+    
+    
+    raw_results_collect(simulation, index, proj_params)
+
+    return
+
+def force_report_net(lines):
+    '''
+    Returns the values of the net line of an exported force or moment report. A report of the single wall zone exported by fluent_results_export has its net line on line 13, while a headless report of an aerobody of several wall zones lists every zone before it.
+    List -> List
+
+    Parameters
+    ---------------------
+    lines : List
+        List containing the lines of the report.
+
+    Returns
+    ---------------------
+    values : List
+        List containing the name and values of the net line.
+    '''
+
+    for line in lines:
+        values = line.split()
+        if (len(values) > 0) and (values[0] == "Net"):
+            return(values)
+
+    return(lines[12].split())
+
+def fluent_results_aggregator(simulation, index, proj_params):
+    '''
+    Aggregates exported fluent results and imports into their Simulation_Results object.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    index : int
+        Integer of current index of converged simulation.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    '''
+
+    raw_results_dir = os.path.join(proj_params.results_dir, simulation.sim_name, "Raw Results").replace(os.sep, '/')
+
+    cop_file = open("{}/cp_x_0m_{}.txt".format(raw_results_dir, index), 'r')
+    drag_file = open("{}/drag{}.txt".format(raw_results_dir, index), 'r')
+    lift_file = open("{}/lift{}.txt".format(raw_results_dir, index), 'r')
+    iter_file = open("{}/iter{}.txt".format(raw_results_dir, index), 'r')
+    f_left_file = open("{}/force_left{}.txt".format(raw_results_dir, index), 'r')
+    f_right_file = open("{}/force_right{}.txt".format(raw_results_dir, index), 'r')
+    pitch_file = open("{}/pitch_moment{}.txt".format(raw_results_dir, index), 'r')
+    roll_file = open("{}/roll_moment{}.txt".format(raw_results_dir, index), 'r')
+    yaw_file = open("{}/yaw_moment{}.txt".format(raw_results_dir, index), 'r')
+
+    cop_all_data = cop_file.readlines()
+    drag_all_data = drag_file.readlines()
+    lift_all_data = lift_file.readlines()
+    iter_all_data = iter_file.readlines()
+    f_left_all_data = f_left_file.readlines()
+    f_right_all_data = f_right_file.readlines()
+    pitch_all_data = pitch_file.readlines()
+    roll_all_data = roll_file.readlines()
+    yaw_all_data = yaw_file.readlines()
+
+    # cop values are on line 5
+    # drag values are on the net line, line 13 for a single wall zone
+    # lift values are on the net line
+    # iter values are on line 1
+    # f_left values are on the net line
+    # f_right values are on the net line
+    # pitch moment values are on the net line
+    # roll moment values are on the net line
+    # yaw moment values are on the net line
+
+    cop_line_data = cop_all_data[4].split()
+    drag_line_data = force_report_net(drag_all_data)
+    lift_line_data = force_report_net(lift_all_data)
+    iter_line_data = iter_all_data[0].split()
+    f_left_line_data = force_report_net(f_left_all_data)
+    f_right_line_data = force_report_net(f_right_all_data)
+    pitch_line_data = force_report_net(pitch_all_data)
+    roll_line_data = force_report_net(roll_all_data)
+    yaw_line_data = force_report_net(yaw_all_data)
+
+    cop_values = str(cop_line_data[1]) + " " + str(cop_line_data[2])
+    drag_comp_values = str(drag_line_data[1]) + " " + str(drag_line_data[2])
+    drag_tot_value = str(drag_line_data[3])
+    lift_comp_values = str(lift_line_data[1] + " " + lift_line_data[2])
+    lift_tot_value = str(lift_line_data[3])
+    iter_value = str(iter_line_data[0])
+    f_left_value = str(f_left_line_data[3])
+    f_right_value = str(f_right_line_data[3])
+    pitch_value = str(pitch_line_data[3])
+    roll_value = str(roll_line_data[3])
+    yaw_value =str(yaw_line_data[3])
+
+    simulation.results.iterations = iter_value
+    simulation.results.drag_tot = drag_tot_value
+    simulation.results.drag_comp = drag_comp_values
+    simulation.results.lift_tot = lift_tot_value
+    simulation.results.lift_comp = lift_comp_values
+    simulation.results.f_left = f_left_value
+    simulation.results.f_right = f_right_value
+
+    if simulation.workflow.cg == True:
+      simulation.results.mom_roll = roll_value
+      simulation.results.mom_pitch = pitch_value
+      simulation.results.mom_yaw = yaw_value
+    else:
+      simulation.results.mom_roll = 0
+      simulation.results.mom_pitch = 0
+      simulation.results.mom_yaw = 0
+    simulation.results.cop = cop_values
+
+    return(simulation)
+
+def raw_results_collect(simulation, index, proj_params):
+    '''
+    Copies the report files of a solved Fluent simulation into its raw results, with the final iteration of the drag report file.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    raw_results_dir = os.path.join(proj_params.results_dir, simulation.sim_name, "Raw Results").replace(os.sep, '/')
+    fluent_dir = solve_dir(index, proj_params)
+
+    iter_file = open("{}/drag-rfile.out".format(fluent_dir), 'r')
+    iter_lines = iter_file.readlines()
+    iter_data = iter_lines[len(iter_lines)-1]
+    
+    output = open("{}/iter{}.txt".format(raw_results_dir, index), 'w')
+    output.write(iter_data)
+    output.close()
+    iter_file.close()
+
+    for file_name in os.listdir(fluent_dir):
+        if file_name.endswith("-rfile.out"):
+            shutil.copyfile("{}/{}".format(fluent_dir, file_name), "{}/{}".format(raw_results_dir, file_name))
+
+    return
+
+def headless_mesh_setup(journal, simulation, proj_params):
+    '''
+    Journals the import of the mesh of a simulation, scaled from millimetres, checked and repaired, with text commands in place of the Fluent GUI. A prepared case in the mesh cache is read instead if there is one. Prepared meshes are not stored in the mesh cache, since the journal only runs once it is complete.
+
+    Parameters
+    ---------------------
+    journal : Fluent_Journal object
+        Instance of Fluent_Journal class.
+    simulation : Simulation object
+        Instance of Simulation object.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    prepared_path = mesh_cache_lookup(simulation, proj_params)
+
+    if prepared_path != None:
+        journal.SendCommand(Command='/file/read-case "{}"'.format(prepared_path))
+        return
+
+    import_dir = simulation.mesh.CAS_dir
+    if simulation.mesh.staged_dir != None:
+        import_dir = simulation.mesh.staged_dir
+
+    journal.SendCommand(Command='/file/read-case "{}/{}.cas"'.format(import_dir.replace(os.sep, '/'), simulation.mesh.CAS_name))
+    journal.SendCommand(Command="/mesh/scale 0.001 0.001 0.001")
+    journal.SendCommand(Command="/mesh/check")
+    journal.SendCommand(Command="/mesh/quality")
+    journal.SendCommand(Command="/mesh/repair-improve/allow-repair-at-boundaries yes")
+    journal.SendCommand(Command="/mesh/repair-improve/include-local-polyhedra-conversion-in-repair yes")
+    journal.SendCommand(Command="/mesh/repair-improve/repair")
+
+    return
+
+def headless_setup(simulation, index, proj_params, body_zones, warm_start = None):
+    '''
+    Journals the setup, solution and results export of a simulation for a batch Fluent process, with the same models, boundary conditions, reports and solver settings as komega_setup and tsst_setup and the same exported results as fluent_results_export.
+    Simulation, Int, Project, List -> Fluent_Journal
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    index : int
+        Integer of index of simulation in list of simulations.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    body_zones : List
+        List containing names of the wall zones of the aerobody.
+    warm_start : Warm_Start object
+        Instance of Warm_Start class describing the solved case to initialise from, or None for a standard initialization.
+
+    Returns
+    ---------------------
+    journal : Fluent_Journal object
+        Instance of Fluent_Journal class.
+    '''
+
+    fluent_dir = solve_dir(index, proj_params)
+    raw_results_dir = os.path.join(proj_params.results_dir, simulation.sim_name, "Raw Results").replace(os.sep, '/')
+    zones = " ".join(body_zones)
+    velocity = simulation.workflow.velocity
+    dimension = simulation.dimension
+
+    journal = Fluent_Journal()
+
+    warm_start_write(journal, index, proj_params, warm_start)
+    headless_mesh_setup(journal, simulation, proj_params)
+
+    if solution_method(simulation) == "K-W":
+        journal.SendCommand(Command="/define/models/viscous/kw-sst yes")
+    else:
+        journal.SendCommand(Command="/define/models/viscous/transition-sst yes")
+    journal.SendCommand(Command="/define/materials/change-create air air yes constant 1.177 no no yes constant 1.846e-05 no no no")
+    journal.SendCommand(Command="/define/boundary-conditions/set/velocity-inlet inlet () vmag no {} quit".format(velocity))
+    journal.SendCommand(Command="/define/boundary-conditions/set/wall road () motion-bc yes motion-bc-moving relative no vmag {} quit".format(velocity))
+    journal.SendCommand(Command="/define/boundary-conditions/set/wall walls () shear-bc yes shear-bc-spec-shear quit")
+    journal.SendCommand(Command="/report/reference-values/compute/velocity-inlet inlet")
+    journal.SendCommand(Command="/report/reference-values/area {}".format(dimension.area))
+    journal.SendCommand(Command="/report/reference-values/length {}".format(dimension.length))
+    journal.SendCommand(Command="/solve/set/p-v-coupling 24")
+    journal.SendCommand(Command="/solve/set/discretization-scheme/pressure 12")
+    journal.SendCommand(Command="/solve/set/pseudo-time-method/formulation 1")
+    journal.SendCommand(Command="/solve/set/pseudo-time-method/global-time-step-settings yes 2 {}".format(dimension.length))
+    journal.SendCommand(Command="/solve/report-definitions/add drag drag force-vector 1 0 0 thread-names {} () quit".format(zones))
+    journal.SendCommand(Command="/solve/report-definitions/add lift lift force-vector 0 0 1 thread-names {} () quit".format(zones))
+    for report in ["drag", "lift"]:
+        journal.SendCommand(Command='/solve/report-files/add {0}-rfile report-defs {0} () file-name "{1}/{0}-rfile.out" quit'.format(report, fluent_dir))
+    convergence_setup(journal, proj_params)
+    abort_setup(journal, index, proj_params)
+    autosave_setup(journal, index, proj_params)
+    journal.SendCommand(Command="/solve/initialize/compute-defaults/velocity-inlet inlet")
+    journal.SendCommand(Command="/solve/initialize/initialize-flow yes")
+    initialization_setup(journal, simulation, proj_params, warm_start)
+    warm_start_read(journal, index, proj_params, warm_start)
+
+    journal.SendCommand(Command="/solve/iterate {}".format(proj_params.max_iterations))
+    journal.SendCommand(Command='/file/write-case-data "{}/final.cas.h5"'.format(fluent_dir))
+
+    # only the aerobody is reported, as the single wall zone selected in fluent_results_export, such that both paths give the same forces and moments
+    export_zones = zones
+    journal.SendCommand(Command='/report/forces/wall-forces no {} () 1 0 0 yes "{}/drag{}.txt"'.format(export_zones, raw_results_dir, index))
+    journal.SendCommand(Command='/report/forces/wall-forces no {} () 0 0 1 yes "{}/lift{}.txt"'.format(export_zones, raw_results_dir, index))
+    for (name, axis) in [("roll_moment", "1 0 0"), ("pitch_moment", "0 1 0"), ("yaw_moment", "0 0 1")]:
+        journal.SendCommand(Command='/report/forces/wall-moments no {} () {} {} {} {} yes "{}/{}{}.txt"'.format(export_zones, dimension.CG_X, dimension.CG_Y, dimension.CG_Z, axis, raw_results_dir, name, index))
+    journal.SendCommand(Command='/report/forces/wall-forces no {} () 0 -1 0 yes "{}/force_left{}.txt"'.format(export_zones, raw_results_dir, index))
+    journal.SendCommand(Command='/report/forces/wall-forces no {} () 0 1 0 yes "{}/force_right{}.txt"'.format(export_zones, raw_results_dir, index))
+    journal.SendCommand(Command='/report/forces/pressure-center no {} () x 0 yes "{}/cp_x_0m_{}.txt"'.format(export_zones, raw_results_dir, index))
+    journal.SendCommand(Command="/exit yes")
+
+    return(journal)
+
+def headless_solve(simulation, index, proj_params, solver, body_zones, warm_start = None, cpus = None):
+    '''
+    Runs a simulation in a batch Fluent process without Workbench, in the same Fluent working directory as a Workbench project would use. The transcript is written where convergence_status reads it, and the force reports are exported into the raw results, where results_extract collects them with the report files. The process is stopped with solver_abort once its wall-clock budget is exceeded. The solve is only recorded in the run ledger if Fluent exits with code 0 after iterating; otherwise the failure is reported and the simulation is left to be solved again. Given logical CPUs, Fluent and its parallel processes are pinned to them with taskset, and Fluent's own process affinity is turned off so that it does not bind them to other cores.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    index : int
+        Index of the Fluent working directory of the simulation.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    solver : List
+        List containing the Fluent executable and the arguments before the journal, e.g. ["fluent", "3ddp", "-g", "-t8"].
+    body_zones : List
+        List containing names of the wall zones of the aerobody.
+    warm_start : Warm_Start object
+        Instance of Warm_Start class describing the solved case to initialise from, or None for a standard initialization.
+    cpus : List
+        List of the logical CPUs the simulation is pinned to, or None to leave its placement to the operating system.
+
+    Returns
+    ---------------------
+    returncode : int
+        Exit code of the Fluent process.
+    '''
+
+    import subprocess
+
+    fluent_dir = solve_dir(index, proj_params)
+    transcript = fluent_dir.replace("_files/dp0/", "_files/progress_files/dp0/") + "/Solution.trn"
+    raw_results_dir = os.path.join(proj_params.results_dir, simulation.sim_name, "Raw Results")
+
+    for directory in [fluent_dir, os.path.dirname(transcript), raw_results_dir]:
+        if os.path.exists(directory) == False:
+            os.makedirs(directory)
+    for file_name in ["exit-fluent", "minerva-abort.txt"]:
+        if os.path.isfile("{}/{}".format(fluent_dir, file_name)):
+            os.remove("{}/{}".format(fluent_dir, file_name))
+
+    journal = headless_setup(simulation, index, proj_params, body_zones, warm_start)
+    journal_path = "{}/minerva.jou".format(fluent_dir)
+    with open(journal_path, 'w') as journal_file:
+        journal_file.write("\n".join(journal.commands) + "\n")
+
+    command = solver + ["-i", journal_path]
+    if cpus != None:
+        command = ["taskset", "-c", cpu_list_format(cpus)] + solver + ["-affinity=off", "-i", journal_path]
+        run_report_write(proj_params, simulation.sim_name, "Placement", "Pinned to CPUs {}".format(cpu_list_format(cpus)))
+
+    budget = solver_budget(simulation, proj_params)
+    start = time.time()
+    aborted = None
+
+    with open(transcript, 'w') as transcript_file:
+        process = subprocess.Popen(command, cwd = fluent_dir, stdout = transcript_file, stderr = subprocess.STDOUT)
+        while process.poll() == None:
+            if (aborted == None) and (time.time() - start > budget):
+                solver_abort(index, proj_params, "Wall-clock budget of {:.0f} min exceeded".format(budget / 60))
+                aborted = time.time()
+            elif (aborted != None) and (time.time() - aborted > 60 * proj_params.stall_timeout):
+                process.kill()
+            time.sleep(1)
+
+    iterations = transcript_timing(transcript)[0]
+    if os.path.isfile("{}/drag-rfile.out".format(fluent_dir)):
+        iterations = max(iterations, len(monitor_history_read("{}/drag-rfile.out".format(fluent_dir))[0]))
+
+    if (process.returncode != 0) or (iterations == 0):
+        run_report_write(proj_params, simulation.sim_name, "Failed", "Fluent exited with code {} after {:.1f} min and {} iterations; left to be solved again".format(process.returncode, (time.time() - start) / 60, iterations))
+        return(process.returncode)
+
+    ledger_record(proj_params, simulation, "solve")
+    processes = [int(argument[2:]) for argument in solver if argument.startswith("-t") and argument[2:].isdigit()]
+    runtime_record(simulation, index, proj_params, (processes + [proj_params.processes])[0], time.time() - start)
+    run_report_write(proj_params, simulation.sim_name, "Headless Solve", "Fluent exited with code {} after {:.1f} min and {} iterations".format(process.returncode, (time.time() - start) / 60, iterations))
+
+    return(process.returncode)
+
+def headless_prepare(sim_list, proj_params):
+    '''
+    Prepares the simulations which are not yet solved for solving in batch Fluent without Workbench. Simulations are restored from the result cache and warm-started as in simulation_setup, and each remaining simulation is given a Fluent working directory and its setup is recorded in the run ledger, marked as having no Workbench system.
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    runs : List
+        List of tuples of each Simulation object to solve and its Warm_Start object, or None.
+    '''
+
+    staging_prefetch(sim_list, proj_params)
+
+    ledger = ledger_load(proj_params)
+    next_index = 0
+    for simulation in sim_list:
+        if ledger_done(ledger, simulation, "setup", proj_params) and (simulation.system_index != None):
+            next_index = max(next_index, simulation.system_index + 1)
+
+    runs = []
+
+    for simulation in sim_list:
+        if ledger_done(ledger, simulation, "solve", proj_params) or ledger_pruned(ledger, simulation, proj_params):
+            continue
+        if ledger_done(ledger, simulation, "setup", proj_params) and (simulation.system_index != None):
+            runs.append((simulation, None))
+            continue
+        if result_cache_restore(simulation, proj_params):
+            continue
+        simulation.system_index = next_index
+        next_index += 1
+        warm_start = None
+        if proj_params.warm_start:
+            warm_start = warm_start_source(simulation, sim_list, proj_params)
+        data = {"system_index": simulation.system_index, "cache_key": simulation.cache_key, "initialization": initialization_strategy(simulation, proj_params), "batch": True}
+        if warm_start != None:
+            data["initialization"] = "Warm Start"
+            data["warm_start"] = warm_start.description
+            run_report_write(proj_params, simulation.sim_name, "Warm Start", warm_start.description)
+        ledger_record(proj_params, simulation, "setup", data)
+        runs.append((simulation, warm_start))
+
+    return(runs)
+
+def headless_run(sim_list, proj_params, solver, body_zones, concurrent = 1, order = "SJF", profile = None, pin = True):
+    '''
+    Sets up and solves every simulation in batch Fluent processes without Workbench, running at most the given number of processes at once, in the order given by runtime_order. Simulations are restored from the result cache and warm-started as in simulation_setup, and simulations already solved according to the run ledger are not run again. With a scaling profile, each simulation is solved with the processes at which its mesh solves fastest on its share of the cores of the machine, instead of the processes of the solver arguments. On Linux, each of the simulations solved at once is pinned to its own physical cores on as few NUMA nodes as possible.
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    solver : List
+        List containing the Fluent executable and the arguments before the journal, e.g. ["fluent", "3ddp", "-g", "-t8"].
+    body_zones : List
+        List containing names of the wall zones of the aerobody.
+    concurrent : int
+        Number of Fluent processes run at once.
+    order : str
+        Either "SJF" for shortest predicted runtime first, "LPT" for longest first, or "CSV" for the order of the CSV file.
+    profile : Scaling_Profile object
+        Instance of Scaling_Profile class of this machine, or None to solve with the processes of the solver arguments.
+    pin : bool
+        Boolean variable indicating whether the simulations are pinned to cores where the CPU topology can be read.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    runs = runtime_order(headless_prepare(sim_list, proj_params), proj_params, order)
+    processes = [int(argument[2:]) for argument in solver if argument.startswith("-t") and argument[2:].isdigit()]
+    runtime_report([run[0] for run in runs], proj_params, concurrent, (processes + [proj_params.processes])[0])
+
+    solvers = {}
+    for (simulation, warm_start) in runs:
+        solvers[simulation.sim_name] = solver
+        if profile != None:
+            cells = mesh_cells(simulation)
+            chosen = scaling_processes(profile, cells, profile.cores // max(int(concurrent), 1))
+            solvers[simulation.sim_name] = solver_processes(solver, chosen)
+            run_report_write(proj_params, simulation.sim_name, "Processes", "{} processes for {} cells from the scaling profile of {}".format(chosen, cells, profile.host))
+
+    # Each simulation takes a free set of cores while it is solved and returns it afterwards
+    slot_cores = (processes + [proj_params.processes])[0]
+    if profile != None:
+        slot_cores = profile.cores // max(int(concurrent), 1)
+    topology = None
+    if pin:
+        topology = cpu_topology()
+    free = None
+    if (topology != None) and (len(runs) > 0):
+        free = cpu_placement(topology, min(int(concurrent), len(runs)), int(slot_cores))
+        if free == None:
+            run_report_write(proj_params, "", "Placement", "Not pinned, {} simulations of {} processes need more than the {} physical cores".format(concurrent, slot_cores, sum([len(node) for node in topology])))
+        else:
+            run_report_write(proj_params, "", "Placement", "{} simulations at once on {} NUMA nodes: {}".format(len(free), len(topology), "; ".join([cpu_list_format(cpus) for cpus in free])))
+    lock = threading.Lock()
+
+    def solve(run):
+        cpus = None
+        if free != None:
+            with lock:
+                cpus = free.pop(0)
+        try:
+            return(headless_solve(run[0], run[0].system_index, proj_params, solvers[run[0].sim_name], body_zones, run[1], cpus))
+        finally:
+            if cpus != None:
+                with lock:
+                    free.append(cpus)
+
+    parallel_map(solve, runs, concurrent)
+
+    staging_sync(proj_params)
+
+    return
+
+def solver_processes(solver, processes):
+    '''
+    Returns the arguments of a batch Fluent process with its number of processes replaced, or added if it has none.
+    List, Int -> List
+
+    Parameters
+    ---------------------
+    solver : List
+        List containing the Fluent executable and the arguments before the journal, e.g. ["fluent", "3ddp", "-g", "-t8"].
+    processes : int
+        Number of Fluent processes.
+
+    Returns
+    ---------------------
+    solver : List
+        List containing the Fluent executable and its arguments.
+    '''
+
+    arguments = [argument for argument in solver if (argument.startswith("-t") and argument[2:].isdigit()) == False]
+
+    return(arguments[:2] + ["-t{}".format(int(processes))] + arguments[2:])
+
+def scaling_time(profile, cells, processes):
+    '''
+    Returns the seconds per iteration of a mesh at a number of processes predicted by a scaling profile.
+    Scaling_Profile, Int, Int -> Float
+
+    Parameters
+    ---------------------
+    profile : Scaling_Profile object
+        Instance of Scaling_Profile class.
+    cells : int
+        Cells of the mesh.
+    processes : int
+        Number of Fluent processes.
+
+    Returns
+    ---------------------
+    seconds_per_iteration : float
+        Predicted seconds per iteration.
+    '''
+
+    return(profile.serial + profile.parallel * cells / float(max(profile.cells, 1)) / processes + profile.overhead * processes)
+
+def scaling_fit(profile):
+    '''
+    Fits the serial, parallel and overhead parts of a scaling profile to its samples by least squares. Parts which would be negative are left out of the fit, and the overhead is only fitted with samples at three or more process counts.
+
+    Parameters
+    ---------------------
+    profile : Scaling_Profile object
+        Instance of Scaling_Profile class with samples of [processes, seconds per iteration].
+
+    Returns
+    ---------------------
+    profile : Scaling_Profile object
+        Instance of Scaling_Profile class with the fitted parts.
+    '''
+
+    basis = {"serial": lambda processes: 1.0, "parallel": lambda processes: 1.0 / processes, "overhead": lambda processes: float(processes)}
+    counts = set([sample[0] for sample in profile.samples])
+
+    for terms in [["serial", "parallel", "overhead"], ["serial", "parallel"], ["parallel", "overhead"], ["parallel"]]:
+        if len(terms) > len(counts):
+            continue
+        # Normal equations of the least squares fit, solved by Gaussian elimination
+        rows = [[sum([basis[a](p) * basis[b](p) for (p, t) in profile.samples]) for b in terms] + [sum([basis[a](p) * t for (p, t) in profile.samples])] for a in terms]
+        size = len(terms)
+        singular = False
+        for i in range(size):
+            pivot = max(range(i, size), key = lambda row: abs(rows[row][i]))
+            if abs(rows[pivot][i]) < 1e-12:
+                singular = True
+                break
+            (rows[i], rows[pivot]) = (rows[pivot], rows[i])
+            for row in range(size):
+                if row != i:
+                    factor = rows[row][i] / rows[i][i]
+                    rows[row] = [rows[row][j] - factor * rows[i][j] for j in range(size + 1)]
+        if singular:
+            continue
+        values = dict([(terms[i], rows[i][size] / rows[i][i]) for i in range(size)])
+        if min(values.values()) < 0:
+            continue
+        profile.serial = values.get("serial", 0.0)
+        profile.parallel = values.get("parallel", 0.0)
+        profile.overhead = values.get("overhead", 0.0)
+        return(profile)
+
+    return(profile)
+
+def scaling_processes(profile, cells, limit):
+    '''
+    Returns the number of processes at most the given limit at which a mesh solves fastest according to a scaling profile, the fewest processes being used where more do not help.
+    Scaling_Profile, Int, Int -> Int
+
+    Parameters
+    ---------------------
+    profile : Scaling_Profile object
+        Instance of Scaling_Profile class.
+    cells : int
+        Cells of the mesh.
+    limit : int
+        Most processes which may be used.
+
+    Returns
+    ---------------------
+    processes : int
+        Number of Fluent processes.
+    '''
+
+    times = [(scaling_time(profile, cells, processes), processes) for processes in range(1, max(int(limit), 1) + 1)]
+    fastest = min(times)[0]
+
+    return(min([processes for (seconds, processes) in times if seconds <= fastest * 1.01]))
+
+def scaling_choose(profile, cells, cores = None):
+    '''
+    Chooses the number of processes of each simulation and of simulations solved at once which solve the most meshes of the given size per hour on the machine of a scaling profile. The simulations solved at once are limited by the cores and by the memory each takes. Where several choices solve within 2% as many meshes per hour, the one with the most processes per simulation is chosen, which finishes each simulation soonest.
+    Scaling_Profile, Int -> Tuple
+
+    Parameters
+    ---------------------
+    profile : Scaling_Profile object
+        Instance of Scaling_Profile class.
+    cells : int
+        Cells of the mesh.
+    cores : int
+        Cores which may be used, or None for every core of the machine.
+
+    Returns
+    ---------------------
+    processes : int
+        Number of Fluent processes of each simulation.
+    concurrent : int
+        Number of simulations solved at once.
+    '''
+
+    if cores == None:
+        cores = profile.cores
+
+    cores = max(int(cores), 1)
+    by_memory = max(int(profile.memory_gb // max(profile.memory_per_million * cells / 1.0e6, 1e-9)), 1)
+    choices = []
+
+    for processes in range(1, cores + 1):
+        concurrent = min(cores // processes, by_memory)
+        choices.append((concurrent / scaling_time(profile, cells, processes), processes, concurrent))
+
+    best = max(choices)[0]
+    (throughput, processes, concurrent) = max([choice for choice in choices if choice[0] >= best * 0.98], key = lambda choice: choice[1])
+
+    return(processes, concurrent)
+
+def calibration_project(proj_params, iterations):
+    '''
+    Returns a copy of the project parameters for short calibration solves of a fixed number of iterations in a temporary directory, without the result cache, local scratch, write-behind or warm starts.
+    Project, Int -> Tuple
+
+    Parameters
+    ---------------------
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    iterations : int
+        Number of iterations of each calibration solve.
+
+    Returns
+    ---------------------
+    calibration : Project object
+        Instance of Project class of the calibration project.
+    work_dir : str
+        Path to the temporary directory of the calibration project, to be removed once the solves are done.
+    '''
+
+    import copy
+    import tempfile
+
+    work_dir = tempfile.mkdtemp()
+    calibration = copy.copy(proj_params)
+    calibration.proj_name = "Calibration"
+    calibration.proj_dir = work_dir
+    calibration.results_dir = work_dir
+    calibration.min_iterations = iterations
+    calibration.max_iterations = iterations
+    calibration.autosave_frequency = iterations + 1
+    calibration.cache_dir = None
+    calibration.scratch_dir = None
+    calibration.write_behind = None
+    calibration.warm_start = False
+
+    return(calibration, work_dir)
+
+def scaling_calibrate(simulation, proj_params, solver, body_zones, process_counts, iterations = 30, repeats = 1):
+    '''
+    Calibrates the strong scaling of Fluent on this machine by solving a representative mesh in batch Fluent for a fixed number of iterations at each of the given process counts, in a temporary project, and fitting a scaling profile to the seconds per iteration. The seconds per iteration are read from the time remaining which Fluent estimates, so that startup and mesh reading are not counted, or from the wall-clock time otherwise.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object of the representative mesh.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    solver : List
+        List containing the Fluent executable and the arguments before the journal, e.g. ["fluent", "3ddp", "-g", "-t8"].
+    body_zones : List
+        List containing names of the wall zones of the aerobody.
+    process_counts : List
+        List of the numbers of processes to calibrate.
+    iterations : int
+        Number of iterations of each calibration solve.
+    repeats : int
+        Number of solves at each number of processes, of which the fastest is kept.
+
+    Returns
+    ---------------------
+    profile : Scaling_Profile object
+        Instance of Scaling_Profile class.
+    '''
+
+    import socket
+
+    (calibration, work_dir) = calibration_project(proj_params, iterations)
+    profile = Scaling_Profile(host = socket.gethostname(), cells = mesh_cells(simulation))
+    index = 0
+
+    try:
+        for processes in process_counts:
+            fastest = None
+            for repeat in range(max(int(repeats), 1)):
+                start = time.time()
+                headless_solve(simulation, index, calibration, solver_processes(solver, processes), body_zones)
+                wall_seconds = time.time() - start
+                transcript = solve_dir(index, calibration).replace("_files/dp0/", "_files/progress_files/dp0/") + "/Solution.trn"
+                (iteration, seconds_per_iteration, finished) = transcript_timing(transcript)
+                if seconds_per_iteration == None:
+                    seconds_per_iteration = wall_seconds / float(max(iteration, iterations))
+                if (fastest == None) or (seconds_per_iteration < fastest):
+                    fastest = seconds_per_iteration
+                index += 1
+            profile.samples.append([int(processes), fastest])
+            run_report_write(proj_params, simulation.sim_name, "Scaling Calibration", "{} processes: {:.3f} s per iteration".format(processes, fastest))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors = True)
+
+    return(scaling_fit(profile))
+
+def scaling_profile_write(profile, path):
+    '''
+    Writes a scaling profile to a JSON file.
+
+    Parameters
+    ---------------------
+    profile : Scaling_Profile object
+        Instance of Scaling_Profile class.
+    path : str
+        Path to the JSON file.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    with open(path, 'w') as profile_file:
+        json.dump(profile.__dict__, profile_file, indent = 2)
+
+    return
+
+def scaling_profile_load(path):
+    '''
+    Reads a scaling profile from a JSON file written by scaling_profile_write.
+    Str -> Scaling_Profile
+
+    Parameters
+    ---------------------
+    path : str
+        Path to the JSON file.
+
+    Returns
+    ---------------------
+    profile : Scaling_Profile object
+        Instance of Scaling_Profile class, or None if the file does not exist or cannot be read.
+    '''
+
+    if (path == None) or (os.path.isfile(path) == False):
+        return(None)
+
+    try:
+        with open(path, 'r') as profile_file:
+            return(Scaling_Profile(**json.load(profile_file)))
+    except (ValueError, TypeError):
+        return(None)
+
+def cpu_list_format(cpus):
+    '''
+    Formats logical CPU numbers as a CPU list, e.g. "0-7,16-23", as used by taskset and the Linux kernel.
+    List -> Str
+
+    Parameters
+    ---------------------
+    cpus : List
+        List of logical CPU numbers.
+
+    Returns
+    ---------------------
+    cpu_list : str
+        CPU list of ranges separated by commas.
+    '''
+
+    ranges = []
+
+    for cpu in sorted(set(cpus)):
+        if (len(ranges) > 0) and (ranges[-1][1] == cpu - 1):
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+
+    return(",".join([["{}-{}".format(first, last), "{}".format(first)][first == last] for (first, last) in ranges]))
+
+def cpu_list_parse(cpu_list):
+    '''
+    Parses a CPU list, e.g. "0-7,16-23", into logical CPU numbers.
+    Str -> List
+
+    Parameters
+    ---------------------
+    cpu_list : str
+        CPU list of ranges separated by commas.
+
+    Returns
+    ---------------------
+    cpus : List
+        List of logical CPU numbers.
+    '''
+
+    cpus = []
+
+    for entry in cpu_list.strip().split(","):
+        if entry == "":
+            continue
+        bounds = entry.split("-")
+        cpus += list(range(int(bounds[0]), int(bounds[-1]) + 1))
+
+    return(cpus)
+
+def cpu_topology(sys_dir = "/sys/devices/system"):
+    '''
+    Reads the NUMA nodes, physical cores and logical CPUs of a Linux machine from sysfs, keeping only the CPUs this process may run on. Machines without NUMA information are taken as a single node.
+    Str -> List
+
+    Parameters
+    ---------------------
+    sys_dir : str
+        Path to the system devices directory of sysfs.
+
+    Returns
+    ---------------------
+    topology : List
+        List of the NUMA nodes in order, each a list of its physical cores, each a list of the logical CPUs of the core. None if the topology cannot be read or processes cannot be pinned with taskset, as on Windows.
+    '''
+
+    cpu_dir = os.path.join(sys_dir, "cpu")
+    node_dir = os.path.join(sys_dir, "node")
+
+    if (os.path.isdir(cpu_dir) == False) or (len([path for path in os.environ.get("PATH", "").split(os.pathsep) if os.access(os.path.join(path, "taskset"), os.X_OK)]) == 0):
+        return(None)
+
+    def read(path, default):
+        try:
+            with open(path, 'r') as sys_file:
+                return(sys_file.read().strip())
+        except (IOError, OSError):
+            return(default)
+
+    node_of = {}
+    if os.path.isdir(node_dir):
+        for name in os.listdir(node_dir):
+            match = re.match("^node(\\d+)$", name)
+            if match != None:
+                for cpu in cpu_list_parse(read(os.path.join(node_dir, name, "cpulist"), "")):
+                    node_of[cpu] = int(match.group(1))
+
+    allowed = None
+    if hasattr(os, "sched_getaffinity"):
+        allowed = os.sched_getaffinity(0)
+
+    cores = {}
+    for name in os.listdir(cpu_dir):
+        match = re.match("^cpu(\\d+)$", name)
+        if match == None:
+            continue
+        cpu = int(match.group(1))
+        topology_dir = os.path.join(cpu_dir, name, "topology")
+        if (os.path.isdir(topology_dir) == False) or (read(os.path.join(cpu_dir, name, "online"), "1") == "0"):
+            continue
+        if (allowed != None) and (cpu not in allowed):
+            continue
+        key = (node_of.get(cpu, 0), int(read(os.path.join(topology_dir, "physical_package_id"), "0")), int(read(os.path.join(topology_dir, "core_id"), "{}".format(cpu))))
+        cores.setdefault(key, []).append(cpu)
+
+    if len(cores) == 0:
+        return(None)
+
+    nodes = {}
+    for key in sorted(cores):
+        nodes.setdefault(key[0], []).append(sorted(cores[key]))
+
+    return([nodes[node] for node in sorted(nodes)])
+
+def cpu_placement(topology, slots, cores, compact = True):
+    '''
+    Assigns each of the simulations solved at once a disjoint set of physical cores. Compact placement puts each simulation on a single NUMA node where one has enough free cores, choosing the node with the fewest, and otherwise on the nodes with the most free cores, such that each simulation spans as few nodes as possible. Scattered placement spreads each simulation over every node in turn, as the operating system does with unpinned processes.
+    List, Int, Int -> List
+
+    Parameters
+    ---------------------
+    topology : List
+        NUMA topology returned by cpu_topology.
+    slots : int
+        Number of simulations solved at once.
+    cores : int
+        Physical cores of each simulation.
+    compact : bool
+        Boolean variable indicating whether the placement is compact or scattered.
+
+    Returns
+    ---------------------
+    placements : List
+        List of the logical CPUs of each simulation, including the hyperthreads of its cores, or None if the machine has too few cores.
+    '''
+
+    free = [list(node) for node in topology]
+    placements = []
+
+    for slot in range(int(slots)):
+        chosen = []
+        if compact:
+            fitting = [i for i in range(len(free)) if len(free[i]) >= cores]
+            order = sorted(range(len(free)), key = lambda i: -len(free[i]))
+            if len(fitting) > 0:
+                order = [min(fitting, key = lambda i: len(free[i]))]
+            for i in order:
+                while (len(free[i]) > 0) and (len(chosen) < cores):
+                    chosen.append(free[i].pop(0))
+        else:
+            while (len(chosen) < cores) and (sum([len(node) for node in free]) > 0):
+                for node in free:
+                    if (len(node) > 0) and (len(chosen) < cores):
+                        chosen.append(node.pop(0))
+        if len(chosen) < cores:
+            return(None)
+        placements.append(sorted(sum(chosen, [])))
+
+    return(placements)
+
+def cpu_nodes(topology, cpus):
+    '''
+    Returns the number of NUMA nodes which a set of logical CPUs spans.
+    List, List -> Int
+
+    Parameters
+    ---------------------
+    topology : List
+        NUMA topology returned by cpu_topology.
+    cpus : List
+        List of logical CPU numbers.
+
+    Returns
+    ---------------------
+    nodes : int
+        Number of NUMA nodes.
+    '''
+
+    return(len([node for node in topology if len(set(sum(node, [])) & set(cpus)) > 0]))
+
+def placement_benchmark(simulation, proj_params, solver, body_zones, concurrent, processes, iterations = 30):
+    '''
+    Compares scattered and pinned placement of simulations solved at once by solving a representative mesh the given number of times at once for a fixed number of iterations, first with each simulation scattered over the NUMA nodes and then with each pinned compactly, and writes the seconds per iteration of each to the run report.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object of the representative mesh.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    solver : List
+        List containing the Fluent executable and the arguments before the journal, e.g. ["fluent", "3ddp", "-g", "-t8"].
+    body_zones : List
+        List containing names of the wall zones of the aerobody.
+    concurrent : int
+        Number of simulations solved at once.
+    processes : int
+        Number of Fluent processes of each simulation.
+    iterations : int
+        Number of iterations of each benchmark solve.
+
+    Returns
+    ---------------------
+    results : dict
+        Mean seconds per iteration of the scattered and pinned placements, or None if the benchmark could not be run.
+    '''
+
+    topology = cpu_topology()
+
+    if topology == None:
+        run_report_write(proj_params, "", "Placement Benchmark", "Not run, the CPU topology cannot be read or taskset is not available")
+        return(None)
+
+    placements = {"Scattered": cpu_placement(topology, concurrent, processes, False), "Pinned": cpu_placement(topology, concurrent, processes, True)}
+
+    if placements["Pinned"] == None:
+        run_report_write(proj_params, "", "Placement Benchmark", "Not run, {} simulations of {} processes need more than the {} physical cores".format(concurrent, processes, sum([len(node) for node in topology])))
+        return(None)
+
+    (calibration, work_dir) = calibration_project(proj_params, iterations)
+    results = {}
+
+    try:
+        for (index, name) in enumerate(["Scattered", "Pinned"]):
+            def solve(slot):
+                system_index = index * concurrent + slot
+                start = time.time()
+                headless_solve(simulation, system_index, calibration, solver_processes(solver, processes), body_zones, None, placements[name][slot])
+                transcript = solve_dir(system_index, calibration).replace("_files/dp0/", "_files/progress_files/dp0/") + "/Solution.trn"
+                (iteration, seconds_per_iteration, finished) = transcript_timing(transcript)
+                if seconds_per_iteration == None:
+                    seconds_per_iteration = (time.time() - start) / float(max(iteration, iterations))
+                return(seconds_per_iteration)
+            times = [seconds for seconds in parallel_map(solve, list(range(concurrent)), concurrent) if seconds != None]
+            if len(times) == 0:
+                continue
+            results[name] = sum(times) / len(times)
+            run_report_write(proj_params, "", "Placement Benchmark", "{}: {} simulations of {} processes on up to {} NUMA nodes each, {:.3f} s per iteration".format(name, concurrent, processes, max([cpu_nodes(topology, cpus) for cpus in placements[name]]), results[name]))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors = True)
+
+    if len(results) == 2:
+        speedup = results["Scattered"] / results["Pinned"] - 1
+        run_report_write(proj_params, "", "Placement Benchmark", "Pinned placement is {:.0%} {} than scattered on {} NUMA nodes".format(abs(speedup), ["slower", "faster"][speedup >= 0], len(topology)))
+
+    return(results)
+
+def queue_dirs(queue_dir):
+    '''
+    Returns the folders of a shared job queue, creating them if needed.
+    Str -> Tuple
+
+    Parameters
+    ---------------------
+    queue_dir : str
+        Path to the shared directory of the job queue.
+
+    Returns
+    ---------------------
+    dirs : Tuple
+        Paths to the folders of the published jobs, of their lease files, and of the completed jobs.
+    '''
+
+    dirs = (os.path.join(queue_dir, "Jobs"), os.path.join(queue_dir, "Leases"), os.path.join(queue_dir, "Done"))
+
+    for directory in dirs:
+        if os.path.exists(directory) == False:
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if os.path.isdir(directory) == False:
+                    raise
+
+    return(dirs)
+
+def queue_publish(sim_list, proj_params, csv_path):
+    '''
+    Publishes a job for every simulation which is not yet solved into the shared job queue of the project, for worker daemons on other machines to claim and solve in batch Fluent. The Simulation Parameters CSV is copied into the Projects folder of the queue, and each job refers to the copy by its path within the queue, such that every worker finds it wherever the queue is mounted. Projects whose folders are given as relative paths are rejected, since the workers would resolve them on their own machines. The simulations are prepared as by headless_run, and the jobs are named such that workers claim them shortest predicted runtime first. A job published by an earlier run is published again with its completion cleared.
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+    csv_path : str
+        Path to the Simulation Parameters CSV, which is copied into the shared directory for the workers to read.
+
+    Returns
+    ---------------------
+    published : int
+        Number of jobs published.
+    '''
+
+    for path in [proj_params.proj_dir, proj_params.results_dir] + [simulation.mesh.CAS_dir for simulation in sim_list]:
+        if os.path.isabs(path) == False:
+            raise ValueError("{} is relative to this machine; queued projects need the full paths of shared folders which every worker sees".format(path))
+
+    (jobs_dir, leases_dir, done_dir) = queue_dirs(proj_params.queue_dir)
+
+    shared_csv = "Projects/{}.csv".format(proj_params.proj_name)
+    if os.path.exists(os.path.join(proj_params.queue_dir, "Projects")) == False:
+        os.makedirs(os.path.join(proj_params.queue_dir, "Projects"))
+    shutil.copyfile(csv_path, os.path.join(proj_params.queue_dir, shared_csv + ".tmp"))
+    if os.path.isfile(os.path.join(proj_params.queue_dir, shared_csv)):
+        os.remove(os.path.join(proj_params.queue_dir, shared_csv))
+    os.rename(os.path.join(proj_params.queue_dir, shared_csv + ".tmp"), os.path.join(proj_params.queue_dir, shared_csv))
+
+    runs = runtime_order(headless_prepare(sim_list, proj_params), proj_params)
+    runtime_report([run[0] for run in runs], proj_params)
+
+    for rank in range(len(runs)):
+        (simulation, warm_start) = runs[rank]
+        job_name = "{} {:05d} {}".format(proj_params.proj_name, rank, simulation.sim_name)
+        for file_name in os.listdir(jobs_dir):
+            if re.match("{} \\d+ {}\\.json$".format(re.escape(proj_params.proj_name), re.escape(simulation.sim_name)), file_name) != None:
+                os.remove(os.path.join(jobs_dir, file_name))
+        job = {"project": proj_params.proj_name, "simulation": simulation.sim_name, "system_index": simulation.system_index, "csv_path": shared_csv, "warm_start": None, "published": datetime.now().strftime("%Y-%m-%dT%H:%M:%S")}
+        if warm_start != None:
+            job["warm_start"] = {"case_path": warm_start.case_path, "data_path": warm_start.data_path, "velocity": warm_start.velocity, "same_mesh": warm_start.same_mesh, "description": warm_start.description, "method": warm_start.method}
+
+        done_path = os.path.join(done_dir, job_name + ".json")
+        if os.path.isfile(done_path):
+            os.remove(done_path)
+
+        job_path = os.path.join(jobs_dir, job_name + ".json")
+        with open(job_path + ".tmp", 'w') as job_file:
+            json.dump(job, job_file, indent=2)
+        if os.path.isfile(job_path):
+            os.remove(job_path)
+        os.rename(job_path + ".tmp", job_path)
+
+    run_report_write(proj_params, "", "Queue", "{} jobs published to {}".format(len(runs), proj_params.queue_dir))
+
+    staging_sync(proj_params)
+
+    return(len(runs))
+
+def queue_pending(queue_dir, project = None):
+    '''
+    Lists the jobs of a shared job queue which have not been completed.
+    Str -> List
+
+    Parameters
+    ---------------------
+    queue_dir : str
+        Path to the shared directory of the job queue.
+    project : str
+        Name of the project whose jobs are listed, or None for the jobs of every project.
+
+    Returns
+    ---------------------
+    pending : List
+        List of the names of the jobs, in the order in which they are claimed.
+    '''
+
+    (jobs_dir, leases_dir, done_dir) = queue_dirs(queue_dir)
+
+    pending = []
+
+    for file_name in sorted(os.listdir(jobs_dir)):
+        if file_name.endswith(".json") == False:
+            continue
+        job_name = file_name[:-len(".json")]
+        if (project != None) and (job_name.startswith(project + " ") == False):
+            continue
+        if os.path.isfile(os.path.join(done_dir, file_name)) == False:
+            pending.append(job_name)
+
+    return(pending)
+
+def queue_leases(leases_dir, job_name):
+    '''
+    Lists the lease files of a job of a shared job queue. Every lease of a job has a generation, which is one more than that of the lease it was stolen from, and only the lease of the highest generation is held.
+    Str, Str -> List
+
+    Parameters
+    ---------------------
+    leases_dir : str
+        Path to the folder of the lease files.
+    job_name : str
+        Name of the job.
+
+    Returns
+    ---------------------
+    leases : List
+        List of tuples of the generation and path of each lease file, highest generation last.
+    '''
+
+    leases = []
+
+    for file_name in os.listdir(leases_dir):
+        match = re.match("{}\\.(\\d+)\\.lease$".format(re.escape(job_name)), file_name)
+        if match != None:
+            leases.append((int(match.group(1)), os.path.join(leases_dir, file_name)))
+
+    return(sorted(leases))
+
+def queue_claim(queue_dir, worker, lease_timeout):
+    '''
+    Claims the first pending job of a shared job queue which no other worker holds a live lease on. A lease is taken by creating its lease file exclusively, so only one worker can hold it. A lease whose file has not been touched by a heartbeat within the lease timeout is stolen by exclusively creating the lease file of the next generation, which only one worker can do, and the expired lease is only removed afterwards, such that no live lease is ever moved or removed by another worker. A worker which finds a higher generation, or the job completed, once it has created its lease backs off. Every claim is counted in the job file, such that a job which keeps failing, or whose workers keep stopping, can be given up.
+    Str, Str, Float -> Dict
+
+    Parameters
+    ---------------------
+    queue_dir : str
+        Path to the shared directory of the job queue.
+    worker : str
+        Name of the worker claiming the job.
+    lease_timeout : float
+        Time in seconds after the last heartbeat at which a lease expires.
+
+    Returns
+    ---------------------
+    job : dict
+        Dictionary of the job, with the name of the job, the path to its lease file, whether its lease was stolen, and the number of times it was claimed, or None if no job can be claimed.
+    '''
+
+    (jobs_dir, leases_dir, done_dir) = queue_dirs(queue_dir)
+
+    for job_name in queue_pending(queue_dir):
+        leases = queue_leases(leases_dir, job_name)
+        generation = 0
+        stolen = False
+
+        if len(leases) > 0:
+            try:
+                if time.time() - os.path.getmtime(leases[-1][1]) < lease_timeout:
+                    continue
+            except OSError:
+                continue
+            generation = leases[-1][0] + 1
+            stolen = True
+
+        lease_path = os.path.join(leases_dir, "{}.{}.lease".format(job_name, generation))
+        try:
+            lease_file = os.open(lease_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError:
+            continue
+        os.write(lease_file, json.dumps({"worker": worker, "generation": generation, "claimed": datetime.now().strftime("%Y-%m-%dT%H:%M:%S")}).encode("utf-8"))
+        os.close(lease_file)
+
+        leases = queue_leases(leases_dir, job_name)
+        if (leases[-1][0] > generation) or os.path.isfile(os.path.join(done_dir, job_name + ".json")):
+            try:
+                os.remove(lease_path)
+            except OSError:
+                pass
+            continue
+
+        # expired leases of earlier generations are removed once this one is held
+        for (earlier, earlier_path) in leases[:-1]:
+            try:
+                os.remove(earlier_path)
+            except OSError:
+                pass
+
+        job_path = os.path.join(jobs_dir, job_name + ".json")
+        with open(job_path, 'r') as job_file:
+            job = json.load(job_file)
+        job["attempts"] = job.get("attempts", 0) + 1
+        with open(job_path + ".{}.tmp".format(worker), 'w') as job_file:
+            json.dump(job, job_file, indent=2)
+        if os.path.isfile(job_path):
+            os.remove(job_path)
+        os.rename(job_path + ".{}.tmp".format(worker), job_path)
+        job["name"] = job_name
+        job["lease_path"] = lease_path
+        job["stolen"] = stolen
+
+        return(job)
+
+    return(None)
+
+def queue_heartbeat(lease_path, interval, stop):
+    '''
+    Touches a lease file at a fixed interval until stopped, so that the lease does not expire while its job is being solved.
+
+    Parameters
+    ---------------------
+    lease_path : str
+        Path to the lease file.
+    interval : float
+        Time in seconds between heartbeats.
+    stop : threading.Event
+        Event set once the job is finished.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    while stop.wait(interval) == False:
+        try:
+            os.utime(lease_path, None)
+        except OSError:
+            return
+
+    return
+
+def queue_complete(queue_dir, job, worker, returncode):
+    '''
+    Marks a job of a shared job queue as completed and releases its lease.
+
+    Parameters
+    ---------------------
+    queue_dir : str
+        Path to the shared directory of the job queue.
+    job : dict
+        Dictionary of the job, as returned by queue_claim.
+    worker : str
+        Name of the worker which solved the job.
+    returncode : int
+        Exit code of the Fluent process, or None if the job was given up.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    (jobs_dir, leases_dir, done_dir) = queue_dirs(queue_dir)
+
+    done_path = os.path.join(done_dir, job["name"] + ".json")
+    with open(done_path + ".tmp", 'w') as done_file:
+        json.dump({"worker": worker, "returncode": returncode, "completed": datetime.now().strftime("%Y-%m-%dT%H:%M:%S")}, done_file, indent=2)
+    if os.path.isfile(done_path):
+        os.remove(done_path)
+    os.rename(done_path + ".tmp", done_path)
+
+    try:
+        os.remove(job["lease_path"])
+    except OSError:
+        pass
+
+    return
+
+def queue_work(queue_dir, worker, solver, body_zones, lease_timeout = 600, heartbeat = 60, poll = 30, exit_when_idle = False, profile = None, cpus = None, attempts = 3):
+    '''
+    Runs a worker daemon which claims jobs from a shared job queue and solves each in batch Fluent with headless_solve, writing the transcript, report files and exported results into the project and results directories on the shared directory, where the journal which published the jobs reads them. The lease of a job is kept alive by a heartbeat while it is solved; a worker which stops without completing a job, or whose solve fails, leaves its lease to expire, after which another worker steals it. A job claimed more often than the number of attempts is completed as failed instead of being solved again. With a scaling profile, each job is solved with the processes at which its mesh solves fastest, at most the processes of the solver arguments.
+
+    Parameters
+    ---------------------
+    queue_dir : str
+        Path to the shared directory of the job queue.
+    worker : str
+        Name of the worker, unique among the workers of the queue.
+    solver : List
+        List containing the Fluent executable and the arguments before the journal, e.g. ["fluent", "3ddp", "-g", "-t8"].
+    body_zones : List
+        List containing names of the wall zones of the aerobody.
+    lease_timeout : float
+        Time in seconds after the last heartbeat at which a lease expires.
+    heartbeat : float
+        Time in seconds between heartbeats.
+    poll : float
+        Time in seconds between looking for jobs when none can be claimed.
+    exit_when_idle : bool
+        Boolean variable indicating whether the worker stops once every job of the queue is completed.
+    profile : Scaling_Profile object
+        Instance of Scaling_Profile class of the machine of the worker, or None to solve with the processes of the solver arguments.
+    cpus : List
+        List of the logical CPUs the jobs of the worker are pinned to, or None to leave their placement to the operating system.
+    attempts : int
+        Number of times a job is attempted before it is given up.
+
+    Returns
+    ---------------------
+    solved : int
+        Number of jobs solved.
+    '''
+
+    solved = 0
+    limit = ([int(argument[2:]) for argument in solver if argument.startswith("-t") and argument[2:].isdigit()] + [1])[0]
+
+    while True:
+        job = queue_claim(queue_dir, worker, lease_timeout)
+
+        if job == None:
+            if exit_when_idle and (len(queue_pending(queue_dir)) == 0):
+                return(solved)
+            time.sleep(poll)
+            continue
+
+        (sim_list, proj_params) = param_extract(os.path.join(queue_dir, job["csv_path"]))
+        project_open(sim_list, proj_params)
+        matches = [simulation for simulation in sim_list if simulation.sim_name == job["simulation"]]
+
+        if len(matches) == 0:
+            run_report_write(proj_params, job["simulation"], "Queue", "{} found no simulation of this name in {}".format(worker, job["csv_path"]))
+            queue_complete(queue_dir, job, worker, None)
+            staging_flush(proj_params)
+            continue
+
+        if job["attempts"] > attempts:
+            run_report_write(proj_params, job["simulation"], "Failed", "Queue job given up by {} after {} attempts".format(worker, attempts))
+            queue_complete(queue_dir, job, worker, None)
+            staging_flush(proj_params)
+            continue
+
+        simulation = matches[0]
+        simulation.system_index = job["system_index"]
+        warm_start = None
+        if job["warm_start"] != None:
+            warm_start = Warm_Start(**job["warm_start"])
+
+        if job["stolen"]:
+            run_report_write(proj_params, simulation.sim_name, "Lease Stolen", "{} took over the expired lease".format(worker))
+        run_report_write(proj_params, simulation.sim_name, "Queue", "Claimed by {}".format(worker))
+
+        job_solver = solver
+        if profile != None:
+            cells = mesh_cells(simulation)
+            chosen = scaling_processes(profile, cells, limit)
+            job_solver = solver_processes(solver, chosen)
+            run_report_write(proj_params, simulation.sim_name, "Processes", "{} processes for {} cells from the scaling profile of {}".format(chosen, cells, profile.host))
+
+        stop = threading.Event()
+        beat = threading.Thread(target=queue_heartbeat, args=(job["lease_path"], heartbeat, stop))
+        beat.daemon = True
+        beat.start()
+
+        try:
+            returncode = headless_solve(simulation, simulation.system_index, proj_params, job_solver, body_zones, warm_start, cpus)
+        except Exception as error:
+            run_report_write(proj_params, simulation.sim_name, "Queue", "{} failed, lease left to expire: {}".format(worker, error))
+            staging_flush(proj_params)
+            continue
+        finally:
+            stop.set()
+            beat.join()
+
+        if ledger_done(ledger_load(proj_params), simulation, "solve", proj_params) == False:
+            run_report_write(proj_params, simulation.sim_name, "Queue", "{} failed with exit code {}, lease left to expire".format(worker, returncode))
+            staging_flush(proj_params)
+            continue
+
+        staging_flush(proj_params)
+        queue_complete(queue_dir, job, worker, returncode)
+        solved += 1
+
+def queue_wait(sim_list, proj_params):
+    '''
+    Waits until every job of the project in its shared job queue is completed, or until no worker has completed a job or renewed a lease for the watchdog stall timeout. The workers record each solve in the run ledger themselves.
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    pending : List
+        List of the names of the jobs which were not completed.
+    '''
+
+    (jobs_dir, leases_dir, done_dir) = queue_dirs(proj_params.queue_dir)
+
+    pending = queue_pending(proj_params.queue_dir, proj_params.proj_name)
+    last_activity = time.time()
+    model = runtime_model(proj_params)
+
+    while len(pending) > 0:
+        runtime_eta_write(sim_list, proj_params, model)
+        time.sleep(60)
+        remaining = queue_pending(proj_params.queue_dir, proj_params.proj_name)
+        heartbeats = []
+        for job_name in remaining:
+            for (generation, lease_path) in queue_leases(leases_dir, job_name):
+                try:
+                    heartbeats.append(os.path.getmtime(lease_path))
+                except OSError:
+                    pass
+        if (len(remaining) < len(pending)) or ((len(heartbeats) > 0) and (time.time() - max(heartbeats) < 60 * proj_params.stall_timeout)):
+            last_activity = time.time()
+        elif time.time() - last_activity > 60 * proj_params.stall_timeout:
+            run_report_write(proj_params, "", "Queue", "No worker active for {} minutes, stopped waiting with {} jobs pending".format(proj_params.stall_timeout, len(remaining)))
+            pending = remaining
+            break
+        pending = remaining
+
+    if len(pending) == 0:
+        run_report_write(proj_params, "", "Queue", "Every job completed")
+
+    staging_sync(proj_params)
+
+    return(pending)
+
+def results_formatter(sim_list, proj_params):
+    export_directory = proj_params.results_dir.replace(os.sep, '/')
+
+    current_date = date.today().strftime("%d/%m/%Y")
+
+    monitor_names = monitor_statistics_columns(sim_list)
+    stats_header = ""
+    for name in monitor_names:
+        stats_header += "{0} Mean,{0} Std. Dev.,{0} Min,{0} Max,{0} 95% CI (+/-),".format(name)
+
+    with open("{}/{} Simulation Results.csv".format(export_directory, proj_params.proj_name), 'w') as csvfile:
+        csvfile.write('Simulation Name,.CAS File Name,Date,Number of Iterations,A. Drag [N] (Total),B. Drag [N]: Pressure + Viscous,A. Lift [N] (Total),B. Lift [N]: Pressure + Viscous,' + stats_header + 'Force Left [N] (Total),Force Right [N] (Total),"Roll Moment [N-m] (axis = [1,0,0])","Pitch Moment [N-m] (axis = [0,1,0])","Yaw Moment [N-m] (axis = [0,0,1])",Center of Pressure (x=0 [m]),Status,Stop Reason\n')
+        for i in range(len(sim_list)):
+            simulation = sim_list[i]
+            stats_entries = ""
+            for name in monitor_names:
+                stats = simulation.results.monitor_stats.get(name)
+                if stats == None:
+                    stats_entries += ",,,,,"
+                else:
+                    stats_entries += "{},{},{},{},{},".format(stats.mean, stats.std_dev, stats.minimum, stats.maximum, stats.ci_half_width)
+            if simulation.results.convergence == "Converged":
+                csvfile.write("{},{},{},{},{},{},{},{},{}{},{},{},{},{},{},{},{}\n".format(simulation.sim_name, simulation.mesh.CAS_name, current_date, simulation.results.iterations, simulation.results.drag_tot, simulation.results.drag_comp, simulation.results.lift_tot, simulation.results.lift_comp, stats_entries, simulation.results.f_left, simulation.results.f_right, simulation.results.mom_roll, simulation.results.mom_pitch, simulation.results.mom_yaw, simulation.results.cop, simulation.results.convergence, simulation.results.stop_reason))
+            else:
+                csvfile.write("{},{},{},,,,,,{},,,,,,{},{}\n".format(simulation.sim_name, simulation.mesh.CAS_name, current_date, stats_entries, simulation.results.convergence, simulation.results.stop_reason))
+        csvfile.close()
+
+    return
+
+def project_summary_path(proj_dir, proj_name):
+    '''
+    Returns the path of the summary of a Workbench project, kept in its user_files folder such that it is archived with the project.
+    Str, Str -> Str
+
+    Parameters
+    ---------------------
+    proj_dir : str
+        Directory of the Workbench project.
+    proj_name : str
+        Name of the Workbench project, without the .wbpj extension.
+
+    Returns
+    ---------------------
+    path : str
+        Path to the JSON summary of the project.
+    '''
+
+    return(os.path.join(proj_dir, "{}_files".format(proj_name), "user_files", "Minerva Summary.json"))
+
+def project_summary_write(sim_list, proj_params):
+    '''
+    Writes the settings, simulations and extracted results of the project to its summary, from which the archive catalogue is built when the project is archived.
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    summary = {"project": proj_params.proj_name, "updated": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+               "settings": {"min_iterations": proj_params.min_iterations, "max_iterations": proj_params.max_iterations,
+                            "conv_criterion": proj_params.conv_criterion, "conv_window": proj_params.conv_window, "processes": proj_params.processes},
+               "simulations": []}
+
+    for simulation in sim_list:
+        entry = {"name": simulation.sim_name, "cas_name": simulation.mesh.CAS_name, "body_size": simulation.mesh.body_size,
+                 "sol_method": solution_method(simulation), "velocity": simulation.workflow.velocity,
+                 "area": simulation.dimension.area, "length": simulation.dimension.length,
+                 "initialization": initialization_strategy(simulation, proj_params),
+                 "system_index": simulation.system_index, "convergence": simulation.results.convergence, "stop_reason": simulation.results.stop_reason}
+        for name in ["iterations", "drag_tot", "lift_tot", "cop"]:
+            entry[name] = getattr(simulation.results, name)
+        summary["simulations"].append(entry)
+
+    path = project_summary_path(proj_params.proj_dir, proj_params.proj_name)
+
+    if os.path.exists(os.path.dirname(path)) == False:
+        os.makedirs(os.path.dirname(path))
+
+    with open(path, 'w') as summary_file:
+        json.dump(summary, summary_file, indent = 1)
+
+    return
+
+def monitor_history_read(rfile_path):
+    '''
+    Reads a Fluent report file (*-rfile.out) into its monitor histories.
+    Str -> List, Dict
+
+    Parameters
+    ---------------------
+    rfile_path : str
+        Path to the report file written by a Fluent report definition.
+
+    Returns
+    ---------------------
+    iterations : list
+        List containing the iteration number of each row of the report file.
+    histories : dict
+        Dictionary of lists containing the values of each monitor column, keyed by column name.
+    '''
+
+    header = []
+    iterations = []
+    columns = []
+
+    with open(rfile_path, 'r') as rfile:
+        for line in rfile:
+            entries = line.split()
+            try:
+                values = [float(entry) for entry in entries]
+            except ValueError:
+                names = re.findall('"([^"]*)"', line)
+                if len(names) > 1:
+                    header = names
+                continue
+            if len(values) < 2:
+                continue
+            iterations.append(int(values[0]))
+            columns.append(values[1:])
+
+    if len(header) > 1:
+        names = header[1:]
+    else:
+        names = [os.path.basename(rfile_path).replace("-rfile.out", "")]
+
+    histories = {}
+
+    for j in range(len(names)):
+        histories[names[j]] = [row[j] for row in columns if j < len(row)]
+
+    return(iterations, histories)
+
+def autocorrelation_time(values):
+    '''
+    Estimates the integrated autocorrelation time of a monitor history by summing its autocorrelation until the first non-positive lag.
+    List -> Float
+
+    Parameters
+    ---------------------
+    values : list
+        List of floats containing the monitor history.
+
+    Returns
+    ---------------------
+    tau : float
+        Integrated autocorrelation time in iterations. Equal to 1 for uncorrelated samples.
+    '''
+
+    n = len(values)
+
+    if n < 3:
+        return(1.0)
+
+    mean = sum(values) / n
+    deviations = [value - mean for value in values]
+    variance = sum([deviation ** 2 for deviation in deviations]) / n
+
+    if variance == 0:
+        return(1.0)
+
+    tau = 1.0
+
+    for lag in range(1, n - 1):
+        rho = sum([deviations[i] * deviations[i + lag] for i in range(n - lag)]) / (n * variance)
+        if rho <= 0:
+            break
+        tau += 2 * rho
+
+    return(tau)
+
+def window_statistics(values, window):
+    '''
+    Computes the statistics of a monitor history over its trailing window of iterations.
+    List, int -> Monitor_Statistics
+
+    Parameters
+    ---------------------
+    values : list
+        List of floats containing the monitor history.
+    window : int
+        Number of trailing iterations to include. The full history is used if it is shorter than the window.
+
+    Returns
+    ---------------------
+    stats : Monitor_Statistics object
+        Instance of Monitor_Statistics object, or None if the history is empty.
+    '''
+
+    sample = values[-window:]
+    n = len(sample)
+
+    if n == 0:
+        return(None)
+
+    mean = sum(sample) / n
+
+    if n > 1:
+        std_dev = math.sqrt(sum([(value - mean) ** 2 for value in sample]) / (n - 1))
+    else:
+        std_dev = 0.0
+
+    eff_samples = n / autocorrelation_time(sample)
+    ci_half_width = 1.96 * std_dev / math.sqrt(eff_samples)
+
+    return(Monitor_Statistics(n, mean, std_dev, min(sample), max(sample), eff_samples, ci_half_width))
+
+def monitor_statistics(simulation, monitor_dir, proj_params):
+    '''
+    Computes trailing-window statistics of every report file monitor of a given Fluent simulation and imports them into its Simulation_Results object.
+
+    Parameters
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    monitor_dir : str
+        Directory containing the report files (*-rfile.out) of the simulation.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    simulation : Simulation object
+        Instance of Simulation object.
+    '''
+
+    for file_name in sorted(os.listdir(monitor_dir)):
+        if file_name.endswith("-rfile.out"):
+            (iterations, histories) = monitor_history_read(os.path.join(monitor_dir, file_name))
+            for name in histories:
+                stats = window_statistics(histories[name], proj_params.stats_window)
+                if stats != None:
+                    simulation.results.monitor_stats[name] = stats
+
+    return(simulation)
+
+def monitor_statistics_columns(sim_list):
+    '''
+    Returns the names of all monitors with statistics in a list of simulations, with drag and lift first.
+    List -> List
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+
+    Returns
+    ---------------------
+    monitor_names : list
+        List containing the names of the monitors in the order their columns are written.
+    '''
+
+    monitor_names = []
+
+    for simulation in sim_list:
+        for name in simulation.results.monitor_stats:
+            if name not in monitor_names:
+                monitor_names.append(name)
+
+    monitor_names.sort(key = lambda name: (name not in ["drag", "lift"], name))
+
+    return(monitor_names)
+
+def post_processing(sim_list, proj_params):
+    ledger = ledger_load(proj_params)
+    stream = []
+
+    for i in range(len(sim_list)):
+        if (sim_list[i].workflow.post == True) and (ledger_done(ledger, sim_list[i], "post", proj_params) == False):
+            if sim_list[i].system_index == None:
+                run_report_write(proj_params, sim_list[i].sim_name, "Post Skipped", "Results restored from the result cache have no Fluent system to post-process")
+                continue
+            if ledger_done(ledger, sim_list[i], "setup", proj_params) and (ledger[(sim_list[i].sim_name, "setup")]["data"] != None) and ledger[(sim_list[i].sim_name, "setup")]["data"].get("batch", False):
+                run_report_write(proj_params, sim_list[i].sim_name, "Post Skipped", "Simulations solved in batch Fluent have no Workbench system to post-process")
+                continue
+            module = post_plots(sim_list[i], sim_list[i].system_index, proj_params)
+            results_upload(proj_params, os.path.join(proj_params.results_dir, sim_list[i].sim_name))
+            if sim_list[i].workflow.streamlines == True:
+                stream.append((i, module))
+            else:
+                ledger_record(proj_params, sim_list[i], "post", {"module": module})
+
+    for (i, module) in stream:
+      simulation = sim_list[i]
+      if module.split()[-1].isdigit():
+        post_index = int(module.split()[-1])
+      else:
+        post_index = 0
+      if simulation.mesh.body_size == "FB":
+        post_streamlines_fb(simulation, post_index, proj_params)
+      if simulation.mesh.body_size == "HB":
+        post_streamlines_hb(simulation, post_index, proj_params)
+      ledger_record(proj_params, simulation, "post", {"module": module})
+      results_upload(proj_params, os.path.join(proj_params.results_dir, simulation.sim_name))
+
+    retention_apply(sim_list, proj_params)
+
+    staging_sync(proj_params)
+
+    return
+
+def retention_files(fluent_dir, policy):
+    '''
+    Returns the files of a Fluent working directory which a retention policy does not keep. The Final policy keeps the latest data file and its case file, or the latest case file if it has none of its own; the Results policy keeps neither, nor the transcripts. Report files and settings are always kept.
+    Str, Str -> List
+
+    Parameters
+    ---------------------
+    fluent_dir : str
+        Path to the Fluent working directory of the simulation.
+    policy : str
+        Either "All", "Final" or "Results".
+
+    Returns
+    ---------------------
+    paths : List
+        List containing paths to the files to be deleted.
+    '''
+
+    if (policy == "All") or (os.path.isdir(fluent_dir) == False):
+        return([])
+
+    kept = []
+    if policy == "Final":
+        data_path = latest_data_file(fluent_dir)
+        case_path = latest_case_file(fluent_dir)
+        if (data_path != None) and os.path.isfile(data_path.replace(".dat", ".cas")):
+            case_path = data_path.replace(".dat", ".cas")
+        kept = [data_path, case_path]
+
+    paths = []
+
+    for file_name in os.listdir(fluent_dir):
+        path = "{}/{}".format(fluent_dir, file_name)
+        if (os.path.isfile(path) == False) or (path in kept):
+            continue
+        heavy = (".cas" in file_name) or (".dat" in file_name) or file_name.endswith(".ip")
+        if policy == "Results":
+            heavy = heavy or file_name.endswith(".trn")
+        if heavy:
+            paths.append(path)
+
+    return(paths)
+
+def retention_apply(sim_list, proj_params):
+    '''
+    Applies the retention policy of the project to the Fluent files and transcripts of each simulation, in the project directory and its synchronised copy, and reports the space reclaimed. Simulations whose results extraction, or requested post-processing, is not recorded in the run ledger are not pruned. With the Results policy, a description of the setup from which the simulation may be run again is written in place of its case and data files.
+
+    Parameters
+    ---------------------
+    sim_list : List
+        List containing Simulation objects.
+    proj_params : Project object
+        Instance of Project class containing project parameters.
+
+    Returns
+    ---------------------
+    reclaimed : int
+        Number of bytes deleted.
+    '''
+
+    if (proj_params.retention == None) or (proj_params.retention == "All"):
+        return(0)
+
+    while len(staging_threads) > 0:
+        staging_threads.pop(0).join()
+
+    ledger = ledger_load(proj_params)
+    reclaimed = 0
+    pruned = 0
+
+    for simulation in sim_list:
+        if simulation.system_index == None:
+            continue
+        if ledger_done(ledger, simulation, "retention", proj_params) and (ledger[(simulation.sim_name, "retention")]["data"]["policy"] == proj_params.retention):
+            continue
+
+        incomplete = [stage for stage in ["aggregate", "post"] if ledger_done(ledger, simulation, stage, proj_params) == False]
+        if simulation.workflow.post != True:
+            incomplete = [stage for stage in incomplete if stage != "post"]
+        if len(incomplete) > 0:
+            run_report_write(proj_params, simulation.sim_name, "Retention Refused", "{} not complete; Fluent files kept".format(" and ".join([{"aggregate": "Results extraction", "post": "Post-processing"}[stage] for stage in incomplete])))
+            continue
+
+        fluent_dirs = [solve_dir(simulation.system_index, proj_params)]
+        if proj_params.sync_dir != None:
+            fluent_dirs.append(fluent_dirs[0].replace(proj_params.proj_dir.replace(os.sep, '/'), proj_params.sync_dir.replace(os.sep, '/'), 1))
+        progress_dirs = [fluent_dir.replace("_files/dp0/", "_files/progress_files/dp0/") for fluent_dir in fluent_dirs]
+
+        if proj_params.retention == "Results":
+            setup = {"simulation": simulation.sim_name, "policy": proj_params.retention, "time": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+                     "fingerprint": simulation_fingerprint(simulation, proj_params, "setup"), "cache_key": simulation.cache_key,
+                     "mesh": {"CAS_name": simulation.mesh.CAS_name, "CAS_dir": simulation.mesh.CAS_dir, "digest": mesh_digest(simulation), "body_size": simulation.mesh.body_size},
+                     "workflow": {"sol_method": solution_method(simulation), "velocity": simulation.workflow.velocity, "initialization": initialization_strategy(simulation, proj_params)},
+                     "dimension": simulation.dimension.__dict__,
+                     "solver": {"min_iterations": proj_params.min_iterations, "max_iterations": proj_params.max_iterations, "conv_criterion": proj_params.conv_criterion, "conv_window": proj_params.conv_window, "processes": proj_params.processes}}
+            for fluent_dir in fluent_dirs:
+                if os.path.isdir(fluent_dir):
+                    with open("{}/Retained Setup.json".format(fluent_dir), 'w') as setup_file:
+                        json.dump(setup, setup_file, indent = 1)
+
+        size = 0
+        count = 0
+        for fluent_dir in fluent_dirs + progress_dirs:
+            for path in retention_files(fluent_dir, proj_params.retention):
+                try:
+                    file_size = os.path.getsize(path)
+                    os.remove(path)
+                except OSError:
+                    continue
+                size += file_size
+                count += 1
+
+        reclaimed += size
+        pruned += 1
+        ledger_record(proj_params, simulation, "retention", {"policy": proj_params.retention, "files": count, "bytes": size})
+        run_report_write(proj_params, simulation.sim_name, "Retention", "{} policy: {} files deleted; {:.1f} MB reclaimed".format(proj_params.retention, count, size / 1024.0 ** 2))
+
+    if pruned > 0:
+        run_report_write(proj_params, "", "Retention Summary", "{} policy applied to {} simulations: {:.1f} MB reclaimed".format(proj_params.retention, pruned, reclaimed / 1024.0 ** 2))
+
+    return(reclaimed)
+
+def post_plots(simulation, index, proj_params):
+    sim_path = os.path.join(proj_params.results_dir, simulation.sim_name)
+    media_dir = os.path.join(sim_path, "Media Files")
+    cp_dir = os.path.join(media_dir, "3D Cp Contour")
+    pressure_dir = os.path.join(media_dir, "Pressure Contour")
+    tke_dir = os.path.join(media_dir, "TKE Contour")
+    wallshear_dir = os.path.join(media_dir, "Wall Shear Streamline")
+    
+    
+    if index == 0:
+        module = "FLU"
+    else:
+        module = "FLU {}".format(index)
+
+    template1 = workbench.GetTemplate(TemplateName="Results")
+    system1 = workbench.GetSystem(Name=module)
+    system2 = template1.CreateSystem(
+        Position="Right",
+        RelativeTo=system1)
+    solutionComponent1 = system1.GetComponent(Name="Solution")
+    resultsComponent1 = system2.GetComponent(Name="Results")
+    solutionComponent1.TransferData(TargetComponent=resultsComponent1)
+    results1 = system2.GetContainer(ComponentName="Results")
+    results1.Edit()
+    results1.SendCommand(Command="""VIEW:View 1
+      Light Angle = 50, 110
+    END
+
+    VIEW:View 2
+      Light Angle = 50, 110
+    END
+
+    VIEW:View 3
+      Light Angle = 50, 110
+    END
+
+    VIEW:View 4
+      Light Angle = 50, 110
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >show /DATA READER/CASE:Case {}/BOUNDARY:car, view=/VIEW:View 1""".format(simulation.sim_name))
+    results1.SendCommand(Command="> autolegend plot=/CONTOUR:TKE Contour, view=VIEW:View 1")
+    results1.SendCommand(Command="""CONTOUR:TKE Contour
+    Apply Instancing Transform = On
+    Clip Contour = Off
+    Colour Map = Default Colour Map
+    Colour Scale = Logarithmic
+    Colour Variable = Turbulence Kinetic Energy
+    Colour Variable Boundary Values = Conservative
+    Constant Contour Colour = Off
+    Contour Range = Global
+    Culling Mode = No Culling
+    Domain List = /DOMAIN GROUP:All Domains
+    Draw Contours = Off
+    Font = Sans Serif
+    Fringe Fill = On
+    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
+    Lighting = On
+    Line Colour = 0, 0, 0
+    Line Colour Mode = Default
+    Line Width = 1
+    Location List = car
+    Max = 0.0 [m^2 s^-2]
+    Min = 0.0 [m^2 s^-2]
+    Number of Contours = 5000
+    Show Numbers = Off
+    Specular Lighting = On
+    Surface Drawing = Smooth Shading
+    Text Colour = 0, 0, 0
+    Text Colour Mode = Default
+    Text Height = 0.024
+    Transparency = 0.0
+    Use Face Values = On
+    Value List = 0 [m^2 s^-2],1 [m^2 s^-2]
+      OBJECT VIEW TRANSFORM:
+      Apply Reflection = Off
+      Apply Rotation = Off
+      Apply Scale = Off
+      Apply Translation = Off
+      END
+    END""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="> autolegend plot=/CONTOUR:Pressure Contour, view=VIEW:View 1")
+    results1.SendCommand(Command="""CONTOUR:Pressure Contour
+    Apply Instancing Transform = On
+    Clip Contour = Off
+    Colour Map = Default Colour Map
+    Colour Scale = Linear
+    Colour Variable = Pressure
+    Colour Variable Boundary Values = Conservative
+    Constant Contour Colour = Off
+    Contour Range = Global
+    Culling Mode = No Culling
+    Domain List = /DOMAIN GROUP:All Domains
+    Draw Contours = Off
+    Font = Sans Serif
+    Fringe Fill = On
+    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
+    Lighting = On
+    Line Colour = 0, 0, 0
+    Line Colour Mode = Default
+    Line Width = 1
+    Location List = car
+    Max = 0.0 [Pa]
+    Min = 0.0 [Pa]
+    Number of Contours = 5000
+    Show Numbers = Off
+    Specular Lighting = On
+    Surface Drawing = Smooth Shading
+    Text Colour = 0, 0, 0
+    Text Colour Mode = Default
+    Text Height = 0.024
+    Transparency = 0.0
+    Use Face Values = On
+    Value List = 0 [Pa],1 [Pa]
+      OBJECT VIEW TRANSFORM:
+      Apply Reflection = Off
+      Apply Rotation = Off
+      Apply Scale = Off
+      Apply Translation = Off
+      END
+    END""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="> autolegend plot=/STREAMLINE:Wall Shear Streamline, view=VIEW:View 1")
+    results1.SendCommand(Command="""STREAMLINE:Wall Shear Streamline
+    Absolute Tolerance = 0.0 [m]
+    Apply Instancing Transform = On
+    Colour = 0, 0, 1
+    Colour Map = Default Colour Map
+    Colour Mode = Constant
+    Colour Scale = Linear
+    Colour Variable = Wall Shear
+    Colour Variable Boundary Values = Conservative
+    Cross Periodics = On
+    Culling Mode = No Culling
+    Domain List = /DOMAIN GROUP:All Domains
+    Draw Faces = On
+    Draw Lines = Off
+    Draw Streams = On
+    Draw Symbols = Off
+    Grid Tolerance = 0.01
+    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
+    Lighting = On
+    Line Width = 1
+    Location List = car
+    Locator Sampling Method = Equally Spaced
+    Max = 0.0 [Pa]
+    Maximum Number of Items = 25
+    Min = 0.0 [Pa]
+    Number of Samples = 500
+    Number of Sides = 8
+    Range = Global
+    Reduction Factor = 1.0
+    Reduction or Max Number = Max Number
+    Sample Spacing = 0.1
+    Sampling Aspect Ratio = 1
+    Sampling Grid Angle = 0 [degree]
+    Seed Point Type = Equally Spaced Samples
+    Simplify Geometry = Off
+    Specular Lighting = On
+    Stream Drawing Mode = Line
+    Stream Initial Direction = 0 , 0 , 0 
+    Stream Size = 1.0
+    Stream Symbol = Ball
+    Streamline Direction = Forward
+    Streamline Maximum Periods = 20
+    Streamline Maximum Segments = 10000
+    Streamline Maximum Time = 0.0 [s]
+    Streamline Type = Surface Streamline
+    Streamline Width = 2
+    Surface Drawing = Smooth Shading
+    Surface Streamline Direction = Forward and Backward
+    Symbol Size = 1.0
+    Symbol Start Time = 10.0 [s]
+    Symbol Stop Time = -10.0 [s]
+    Symbol Time Interval = 1.0 [s]
+    Tolerance Mode = Grid Relative
+    Transparency = 0.0
+    Variable = Wall Shear
+    Variable Boundary Values = Conservative
+      OBJECT VIEW TRANSFORM:
+      Apply Reflection = Off
+      Apply Rotation = Off
+      Apply Scale = Off
+      Apply Translation = Off
+      Principal Axis = Z
+      Reflection Plane Option = XY Plane
+      Rotation Angle = 0.0 [degree]
+      Rotation Axis From = 0 [m], 0 [m], 0 [m]
+      Rotation Axis To = 0 [m], 0 [m], 0 [m]
+      Rotation Axis Type = Principal Axis
+      Scale Vector = 1 , 1 , 1 
+      Translation Vector = 0 [m], 0 [m], 0 [m]
+      X = 0.0 [m]
+      Y = 0.0 [m]
+      Z = 0.0 [m]
+      END
+    END""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""LIBRARY:
+      CEL:
+        EXPRESSIONS:
+          Cp Expr = (Pressure - Reference Pressure ) / (0.5 * areaAve(Density)@inlet * areaAve(Velocity)@inlet^2)
+        END
+      END
+    END
+
+    EXPRESSION EVALUATOR:
+      Evaluated Expression = Cp Expr
+    END
+
+    > forceupdate EXPRESSION EVALUATOR""")
+    results1.SendCommand(Command="""USER SCALAR VARIABLE:Cp Var
+    Boundary Values = Conservative
+    Calculate Global Range = On
+    Expression = Cp Expr
+    Recipe = Expression
+    Variable to Copy = Pressure
+    Variable to Gradient = Pressure
+    END""")
+    results1.SendCommand(Command="> autolegend plot=/CONTOUR:Cp Contour, view=VIEW:View 1")
+    results1.SendCommand(Command="""CONTOUR:Cp Contour
+    Apply Instancing Transform = On
+    Clip Contour = Off
+    Colour Map = Default Colour Map
+    Colour Scale = Linear
+    Colour Variable = Cp Var
+    Colour Variable Boundary Values = Conservative
+    Constant Contour Colour = Off
+    Contour Range = Local
+    Culling Mode = No Culling
+    Domain List = /DOMAIN GROUP:All Domains
+    Draw Contours = Off
+    Font = Sans Serif
+    Fringe Fill = On
+    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
+    Lighting = On
+    Line Colour = 0, 0, 0
+    Line Colour Mode = Default
+    Line Width = 1
+    Location List = car
+    Max = 0.0
+    Min = 0.0
+    Number of Contours = 5000
+    Show Numbers = Off
+    Specular Lighting = On
+    Surface Drawing = Smooth Shading
+    Text Colour = 0, 0, 0
+    Text Colour Mode = Default
+    Text Height = 0.024
+    Transparency = 0.0
+    Use Face Values = On
+    Value List = 0,1
+      OBJECT VIEW TRANSFORM:
+      Apply Reflection = Off
+      Apply Rotation = Off
+      Apply Scale = Off
+      Apply Translation = Off
+      Principal Axis = Z
+      Reflection Plane Option = XY Plane
+      Rotation Angle = 0.0 [degree]
+      Rotation Axis From = 0 [m], 0 [m], 0 [m]
+      Rotation Axis To = 0 [m], 0 [m], 0 [m]
+      Rotation Axis Type = Principal Axis
+      Scale Vector = 1 , 1 , 1 
+      Translation Vector = 0 [m], 0 [m], 0 [m]
+      X = 0.0 [m]
+      Y = 0.0 [m]
+      Z = 0.0 [m]
+      END
+    END""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="> autolegend plot=/ISOSURFACE:Y 0 Plane, view=VIEW:View 1")
+    results1.SendCommand(Command="""ISOSURFACE:Y 0 Plane
+    Apply Instancing Transform = On
+    Apply Texture = Off
+    Blend Texture = On
+    Colour = 0.75, 0.75, 0.75
+    Colour Map = Default Colour Map
+    Colour Mode = Use Plot Variable
+    Colour Scale = Linear
+    Colour Variable = Y
+    Colour Variable Boundary Values = Conservative
+    Culling Mode = No Culling
+    Domain List = /DOMAIN GROUP:All Domains
+    Draw Faces = On
+    Draw Lines = Off
+    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
+    Lighting = On
+    Line Colour = 0, 0, 0
+    Line Colour Mode = Default
+    Line Width = 1
+    Max = 0.0 [m]
+    Min = 0.0 [m]
+    Range = Global
+    Render Edge Angle = 0 [degree]
+    Specular Lighting = On
+    Surface Drawing = Smooth Shading
+    Texture Angle = 0
+    Texture Direction = 0 , 1 , 0 
+    Texture File =  
+    Texture Material = Metal
+    Texture Position = 0 , 0 
+    Texture Scale = 1
+    Texture Type = Predefined
+    Tile Texture = Off
+    Transform Texture = Off
+    Transparency = 0.0
+    Value = 0.0 [m]
+    Variable = Y
+    Variable Boundary Values = Conservative
+      OBJECT VIEW TRANSFORM:
+      Apply Reflection = Off
+      Apply Rotation = Off
+      Apply Scale = Off
+      Apply Translation = Off
+      Principal Axis = Z
+      Reflection Plane Option = XY Plane
+      Rotation Angle = 0.0 [degree]
+      Rotation Axis From = 0 [m], 0 [m], 0 [m]
+      Rotation Axis To = 0 [m], 0 [m], 0 [m]
+      Rotation Axis Type = Principal Axis
+      Scale Vector = 1 , 1 , 1 
+      Translation Vector = 0 [m], 0 [m], 0 [m]
+      X = 0.0 [m]
+      Y = 0.0 [m]
+      Z = 0.0 [m]
+      END
+    END""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /ISOSURFACE:Y 0 Plane, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /ISOSURFACE:Y 0 Plane, view=/VIEW:View 1""")
+    results1.SendCommand(Command="> autolegend plot=/POLYLINE:Centerline Polyline, view=VIEW:View 1")
+    results1.SendCommand(Command="""POLYLINE:Centerline Polyline
+    Apply Instancing Transform = On
+    Boundary List = car
+    Colour = 0, 1, 0
+    Colour Map = Default Colour Map
+    Colour Mode = Variable
+    Colour Scale = Linear
+    Colour Variable = Cp Var
+    Colour Variable Boundary Values = Conservative
+    Contour Level = 1
+    Domain List = /DOMAIN GROUP:All Domains
+    Input File =  
+    Instancing Transform = /DEFAULT INSTANCE TRANSFORM:Default Transform
+    Line Width = 15
+    Location = /ISOSURFACE:Y 0 Plane
+    Max = 0.0
+    Min = 0.0
+    Option = Boundary Intersection
+    Range = Global
+      OBJECT VIEW TRANSFORM:
+      Apply Reflection = Off
+      Apply Rotation = Off
+      Apply Scale = Off
+      Apply Translation = Off
+      Principal Axis = Z
+      Reflection Plane Option = XY Plane
+      Rotation Angle = 0.0 [degree]
+      Rotation Axis From = 0 [m], 0 [m], 0 [m]
+      Rotation Axis To = 0 [m], 0 [m], 0 [m]
+      Rotation Axis Type = Principal Axis
+      Scale Vector = 1 , 1 , 1 
+      Translation Vector = 0 [m], 0 [m], 0 [m]
+      X = 0.0 [m]
+      Y = 0.0 [m]
+      Z = 0.0 [m]
+      END
+    END""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /POLYLINE:Centerline Polyline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /POLYLINE:Centerline Polyline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""CHART:Cp vs X Coord
+    Chart Axes Font = Tahoma, 10, False, False, False, False
+    Chart Axes Titles Font = Tahoma, 10, True, False, False, False
+    Chart Grid Line Width = 1
+    Chart Horizontal Grid = On
+    Chart Legend = On
+    Chart Legend Font = Tahoma, 8, False, False, False, False
+    Chart Legend Inside = Outside Chart
+    Chart Legend Justification = Center
+    Chart Legend Position = Bottom
+    Chart Legend Width Height = 0.2 , 0.4 
+    Chart Legend X Justification = Right
+    Chart Legend XY Position = 0.73 , 0.275 
+    Chart Legend Y Justification = Center
+    Chart Line Width = 2
+    Chart Lines Order = Series 1,Chart Line 1
+    Chart Minor Grid = Off
+    Chart Minor Grid Line Width = 1
+    Chart Symbol Size = 4
+    Chart Title = Cp vs X Coordinate
+    Chart Title Font = Tahoma, 12, True, False, False, False
+    Chart Title Visibility = On
+    Chart Type = XY
+    Chart Vertical Grid = On
+    Chart X Axis Automatic Number Formatting = On
+    Chart X Axis Label = X Axis <units>
+    Chart X Axis Number Format = %10.3e
+    Chart Y Axis Automatic Number Formatting = On
+    Chart Y Axis Label = Y Axis <units>
+    Chart Y Axis Number Format = %10.3e
+    Default Chart X Variable = X
+    Default Chart Y Variable = Cp Var
+    Default Difference Line Calculation = From Points
+    Default Histogram Y Axis Weighting = None
+    Default Time Chart Variable = Pressure
+    Default Time Chart X Expression = Time
+    Default Time Variable Absolute Value = Off
+    Default Time Variable Boundary Values = Conservative
+    Default X Variable Absolute Value = Off
+    Default X Variable Boundary Values = Conservative
+    Default Y Variable Absolute Value = Off
+    Default Y Variable Boundary Values = Conservative
+    FFT Full Input Range = On
+    FFT Max = 0.0
+    FFT Min = 0.0
+    FFT Subtract Mean = Off
+    FFT Window Type = Hanning
+    FFT X Function = Frequency
+    FFT Y Function = Power Spectral Density
+    Histogram Automatic Divisions = Automatic
+    Histogram Divisions = -1.0,1.0
+    Histogram Divisions Count = 10
+    Histogram Y Axis Value = Count
+    Is FFT Chart = Off
+    Max X = 1.0
+    Max Y = 1.0
+    Min X = -1.0
+    Min Y = -1.0
+    Use Data For X Axis Labels = On
+    Use Data For Y Axis Labels = On
+    X Axis Automatic Range = On
+    X Axis Inverted = Off
+    X Axis Logarithmic Scaling = Off
+    Y Axis Automatic Range = On
+    Y Axis Inverted = Off
+    Y Axis Logarithmic Scaling = Off
+      CHART SERIES:Series 1
+      Chart Line Custom Data Selection = Off
+      Chart Line Filename =  
+      Chart Series Type = Regular
+      Location = /POLYLINE:Centerline Polyline
+      Monitor Data Filename =  
+      Monitor Data Source = Case
+      Monitor Data X Variable Absolute Value = Off
+      Monitor Data Y Variable Absolute Value = Off
+      Operating Point Data Case = Case {}
+      Operating Point Data Filename =  
+      Operating Point Data Source = File
+      Series Name = Series 1
+      Time Chart Expression = Time
+      Time Chart Type = Point
+        CHART LINE:Chart Line 1
+        Auto Chart Line Colour = On
+        Auto Chart Symbol Colour = On
+        Chart FFT Line Type = Bars
+        Chart Line Colour = 1.0, 0.0, 0.0
+        Chart Line Style = Automatic
+        Chart Line Type = Lines
+        Chart Line Visibility = On
+        Chart Symbol Colour = 0.0, 1.0, 0.0
+        Chart Symbol Style = Automatic
+        Fill Area = On
+        Fill Area Options = Automatic
+        Is Valid = True
+        Line Name = Series 1
+        Use Automatic Line Naming = On
+        END
+      END
+      OBJECT REPORT OPTIONS:
+          Report Caption = Pressure coefficient along centerline of car by distance along X axis from nose of car
+      END
+    END""".format(simulation.sim_name))
+    results1.SendCommand(Command=">chart print, Chart Name = /CHART:Cp vs X Coord, filename = {}/Cp vs X Coord.png, x size = 2000, y size = 2000, format = png, factor = 1.83074".format(media_dir))
+    results1.SendCommand(Command="> report hideItem=/CHART:Cp vs X Coord")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /WIREFRAME:Wireframe, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.655433
+        Pan = -0.0111499, -0.372659
+        Rotation Quaternion = -0.707107, 0, 0, 0.707107
+        
+      END
+
+    END
+
+    > update
+    HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Contour 01 Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(cp_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Pressure Contour 01 Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(pressure_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/TKE Contour 01 Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(tke_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Wall Shear Streamline 01 Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(wallshear_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.512924
+        Pan = 0, 0
+        Rotation Quaternion = -4.32978e-17, 0.707107, 0.707107, 4.32978e-17
+        
+      END
+
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.689005
+        Pan = -0.0972085, -0.337592
+        Rotation Quaternion = -4.32978e-17, 0.707107, 0.707107, 4.32978e-17
+        
+      END
+
+    END
+
+    > update
+    HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Contour 02 Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(cp_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Pressure Contour 02 Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(pressure_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename ={}/TKE Contour 02 Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(tke_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Wall Shear Streamline 02 Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(wallshear_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 1.59745
+        Pan = 0, 0
+        Rotation Quaternion = -0.5, 0.5, 0.5, 0.5
+        
+      END
+
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Contour 03 Front.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(cp_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Pressure Contour 03 Front.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(pressure_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/TKE Contour 03 Front.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(tke_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Wall Shear Streamline 03 Front.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(wallshear_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 1.59745
+        Pan = 0, 0
+        Rotation Quaternion = -0.5, -0.5, -0.5, 0.5
+        
+      END
+
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Contour 04 Rear.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(cp_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Pressure Contour 04 Rear.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(pressure_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/TKE Contour 04 Rear.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(tke_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Wall Shear Streamline 04 Rear.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(wallshear_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.609706
+        Pan = 0, 0
+        Rotation Quaternion = 0, 0, 0, 1
+        
+      END
+
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.624948
+        Pan = -0.141048, -0.546109
+        Rotation Quaternion = 0, 0, 0, 1
+        
+      END
+
+    END
+
+    > update
+    HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Contour 05 Top.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(cp_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Pressure Contour 05 Top.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(pressure_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/TKE Contour 05 Top.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(tke_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Wall Shear Streamline 05 Top.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(wallshear_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.640572
+        Pan = -0.079174, -0.550776
+        Rotation Quaternion = 1, 4.47035e-08, -6.12324e-17, 1.44757e-24
+        
+      END
+
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Contour 06 Bottom.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(cp_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Pressure Contour 06 Bottom.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(pressure_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/TKE Contour 06 Bottom.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(tke_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Wall Shear Streamline 06 Bottom.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(wallshear_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.640572
+        Pan = -0.079174, -0.550776
+        Rotation Quaternion = 0.611682, -0.00437015, -0.0498028, -0.789522
+        
+      END
+
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.707071
+        Pan = 0.0309811, -0.313254
+        Rotation Quaternion = 0.16889, 0.490153, 0.833347, -0.191657
+        
+      END
+
+    END
+
+    > update
+    HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Contour 07 Top Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(cp_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Pressure Contour 07 Top Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(pressure_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/TKE Contour 07 Top Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(tke_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Wall Shear Streamline 07 Top Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(wallshear_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.656586
+        Pan = 0.154765, -0.404108
+        Rotation Quaternion = -0.466997, 0.0118956, -0.123012, 0.87557
+        
+      END
+
+    END
+
+    VIEW:View 1
+      Light Angle = 90.0881, 104.046
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Contour 08 Top Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(cp_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Pressure Contour 08 Top Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(pressure_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/TKE Contour 08 Top Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(tke_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Wall Shear Streamline 08 Top Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(wallshear_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.671819
+        Pan = 0.00328224, -0.331506
+        Rotation Quaternion = -0.863355, 0.0798891, -0.128229, 0.481439
+        
+      END
+
+    END
+
+    VIEW:View 1
+      Light Angle = 126.207, 83.4066
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.671819
+        Pan = -0.0328224, -0.246168
+        Rotation Quaternion = -0.866455, 0.0319442, -0.101365, 0.487802
+        
+      END
+
+    END
+
+    > update
+    HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Contour 09 Bottom Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(cp_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Pressure Contour 09 Bottom Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(pressure_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/TKE Contour 09 Bottom Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(tke_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="> autolegend plot=/STREAMLINE:Wall Shear Streamline, view=VIEW:View 1")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Wall Shear Streamline 09 Bottom Left.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(wallshear_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.671819
+        Pan = -0.0328224, -0.246168
+        Rotation Quaternion = -0.0665846, -0.813088, -0.53828, 0.211405
+        
+      END
+
+    END
+
+    VIEW:View 1
+      Light Angle = 95.0494, 82.0174
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.671819
+        Pan = -0.0328224, -0.246168
+        Rotation Quaternion = -0.0149095, -0.854263, -0.494958, 0.15814
+        
+      END
+
+    END
+
+    VIEW:View 1
+      Light Angle = 89.0957, 75.2699
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >show /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Contour 10 Bottom Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(cp_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Cp Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Pressure Contour 10 Bottom Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(pressure_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:Pressure Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/TKE Contour 10 Bottom Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(tke_dir))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /CONTOUR:TKE Contour, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Wall Shear Streamline 10 Bottom Right.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(wallshear_dir))
+    results1.SendCommand(Command="> report showItem=/CHART:Cp vs X Coord")
+    results1.SendCommand(Command="""EXPORT:
+     Export File = {}/Cp vs X Coord.csv
+     Export Chart Name = Cp vs X Coord
+     Overwrite = On
+    END
+    >export chart""".format(media_dir))
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.512924
+        Pan = 0, 0
+        Rotation Quaternion = -0.707107, 0, 0, 0.707107
+        
+      END
+
+    END
+
+    > update
+    # Sending visibility action from ViewUtilities
+    >hide /STREAMLINE:Wall Shear Streamline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /DATA READER/CASE:Case {}/BOUNDARY:car, view=/VIEW:View 1""".format(simulation.sim_name))
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /POLYLINE:Centerline Polyline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.656586
+        Pan = 0.0997342, -0.360136
+        Rotation Quaternion = -0.707107, 0, 0, 0.707107
+        
+      END
+
+    END
+
+    > update
+    HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Centerline Polyline.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(media_dir))
+    results1.SendCommand(Command=">setPreferences Viewer Background Colour Type = Solid, Viewer Background Image File =  , Viewer Background Colour = 0&0&0, Global Text Colour = 1&1&1")
+    results1.SendCommand(Command="""HARDCOPY:
+    Antialiasing = On
+    Hardcopy Filename = {}/Cp Centerline Polyline Black.png
+    Hardcopy Format = png
+    Hardcopy Tolerance = 0.0001
+    Image Height = 4000
+    Image Scale = 100
+    Image Width = 8000
+    JPEG Image Quality = 80
+    Screen Capture = Off
+    Use Screen Size = Off
+    White Background = Off
+    END
+    >print""".format(media_dir))
+    results1.SendCommand(Command=">setPreferences Viewer Background Type = Colour, Viewer Background Colour Type = Top-Bottom Gradient, Viewer Background Colour = 0.42&0.55&0.871, Viewer Background Colour 2 = 1&1&1, Global Text Colour = 0&0&0, Global Edge Colour = 0&0&0")
+    results1.Exit()
+
+    return(system2.Name)
+
+def post_streamlines_fb(simulation, index, proj_params):
+    if index==0:
+        module = "Post"
+    else:
+        module = "Post {}".format(index)
+
+    sim_path = os.path.join(proj_params.results_dir, simulation.sim_name)
+    media_dir = os.path.join(sim_path, "Media Files")
+    animate_dir = os.path.join(media_dir, "Streamline Animations")
+    
+    system1 = workbench.GetSystem(Name=module)
+    results1 = system1.GetContainer(ComponentName="Results")
+    results1.Edit()
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >hide /POLYLINE:Centerline Polyline, view=/VIEW:View 1""")
+    results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
+    >show /DATA READER/CASE:Case {}/BOUNDARY:car, view=/VIEW:View 1""".format(simulation.sim_name))
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 2.45395, 0, 0.584167
+        Scale = 0.656586
+        Pan = 0.0997342, -0.360136
+        Rotation Quaternion = -0.555856, 0.2474, 0.348336, 0.713069
+        
+      END
+
+    END
+
+    VIEW:View 1
+      Light Angle = 101.003, 125.876
+    END
+
+    > update
+    > autolegend plot=/ISOSURFACE:Isosurface Y 0, view=VIEW:View 1""")
+    results1.SendCommand(Command="""ISOSURFACE:Isosurface Y 0
+    Apply Instancing Transform = On
+    Apply Texture = Off
     Blend Texture = On
     Colour = 0.75, 0.75, 0.75
     Colour Map = Default Colour Map
@@ -2942,7 +8325,7 @@ def post_streamlines_hb(simulation, index, proj_params):
     media_dir = os.path.join(sim_path, "Media Files")
     animate_dir = os.path.join(media_dir, "Streamline Animations")
 
-    system1 = GetSystem(Name=module)
+    system1 = workbench.GetSystem(Name=module)
     results1 = system1.GetContainer(ComponentName="Results")
     results1.Edit()
     results1.SendCommand(Command="""# Sending visibility action from ViewUtilities
@@ -3252,124 +8635,1654 @@ def post_streamlines_hb(simulation, index, proj_params):
     Pan = 2.19897, -0.011249
     Rotation Quaternion = -4.32978e-17, 0.707107, 0.707107, 4.32978e-17
 
-    END
+    END
+
+    END
+
+    > update
+    ANIMATION:ANIMATION
+    QAnim MPEG Filename = {}/Trailing Edge and Wake Streamline Animation.mp4
+    QAnim Save MPEG = On
+    QAnim Looping = Loop
+    QAnim Looping Cycles = 1
+    Video Format = mp4
+
+    END""".format(animate_dir))
+    results1.SendCommand(Command="""ANIMATION:
+    Animation Bit Rate = 5152000
+    Animation Frame Rate = 24
+    Animation Quality = Highest
+    Animation Speed Factor = 2
+    Antialiasing = On
+    Drop Last MPEG Frame = Off
+    Hardcopy Tolerance = 0.0001
+    Intermediate File Format = jpg
+    Keep Intermediate Files = Off
+    MPEG Height = 1080
+    MPEG Scale = 100
+    MPEG Size = 1080p
+    MPEG Width = 1920
+    Output Directory = .
+    Output to User Directory = Off
+    QAnim Override Symbol = On
+    QAnim Symbol Size = 0.05
+    QAnim Symbol Spacing = 0.3
+    QAnim Symbol Type = Ball
+    Screen Capture = Off
+    Speed Adjustment Selection = Normal
+    Speed Scaling Method = Distribute Frames Smoothly
+    Timestep Interpolation Method = Timestep
+    Variable Bit Rate = On
+    White Background = Off
+    END""")
+    results1.SendCommand(Command="""ANIMATION: ANIMATION
+    QAnim Object List = /STREAMLINE:Streamline Pos Y 40,/STREAMLINE:Streamline Y 0
+    QAnim Frames = 100
+    QAnim MPEG Filename = {}/Trailing Edge and Wake Streamline Animation.mp4
+    QAnim Save MPEG = On
+    QAnim Looping = Loop
+    QAnim Looping Cycles = 1
+    Video Format = mp4
+    END
+    >animate quickAnimate""".format(animate_dir))
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 4.4939, 0.459533, 0.511379
+        Scale = 0.860138
+        Pan = -1.27971, -0.419625
+        Rotation Quaternion = -3.72529e-09, 0.707107, 0.707107, -3.72529e-09
+        
+      END
+
+    END
+
+    > update
+    ANIMATION:ANIMATION
+    QAnim MPEG Filename = {}/Canopy Streamline Animation.mp4
+    QAnim Save MPEG = On
+    QAnim Looping = Loop
+    QAnim Looping Cycles = 1
+    Video Format = mp4
+
+    END""".format(animate_dir))
+    results1.SendCommand(Command="""ANIMATION: ANIMATION
+    QAnim Object List = /STREAMLINE:Streamline Pos Y 40,/STREAMLINE:Streamline Y 0
+    QAnim Frames = 100
+    QAnim MPEG Filename = {}/Canopy Streamline Animation.mp4
+    QAnim Save MPEG = On
+    QAnim Looping = Loop
+    QAnim Looping Cycles = 1
+    Video Format = mp4
+    END
+    >animate quickAnimate""".format(animate_dir))
+    results1.SendCommand(Command="""VIEW:View 1
+      Camera Mode = User Specified
+      CAMERA:
+        Option = Pivot Point and Quaternion
+        Pivot Point = 3.23676, 0.504839, 0.995587
+        Scale = 0.289498
+        Pan = -0.24374, -1.06636
+        Rotation Quaternion = -4.32978e-17, 0.707107, 0.707107, 4.32978e-17
+        
+      END
+
+    END
+
+    > update
+    ANIMATION:ANIMATION
+    QAnim MPEG Filename = {}/Right Side Streamline Animation.mp4
+    QAnim Save MPEG = On
+    QAnim Looping = Loop
+    QAnim Looping Cycles = 1
+    Video Format = mp4
+
+    END""".format(animate_dir))
+    results1.SendCommand(Command="""ANIMATION: ANIMATION
+    QAnim Object List = /STREAMLINE:Streamline Pos Y 40,/STREAMLINE:Streamline Y 0
+    QAnim Frames = 100
+    QAnim MPEG Filename = {}/Right Side Streamline Animation.mp4
+    QAnim Save MPEG = On
+    QAnim Looping = Loop
+    QAnim Looping Cycles = 1
+    Video Format = mp4
+    END
+    >animate quickAnimate""".format(animate_dir))
+    results1.Exit()
+
+    return
+
+def archive_param_extract(csv_path):
+    '''
+    Extracts the projects to be archived and the archive settings from the batch archive CSV file. The settings are entered once in row 2, after a blank column.
+    Str -> List, Archive_Properties (class)
+
+    Parameters
+    ---------------------
+    csv_path : str
+        Path to the batch archive CSV file.
+
+    Returns
+    ---------------------
+    jobs : List
+        List containing Archive_Job objects.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+    '''
+
+    csvfile = open(csv_path, 'r')
+
+    next(csvfile)
+    lines = [line.split(",") for line in csvfile.readlines() if line.strip() != ""]
+
+    csvfile.close()
+
+    settings = []
+    if len(lines) > 0:
+        settings = lines[0]
+
+    build_dir = csv_entry(settings, 7, os.path.join(os.getcwd(), "Archive Builds"))
+    bandwidth = csv_entry(settings, 9)
+    if bandwidth != None:
+        bandwidth = float(bandwidth)
+
+    backend = "WBPZ"
+    if csv_entry(settings, 11, "WBPZ").lower() == "chunks":
+        backend = "Chunks"
+
+    archive_props = Archive_Properties(csv_entry(settings, 6, "//172.16.1.12/hpc/sims/Archives"), build_dir, int(csv_entry(settings, 8, 2)), bandwidth, log_path = os.path.join(build_dir, "Archive Log.csv"), threads = int(csv_entry(settings, 10, 4)), backend = backend, catalogue_path = os.path.join(os.getcwd(), "Archive Catalogue.sqlite"))
+
+    jobs = []
+
+    for entries in lines:
+        if csv_entry(entries, 1) == None:
+            continue
+        archive_name = csv_entry(entries, 4)
+        relative = "{}/{}/{}.wbpz".format(csv_entry(entries, 2), csv_entry(entries, 3), archive_name)
+        if backend == "Chunks":
+            relative = "{}/{}/{}.manifest.json".format(csv_entry(entries, 2), csv_entry(entries, 3), archive_name)
+        jobs.append(Archive_Job(csv_entry(entries, 0), csv_entry(entries, 1), csv_entry(entries, 2), csv_entry(entries, 3), archive_name,
+                                os.path.join(build_dir, relative).replace(os.sep, '/'), "{}/{}".format(archive_props.dest_root.replace(os.sep, '/'), relative)))
+
+    return(jobs, archive_props)
+
+archive_log_lock = threading.Lock()
+
+def archive_log_write(archive_props, archive_name, event, detail):
+    '''
+    Appends an event to the CSV log of a batch of archives. May be called from several upload threads.
+
+    Parameters
+    ---------------------
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+    archive_name : str
+        Name of the archive the event concerns.
+    event : str
+        Short name of the event.
+    detail : str
+        Description of the event.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    with archive_log_lock:
+        if os.path.exists(os.path.dirname(archive_props.log_path)) == False:
+            os.makedirs(os.path.dirname(archive_props.log_path))
+        new_log = (os.path.isfile(archive_props.log_path) == False)
+        with open(archive_props.log_path, 'a') as log:
+            if new_log:
+                log.write("Timestamp,Archive,Event,Detail\n")
+            log.write("{},{},{},{}\n".format(datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), archive_name, event, detail.replace(",", ";")))
+
+    return
+
+def archive_digest(archive_path):
+    '''
+    Returns the SHA-1 digest recorded next to an archive once it was built or verified.
+    Str -> Str
+
+    Parameters
+    ---------------------
+    archive_path : str
+        Path to the archive.
+
+    Returns
+    ---------------------
+    digest : str
+        SHA-1 hex digest recorded in the .sha1 file of the archive, or None if there is none or the archive is missing.
+    '''
+
+    if (os.path.isfile(archive_path) == False) or (os.path.isfile(archive_path + ".sha1") == False):
+        return(None)
+
+    with open(archive_path + ".sha1", 'r') as digest_file:
+        return(digest_file.read().strip())
+
+def archive_build(job, archive_props):
+    '''
+    Builds the archive of a Workbench project on local disk with Workbench, recording its digest. Archives which were built by an earlier run of the batch are kept.
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if archive_digest(job.local_path) != None:
+        archive_log_write(archive_props, job.archive_name, "Build Skipped", "Built by an earlier run")
+        return
+
+    if os.path.exists(os.path.dirname(job.local_path)) == False:
+        os.makedirs(os.path.dirname(job.local_path))
+
+    start = time.time()
+    workbench.Open(FilePath="{}/{}.wbpj".format(job.proj_dir.replace(os.sep, '/'), job.proj_name))
+    workbench.Archive(
+        FilePath=job.local_path,
+        IncludeExternalImportedFiles=True)
+
+    with open(job.local_path + ".sha1", 'w') as digest_file:
+        digest_file.write(file_digest(job.local_path))
+
+    archive_log_write(archive_props, job.archive_name, "Built", "{:.1f} MB in {:.0f} s".format(os.path.getsize(job.local_path) / 1024.0 ** 2, time.time() - start))
+
+    return
+
+stored_extensions = [".png", ".jpg", ".jpeg", ".gif", ".mp4", ".avi", ".gz", ".h5", ".zip", ".wbpz", ".7z", ".bz2", ".xz"]
+
+def wbpz_members(job):
+    '''
+    Lists the files of a Workbench project in the layout of its .wbpz archive: the .wbpj file at the root followed by its _files tree. Lock files and the project scratch directory are left out, as Workbench does when archiving.
+    Archive_Job -> List
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+
+    Returns
+    ---------------------
+    members : List
+        List of tuples of the name of each member within the archive and the path to its file.
+    '''
+
+    files_dir = os.path.join(job.proj_dir, job.proj_name + "_files")
+    members = [(job.proj_name + ".wbpj", os.path.join(job.proj_dir, job.proj_name + ".wbpj"))]
+
+    for (root, dirs, files) in os.walk(files_dir):
+        dirs[:] = sorted([name for name in dirs if name != "_ProjectScratch"])
+        for file_name in sorted(files):
+            if file_name.endswith(".lock") or file_name.endswith(".partial"):
+                continue
+            path = os.path.join(root, file_name)
+            members.append(("{}_files/{}".format(job.proj_name, os.path.relpath(path, files_dir).replace(os.sep, '/')), path))
+
+    return(members)
+
+def zip_dos_time(timestamp):
+    '''
+    Converts a timestamp to the DOS date and time fields of a zip header.
+    Float -> Int, Int
+
+    Parameters
+    ---------------------
+    timestamp : float
+        Time in seconds since the epoch.
+
+    Returns
+    ---------------------
+    dos_time : int
+        DOS time field.
+    dos_date : int
+        DOS date field.
+    '''
+
+    moment = time.localtime(timestamp)
+    year = min(max(moment[0], 1980), 2107)
+
+    return((moment[3] << 11) | (moment[4] << 5) | (moment[5] // 2), ((year - 1980) << 9) | (moment[1] << 5) | moment[2])
+
+def zip_compress(path, temp_path):
+    '''
+    Compresses a file with raw deflate, keeping the result in memory for small files and writing it to a temporary file otherwise.
+    Str, Str -> Int, Int, Bytes
+
+    Parameters
+    ---------------------
+    path : str
+        Path to the file to be compressed.
+    temp_path : str
+        Path to the temporary file for the compressed data of large files.
+
+    Returns
+    ---------------------
+    crc : int
+        CRC-32 of the file.
+    compressed_size : int
+        Size of the compressed data in bytes.
+    data : bytes
+        Compressed data, or None if it was written to temp_path.
+    '''
+
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    crc = 0
+    in_memory = os.path.getsize(path) < 4 * 1024 ** 2
+    parts = []
+    compressed_size = 0
+
+    if in_memory == False:
+        output = open(temp_path, 'wb')
+
+    with open(path, 'rb') as source:
+        chunk = source.read(1024 ** 2)
+        while True:
+            if chunk:
+                crc = zlib.crc32(chunk, crc)
+                block = compressor.compress(chunk)
+            else:
+                block = compressor.flush()
+            compressed_size += len(block)
+            if in_memory:
+                parts.append(block)
+            else:
+                output.write(block)
+            if not chunk:
+                break
+            chunk = source.read(1024 ** 2)
+
+    if in_memory:
+        return(crc & 0xFFFFFFFF, compressed_size, b"".join(parts))
+
+    output.close()
+
+    return(crc & 0xFFFFFFFF, compressed_size, None)
+
+def zip_write(zip_path, members, threads, temp_dir):
+    '''
+    Writes a zip archive with ZIP64 extensions where needed. Members are compressed in parallel by a number of threads, at most twice as many members ahead of the member being written, while already-compressed formats are stored without recompression.
+
+    Parameters
+    ---------------------
+    zip_path : str
+        Path to the zip archive to be written.
+    members : List
+        List of tuples of the name of each member within the archive and the path to its file.
+    threads : int
+        Number of threads compressing members.
+    temp_dir : str
+        Directory for the compressed data of large members.
+
+    Returns
+    ---------------------
+    size : int
+        Total uncompressed size of the members in bytes.
+    '''
+
+    if os.path.exists(temp_dir) == False:
+        os.makedirs(temp_dir)
+
+    stored = [os.path.splitext(path)[1].lower() in stored_extensions for (name, path) in members]
+    results = {}
+    state = {"next": 0, "written": 0}
+    condition = threading.Condition()
+    window = max(threads, 1) * 2
+
+    def worker():
+        while True:
+            with condition:
+                while (state["next"] < len(members)) and stored[state["next"]]:
+                    state["next"] += 1
+                if state["next"] >= len(members):
+                    return
+                index = state["next"]
+                state["next"] += 1
+                while index >= state["written"] + window:
+                    condition.wait()
+            try:
+                result = zip_compress(members[index][1], os.path.join(temp_dir, "{}.deflate".format(index)))
+            except (IOError, OSError) as error:
+                result = error
+            with condition:
+                results[index] = result
+                condition.notify_all()
+
+    workers = [threading.Thread(target = worker) for i in range(max(threads, 1))]
+    for thread in workers:
+        thread.daemon = True
+        thread.start()
+
+    central = []
+    total = 0
+
+    with open(zip_path, 'wb') as archive:
+        for index in range(len(members)):
+            (name, path) = members[index]
+            encoded = name.encode("utf-8")
+            size = os.path.getsize(path)
+            (dos_time, dos_date) = zip_dos_time(os.path.getmtime(path))
+            offset = archive.tell()
+
+            if stored[index]:
+                method = 0
+                compressed_size = size
+                crc = 0
+            else:
+                method = 8
+                with condition:
+                    while index not in results:
+                        condition.wait()
+                    result = results.pop(index)
+                if isinstance(result, Exception):
+                    raise result
+                (crc, compressed_size, data) = result
+
+            zip64 = (size >= 0xFFFFFFFF) or (compressed_size >= 0xFFFFFFFF)
+            extra = b""
+            if zip64:
+                extra = struct.pack("<HHQQ", 1, 16, size, compressed_size)
+            archive.write(struct.pack("<IHHHHHIIIHH", 0x04034b50, 45 if zip64 else 20, 0x800, method, dos_time, dos_date, crc,
+                                      0xFFFFFFFF if zip64 else compressed_size, 0xFFFFFFFF if zip64 else size, len(encoded), len(extra)))
+            archive.write(encoded)
+            archive.write(extra)
+
+            if stored[index]:
+                with open(path, 'rb') as source:
+                    chunk = source.read(1024 ** 2)
+                    while chunk:
+                        crc = zlib.crc32(chunk, crc)
+                        archive.write(chunk)
+                        chunk = source.read(1024 ** 2)
+                crc = crc & 0xFFFFFFFF
+                end = archive.tell()
+                archive.seek(offset + 14)
+                archive.write(struct.pack("<I", crc))
+                archive.seek(end)
+            elif data != None:
+                archive.write(data)
+            else:
+                temp_path = os.path.join(temp_dir, "{}.deflate".format(index))
+                with open(temp_path, 'rb') as source:
+                    chunk = source.read(1024 ** 2)
+                    while chunk:
+                        archive.write(chunk)
+                        chunk = source.read(1024 ** 2)
+                os.remove(temp_path)
+
+            with condition:
+                state["written"] = index + 1
+                condition.notify_all()
+
+            central.append((encoded, method, dos_time, dos_date, crc, compressed_size, size, offset))
+            total += size
+
+        central_offset = archive.tell()
+        for (encoded, method, dos_time, dos_date, crc, compressed_size, size, offset) in central:
+            zip64 = (size >= 0xFFFFFFFF) or (compressed_size >= 0xFFFFFFFF) or (offset >= 0xFFFFFFFF)
+            extra = b""
+            if zip64:
+                extra = struct.pack("<HHQQQ", 1, 24, size, compressed_size, offset)
+                (compressed_size, size, offset) = (0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF)
+            archive.write(struct.pack("<IHHHHHHIIIHHHHHII", 0x02014b50, 45, 45 if zip64 else 20, 0x800, method, dos_time, dos_date, crc,
+                                      compressed_size, size, len(encoded), len(extra), 0, 0, 0, 0, offset))
+            archive.write(encoded)
+            archive.write(extra)
+        central_size = archive.tell() - central_offset
+
+        entries = len(central)
+        if (entries >= 0xFFFF) or (central_offset >= 0xFFFFFFFF) or (central_size >= 0xFFFFFFFF):
+            zip64_offset = archive.tell()
+            archive.write(struct.pack("<IQHHIIQQQQ", 0x06064b50, 44, 45, 45, 0, 0, entries, entries, central_size, central_offset))
+            archive.write(struct.pack("<IIQI", 0x07064b50, 0, zip64_offset, 1))
+            archive.write(struct.pack("<IHHHHIIH", 0x06054b50, 0, 0, min(entries, 0xFFFF), min(entries, 0xFFFF), min(central_size, 0xFFFFFFFF), min(central_offset, 0xFFFFFFFF), 0))
+        else:
+            archive.write(struct.pack("<IHHHHIIH", 0x06054b50, 0, 0, entries, entries, central_size, central_offset, 0))
+
+    for thread in workers:
+        thread.join()
+
+    return(total)
+
+def wbpz_build(job, archive_props):
+    '''
+    Builds the .wbpz archive of a Workbench project on local disk directly from its .wbpj file and _files tree, without opening it in Workbench, and records its digest. Archives which were built by an earlier run of the batch are kept. May be passed to archive_batch in place of archive_build.
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if archive_digest(job.local_path) != None:
+        archive_log_write(archive_props, job.archive_name, "Build Skipped", "Built by an earlier run")
+        return
+
+    if os.path.exists(os.path.dirname(job.local_path)) == False:
+        os.makedirs(os.path.dirname(job.local_path))
+
+    start = time.time()
+    temp_dir = job.local_path + ".members"
+    size = zip_write(job.local_path + ".partial", wbpz_members(job), archive_props.threads, temp_dir)
+    shutil.rmtree(temp_dir)
+
+    if os.path.exists(job.local_path):
+        os.remove(job.local_path)
+    os.rename(job.local_path + ".partial", job.local_path)
+
+    with open(job.local_path + ".sha1", 'w') as digest_file:
+        digest_file.write(file_digest(job.local_path))
+
+    elapsed = max(time.time() - start, 0.001)
+    archive_log_write(archive_props, job.archive_name, "Built", "{:.1f} MB from {:.1f} MB of project files without Workbench in {:.0f} s ({:.1f} MB/s)".format(os.path.getsize(job.local_path) / 1024.0 ** 2, size / 1024.0 ** 2, elapsed, size / 1024.0 ** 2 / elapsed))
+
+    return
+
+def throttle_wait(throttle, size):
+    '''
+    Waits until a chunk of data may be copied without exceeding the bandwidth limit shared by all threads.
+
+    Parameters
+    ---------------------
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+    size : int
+        Size of the chunk in bytes.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if throttle.rate == None:
+        return
+
+    with throttle.lock:
+        now = time.time()
+        start = max(now, throttle.next_time)
+        throttle.next_time = start + size / throttle.rate
+
+    if start > now:
+        time.sleep(start - now)
+
+    return
+
+def chunked_upload(source, destination, digest, throttle, chunk_size, progress = None):
+    '''
+    Copies a file in chunks to a .partial file at the destination, resuming after the chunks copied by an interrupted earlier attempt. The copy is only moved into place once its digest matches; otherwise the partial file is deleted so that the next attempt starts over.
+
+    Parameters
+    ---------------------
+    source : str
+        Path to the file to be copied.
+    destination : str
+        Path to the copy.
+    digest : str
+        SHA-1 hex digest of the source file.
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+    chunk_size : int
+        Size of each chunk in bytes.
+    progress : function
+        Function of the bytes copied so far and the bytes resumed from, called after each chunk, or None.
+
+    Returns
+    ---------------------
+    verified : bool
+        Boolean variable indicating whether the copy matches the source.
+    '''
+
+    partial = destination + ".partial"
+    size = os.path.getsize(source)
+
+    if os.path.exists(os.path.dirname(destination)) == False:
+        os.makedirs(os.path.dirname(destination))
+
+    offset = 0
+    if os.path.isfile(partial):
+        offset = os.path.getsize(partial)
+    if offset > size:
+        os.remove(partial)
+        offset = 0
+    resumed = offset
+
+    with open(source, 'rb') as source_file:
+        with open(partial, 'ab') as partial_file:
+            source_file.seek(offset)
+            chunk = source_file.read(chunk_size)
+            while chunk:
+                throttle_wait(throttle, len(chunk))
+                partial_file.write(chunk)
+                offset += len(chunk)
+                if progress != None:
+                    progress(offset, resumed)
+                chunk = source_file.read(chunk_size)
+
+    if file_digest(partial) != digest:
+        os.remove(partial)
+        return(False)
+
+    if os.path.exists(destination):
+        os.remove(destination)
+    os.rename(partial, destination)
+
+    with open(destination + ".sha1", 'w') as digest_file:
+        digest_file.write(digest)
+
+    return(True)
+
+def archive_upload(job, archive_props, throttle):
+    '''
+    Uploads a locally built archive to its destination, retrying failed uploads, and logs its progress and throughput. Archives whose verified copy is already at the destination are skipped.
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    digest = archive_digest(job.local_path)
+
+    if archive_digest(job.dest_path) == digest:
+        job.status = "Uploaded"
+        archive_log_write(archive_props, job.archive_name, "Upload Skipped", "Verified copy already at {}".format(job.dest_path))
+        return
+
+    size = os.path.getsize(job.local_path)
+    logged = [0]
+
+    for attempt in range(archive_props.retries + 1):
+        start = time.time()
+
+        def progress(offset, resumed):
+            if (offset - logged[0] >= max(size // 10, archive_props.chunk_size)) or (offset == size):
+                logged[0] = offset
+                archive_log_write(archive_props, job.archive_name, "Progress", "{:.0f}% of {:.1f} MB at {:.1f} MB/s".format(100.0 * offset / max(size, 1), size / 1024.0 ** 2, (offset - resumed) / 1024.0 ** 2 / max(time.time() - start, 0.001)))
+
+        try:
+            if os.path.isfile(job.dest_path + ".partial"):
+                archive_log_write(archive_props, job.archive_name, "Resumed", "From {:.1f} MB".format(os.path.getsize(job.dest_path + ".partial") / 1024.0 ** 2))
+            verified = chunked_upload(job.local_path, job.dest_path, digest, throttle, archive_props.chunk_size, progress)
+        except (IOError, OSError) as error:
+            verified = False
+            archive_log_write(archive_props, job.archive_name, "Interrupted", "{}".format(error))
+
+        if verified:
+            job.status = "Uploaded"
+            job.uploaded = size
+            elapsed = max(time.time() - start, 0.001)
+            archive_log_write(archive_props, job.archive_name, "Uploaded", "{:.1f} MB verified at {} in {:.0f} s ({:.1f} MB/s)".format(size / 1024.0 ** 2, job.dest_path, elapsed, size / 1024.0 ** 2 / elapsed))
+            return
+
+        if attempt < archive_props.retries:
+            time.sleep(2 ** attempt)
+
+    job.status = "Failed"
+    archive_log_write(archive_props, job.archive_name, "Failed", "Not uploaded after {} attempts; the local archive is kept in {}".format(archive_props.retries + 1, job.local_path))
+
+    return
+
+chunk_gear = [int(hashlib.sha1("gear {}".format(i).encode("utf-8")).hexdigest()[:8], 16) for i in range(256)]
+
+def chunk_cut(buffer, minimum = 512 * 1024, maximum = 4 * 1024 ** 2, mask = (1 << 20) - 1):
+    '''
+    Finds the end of the first content-defined chunk of a buffer, where a rolling gear hash of the preceding bytes has its masked bits clear. Bytes before the minimum chunk size are skipped, and chunks are cut at the maximum size regardless.
+    Bytearray -> Int
+
+    Parameters
+    ---------------------
+    buffer : bytearray
+        Data to be chunked.
+    minimum : int
+        Minimum chunk size in bytes.
+    maximum : int
+        Maximum chunk size in bytes.
+    mask : int
+        Mask of the rolling hash, setting the average chunk size beyond the minimum.
+
+    Returns
+    ---------------------
+    cut : int
+        Length of the first chunk.
+    '''
+
+    end = min(maximum, len(buffer))
+
+    if minimum >= end:
+        return(end)
+
+    gear = chunk_gear
+    rolling = 0
+    position = minimum
+
+    for byte in buffer[minimum:end]:
+        rolling = ((rolling << 1) + gear[byte]) & 0xFFFFFFFF
+        position += 1
+        if (rolling & mask) == 0:
+            return(position)
+
+    return(end)
+
+def file_chunks(path):
+    '''
+    Splits a file into content-defined chunks, such that an insertion or change within the file only changes the chunks around it.
+
+    Parameters
+    ---------------------
+    path : str
+        Path to the file.
+
+    Returns
+    ---------------------
+    chunks : generator
+        Generator of the chunks of the file as bytes.
+    '''
+
+    buffer = bytearray()
+
+    with open(path, 'rb') as source:
+        data = source.read(4 * 1024 ** 2)
+        while True:
+            buffer.extend(data)
+            while (len(buffer) >= 4 * 1024 ** 2) or ((not data) and (len(buffer) > 0)):
+                cut = chunk_cut(buffer)
+                yield bytes(buffer[:cut])
+                del buffer[:cut]
+            if not data:
+                break
+            data = source.read(4 * 1024 ** 2)
+
+def chunk_path(store_dir, digest):
+    '''
+    Returns the path of a chunk within the chunk store, without the .z extension of compressed chunks.
+    Str, Str -> Str
+
+    Parameters
+    ---------------------
+    store_dir : str
+        Root directory of the chunk store.
+    digest : str
+        SHA-1 hex digest of the chunk.
+
+    Returns
+    ---------------------
+    path : str
+        Path to the chunk.
+    '''
+
+    return(os.path.join(store_dir, "Chunks", digest[:2], digest))
+
+def chunk_put(store_dir, chunk, compress, throttle):
+    '''
+    Stores a chunk in the chunk store unless the store already has it. Chunks are stored zlib-compressed with a .z extension when this makes them smaller, and are read back and verified after they are written.
+
+    Parameters
+    ---------------------
+    store_dir : str
+        Root directory of the chunk store.
+    chunk : bytes
+        Contents of the chunk.
+    compress : bool
+        Specification of whether compressing the chunk should be attempted.
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+
+    Returns
+    ---------------------
+    digest : str
+        SHA-1 hex digest of the chunk.
+    uploaded : int
+        Number of bytes written to the store, 0 if the store already had the chunk.
+    '''
+
+    digest = hashlib.sha1(chunk).hexdigest()
+    path = chunk_path(store_dir, digest)
+
+    if os.path.isfile(path) or os.path.isfile(path + ".z"):
+        return(digest, 0)
+
+    payload = chunk
+    if compress:
+        compressed = zlib.compress(chunk, 6)
+        if len(compressed) < len(chunk):
+            payload = compressed
+            path = path + ".z"
+
+    if os.path.exists(os.path.dirname(path)) == False:
+        try:
+            os.makedirs(os.path.dirname(path))
+        except OSError:
+            pass
+
+    throttle_wait(throttle, len(payload))
+    partial = path + ".{}.partial".format(threading.current_thread().ident)
+    with open(partial, 'wb') as chunk_file:
+        chunk_file.write(payload)
+
+    if chunk_get(partial, path.endswith(".z")) != chunk:
+        os.remove(partial)
+        raise IOError("Chunk {} could not be verified after upload".format(digest))
+
+    try:
+        if os.path.isfile(path):
+            os.remove(partial)
+        else:
+            os.rename(partial, path)
+    except OSError:
+        # another upload of the same chunk stored it first
+        if os.path.isfile(partial):
+            os.remove(partial)
+        if os.path.isfile(path) == False:
+            raise
+
+    return(digest, len(payload))
+
+def chunk_get(path, compressed):
+    '''
+    Reads a chunk from the chunk store.
+    Str, Bool -> Bytes
+
+    Parameters
+    ---------------------
+    path : str
+        Path to the chunk file.
+    compressed : bool
+        Specification of whether the chunk file is zlib-compressed.
+
+    Returns
+    ---------------------
+    chunk : bytes
+        Contents of the chunk.
+    '''
+
+    with open(path, 'rb') as chunk_file:
+        payload = chunk_file.read()
+
+    if compressed:
+        return(zlib.decompress(payload))
+
+    return(payload)
+
+def chunk_file_store(store_dir, path, throttle):
+    '''
+    Stores a file in the chunk store as a list of chunks. Files whose contents the store already has, for instance a mesh archived with an earlier project, are recognised by their digest and not chunked again.
+
+    Parameters
+    ---------------------
+    store_dir : str
+        Root directory of the chunk store.
+    path : str
+        Path to the file.
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+
+    Returns
+    ---------------------
+    entry : dict
+        Dictionary of the digest, size and chunk digests of the file.
+    uploaded : int
+        Number of bytes written to the store.
+    '''
+
+    digest = file_digest(path)
+    index_path = os.path.join(store_dir, "Files", digest[:2], digest + ".json")
+
+    if os.path.isfile(index_path):
+        with open(index_path, 'r') as index_file:
+            return(json.load(index_file), 0)
+
+    compress = os.path.splitext(path)[1].lower() not in stored_extensions
+    chunks = []
+    uploaded = 0
+
+    for chunk in file_chunks(path):
+        (chunk_digest, chunk_uploaded) = chunk_put(store_dir, chunk, compress, throttle)
+        chunks.append(chunk_digest)
+        uploaded += chunk_uploaded
+
+    entry = {"sha1": digest, "size": os.path.getsize(path), "chunks": chunks}
+
+    if os.path.exists(os.path.dirname(index_path)) == False:
+        try:
+            os.makedirs(os.path.dirname(index_path))
+        except OSError:
+            pass
+    partial = index_path + ".{}.partial".format(threading.current_thread().ident)
+    with open(partial, 'w') as index_file:
+        json.dump(entry, index_file)
+    try:
+        if os.path.isfile(index_path):
+            os.remove(partial)
+        else:
+            os.rename(partial, index_path)
+    except OSError:
+        # another upload of the same file stored the index first
+        if os.path.isfile(partial):
+            os.remove(partial)
+        if os.path.isfile(index_path) == False:
+            raise
+
+    return(entry, uploaded)
+
+def chunk_archive(job, archive_props, throttle):
+    '''
+    Archives a Workbench project into the chunk store at the archive root, uploading only the chunks the store does not already have, and writes the manifest of the project to the job's destination.
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if os.path.isfile(job.dest_path):
+        job.status = "Uploaded"
+        archive_log_write(archive_props, job.archive_name, "Upload Skipped", "Manifest already at {}".format(job.dest_path))
+        return
+
+    start = time.time()
+    members = wbpz_members(job)
+    stored = parallel_map(lambda member: chunk_file_store(archive_props.dest_root, member[1], throttle), members, archive_props.threads)
+
+    if None in stored:
+        job.status = "Failed"
+        archive_log_write(archive_props, job.archive_name, "Failed", "{} files could not be stored".format(stored.count(None)))
+        return
+
+    manifest = {"project": job.proj_name, "archive_name": job.archive_name, "cycle": job.cycle, "series": job.series,
+                "created": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), "members": []}
+    for ((name, path), (entry, uploaded)) in zip(members, stored):
+        manifest["members"].append({"name": name, "mtime": os.path.getmtime(path), "sha1": entry["sha1"], "size": entry["size"], "chunks": entry["chunks"]})
+
+    local_manifest = os.path.join(archive_props.build_dir, os.path.basename(job.dest_path))
+    if os.path.exists(archive_props.build_dir) == False:
+        os.makedirs(archive_props.build_dir)
+    with open(local_manifest, 'w') as manifest_file:
+        json.dump(manifest, manifest_file)
+    if file_copy_verified(local_manifest, job.dest_path) == None:
+        job.status = "Failed"
+        archive_log_write(archive_props, job.archive_name, "Failed", "Manifest could not be verified at {}".format(job.dest_path))
+        return
+    os.remove(local_manifest)
+
+    size = sum([entry["size"] for (entry, uploaded) in stored])
+    job.uploaded = sum([uploaded for (entry, uploaded) in stored])
+    job.status = "Uploaded"
+    archive_log_write(archive_props, job.archive_name, "Uploaded", "{:.1f} MB of project files stored as {:.1f} MB of new chunks in {:.0f} s; manifest at {}".format(size / 1024.0 ** 2, job.uploaded / 1024.0 ** 2, time.time() - start, job.dest_path))
+
+    return
+
+def chunk_restore(manifest_path, output_path, store_dir = None, threads = 4):
+    '''
+    Rebuilds the .wbpz archive of a project, or its project folder, from its manifest and the chunk store, verifying the digest of every file.
+
+    Parameters
+    ---------------------
+    manifest_path : str
+        Path to the manifest of the project.
+    output_path : str
+        Path to the .wbpz archive to be rebuilt, or to the folder the project files are restored into if it does not end in .wbpz.
+    store_dir : str
+        Root directory of the chunk store, the archive root three levels above the manifest if None.
+    threads : int
+        Number of threads restoring and compressing files.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if store_dir == None:
+        store_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(manifest_path))))
+
+    with open(manifest_path, 'r') as manifest_file:
+        manifest = json.load(manifest_file)
+
+    building = output_path.lower().endswith(".wbpz")
+    files_dir = output_path
+    if building:
+        files_dir = output_path + ".files"
+
+    paths = parallel_map(lambda member: chunk_member_restore(member, files_dir, store_dir), manifest["members"], threads)
+
+    if None in paths:
+        raise IOError("{} files could not be restored from {}".format(paths.count(None), store_dir))
+
+    if building:
+        zip_write(output_path, [(member["name"], path) for (member, path) in zip(manifest["members"], paths)], threads, output_path + ".members")
+        shutil.rmtree(output_path + ".members")
+        shutil.rmtree(files_dir)
+
+    return
+
+def chunk_member_restore(member, output_dir, store_dir):
+    '''
+    Restores a file listed in a manifest from the chunk store, verifying its digest.
+    Dict, Str, Str -> Str
+
+    Parameters
+    ---------------------
+    member : dict
+        Manifest entry of the file.
+    output_dir : str
+        Directory the file is restored into, under its path within the project.
+    store_dir : str
+        Root directory of the chunk store.
+
+    Returns
+    ---------------------
+    path : str
+        Path to the restored file.
+    '''
+
+    path = member_output_path(output_dir, member["name"])
 
-    END
+    with open(path, 'wb') as output:
+        for digest in member["chunks"]:
+            chunk = chunk_path(store_dir, digest)
+            if os.path.isfile(chunk + ".z"):
+                output.write(chunk_get(chunk + ".z", True))
+            else:
+                output.write(chunk_get(chunk, False))
 
-    > update
-    ANIMATION:ANIMATION
-    QAnim MPEG Filename = {}/Trailing Edge and Wake Streamline Animation.mp4
-    QAnim Save MPEG = On
-    QAnim Looping = Loop
-    QAnim Looping Cycles = 1
-    Video Format = mp4
+    if file_digest(path) != member["sha1"]:
+        raise IOError("{} does not match its digest after restoring".format(member["name"]))
+    os.utime(path, (time.time(), member["mtime"]))
 
-    END""".format(animate_dir))
-    results1.SendCommand(Command="""ANIMATION:
-    Animation Bit Rate = 5152000
-    Animation Frame Rate = 24
-    Animation Quality = Highest
-    Animation Speed Factor = 2
-    Antialiasing = On
-    Drop Last MPEG Frame = Off
-    Hardcopy Tolerance = 0.0001
-    Intermediate File Format = jpg
-    Keep Intermediate Files = Off
-    MPEG Height = 1080
-    MPEG Scale = 100
-    MPEG Size = 1080p
-    MPEG Width = 1920
-    Output Directory = .
-    Output to User Directory = Off
-    QAnim Override Symbol = On
-    QAnim Symbol Size = 0.05
-    QAnim Symbol Spacing = 0.3
-    QAnim Symbol Type = Ball
-    Screen Capture = Off
-    Speed Adjustment Selection = Normal
-    Speed Scaling Method = Distribute Frames Smoothly
-    Timestep Interpolation Method = Timestep
-    Variable Bit Rate = On
-    White Background = Off
-    END""")
-    results1.SendCommand(Command="""ANIMATION: ANIMATION
-    QAnim Object List = /STREAMLINE:Streamline Pos Y 40,/STREAMLINE:Streamline Y 0
-    QAnim Frames = 100
-    QAnim MPEG Filename = {}/Trailing Edge and Wake Streamline Animation.mp4
-    QAnim Save MPEG = On
-    QAnim Looping = Loop
-    QAnim Looping Cycles = 1
-    Video Format = mp4
-    END
-    >animate quickAnimate""".format(animate_dir))
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 4.4939, 0.459533, 0.511379
-        Scale = 0.860138
-        Pan = -1.27971, -0.419625
-        Rotation Quaternion = -3.72529e-09, 0.707107, 0.707107, -3.72529e-09
-        
-      END
+    return(path)
 
-    END
+def member_output_path(output_dir, name):
+    '''
+    Returns the path a member of an archive is restored to, creating its folder. Members whose names would leave the output directory are refused.
+    Str, Str -> Str
 
-    > update
-    ANIMATION:ANIMATION
-    QAnim MPEG Filename = {}/Canopy Streamline Animation.mp4
-    QAnim Save MPEG = On
-    QAnim Looping = Loop
-    QAnim Looping Cycles = 1
-    Video Format = mp4
+    Parameters
+    ---------------------
+    output_dir : str
+        Directory the archive is restored into.
+    name : str
+        Name of the member within the archive.
 
-    END""".format(animate_dir))
-    results1.SendCommand(Command="""ANIMATION: ANIMATION
-    QAnim Object List = /STREAMLINE:Streamline Pos Y 40,/STREAMLINE:Streamline Y 0
-    QAnim Frames = 100
-    QAnim MPEG Filename = {}/Canopy Streamline Animation.mp4
-    QAnim Save MPEG = On
-    QAnim Looping = Loop
-    QAnim Looping Cycles = 1
-    Video Format = mp4
-    END
-    >animate quickAnimate""".format(animate_dir))
-    results1.SendCommand(Command="""VIEW:View 1
-      Camera Mode = User Specified
-      CAMERA:
-        Option = Pivot Point and Quaternion
-        Pivot Point = 3.23676, 0.504839, 0.995587
-        Scale = 0.289498
-        Pan = -0.24374, -1.06636
-        Rotation Quaternion = -4.32978e-17, 0.707107, 0.707107, 4.32978e-17
-        
-      END
+    Returns
+    ---------------------
+    path : str
+        Path to the restored member.
+    '''
 
-    END
+    parts = [part for part in name.replace("\\", "/").split("/") if part not in ["", "."]]
 
-    > update
-    ANIMATION:ANIMATION
-    QAnim MPEG Filename = {}/Right Side Streamline Animation.mp4
-    QAnim Save MPEG = On
-    QAnim Looping = Loop
-    QAnim Looping Cycles = 1
-    Video Format = mp4
+    if (".." in parts) or (len(parts) == 0) or (":" in parts[0]):
+        raise IOError("{} is not a valid member name".format(name))
 
-    END""".format(animate_dir))
-    results1.SendCommand(Command="""ANIMATION: ANIMATION
-    QAnim Object List = /STREAMLINE:Streamline Pos Y 40,/STREAMLINE:Streamline Y 0
-    QAnim Frames = 100
-    QAnim MPEG Filename = {}/Right Side Streamline Animation.mp4
-    QAnim Save MPEG = On
-    QAnim Looping = Loop
-    QAnim Looping Cycles = 1
-    Video Format = mp4
-    END
-    >animate quickAnimate""".format(animate_dir))
-    results1.Exit()
+    path = os.path.join(output_dir, *parts)
+
+    if os.path.exists(os.path.dirname(path)) == False:
+        try:
+            os.makedirs(os.path.dirname(path))
+        except OSError:
+            pass
+
+    return(path)
+
+def archive_members(archive_path, store_dir = None):
+    '''
+    Lists the members of an archived project. For a .wbpz archive, only its central directory is read, with a few ranged reads at the end of the file; for a manifest, only the manifest is read.
+    Str -> List
+
+    Parameters
+    ---------------------
+    archive_path : str
+        Path to a .wbpz archive or to the manifest of a project in the chunk store.
+    store_dir : str
+        Root directory of the chunk store, the archive root three levels above the manifest if None.
+
+    Returns
+    ---------------------
+    members : List
+        List containing a dictionary of the "name" and "size" of each member, with its "chunks" for a manifest.
+    '''
+
+    if archive_path.lower().endswith(".json"):
+        with open(archive_path, 'r') as manifest_file:
+            return(json.load(manifest_file)["members"])
+
+    archive = zipfile.ZipFile(archive_path, 'r')
+    members = [{"name": info.filename.replace("\\", "/"), "size": info.file_size, "info": info} for info in archive.infolist() if info.filename.endswith("/") == False]
+    archive.close()
+
+    return(members)
+
+def archive_member_read(archive_path, name, store_dir = None):
+    '''
+    Reads a single member of an archived project into memory without restoring the rest of the archive.
+    Str, Str -> Bytes
+
+    Parameters
+    ---------------------
+    archive_path : str
+        Path to a .wbpz archive or to the manifest of a project in the chunk store.
+    name : str
+        Name of the member within the archive.
+    store_dir : str
+        Root directory of the chunk store, the archive root three levels above the manifest if None.
+
+    Returns
+    ---------------------
+    data : bytes
+        Contents of the member, or None if the archive has no such member.
+    '''
+
+    if archive_path.lower().endswith(".json") == False:
+        archive = zipfile.ZipFile(archive_path, 'r')
+        try:
+            return(archive.read(name))
+        except KeyError:
+            return(None)
+        finally:
+            archive.close()
+
+    if store_dir == None:
+        store_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(archive_path))))
+
+    for member in archive_members(archive_path):
+        if member["name"] == name:
+            data = b""
+            for digest in member["chunks"]:
+                chunk = chunk_path(store_dir, digest)
+                if os.path.isfile(chunk + ".z"):
+                    data += chunk_get(chunk + ".z", True)
+                else:
+                    data += chunk_get(chunk, False)
+            return(data)
+
+    return(None)
+
+def simulation_patterns(archive_path, sim_names, store_dir = None):
+    '''
+    Returns the member patterns of the Fluent systems of simulations in an archived project, found from the project summary within the archive.
+    Str, List -> List
+
+    Parameters
+    ---------------------
+    archive_path : str
+        Path to a .wbpz archive or to the manifest of a project in the chunk store.
+    sim_names : List
+        List containing names of simulations.
+    store_dir : str
+        Root directory of the chunk store, the archive root three levels above the manifest if None.
+
+    Returns
+    ---------------------
+    patterns : List
+        List containing a pattern of the Fluent system folder of each simulation.
+    '''
+
+    summaries = [member["name"] for member in archive_members(archive_path, store_dir) if member["name"].endswith("/user_files/Minerva Summary.json")]
+
+    if len(summaries) == 0:
+        raise IOError("{} has no project summary to find simulations in".format(archive_path))
+
+    summary = json.loads(archive_member_read(archive_path, summaries[0], store_dir).decode("utf-8"))
+    files_dir = summaries[0][:-len("/user_files/Minerva Summary.json")]
+    patterns = []
+
+    for name in sim_names:
+        systems = [simulation.get("system_index") for simulation in summary["simulations"] if simulation["name"] == name]
+        if (len(systems) == 0) or (systems[0] == None):
+            raise IOError("{} has no Fluent system for simulation {}".format(archive_path, name))
+        if systems[0] == 0:
+            patterns.append("{}/dp0/FLU/*".format(files_dir))
+        else:
+            patterns.append("{}/dp0/FLU-{}/*".format(files_dir, systems[0]))
+
+    return(patterns)
+
+def archive_extract(archive_path, output_dir, patterns, store_dir = None, threads = 4):
+    '''
+    Restores only the members of an archived project matching any of the given patterns, reading each directly from the archive without copying the archive itself. Members of a .wbpz archive are read with ranged reads of their compressed data and streamed to disk; members in the chunk store are rebuilt from their chunks.
+
+    Parameters
+    ---------------------
+    archive_path : str
+        Path to a .wbpz archive or to the manifest of a project in the chunk store.
+    output_dir : str
+        Directory the members are restored into, under their paths within the project.
+    patterns : List
+        List containing shell-style patterns of member names, e.g. "*/Media Files/*".
+    store_dir : str
+        Root directory of the chunk store, the archive root three levels above the manifest if None.
+    threads : int
+        Number of members restored at once.
+
+    Returns
+    ---------------------
+    paths : List
+        List containing paths to the restored members.
+    '''
+
+    if store_dir == None:
+        store_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(archive_path))))
+
+    members = [member for member in archive_members(archive_path, store_dir) if any([fnmatch.fnmatch(member["name"], pattern) for pattern in patterns])]
+    handles = threading.local()
+    opened = []
+    opened_lock = threading.Lock()
+
+    def extract(member):
+        if "chunks" in member:
+            return(chunk_member_restore(member, output_dir, store_dir))
+        if getattr(handles, "archive", None) == None:
+            handles.archive = zipfile.ZipFile(archive_path, 'r')
+            with opened_lock:
+                opened.append(handles.archive)
+        path = member_output_path(output_dir, member["name"])
+        source = handles.archive.open(member["info"], 'r')
+        with open(path, 'wb') as output:
+            shutil.copyfileobj(source, output, 1024 ** 2)
+        source.close()
+        return(path)
+
+    try:
+        paths = parallel_map(extract, members, threads)
+    finally:
+        for archive in opened:
+            archive.close()
+
+    if None in paths:
+        raise IOError("{} of {} members could not be restored from {}".format(paths.count(None), len(members), archive_path))
+
+    return(paths)
+
+def archive_batch(jobs, archive_props, build_function = None):
+    '''
+    Archives a batch of Workbench projects. Each archive is built on local disk in turn, and is uploaded in a background thread while the next archive is built, with at most archive_props.uploads uploads at once. Running the batch again resumes it: built archives are not rebuilt, interrupted uploads continue from their partial copies, and verified uploads are skipped. With the Chunks backend, nothing is built and each project is stored in the chunk store by chunk_archive instead.
+
+    Parameters
+    ---------------------
+    jobs : List
+        List containing Archive_Job objects.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+    build_function : function
+        Function of an Archive_Job and Archive_Properties object building the archive, archive_build if None.
+
+    Returns
+    ---------------------
+    jobs : List
+        List containing Archive_Job objects with their final status.
+    '''
+
+    if build_function == None:
+        build_function = archive_build
+
+    rate = None
+    if archive_props.bandwidth != None:
+        rate = archive_props.bandwidth * 1024 ** 2
+    throttle = Bandwidth_Throttle(rate)
+    slots = threading.Semaphore(max(archive_props.uploads, 1))
+    uploads = []
+    start = time.time()
+
+    def upload(job):
+        try:
+            if archive_props.backend == "Chunks":
+                chunk_archive(job, archive_props, throttle)
+            else:
+                archive_upload(job, archive_props, throttle)
+            if job.status == "Uploaded":
+                catalogue_publish(job, archive_props)
+        except Exception as error:
+            job.status = "Failed"
+            archive_log_write(archive_props, job.archive_name, "Failed", "{}".format(error))
+        finally:
+            slots.release()
+
+    for job in jobs:
+        try:
+            if archive_props.backend != "Chunks":
+                build_function(job, archive_props)
+        except Exception as error:
+            job.status = "Failed"
+            archive_log_write(archive_props, job.archive_name, "Failed", "Could not be built: {}".format(error))
+            continue
+        job.status = "Built"
+        slots.acquire()
+        thread = threading.Thread(target = upload, args = (job,))
+        thread.start()
+        uploads.append(thread)
+
+    for thread in uploads:
+        thread.join()
+
+    uploaded = [job for job in jobs if job.status == "Uploaded"]
+    total = sum([job.uploaded for job in jobs])
+    archive_log_write(archive_props, "", "Batch Finished", "{} of {} archives uploaded; {:.1f} MB in {:.0f} s".format(len(uploaded), len(jobs), total / 1024.0 ** 2, time.time() - start))
+
+    return(jobs)
+
+def catalogue_record(job, archive_props):
+    '''
+    Builds the catalogue record of an archived project from the summary written into the project by Project Minerva and the archive itself. Projects without a summary are recorded without simulations.
+    Archive_Job, Archive_Properties -> Dict
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+
+    Returns
+    ---------------------
+    record : dict
+        Dictionary of the archive, its project settings and its simulations.
+    '''
+
+    record = {"archive_name": job.archive_name, "project": job.proj_name, "cycle": job.cycle, "series": job.series,
+              "backend": archive_props.backend, "dest_path": job.dest_path, "archived": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+              "size": None, "sha1": None, "settings": {}, "simulations": []}
+
+    summary_path = project_summary_path(job.proj_dir, job.proj_name)
+    if os.path.isfile(summary_path):
+        with open(summary_path, 'r') as summary_file:
+            summary = json.load(summary_file)
+        record["settings"] = summary.get("settings", {})
+        record["simulations"] = summary.get("simulations", [])
+
+    if archive_props.backend == "Chunks":
+        with open(job.dest_path, 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+        record["size"] = sum([member["size"] for member in manifest["members"]])
+        record["sha1"] = file_digest(job.dest_path)
+    elif os.path.isfile(job.local_path):
+        record["size"] = os.path.getsize(job.local_path)
+        record["sha1"] = archive_digest(job.local_path)
+
+    return(record)
+
+def catalogue_publish(job, archive_props):
+    '''
+    Writes the catalogue record of an archived project next to the other records in the Catalogue folder of the archive root, from which every catalogue may be synchronised, and adds it to the local catalogue.
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    record = catalogue_record(job, archive_props)
+    record_path = os.path.join(archive_props.dest_root, "Catalogue", job.cycle, job.series, job.archive_name + ".json")
+    local_path = os.path.join(archive_props.build_dir, job.archive_name + ".catalogue.json")
+
+    if os.path.exists(archive_props.build_dir) == False:
+        os.makedirs(archive_props.build_dir)
+    with open(local_path, 'w') as record_file:
+        json.dump(record, record_file, indent = 1)
+
+    if file_copy_verified(local_path, record_path) == None:
+        archive_log_write(archive_props, job.archive_name, "Catalogue Failed", "Record could not be verified at {}".format(record_path))
+        return
+    os.remove(local_path)
+
+    if archive_props.catalogue_path != None:
+        connection = catalogue_open(archive_props.catalogue_path)
+        if connection != None:
+            with archive_log_lock:
+                catalogue_index(connection, record, record_path, os.path.getmtime(record_path))
+                connection.commit()
+            connection.close()
+
+    archive_log_write(archive_props, job.archive_name, "Catalogued", "{} simulations recorded at {}".format(len(record["simulations"]), record_path))
+
+    return
+
+def catalogue_open(catalogue_path):
+    '''
+    Opens the local SQLite archive catalogue, creating its tables and indexes if it is new. SQLite is not available in the IronPython of Workbench, in which case the catalogue is only updated by catalogue_sync.
+    Str -> Connection
+
+    Parameters
+    ---------------------
+    catalogue_path : str
+        Path to the SQLite database of the catalogue.
+
+    Returns
+    ---------------------
+    connection : sqlite3.Connection
+        Connection to the catalogue, or None if SQLite is not available.
+    '''
+
+    try:
+        import sqlite3
+    except ImportError:
+        return(None)
+
+    connection = sqlite3.connect(catalogue_path, timeout = 30)
+    connection.row_factory = sqlite3.Row
+    connection.executescript('''
+        CREATE TABLE IF NOT EXISTS archives (id INTEGER PRIMARY KEY, archive_name TEXT, project TEXT, cycle TEXT, series TEXT, backend TEXT,
+            dest_path TEXT UNIQUE, size INTEGER, sha1 TEXT, archived TEXT, min_iterations INTEGER, max_iterations INTEGER, conv_criterion REAL,
+            record_path TEXT, record_mtime REAL);
+        CREATE TABLE IF NOT EXISTS simulations (archive_id INTEGER, sim_name TEXT, cas_name TEXT, body_size TEXT, sol_method TEXT,
+            velocity REAL, area REAL, length REAL, initialization TEXT, convergence TEXT, stop_reason TEXT, iterations INTEGER,
+            drag REAL, lift REAL, cop TEXT);
+        CREATE INDEX IF NOT EXISTS archives_cycle ON archives (cycle, series);
+        CREATE INDEX IF NOT EXISTS archives_project ON archives (project);
+        CREATE INDEX IF NOT EXISTS simulations_archive ON simulations (archive_id);
+        CREATE INDEX IF NOT EXISTS simulations_method ON simulations (sol_method, body_size, drag);
+        CREATE INDEX IF NOT EXISTS simulations_drag ON simulations (drag);
+        CREATE INDEX IF NOT EXISTS simulations_lift ON simulations (lift);
+    ''')
+
+    return(connection)
+
+def catalogue_number(value):
+    '''
+    Converts an extracted result, stored as a string, to a number for the catalogue.
+
+    Parameters
+    ---------------------
+    value : str
+        Extracted result.
+
+    Returns
+    ---------------------
+    number : float
+        Value of the result, or None if it was not extracted.
+    '''
+
+    try:
+        return(float(value))
+    except (TypeError, ValueError):
+        return(None)
+
+def catalogue_index(connection, record, record_path, record_mtime):
+    '''
+    Adds a catalogue record to the local catalogue, replacing the earlier record of the same archive.
+
+    Parameters
+    ---------------------
+    connection : sqlite3.Connection
+        Connection to the catalogue returned by catalogue_open.
+    record : dict
+        Catalogue record returned by catalogue_record.
+    record_path : str
+        Path to the record in the Catalogue folder of the archive root.
+    record_mtime : float
+        Modification time of the record, such that unchanged records are not indexed again.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    for row in connection.execute("SELECT id FROM archives WHERE dest_path = ?", (record["dest_path"],)).fetchall():
+        connection.execute("DELETE FROM simulations WHERE archive_id = ?", (row[0],))
+        connection.execute("DELETE FROM archives WHERE id = ?", (row[0],))
+
+    settings = record.get("settings", {})
+    cursor = connection.execute("INSERT INTO archives (archive_name, project, cycle, series, backend, dest_path, size, sha1, archived, min_iterations, max_iterations, conv_criterion, record_path, record_mtime) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                (record["archive_name"], record["project"], record["cycle"], record["series"], record["backend"], record["dest_path"], record["size"], record["sha1"],
+                                 record["archived"], settings.get("min_iterations"), settings.get("max_iterations"), settings.get("conv_criterion"), record_path, record_mtime))
+
+    for simulation in record.get("simulations", []):
+        iterations = catalogue_number(simulation.get("iterations"))
+        if iterations != None:
+            iterations = int(iterations)
+        connection.execute("INSERT INTO simulations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                           (cursor.lastrowid, simulation.get("name"), simulation.get("cas_name"), simulation.get("body_size"), simulation.get("sol_method"),
+                            catalogue_number(simulation.get("velocity")), catalogue_number(simulation.get("area")), catalogue_number(simulation.get("length")),
+                            simulation.get("initialization"), simulation.get("convergence"), simulation.get("stop_reason"), iterations,
+                            catalogue_number(simulation.get("drag_tot")), catalogue_number(simulation.get("lift_tot")), simulation.get("cop")))
 
     return
 
+def catalogue_sync(catalogue_path, dest_root):
+    '''
+    Brings the local catalogue up to date with the records in the Catalogue folder of the archive root. Only new and changed records are read.
+    Str, Str -> Int
+
+    Parameters
+    ---------------------
+    catalogue_path : str
+        Path to the SQLite database of the catalogue.
+    dest_root : str
+        Root directory of the archive.
+
+    Returns
+    ---------------------
+    count : int
+        Number of records added or updated.
+    '''
+
+    connection = catalogue_open(catalogue_path)
+    known = {}
+    for row in connection.execute("SELECT record_path, record_mtime FROM archives"):
+        known[row[0]] = row[1]
+
+    count = 0
+
+    for (root, dirs, files) in os.walk(os.path.join(dest_root, "Catalogue")):
+        for name in files:
+            if name.endswith(".json") == False:
+                continue
+            record_path = os.path.join(root, name)
+            record_mtime = os.path.getmtime(record_path)
+            if known.get(record_path) == record_mtime:
+                continue
+            with open(record_path, 'r') as record_file:
+                try:
+                    record = json.load(record_file)
+                except ValueError:
+                    continue
+            catalogue_index(connection, record, record_path, record_mtime)
+            count += 1
+
+    connection.commit()
+    connection.close()
+
+    return(count)
+
+def catalogue_query(catalogue_path, cycle = None, series = None, project = None, sol_method = None, body_size = None, converged = None, drag_min = None, drag_max = None, lift_min = None, lift_max = None):
+    '''
+    Finds the archived simulations matching every given criterion in the local catalogue, without reading the archive.
+    Str -> List
+
+    Parameters
+    ---------------------
+    catalogue_path : str
+        Path to the SQLite database of the catalogue.
+    cycle : str
+        Design cycle, e.g. "Gen 12".
+    series : str
+        Design series, e.g. "DV6".
+    project : str
+        Part of the project or archive name.
+    sol_method : str
+        Either "K-W" or "T-SST".
+    body_size : str
+        Either "FB" or "HB".
+    converged : bool
+        Specification of whether only converged, or only unconverged, simulations are returned.
+    drag_min, drag_max : float
+        Range of the total drag in Newtons.
+    lift_min, lift_max : float
+        Range of the total lift in Newtons.
+
+    Returns
+    ---------------------
+    rows : List
+        List containing a dictionary of the archive and results of each matching simulation.
+    '''
+
+    conditions = []
+    values = []
+
+    for (column, value) in [("a.cycle", cycle), ("a.series", series), ("s.sol_method", sol_method), ("s.body_size", body_size)]:
+        if value != None:
+            conditions.append("{} = ? COLLATE NOCASE".format(column))
+            values.append(value)
+
+    if project != None:
+        conditions.append("(a.project LIKE ? OR a.archive_name LIKE ?)")
+        values = values + ["%{}%".format(project)] * 2
+
+    if converged == True:
+        conditions.append("s.convergence = 'Converged'")
+    elif converged == False:
+        conditions.append("(s.convergence IS NULL OR s.convergence != 'Converged')")
+
+    for (condition, value) in [("s.drag >= ?", drag_min), ("s.drag <= ?", drag_max), ("s.lift >= ?", lift_min), ("s.lift <= ?", lift_max)]:
+        if value != None:
+            conditions.append(condition)
+            values.append(value)
+
+    query = "SELECT a.cycle, a.series, a.archive_name, s.sim_name, s.cas_name, s.body_size, s.sol_method, s.velocity, s.initialization, s.convergence, s.iterations, s.drag, s.lift, a.size, a.sha1, a.dest_path FROM simulations s JOIN archives a ON a.id = s.archive_id"
+    if len(conditions) > 0:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY a.cycle, a.series, a.archive_name, s.sim_name"
+
+    connection = catalogue_open(catalogue_path)
+    rows = [dict(zip(row.keys(), tuple(row))) for row in connection.execute(query, values)]
+    connection.close()
+
+    return(rows)
+
 def name_check(sim_list):
   names = []
   for i in range(len(sim_list)):
@@ -3392,8 +10305,14 @@ os.chdir(dir)
 
 (sim_list, proj_params) = param_extract("Simulation Parameters.csv")
 
+project_open(sim_list, proj_params)
+
 name_check(sim_list)
 
-initialize_project(proj_params)
+if proj_params.resume or ledger_complete(sim_list, proj_params, "setup"):
+    fluent_sim_resume(sim_list, proj_params)
+else:
+    initialize_project(proj_params)
+    fluent_sim_setup(sim_list, proj_params)
 
-fluent_sim_setup(sim_list, proj_params.processes)
\ No newline at end of file
+staging_flush(proj_params)
\ No newline at end of file
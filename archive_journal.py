@@ -3,34 +3,1193 @@
 SetScriptVersion(Version="20.1.164")
 
 import os
+import json
+import time
+import zlib
+import hashlib
+import threading
+from datetime import datetime
 
-abspath = os.path.abspath(__file__)
-dir = os.path.dirname(abspath)
-os.chdir(dir)
+class Archive_Job:
+    '''
+    Class which contains a Workbench project to be archived and the state of its archive.
+
+    Instance Variables
+    ---------------------
+    proj_dir : Directory containing the Workbench project. [str]
+    proj_name : Name of the Workbench project, without the .wbpj extension. [str]
+    cycle : Cycle folder of the archive. [str]
+    series : Design series folder of the archive. [str]
+    archive_name : Name of the archived project, without the .wbpz extension. [str]
+    local_path : Path to the archive built on local disk. [str]
+    dest_path : Path to the archive at the destination. [str]
+    status : Either Waiting, Built, Uploaded or Failed. [str]
+    uploaded : Number of bytes uploaded for the archive. [int]
+    '''
+
+    def __init__(self, proj_dir = None, proj_name = None, cycle = None, series = None, archive_name = None, local_path = None, dest_path = None, status = "Waiting", uploaded = 0):
+        '''Define instance variables.'''
+        self.proj_dir = proj_dir
+        self.proj_name = proj_name
+        self.cycle = cycle
+        self.series = series
+        self.archive_name = archive_name
+        self.local_path = local_path
+        self.dest_path = dest_path
+        self.status = status
+        self.uploaded = uploaded
+
+    def __str__(self):
+        return("\n----ARCHIVE JOB----\nProject: {}/{}.wbpj\nLocal archive: {}\nDestination: {}\nStatus: {}".format(self.proj_dir, self.proj_name, self.local_path, self.dest_path, self.status))
+
+class Archive_Properties:
+    '''
+    Class which contains the settings of a batch of archives.
+
+    Instance Variables
+    ---------------------
+    dest_root : Root directory of the archive, containing the cycle folders. [str]
+    build_dir : Local directory the archives are built in before upload. [str]
+    uploads : Number of archives uploaded at once. [int]
+    bandwidth : Total upload bandwidth limit in MB/s, or None for no limit. [float]
+    chunk_size : Size of the chunks an archive is uploaded in, in bytes. [int]
+    retries : Number of times a failed upload is retried. [int]
+    log_path : Path to the CSV log of the batch. [str]
+    threads : Number of threads compressing members of archives built without Workbench. [int]
+    backend : Either WBPZ, storing each project as a .wbpz archive, or Chunks, storing each project as a manifest of deduplicated chunks. [str]
+    catalogue_path : Path to the local SQLite archive catalogue, or None if it is not updated. [str]
+    '''
+
+    def __init__(self, dest_root = None, build_dir = None, uploads = None, bandwidth = None, chunk_size = 8 * 1024 ** 2, retries = 3, log_path = None, threads = 4, backend = "WBPZ", catalogue_path = None):
+        '''Define instance variables.'''
+        self.dest_root = dest_root
+        self.build_dir = build_dir
+        self.uploads = uploads
+        self.bandwidth = bandwidth
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.log_path = log_path
+        self.threads = threads
+        self.backend = backend
+        self.catalogue_path = catalogue_path
+
+    def __str__(self):
+        return("\n----ARCHIVE PROPERTIES----\nDestination root: {}\nBuild directory: {}\nConcurrent uploads: {}\nBandwidth limit: {} MB/s\nChunk size: {} MB\nRetries: {}\nLog: {}\nCompression threads: {}\nBackend: {}\nCatalogue: {}".format(self.dest_root, self.build_dir, self.uploads, self.bandwidth, self.chunk_size // 1024 ** 2, self.retries, self.log_path, self.threads, self.backend, self.catalogue_path))
+
+class Bandwidth_Throttle:
+    '''
+    Class which limits the total rate at which several threads copy data.
+
+    Instance Variables
+    ---------------------
+    rate : Bandwidth limit in bytes per second, or None for no limit. [float]
+    next_time : Time at which the next chunk may be copied. [float]
+    lock : Lock guarding next_time.
+    '''
+
+    def __init__(self, rate = None):
+        '''Define instance variables.'''
+        self.rate = rate
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def __str__(self):
+        return("\n----BANDWIDTH THROTTLE----\nRate: {} B/s".format(self.rate))
+
+class Workbench_Backend:
+    '''
+    Workbench_Backend object carries out project operations with the scripting functions of the running Workbench session. It is the backend used inside Workbench; Fake_Backend of fake_backend.py takes its place to run the workflow without Ansys.
+
+    Instance Variables
+    ---------------------
+    None
+    '''
+
+    def __init__(self):
+        '''Define instance variables.'''
+
+    def GetTemplate(self, TemplateName = None):
+        '''Return the Workbench template of the given name.'''
+        return(GetTemplate(TemplateName=TemplateName))
+
+    def GetSystem(self, Name = None):
+        '''Return the Workbench system of the given name.'''
+        return(GetSystem(Name=Name))
+
+    def GetDesignPoint(self, Name = None):
+        '''Return the Workbench design point of the given name.'''
+        return(Parameters.GetDesignPoint(Name=Name))
+
+    def UpdateAllDesignPoints(self, DesignPoints = None):
+        '''Update the given design points, solving every Fluent system which is out of date.'''
+        return(UpdateAllDesignPoints(DesignPoints=DesignPoints))
+
+    def Save(self, FilePath = None, Overwrite = True):
+        '''Save the project, to a new path if one is given.'''
+        if FilePath == None:
+            return(Save(Overwrite=Overwrite))
+        return(Save(FilePath=FilePath, Overwrite=Overwrite))
+
+    def Open(self, FilePath = None):
+        '''Open an existing project.'''
+        return(Open(FilePath=FilePath))
+
+    def Archive(self, FilePath = None, IncludeExternalImportedFiles = True):
+        '''Archive the open project to a .wbpz file.'''
+        return(Archive(FilePath=FilePath, IncludeExternalImportedFiles=IncludeExternalImportedFiles))
+
+    def Set(self, **properties):
+        '''Build a Workbench property set.'''
+        return(Set(**properties))
+
+    def __str__(self):
+        return("\n----WORKBENCH BACKEND----\nWorkbench scripting session")
+
+workbench = Workbench_Backend()
+
+def csv_entry(line, index, default = None):
+    '''
+    Returns the stripped entry of a split CSV line, or a default value if the column is missing or left blank.
+    List, int -> Str
+
+    Parameters
+    ---------------------
+    line : List
+        List containing strings of a split CSV line.
+    index : int
+        Index of the column to be read.
+    default : any
+        Value returned if the column is missing or blank.
+
+    Returns
+    ---------------------
+    entry : str
+        Stripped entry of the column, or default.
+    '''
+
+    if index >= len(line):
+        return(default)
+
+    entry = line[index].strip()
+
+    if entry == "":
+        return(default)
+
+    return(entry)
+
+def file_digest(path):
+    '''
+    Computes the SHA-1 digest of the contents of a file, reading it in chunks.
+    Str -> Str
+
+    Parameters
+    ---------------------
+    path : str
+        Path to the file.
+
+    Returns
+    ---------------------
+    digest : str
+        SHA-1 hex digest of the file contents.
+    '''
+
+    digest = hashlib.sha1()
+
+    with open(path, 'rb') as digest_file:
+        chunk = digest_file.read(1024 ** 2)
+        while chunk:
+            digest.update(chunk)
+            chunk = digest_file.read(1024 ** 2)
+
+    return(digest.hexdigest())
+
+def file_copy_verified(source, destination):
+    '''
+    Copies a file through a temporary file, computing the SHA-1 digest of the source while it is read, and only moves the copy into place once its own digest matches.
+    Str, Str -> Str
+
+    Parameters
+    ---------------------
+    source : str
+        Path to the file to be copied.
+    destination : str
+        Path to the copy.
+
+    Returns
+    ---------------------
+    digest : str
+        SHA-1 hex digest of the copied file, or None if the copy could not be verified.
+    '''
+
+    partial = destination + ".partial"
+    digest = hashlib.sha1()
+
+    if os.path.exists(os.path.dirname(destination)) == False:
+        try:
+            os.makedirs(os.path.dirname(destination))
+        except OSError:
+            pass
+
+    with open(source, 'rb') as source_file:
+        with open(partial, 'wb') as partial_file:
+            chunk = source_file.read(1024 ** 2)
+            while chunk:
+                digest.update(chunk)
+                partial_file.write(chunk)
+                chunk = source_file.read(1024 ** 2)
+
+    if file_digest(partial) != digest.hexdigest():
+        os.remove(partial)
+        return(None)
+
+    if os.path.exists(destination):
+        os.remove(destination)
+    os.rename(partial, destination)
+    os.utime(destination, (time.time(), os.path.getmtime(source)))
+
+    return(digest.hexdigest())
+
+def parallel_map(function, items, threads):
+    '''
+    Calls a function on every item of a list using a fixed number of threads.
+
+    Parameters
+    ---------------------
+    function : function
+        Function of one argument.
+    items : List
+        List of arguments.
+    threads : int
+        Number of threads.
+
+    Returns
+    ---------------------
+    results : List
+        List of the return values, in the order of the items.
+    '''
+
+    results = [None] * len(items)
+    pending = list(range(len(items)))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if len(pending) == 0:
+                    return
+                index = pending.pop(0)
+            try:
+                results[index] = function(items[index])
+            except (IOError, OSError):
+                results[index] = None
+
+    workers = [threading.Thread(target = worker) for i in range(max(min(threads, len(items)), 1))]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    return(results)
+
+def project_summary_path(proj_dir, proj_name):
+    '''
+    Returns the path of the summary of a Workbench project, kept in its user_files folder such that it is archived with the project.
+    Str, Str -> Str
+
+    Parameters
+    ---------------------
+    proj_dir : str
+        Directory of the Workbench project.
+    proj_name : str
+        Name of the Workbench project, without the .wbpj extension.
+
+    Returns
+    ---------------------
+    path : str
+        Path to the JSON summary of the project.
+    '''
+
+    return(os.path.join(proj_dir, "{}_files".format(proj_name), "user_files", "Minerva Summary.json"))
+
+def archive_param_extract(csv_path):
+    '''
+    Extracts the projects to be archived and the archive settings from the batch archive CSV file. The settings are entered once in row 2, after a blank column.
+    Str -> List, Archive_Properties (class)
+
+    Parameters
+    ---------------------
+    csv_path : str
+        Path to the batch archive CSV file.
+
+    Returns
+    ---------------------
+    jobs : List
+        List containing Archive_Job objects.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+    '''
+
+    csvfile = open(csv_path, 'r')
+
+    next(csvfile)
+    lines = [line.split(",") for line in csvfile.readlines() if line.strip() != ""]
+
+    csvfile.close()
+
+    settings = []
+    if len(lines) > 0:
+        settings = lines[0]
+
+    build_dir = csv_entry(settings, 7, os.path.join(os.getcwd(), "Archive Builds"))
+    bandwidth = csv_entry(settings, 9)
+    if bandwidth != None:
+        bandwidth = float(bandwidth)
+
+    backend = "WBPZ"
+    if csv_entry(settings, 11, "WBPZ").lower() == "chunks":
+        backend = "Chunks"
+
+    archive_props = Archive_Properties(csv_entry(settings, 6, "//172.16.1.12/hpc/sims/Archives"), build_dir, int(csv_entry(settings, 8, 2)), bandwidth, log_path = os.path.join(build_dir, "Archive Log.csv"), threads = int(csv_entry(settings, 10, 4)), backend = backend, catalogue_path = os.path.join(os.getcwd(), "Archive Catalogue.sqlite"))
+
+    jobs = []
+
+    for entries in lines:
+        if csv_entry(entries, 1) == None:
+            continue
+        archive_name = csv_entry(entries, 4)
+        relative = "{}/{}/{}.wbpz".format(csv_entry(entries, 2), csv_entry(entries, 3), archive_name)
+        if backend == "Chunks":
+            relative = "{}/{}/{}.manifest.json".format(csv_entry(entries, 2), csv_entry(entries, 3), archive_name)
+        jobs.append(Archive_Job(csv_entry(entries, 0), csv_entry(entries, 1), csv_entry(entries, 2), csv_entry(entries, 3), archive_name,
+                                os.path.join(build_dir, relative).replace(os.sep, '/'), "{}/{}".format(archive_props.dest_root.replace(os.sep, '/'), relative)))
+
+    return(jobs, archive_props)
+
+archive_log_lock = threading.Lock()
+
+def archive_log_write(archive_props, archive_name, event, detail):
+    '''
+    Appends an event to the CSV log of a batch of archives. May be called from several upload threads.
+
+    Parameters
+    ---------------------
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+    archive_name : str
+        Name of the archive the event concerns.
+    event : str
+        Short name of the event.
+    detail : str
+        Description of the event.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    with archive_log_lock:
+        if os.path.exists(os.path.dirname(archive_props.log_path)) == False:
+            os.makedirs(os.path.dirname(archive_props.log_path))
+        new_log = (os.path.isfile(archive_props.log_path) == False)
+        with open(archive_props.log_path, 'a') as log:
+            if new_log:
+                log.write("Timestamp,Archive,Event,Detail\n")
+            log.write("{},{},{},{}\n".format(datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), archive_name, event, detail.replace(",", ";")))
+
+    return
+
+def archive_digest(archive_path):
+    '''
+    Returns the SHA-1 digest recorded next to an archive once it was built or verified.
+    Str -> Str
+
+    Parameters
+    ---------------------
+    archive_path : str
+        Path to the archive.
+
+    Returns
+    ---------------------
+    digest : str
+        SHA-1 hex digest recorded in the .sha1 file of the archive, or None if there is none or the archive is missing.
+    '''
+
+    if (os.path.isfile(archive_path) == False) or (os.path.isfile(archive_path + ".sha1") == False):
+        return(None)
+
+    with open(archive_path + ".sha1", 'r') as digest_file:
+        return(digest_file.read().strip())
+
+def archive_build(job, archive_props):
+    '''
+    Builds the archive of a Workbench project on local disk with Workbench, recording its digest. Archives which were built by an earlier run of the batch are kept.
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if archive_digest(job.local_path) != None:
+        archive_log_write(archive_props, job.archive_name, "Build Skipped", "Built by an earlier run")
+        return
+
+    if os.path.exists(os.path.dirname(job.local_path)) == False:
+        os.makedirs(os.path.dirname(job.local_path))
+
+    start = time.time()
+    workbench.Open(FilePath="{}/{}.wbpj".format(job.proj_dir.replace(os.sep, '/'), job.proj_name))
+    workbench.Archive(
+        FilePath=job.local_path,
+        IncludeExternalImportedFiles=True)
+
+    with open(job.local_path + ".sha1", 'w') as digest_file:
+        digest_file.write(file_digest(job.local_path))
+
+    archive_log_write(archive_props, job.archive_name, "Built", "{:.1f} MB in {:.0f} s".format(os.path.getsize(job.local_path) / 1024.0 ** 2, time.time() - start))
+
+    return
+
+stored_extensions = [".png", ".jpg", ".jpeg", ".gif", ".mp4", ".avi", ".gz", ".h5", ".zip", ".wbpz", ".7z", ".bz2", ".xz"]
+
+def wbpz_members(job):
+    '''
+    Lists the files of a Workbench project in the layout of its .wbpz archive: the .wbpj file at the root followed by its _files tree. Lock files and the project scratch directory are left out, as Workbench does when archiving.
+    Archive_Job -> List
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+
+    Returns
+    ---------------------
+    members : List
+        List of tuples of the name of each member within the archive and the path to its file.
+    '''
+
+    files_dir = os.path.join(job.proj_dir, job.proj_name + "_files")
+    members = [(job.proj_name + ".wbpj", os.path.join(job.proj_dir, job.proj_name + ".wbpj"))]
+
+    for (root, dirs, files) in os.walk(files_dir):
+        dirs[:] = sorted([name for name in dirs if name != "_ProjectScratch"])
+        for file_name in sorted(files):
+            if file_name.endswith(".lock") or file_name.endswith(".partial"):
+                continue
+            path = os.path.join(root, file_name)
+            members.append(("{}_files/{}".format(job.proj_name, os.path.relpath(path, files_dir).replace(os.sep, '/')), path))
+
+    return(members)
+
+def throttle_wait(throttle, size):
+    '''
+    Waits until a chunk of data may be copied without exceeding the bandwidth limit shared by all threads.
+
+    Parameters
+    ---------------------
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+    size : int
+        Size of the chunk in bytes.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if throttle.rate == None:
+        return
+
+    with throttle.lock:
+        now = time.time()
+        start = max(now, throttle.next_time)
+        throttle.next_time = start + size / throttle.rate
+
+    if start > now:
+        time.sleep(start - now)
+
+    return
+
+def chunked_upload(source, destination, digest, throttle, chunk_size, progress = None):
+    '''
+    Copies a file in chunks to a .partial file at the destination, resuming after the chunks copied by an interrupted earlier attempt. The copy is only moved into place once its digest matches; otherwise the partial file is deleted so that the next attempt starts over.
+
+    Parameters
+    ---------------------
+    source : str
+        Path to the file to be copied.
+    destination : str
+        Path to the copy.
+    digest : str
+        SHA-1 hex digest of the source file.
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+    chunk_size : int
+        Size of each chunk in bytes.
+    progress : function
+        Function of the bytes copied so far and the bytes resumed from, called after each chunk, or None.
+
+    Returns
+    ---------------------
+    verified : bool
+        Boolean variable indicating whether the copy matches the source.
+    '''
+
+    partial = destination + ".partial"
+    size = os.path.getsize(source)
+
+    if os.path.exists(os.path.dirname(destination)) == False:
+        os.makedirs(os.path.dirname(destination))
+
+    offset = 0
+    if os.path.isfile(partial):
+        offset = os.path.getsize(partial)
+    if offset > size:
+        os.remove(partial)
+        offset = 0
+    resumed = offset
+
+    with open(source, 'rb') as source_file:
+        with open(partial, 'ab') as partial_file:
+            source_file.seek(offset)
+            chunk = source_file.read(chunk_size)
+            while chunk:
+                throttle_wait(throttle, len(chunk))
+                partial_file.write(chunk)
+                offset += len(chunk)
+                if progress != None:
+                    progress(offset, resumed)
+                chunk = source_file.read(chunk_size)
+
+    if file_digest(partial) != digest:
+        os.remove(partial)
+        return(False)
 
-csvfile = open("Ansys Batch Archive.csv", 'r')
+    if os.path.exists(destination):
+        os.remove(destination)
+    os.rename(partial, destination)
 
-next(csvfile)
-lines = csvfile.readlines()
+    with open(destination + ".sha1", 'w') as digest_file:
+        digest_file.write(digest)
 
-proj_dir = []
-proj_name = []
-cycle = []
-series = []
-archive_name = []
+    return(True)
 
-for line in lines:
-    entries = line.split(",")
-    proj_dir.append(entries[0])
-    proj_name.append(entries[1])
-    cycle.append(entries[2])
-    series.append(entries[3])
-    archive_name.append(entries[4].strip())
+def archive_upload(job, archive_props, throttle):
+    '''
+    Uploads a locally built archive to its destination, retrying failed uploads, and logs its progress and throughput. Archives whose verified copy is already at the destination are skipped.
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    digest = archive_digest(job.local_path)
+
+    if archive_digest(job.dest_path) == digest:
+        job.status = "Uploaded"
+        archive_log_write(archive_props, job.archive_name, "Upload Skipped", "Verified copy already at {}".format(job.dest_path))
+        return
+
+    size = os.path.getsize(job.local_path)
+    logged = [0]
+
+    for attempt in range(archive_props.retries + 1):
+        start = time.time()
+
+        def progress(offset, resumed):
+            if (offset - logged[0] >= max(size // 10, archive_props.chunk_size)) or (offset == size):
+                logged[0] = offset
+                archive_log_write(archive_props, job.archive_name, "Progress", "{:.0f}% of {:.1f} MB at {:.1f} MB/s".format(100.0 * offset / max(size, 1), size / 1024.0 ** 2, (offset - resumed) / 1024.0 ** 2 / max(time.time() - start, 0.001)))
+
+        try:
+            if os.path.isfile(job.dest_path + ".partial"):
+                archive_log_write(archive_props, job.archive_name, "Resumed", "From {:.1f} MB".format(os.path.getsize(job.dest_path + ".partial") / 1024.0 ** 2))
+            verified = chunked_upload(job.local_path, job.dest_path, digest, throttle, archive_props.chunk_size, progress)
+        except (IOError, OSError) as error:
+            verified = False
+            archive_log_write(archive_props, job.archive_name, "Interrupted", "{}".format(error))
+
+        if verified:
+            job.status = "Uploaded"
+            job.uploaded = size
+            elapsed = max(time.time() - start, 0.001)
+            archive_log_write(archive_props, job.archive_name, "Uploaded", "{:.1f} MB verified at {} in {:.0f} s ({:.1f} MB/s)".format(size / 1024.0 ** 2, job.dest_path, elapsed, size / 1024.0 ** 2 / elapsed))
+            return
+
+        if attempt < archive_props.retries:
+            time.sleep(2 ** attempt)
+
+    job.status = "Failed"
+    archive_log_write(archive_props, job.archive_name, "Failed", "Not uploaded after {} attempts; the local archive is kept in {}".format(archive_props.retries + 1, job.local_path))
+
+    return
+
+chunk_gear = [int(hashlib.sha1("gear {}".format(i).encode("utf-8")).hexdigest()[:8], 16) for i in range(256)]
+
+def chunk_cut(buffer, minimum = 512 * 1024, maximum = 4 * 1024 ** 2, mask = (1 << 20) - 1):
+    '''
+    Finds the end of the first content-defined chunk of a buffer, where a rolling gear hash of the preceding bytes has its masked bits clear. Bytes before the minimum chunk size are skipped, and chunks are cut at the maximum size regardless.
+    Bytearray -> Int
+
+    Parameters
+    ---------------------
+    buffer : bytearray
+        Data to be chunked.
+    minimum : int
+        Minimum chunk size in bytes.
+    maximum : int
+        Maximum chunk size in bytes.
+    mask : int
+        Mask of the rolling hash, setting the average chunk size beyond the minimum.
+
+    Returns
+    ---------------------
+    cut : int
+        Length of the first chunk.
+    '''
+
+    end = min(maximum, len(buffer))
+
+    if minimum >= end:
+        return(end)
+
+    gear = chunk_gear
+    rolling = 0
+    position = minimum
+
+    for byte in buffer[minimum:end]:
+        rolling = ((rolling << 1) + gear[byte]) & 0xFFFFFFFF
+        position += 1
+        if (rolling & mask) == 0:
+            return(position)
+
+    return(end)
+
+def file_chunks(path):
+    '''
+    Splits a file into content-defined chunks, such that an insertion or change within the file only changes the chunks around it.
+
+    Parameters
+    ---------------------
+    path : str
+        Path to the file.
+
+    Returns
+    ---------------------
+    chunks : generator
+        Generator of the chunks of the file as bytes.
+    '''
+
+    buffer = bytearray()
+
+    with open(path, 'rb') as source:
+        data = source.read(4 * 1024 ** 2)
+        while True:
+            buffer.extend(data)
+            while (len(buffer) >= 4 * 1024 ** 2) or ((not data) and (len(buffer) > 0)):
+                cut = chunk_cut(buffer)
+                yield bytes(buffer[:cut])
+                del buffer[:cut]
+            if not data:
+                break
+            data = source.read(4 * 1024 ** 2)
+
+def chunk_path(store_dir, digest):
+    '''
+    Returns the path of a chunk within the chunk store, without the .z extension of compressed chunks.
+    Str, Str -> Str
+
+    Parameters
+    ---------------------
+    store_dir : str
+        Root directory of the chunk store.
+    digest : str
+        SHA-1 hex digest of the chunk.
+
+    Returns
+    ---------------------
+    path : str
+        Path to the chunk.
+    '''
+
+    return(os.path.join(store_dir, "Chunks", digest[:2], digest))
+
+def chunk_put(store_dir, chunk, compress, throttle):
+    '''
+    Stores a chunk in the chunk store unless the store already has it. Chunks are stored zlib-compressed with a .z extension when this makes them smaller, and are read back and verified after they are written.
+
+    Parameters
+    ---------------------
+    store_dir : str
+        Root directory of the chunk store.
+    chunk : bytes
+        Contents of the chunk.
+    compress : bool
+        Specification of whether compressing the chunk should be attempted.
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+
+    Returns
+    ---------------------
+    digest : str
+        SHA-1 hex digest of the chunk.
+    uploaded : int
+        Number of bytes written to the store, 0 if the store already had the chunk.
+    '''
+
+    digest = hashlib.sha1(chunk).hexdigest()
+    path = chunk_path(store_dir, digest)
+
+    if os.path.isfile(path) or os.path.isfile(path + ".z"):
+        return(digest, 0)
+
+    payload = chunk
+    if compress:
+        compressed = zlib.compress(chunk, 6)
+        if len(compressed) < len(chunk):
+            payload = compressed
+            path = path + ".z"
+
+    if os.path.exists(os.path.dirname(path)) == False:
+        try:
+            os.makedirs(os.path.dirname(path))
+        except OSError:
+            pass
+
+    throttle_wait(throttle, len(payload))
+    partial = path + ".{}.partial".format(threading.current_thread().ident)
+    with open(partial, 'wb') as chunk_file:
+        chunk_file.write(payload)
+
+    if chunk_get(partial, path.endswith(".z")) != chunk:
+        os.remove(partial)
+        raise IOError("Chunk {} could not be verified after upload".format(digest))
+
+    try:
+        if os.path.isfile(path):
+            os.remove(partial)
+        else:
+            os.rename(partial, path)
+    except OSError:
+        # another upload of the same chunk stored it first
+        if os.path.isfile(partial):
+            os.remove(partial)
+        if os.path.isfile(path) == False:
+            raise
+
+    return(digest, len(payload))
+
+def chunk_get(path, compressed):
+    '''
+    Reads a chunk from the chunk store.
+    Str, Bool -> Bytes
+
+    Parameters
+    ---------------------
+    path : str
+        Path to the chunk file.
+    compressed : bool
+        Specification of whether the chunk file is zlib-compressed.
+
+    Returns
+    ---------------------
+    chunk : bytes
+        Contents of the chunk.
+    '''
+
+    with open(path, 'rb') as chunk_file:
+        payload = chunk_file.read()
+
+    if compressed:
+        return(zlib.decompress(payload))
+
+    return(payload)
+
+def chunk_file_store(store_dir, path, throttle):
+    '''
+    Stores a file in the chunk store as a list of chunks. Files whose contents the store already has, for instance a mesh archived with an earlier project, are recognised by their digest and not chunked again.
+
+    Parameters
+    ---------------------
+    store_dir : str
+        Root directory of the chunk store.
+    path : str
+        Path to the file.
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+
+    Returns
+    ---------------------
+    entry : dict
+        Dictionary of the digest, size and chunk digests of the file.
+    uploaded : int
+        Number of bytes written to the store.
+    '''
+
+    digest = file_digest(path)
+    index_path = os.path.join(store_dir, "Files", digest[:2], digest + ".json")
+
+    if os.path.isfile(index_path):
+        with open(index_path, 'r') as index_file:
+            return(json.load(index_file), 0)
+
+    compress = os.path.splitext(path)[1].lower() not in stored_extensions
+    chunks = []
+    uploaded = 0
+
+    for chunk in file_chunks(path):
+        (chunk_digest, chunk_uploaded) = chunk_put(store_dir, chunk, compress, throttle)
+        chunks.append(chunk_digest)
+        uploaded += chunk_uploaded
+
+    entry = {"sha1": digest, "size": os.path.getsize(path), "chunks": chunks}
+
+    if os.path.exists(os.path.dirname(index_path)) == False:
+        try:
+            os.makedirs(os.path.dirname(index_path))
+        except OSError:
+            pass
+    partial = index_path + ".{}.partial".format(threading.current_thread().ident)
+    with open(partial, 'w') as index_file:
+        json.dump(entry, index_file)
+    try:
+        if os.path.isfile(index_path):
+            os.remove(partial)
+        else:
+            os.rename(partial, index_path)
+    except OSError:
+        # another upload of the same file stored the index first
+        if os.path.isfile(partial):
+            os.remove(partial)
+        if os.path.isfile(index_path) == False:
+            raise
+
+    return(entry, uploaded)
+
+def chunk_archive(job, archive_props, throttle):
+    '''
+    Archives a Workbench project into the chunk store at the archive root, uploading only the chunks the store does not already have, and writes the manifest of the project to the job's destination.
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+    throttle : Bandwidth_Throttle object
+        Instance of Bandwidth_Throttle class.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    if os.path.isfile(job.dest_path):
+        job.status = "Uploaded"
+        archive_log_write(archive_props, job.archive_name, "Upload Skipped", "Manifest already at {}".format(job.dest_path))
+        return
+
+    start = time.time()
+    members = wbpz_members(job)
+    stored = parallel_map(lambda member: chunk_file_store(archive_props.dest_root, member[1], throttle), members, archive_props.threads)
+
+    if None in stored:
+        job.status = "Failed"
+        archive_log_write(archive_props, job.archive_name, "Failed", "{} files could not be stored".format(stored.count(None)))
+        return
+
+    manifest = {"project": job.proj_name, "archive_name": job.archive_name, "cycle": job.cycle, "series": job.series,
+                "created": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), "members": []}
+    for ((name, path), (entry, uploaded)) in zip(members, stored):
+        manifest["members"].append({"name": name, "mtime": os.path.getmtime(path), "sha1": entry["sha1"], "size": entry["size"], "chunks": entry["chunks"]})
+
+    local_manifest = os.path.join(archive_props.build_dir, os.path.basename(job.dest_path))
+    if os.path.exists(archive_props.build_dir) == False:
+        os.makedirs(archive_props.build_dir)
+    with open(local_manifest, 'w') as manifest_file:
+        json.dump(manifest, manifest_file)
+    if file_copy_verified(local_manifest, job.dest_path) == None:
+        job.status = "Failed"
+        archive_log_write(archive_props, job.archive_name, "Failed", "Manifest could not be verified at {}".format(job.dest_path))
+        return
+    os.remove(local_manifest)
+
+    size = sum([entry["size"] for (entry, uploaded) in stored])
+    job.uploaded = sum([uploaded for (entry, uploaded) in stored])
+    job.status = "Uploaded"
+    archive_log_write(archive_props, job.archive_name, "Uploaded", "{:.1f} MB of project files stored as {:.1f} MB of new chunks in {:.0f} s; manifest at {}".format(size / 1024.0 ** 2, job.uploaded / 1024.0 ** 2, time.time() - start, job.dest_path))
+
+    return
+
+def archive_batch(jobs, archive_props, build_function = None):
+    '''
+    Archives a batch of Workbench projects. Each archive is built on local disk in turn, and is uploaded in a background thread while the next archive is built, with at most archive_props.uploads uploads at once. Running the batch again resumes it: built archives are not rebuilt, interrupted uploads continue from their partial copies, and verified uploads are skipped. With the Chunks backend, nothing is built and each project is stored in the chunk store by chunk_archive instead.
+
+    Parameters
+    ---------------------
+    jobs : List
+        List containing Archive_Job objects.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+    build_function : function
+        Function of an Archive_Job and Archive_Properties object building the archive, archive_build if None.
+
+    Returns
+    ---------------------
+    jobs : List
+        List containing Archive_Job objects with their final status.
+    '''
+
+    if build_function == None:
+        build_function = archive_build
+
+    rate = None
+    if archive_props.bandwidth != None:
+        rate = archive_props.bandwidth * 1024 ** 2
+    throttle = Bandwidth_Throttle(rate)
+    slots = threading.Semaphore(max(archive_props.uploads, 1))
+    uploads = []
+    start = time.time()
+
+    def upload(job):
+        try:
+            if archive_props.backend == "Chunks":
+                chunk_archive(job, archive_props, throttle)
+            else:
+                archive_upload(job, archive_props, throttle)
+            if job.status == "Uploaded":
+                catalogue_publish(job, archive_props)
+        except Exception as error:
+            job.status = "Failed"
+            archive_log_write(archive_props, job.archive_name, "Failed", "{}".format(error))
+        finally:
+            slots.release()
+
+    for job in jobs:
+        try:
+            if archive_props.backend != "Chunks":
+                build_function(job, archive_props)
+        except Exception as error:
+            job.status = "Failed"
+            archive_log_write(archive_props, job.archive_name, "Failed", "Could not be built: {}".format(error))
+            continue
+        job.status = "Built"
+        slots.acquire()
+        thread = threading.Thread(target = upload, args = (job,))
+        thread.start()
+        uploads.append(thread)
+
+    for thread in uploads:
+        thread.join()
+
+    uploaded = [job for job in jobs if job.status == "Uploaded"]
+    total = sum([job.uploaded for job in jobs])
+    archive_log_write(archive_props, "", "Batch Finished", "{} of {} archives uploaded; {:.1f} MB in {:.0f} s".format(len(uploaded), len(jobs), total / 1024.0 ** 2, time.time() - start))
+
+    return(jobs)
+
+def catalogue_record(job, archive_props):
+    '''
+    Builds the catalogue record of an archived project from the summary written into the project by Project Minerva and the archive itself. Projects without a summary are recorded without simulations.
+    Archive_Job, Archive_Properties -> Dict
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+
+    Returns
+    ---------------------
+    record : dict
+        Dictionary of the archive, its project settings and its simulations.
+    '''
+
+    record = {"archive_name": job.archive_name, "project": job.proj_name, "cycle": job.cycle, "series": job.series,
+              "backend": archive_props.backend, "dest_path": job.dest_path, "archived": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+              "size": None, "sha1": None, "settings": {}, "simulations": []}
+
+    summary_path = project_summary_path(job.proj_dir, job.proj_name)
+    if os.path.isfile(summary_path):
+        with open(summary_path, 'r') as summary_file:
+            summary = json.load(summary_file)
+        record["settings"] = summary.get("settings", {})
+        record["simulations"] = summary.get("simulations", [])
+
+    if archive_props.backend == "Chunks":
+        with open(job.dest_path, 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+        record["size"] = sum([member["size"] for member in manifest["members"]])
+        record["sha1"] = file_digest(job.dest_path)
+    elif os.path.isfile(job.local_path):
+        record["size"] = os.path.getsize(job.local_path)
+        record["sha1"] = archive_digest(job.local_path)
+
+    return(record)
+
+def catalogue_publish(job, archive_props):
+    '''
+    Writes the catalogue record of an archived project next to the other records in the Catalogue folder of the archive root, from which every catalogue may be synchronised, and adds it to the local catalogue.
+
+    Parameters
+    ---------------------
+    job : Archive_Job object
+        Instance of Archive_Job class.
+    archive_props : Archive_Properties object
+        Instance of Archive_Properties class.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    record = catalogue_record(job, archive_props)
+    record_path = os.path.join(archive_props.dest_root, "Catalogue", job.cycle, job.series, job.archive_name + ".json")
+    local_path = os.path.join(archive_props.build_dir, job.archive_name + ".catalogue.json")
+
+    if os.path.exists(archive_props.build_dir) == False:
+        os.makedirs(archive_props.build_dir)
+    with open(local_path, 'w') as record_file:
+        json.dump(record, record_file, indent = 1)
+
+    if file_copy_verified(local_path, record_path) == None:
+        archive_log_write(archive_props, job.archive_name, "Catalogue Failed", "Record could not be verified at {}".format(record_path))
+        return
+    os.remove(local_path)
+
+    if archive_props.catalogue_path != None:
+        connection = catalogue_open(archive_props.catalogue_path)
+        if connection != None:
+            with archive_log_lock:
+                catalogue_index(connection, record, record_path, os.path.getmtime(record_path))
+                connection.commit()
+            connection.close()
+
+    archive_log_write(archive_props, job.archive_name, "Catalogued", "{} simulations recorded at {}".format(len(record["simulations"]), record_path))
+
+    return
+
+def catalogue_open(catalogue_path):
+    '''
+    Opens the local SQLite archive catalogue, creating its tables and indexes if it is new. SQLite is not available in the IronPython of Workbench, in which case the catalogue is only updated by catalogue_sync.
+    Str -> Connection
+
+    Parameters
+    ---------------------
+    catalogue_path : str
+        Path to the SQLite database of the catalogue.
+
+    Returns
+    ---------------------
+    connection : sqlite3.Connection
+        Connection to the catalogue, or None if SQLite is not available.
+    '''
+
+    try:
+        import sqlite3
+    except ImportError:
+        return(None)
+
+    connection = sqlite3.connect(catalogue_path, timeout = 30)
+    connection.row_factory = sqlite3.Row
+    connection.executescript('''
+        CREATE TABLE IF NOT EXISTS archives (id INTEGER PRIMARY KEY, archive_name TEXT, project TEXT, cycle TEXT, series TEXT, backend TEXT,
+            dest_path TEXT UNIQUE, size INTEGER, sha1 TEXT, archived TEXT, min_iterations INTEGER, max_iterations INTEGER, conv_criterion REAL,
+            record_path TEXT, record_mtime REAL);
+        CREATE TABLE IF NOT EXISTS simulations (archive_id INTEGER, sim_name TEXT, cas_name TEXT, body_size TEXT, sol_method TEXT,
+            velocity REAL, area REAL, length REAL, initialization TEXT, convergence TEXT, stop_reason TEXT, iterations INTEGER,
+            drag REAL, lift REAL, cop TEXT);
+        CREATE INDEX IF NOT EXISTS archives_cycle ON archives (cycle, series);
+        CREATE INDEX IF NOT EXISTS archives_project ON archives (project);
+        CREATE INDEX IF NOT EXISTS simulations_archive ON simulations (archive_id);
+        CREATE INDEX IF NOT EXISTS simulations_method ON simulations (sol_method, body_size, drag);
+        CREATE INDEX IF NOT EXISTS simulations_drag ON simulations (drag);
+        CREATE INDEX IF NOT EXISTS simulations_lift ON simulations (lift);
+    ''')
+
+    return(connection)
+
+def catalogue_number(value):
+    '''
+    Converts an extracted result, stored as a string, to a number for the catalogue.
+
+    Parameters
+    ---------------------
+    value : str
+        Extracted result.
+
+    Returns
+    ---------------------
+    number : float
+        Value of the result, or None if it was not extracted.
+    '''
+
+    try:
+        return(float(value))
+    except (TypeError, ValueError):
+        return(None)
+
+def catalogue_index(connection, record, record_path, record_mtime):
+    '''
+    Adds a catalogue record to the local catalogue, replacing the earlier record of the same archive.
+
+    Parameters
+    ---------------------
+    connection : sqlite3.Connection
+        Connection to the catalogue returned by catalogue_open.
+    record : dict
+        Catalogue record returned by catalogue_record.
+    record_path : str
+        Path to the record in the Catalogue folder of the archive root.
+    record_mtime : float
+        Modification time of the record, such that unchanged records are not indexed again.
+
+    Returns
+    ---------------------
+    None
+    '''
+
+    for row in connection.execute("SELECT id FROM archives WHERE dest_path = ?", (record["dest_path"],)).fetchall():
+        connection.execute("DELETE FROM simulations WHERE archive_id = ?", (row[0],))
+        connection.execute("DELETE FROM archives WHERE id = ?", (row[0],))
+
+    settings = record.get("settings", {})
+    cursor = connection.execute("INSERT INTO archives (archive_name, project, cycle, series, backend, dest_path, size, sha1, archived, min_iterations, max_iterations, conv_criterion, record_path, record_mtime) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                (record["archive_name"], record["project"], record["cycle"], record["series"], record["backend"], record["dest_path"], record["size"], record["sha1"],
+                                 record["archived"], settings.get("min_iterations"), settings.get("max_iterations"), settings.get("conv_criterion"), record_path, record_mtime))
+
+    for simulation in record.get("simulations", []):
+        iterations = catalogue_number(simulation.get("iterations"))
+        if iterations != None:
+            iterations = int(iterations)
+        connection.execute("INSERT INTO simulations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                           (cursor.lastrowid, simulation.get("name"), simulation.get("cas_name"), simulation.get("body_size"), simulation.get("sol_method"),
+                            catalogue_number(simulation.get("velocity")), catalogue_number(simulation.get("area")), catalogue_number(simulation.get("length")),
+                            simulation.get("initialization"), simulation.get("convergence"), simulation.get("stop_reason"), iterations,
+                            catalogue_number(simulation.get("drag_tot")), catalogue_number(simulation.get("lift_tot")), simulation.get("cop")))
+
+    return
+
+abspath = os.path.abspath(__file__)
+dir = os.path.dirname(abspath)
+os.chdir(dir)
 
-csvfile.close()
+(jobs, archive_props) = archive_param_extract("Ansys Batch Archive.csv")
 
-for j in range(len(proj_dir)):
-    Open(FilePath="{}/{}.wbpj".format(proj_dir[j].replace(os.sep, '/'), proj_name[j]))
-    Archive(
-        FilePath="//172.16.1.12/hpc/sims/Archives/{}/{}/{}.wbpz".format(cycle[j], series[j], archive_name[j]),
-        IncludeExternalImportedFiles=True)
\ No newline at end of file
+archive_batch(jobs, archive_props)
\ No newline at end of file
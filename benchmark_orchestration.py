@@ -0,0 +1,58 @@
+import sys
+import time
+import shutil
+import tempfile
+import resources
+from fake_backend import Fake_Backend, synthetic_project
+from resources import param_extract, project_open, initialize_project, fluent_sim_setup, completion_status, convergence_status, results_dir, results_extract, post_processing, staging_flush
+
+# Runs the whole workflow against the fake backend, so the time measured is the orchestration overhead of Minerva itself
+sim_counts = [int(count) for count in sys.argv[1:]] or [10, 100, 1000]
+
+latency = 0.0 #Seconds per Workbench operation and Fluent or CFD-Post command
+iteration_latency = 0.0 #Seconds per solver iteration
+failure_rate = 0.02
+divergence_rate = 0.05
+post_every = 10 #Every tenth simulation is post-processed
+
+for count in sim_counts:
+    root = tempfile.mkdtemp()
+    backend = Fake_Backend(latency, iteration_latency, failure_rate, divergence_rate, seed=count)
+    resources.workbench = backend
+    csv_path = synthetic_project(root, count, None, post_every)
+    stages = []
+
+    start = time.time()
+    (sim_list, proj_params) = param_extract(csv_path)
+    project_open(sim_list, proj_params)
+    stages.append(("Parameter extraction", time.time() - start))
+
+    start = time.time()
+    initialize_project(proj_params)
+    fluent_sim_setup(sim_list, proj_params)
+    stages.append(("Setup and solve", time.time() - start))
+
+    start = time.time()
+    completion_status(sim_list, proj_params)
+    sim_list = convergence_status(sim_list, proj_params)
+    stages.append(("Convergence", time.time() - start))
+
+    start = time.time()
+    results_dir(sim_list, proj_params)
+    results_extract(sim_list, proj_params)
+    stages.append(("Results extraction", time.time() - start))
+
+    start = time.time()
+    post_processing(sim_list, proj_params)
+    staging_flush(proj_params)
+    stages.append(("Post-processing", time.time() - start))
+
+    converged = len([sim for sim in sim_list if sim.results.convergence == "Converged"])
+    total = sum([stage[1] for stage in stages])
+
+    print("{} simulations, {} converged, {} commands sent".format(count, converged, backend.calls.get("SendCommand", 0)))
+    for (stage, duration) in stages:
+        print("  {}: {:.2f} s, {:.2f} ms per simulation".format(stage, duration, 1000 * duration / count))
+    print("  Total: {:.2f} s, {:.2f} ms per simulation".format(total, 1000 * total / count))
+
+    shutil.rmtree(root)
@@ -0,0 +1,207 @@
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import argparse
+import platform
+import tempfile
+import builtins
+import tracemalloc
+import resources
+from datetime import datetime
+from fake_backend import Fake_Backend, synthetic_project
+from resources import param_extract, project_open, initialize_project, fluent_sim_setup, completion_status, convergence_status, results_dir, results_extract, post_processing, staging_flush
+
+# Stages and functions of Minerva which are timed; the solver itself is replaced by the fake backend and not timed
+profiled_functions = ["fluent_results_export", "fluent_results_aggregator", "monitor_statistics", "results_formatter", "ledger_record", "run_report_write", "post_plots"]
+
+parser = argparse.ArgumentParser(description="Runs every non-solver stage of the workflow on synthetic projects with the fake backend, records the timings, peak memory and file operations of each stage in a history file, and flags regressions against earlier runs.")
+parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000], help="Numbers of simulations in the synthetic projects")
+parser.add_argument("--bodies", nargs="+", default=["HB", "FB"], choices=["HB", "FB"], help="Body sizes of the synthetic projects")
+parser.add_argument("--post", nargs="+", default=["off", "on"], choices=["off", "on"], help="Whether every simulation is post-processed")
+parser.add_argument("--repeats", type=int, default=3, help="Number of times each project is run, of which the fastest run of each stage is kept")
+parser.add_argument("--history", default="Benchmark History.jsonl", help="File to which the results are appended and against which regressions are flagged")
+parser.add_argument("--window", type=int, default=5, help="Number of earlier runs of each project compared against")
+parser.add_argument("--tolerance", type=float, default=0.5, help="Fraction by which a stage may be slower or use more memory before it is flagged")
+parser.add_argument("--label", default="", help="Description of the change being benchmarked, stored in the history")
+parser.add_argument("--no-record", action="store_true", help="Compare against the history without appending to it")
+args = parser.parse_args()
+
+class Counters:
+    '''
+    Counters object accumulates the time and calls of the profiled functions and the files opened during a stage.
+
+    Instance Variables
+    ---------------------
+    functions : Seconds and calls of each profiled function. [dict]
+    reads : Number of files opened for reading. [int]
+    writes : Number of files opened for writing or appending. [int]
+    '''
+
+    def __init__(self):
+        '''Define instance variables.'''
+        self.functions = {}
+        self.reads = 0
+        self.writes = 0
+
+    def __str__(self):
+        return("\n----COUNTERS----\nReads: {}\nWrites: {}".format(self.reads, self.writes))
+
+counters = Counters()
+builtin_open = builtins.open
+
+def counted_open(file, mode = 'r', *args, **kwargs):
+    if any(flag in mode for flag in "wax+"):
+        counters.writes += 1
+    else:
+        counters.reads += 1
+    return(builtin_open(file, mode, *args, **kwargs))
+
+def profiled(name, function):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return(function(*args, **kwargs))
+        finally:
+            (seconds, calls) = counters.functions.get(name, (0.0, 0))
+            counters.functions[name] = (seconds + time.perf_counter() - start, calls + 1)
+    return(wrapper)
+
+def proc_io():
+    # Bytes read and written by the process, where the platform reports them
+    try:
+        with builtin_open("/proc/self/io", 'r') as io_file:
+            values = dict(line.split(": ") for line in io_file.read().splitlines())
+        return(int(values["rchar"]), int(values["wchar"]))
+    except (IOError, OSError, KeyError, ValueError):
+        return(None)
+
+def measure(stages, name, function, *args):
+    global counters
+    counters = Counters()
+    io_start = proc_io()
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.stop()
+        tracemalloc.start()
+    start = time.perf_counter()
+    output = function(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    io_end = proc_io()
+    stage = {"seconds": seconds, "peak_mb": peak / 1024.0 ** 2, "reads": counters.reads, "writes": counters.writes, "functions": dict((key, {"seconds": value[0], "calls": value[1]}) for (key, value) in counters.functions.items())}
+    if (io_start != None) and (io_end != None):
+        stage["read_mb"] = (io_end[0] - io_start[0]) / 1024.0 ** 2
+        stage["written_mb"] = (io_end[1] - io_start[1]) / 1024.0 ** 2
+    stages[name] = stage
+    return(output)
+
+def setup_and_solve(sim_list, proj_params):
+    initialize_project(proj_params)
+    fluent_sim_setup(sim_list, proj_params)
+
+def convergence(sim_list, proj_params):
+    completion_status(sim_list, proj_params)
+    return(convergence_status(sim_list, proj_params))
+
+def results(sim_list, proj_params):
+    results_dir(sim_list, proj_params)
+    results_extract(sim_list, proj_params)
+
+def post(sim_list, proj_params):
+    post_processing(sim_list, proj_params)
+    staging_flush(proj_params)
+
+def run_project(count, body_size, post_on):
+    root = tempfile.mkdtemp()
+    resources.workbench = Fake_Backend(failure_rate=0.02, divergence_rate=0.05, seed=count)
+    csv_path = synthetic_project(root, count, body_size, [0, 1][post_on])
+    stages = {}
+    (sim_list, proj_params) = measure(stages, "param_extract", param_extract, csv_path)
+    project_open(sim_list, proj_params)
+    # Setup is run for the solver output the later stages read, and is not compared as the fake solve dominates it
+    setup_and_solve(sim_list, proj_params)
+    sim_list = measure(stages, "convergence_status", convergence, sim_list, proj_params)
+    measure(stages, "results_extract", results, sim_list, proj_params)
+    if post_on:
+        measure(stages, "post_processing", post, sim_list, proj_params)
+    shutil.rmtree(root)
+    return(stages)
+
+def history_load(path):
+    runs = []
+    if os.path.isfile(path):
+        with open(path, 'r') as history:
+            for line in history:
+                if line.strip() != "":
+                    runs.append(json.loads(line))
+    return(runs)
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2 == 1:
+        return(values[middle])
+    return((values[middle - 1] + values[middle]) / 2.0)
+
+def regressions(projects, runs):
+    # A stage is flagged when it is slower or uses more memory than the median of its earlier runs by more than the tolerance and a noise floor, or when it opens more files
+    flags = []
+    for (project, stages) in sorted(projects.items()):
+        for (stage, result) in sorted(stages.items()):
+            earlier = [run["projects"][project][stage] for run in runs if stage in run["projects"].get(project, {})][-args.window:]
+            if len(earlier) == 0:
+                continue
+            for (metric, unit, floor) in [("seconds", "s", 0.1), ("peak_mb", "MB", 1.0)]:
+                baseline = median([entry[metric] for entry in earlier])
+                if (result[metric] > baseline * (1 + args.tolerance)) and (result[metric] - baseline > floor):
+                    flags.append("{}, {}: {:.3f} {} against a median of {:.3f} {} (+{:.0f}%)".format(project, stage, result[metric], unit, baseline, unit, 100 * (result[metric] / baseline - 1)))
+            for metric in ["reads", "writes"]:
+                baseline = min([entry[metric] for entry in earlier])
+                if result[metric] > baseline:
+                    flags.append("{}, {}: {} files opened for {} against {} before".format(project, stage, result[metric], metric[:-1] + "ing", baseline))
+    return(flags)
+
+tracemalloc.start()
+builtins.open = counted_open
+io.open = counted_open
+for name in profiled_functions:
+    setattr(resources, name, profiled(name, getattr(resources, name)))
+
+projects = {}
+for count in args.scales:
+    for body_size in args.bodies:
+        for post_option in args.post:
+            project = "{} {} post {}".format(count, body_size, post_option)
+            projects[project] = {}
+            for repeat in range(args.repeats):
+                for (stage, result) in run_project(count, body_size, post_option == "on").items():
+                    if (stage not in projects[project]) or (result["seconds"] < projects[project][stage]["seconds"]):
+                        projects[project][stage] = result
+            print("{}:".format(project))
+            for (stage, result) in projects[project].items():
+                print("  {}: {:.3f} s, {:.2f} ms per simulation, peak {:.1f} MB, {} reads, {} writes".format(stage, result["seconds"], 1000 * result["seconds"] / count, result["peak_mb"], result["reads"], result["writes"]))
+                for (function, timing) in sorted(result["functions"].items(), key=lambda item: -item[1]["seconds"]):
+                    print("    {}: {:.3f} s in {} calls".format(function, timing["seconds"], timing["calls"]))
+
+builtins.open = builtin_open
+io.open = builtin_open
+tracemalloc.stop()
+
+flags = regressions(projects, history_load(args.history))
+
+if args.no_record == False:
+    with open(args.history, 'a') as history:
+        history.write(json.dumps({"time": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), "label": args.label, "host": socket.gethostname(), "python": platform.python_version(), "regressions": flags, "projects": projects}) + "\n")
+
+if len(flags) > 0:
+    print("\n{} regressions against the last {} runs:".format(len(flags), args.window))
+    for flag in flags:
+        print("  " + flag)
+    sys.exit(1)
+
+print("\nNo regressions against the last {} runs".format(args.window))
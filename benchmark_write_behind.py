@@ -0,0 +1,57 @@
+import os
+import time
+import shutil
+import tempfile
+from resources import file_copy_verified, write_behind_start, write_behind_submit, write_behind_flush
+
+# Stand-in for a network results directory: every copy pays a fixed latency and a limited bandwidth
+latency = 0.05 #Seconds per file
+bandwidth = 20 * 1024 ** 2 #Bytes per second
+
+file_count = 60
+file_size = 512 * 1024 #Bytes, about the size of a rendered contour plot
+upload_threads = 4
+upload_retries = 3
+
+def slow_copy(source, destination):
+    time.sleep(latency + os.path.getsize(source) / float(bandwidth))
+    return(file_copy_verified(source, destination))
+
+def produce(directory, index):
+    path = os.path.join(directory, "Media Files", "plot{}.png".format(index))
+    if os.path.exists(os.path.dirname(path)) == False:
+        os.makedirs(os.path.dirname(path))
+    with open(path, 'wb') as plot:
+        plot.write(os.urandom(file_size))
+    return(path)
+
+root = tempfile.mkdtemp()
+spool_dir = os.path.join(root, "Spool")
+direct_dir = os.path.join(root, "Direct")
+behind_dir = os.path.join(root, "Write-Behind")
+
+# Direct writes: the producer waits for every file to reach the results directory
+start = time.time()
+for i in range(file_count):
+    path = produce(spool_dir, i)
+    slow_copy(path, os.path.join(direct_dir, os.path.relpath(path, spool_dir)))
+direct_time = time.time() - start
+shutil.rmtree(spool_dir)
+
+# Write-behind: the producer only writes to the spool, and the flush barrier waits for the uploads
+start = time.time()
+write_behind = write_behind_start(spool_dir, behind_dir, upload_threads, upload_retries, slow_copy)
+for i in range(file_count):
+    write_behind_submit(write_behind, produce(spool_dir, i))
+produce_time = time.time() - start
+failed = write_behind_flush(write_behind)
+behind_time = time.time() - start
+
+verified = len([i for i in range(file_count) if os.path.isfile(os.path.join(behind_dir, "Media Files", "plot{}.png".format(i)))])
+
+print("{} files of {} kB, {} ms latency and {} MB/s per copy".format(file_count, file_size // 1024, int(latency * 1000), bandwidth // 1024 ** 2))
+print("Direct writes: {:.2f} s".format(direct_time))
+print("Write-behind with {} threads: {:.2f} s until the producer finished, {:.2f} s until the flush barrier".format(upload_threads, produce_time, behind_time))
+print("Uploaded {} of {} files, {} failed".format(verified, file_count, len(failed)))
+
+shutil.rmtree(root)
@@ -0,0 +1,56 @@
+import os
+import argparse
+from psutil import virtual_memory, cpu_count
+from resources import param_extract, scaling_calibrate, scaling_time, scaling_choose, scaling_profile_write
+
+physical_cores = cpu_count(logical = False) or max(1, (os.cpu_count() or 2) // 2)
+
+parser = argparse.ArgumentParser(description = "Calibrate the strong scaling of Fluent on this machine with short solves of a representative mesh at several process counts, and store it as the machine profile used to choose the processes of each simulation.")
+parser.add_argument("--csv", default = "Simulation Parameters.csv")
+parser.add_argument("--simulation", default = None, help = "Name of the simulation whose mesh is solved, by default the first of the CSV file.")
+parser.add_argument("--solver", default = "fluent", help = "Path to the Fluent executable, or to a stand-in accepting the same arguments.")
+parser.add_argument("--version", default = "3ddp", help = "Fluent version argument.")
+parser.add_argument("--body-zones", default = "body", help = "Names of the wall zones of the aerobody, separated by spaces.")
+parser.add_argument("--processes", type = int, nargs = "+", default = None, help = "Numbers of processes to calibrate, by default powers of two up to the physical cores.")
+parser.add_argument("--iterations", type = int, default = 30, help = "Iterations of each calibration solve.")
+parser.add_argument("--repeats", type = int, default = 1, help = "Solves at each number of processes, of which the fastest is kept.")
+parser.add_argument("--profile", default = "Machine Profile.json", help = "File to which the machine profile is written.")
+args = parser.parse_args()
+
+abspath = os.path.abspath(__file__)
+dir = os.path.dirname(abspath)
+os.chdir(dir)
+
+(sim_list, proj_params) = param_extract(args.csv)
+
+simulation = sim_list[0]
+if args.simulation != None:
+    simulation = [sim for sim in sim_list if sim.sim_name == args.simulation][0]
+
+process_counts = args.processes
+if process_counts == None:
+    process_counts = [2 ** i for i in range(physical_cores.bit_length()) if 2 ** i <= physical_cores]
+    if process_counts[-1] != physical_cores:
+        process_counts.append(physical_cores)
+
+solver = [args.solver, args.version, "-g"]
+if os.name == "nt":
+    solver.append("-wait")
+
+profile = scaling_calibrate(simulation, proj_params, solver, args.body_zones.split(), process_counts, args.iterations, args.repeats)
+profile.cores = physical_cores
+profile.memory_gb = round(virtual_memory().total / (1024 ** 3), 1)
+
+scaling_profile_write(profile, args.profile)
+
+single = scaling_time(profile, profile.cells, 1)
+print("{} cells of {} on {}, {} physical cores and {} GB:".format(profile.cells, simulation.sim_name, profile.host, profile.cores, profile.memory_gb))
+for (processes, seconds_per_iteration) in profile.samples:
+    print("  {} processes: {:.3f} s per iteration measured, {:.3f} s fitted, speedup {:.1f}, efficiency {:.0%}".format(processes, seconds_per_iteration, scaling_time(profile, profile.cells, processes), single / seconds_per_iteration, single / seconds_per_iteration / processes))
+print("Serial fraction (Amdahl): {:.1%}, overhead {:.4f} s per iteration per process".format(profile.serial / max(profile.serial + profile.parallel, 1e-12), profile.overhead))
+
+for cells in sorted(set([profile.cells, 1000000, 5000000, 10000000, 20000000, 50000000])):
+    (processes, concurrent) = scaling_choose(profile, cells)
+    print("  {:.1f} million cells: {} processes, {} at once, {:.1f} simulations of 1000 iterations per hour".format(cells / 1.0e6, processes, concurrent, 3600 * concurrent / (1000 * scaling_time(profile, cells, processes))))
+
+print("Machine profile written to {}".format(args.profile))
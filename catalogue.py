@@ -0,0 +1,45 @@
+import os
+import sys
+import time
+import argparse
+from resources import catalogue_sync, catalogue_query
+
+abspath = os.path.abspath(__file__)
+dir = os.path.dirname(abspath)
+os.chdir(dir)
+
+parser = argparse.ArgumentParser(description = "Search the catalogue of archived Workbench projects.")
+parser.add_argument("--database", default = "Archive Catalogue.sqlite", help = "Path to the local catalogue.")
+parser.add_argument("--root", default = "//172.16.1.12/hpc/sims/Archives", help = "Root directory of the archive.")
+parser.add_argument("--sync", action = "store_true", help = "Read new and changed records from the archive before searching.")
+parser.add_argument("--cycle")
+parser.add_argument("--series")
+parser.add_argument("--project", help = "Part of the project or archive name.")
+parser.add_argument("--method", help = "K-W or T-SST.")
+parser.add_argument("--body", help = "FB or HB.")
+parser.add_argument("--converged", action = "store_true", help = "Only converged simulations.")
+parser.add_argument("--drag-min", type = float)
+parser.add_argument("--drag-max", type = float)
+parser.add_argument("--lift-min", type = float)
+parser.add_argument("--lift-max", type = float)
+args = parser.parse_args()
+
+if args.sync or (os.path.isfile(args.database) == False):
+    start = time.time()
+    count = catalogue_sync(args.database, args.root)
+    print("Synchronised {} records from {} in {:.1f} s".format(count, args.root, time.time() - start))
+
+converged = None
+if args.converged:
+    converged = True
+
+start = time.time()
+rows = catalogue_query(args.database, args.cycle, args.series, args.project, args.method, args.body, converged, args.drag_min, args.drag_max, args.lift_min, args.lift_max)
+elapsed = time.time() - start
+
+columns = ["cycle", "series", "archive_name", "sim_name", "cas_name", "body_size", "sol_method", "velocity", "initialization", "convergence", "iterations", "drag", "lift", "dest_path"]
+print(",".join(columns))
+for row in rows:
+    print(",".join(["{}".format(row[column]) if row[column] != None else "" for column in columns]))
+
+sys.stderr.write("{} simulations in {:.1f} ms\n".format(len(rows), elapsed * 1000))
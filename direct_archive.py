@@ -0,0 +1,17 @@
+import os
+from resources import archive_param_extract, archive_batch, wbpz_build
+
+abspath = os.path.abspath(__file__)
+dir = os.path.dirname(abspath)
+os.chdir(dir)
+
+csv_path = "ANSYS Batch Archive.csv"
+if os.path.isfile(csv_path) == False:
+    csv_path = "Ansys Batch Archive.csv"
+
+(jobs, archive_props) = archive_param_extract(csv_path)
+
+jobs = archive_batch(jobs, archive_props, wbpz_build)
+
+for job in jobs:
+    print("{}: {}".format(job.archive_name, job.status))
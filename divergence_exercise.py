@@ -0,0 +1,70 @@
+import os
+import sys
+import math
+import shutil
+import tempfile
+from resources import Transcript_Monitor, transcript_poll
+
+# Runs synthetic transcripts through transcript_poll, written a few kilobytes at a time as a running Fluent would write them,
+# and checks that each diverging case is caught with the expected signature and that each healthy case is left running
+iterations = 400
+chunk_size = 4096 #Bytes appended to the transcript between polls
+
+def residual_line(i, residual):
+    remaining = 2 * (iterations - i)
+    return("{:6d}  {:.4e}  {:.4e}  {:.4e}  {:.4e}  {:.4e}  {:.4e}  {}:{:02d}:{:02d}  {}\n".format(i, residual, 0.1 * residual, 0.1 * residual, 0.1 * residual, 0.5 * residual, 0.5 * residual, remaining // 3600, remaining // 60 % 60, remaining % 60, iterations - i))
+
+def transcript(kind):
+    text = "  iter  continuity  x-velocity  y-velocity  z-velocity           k       omega     time/iter\n"
+    for i in range(1, iterations + 1):
+        residual = math.exp(-i / 80.0)
+        if (kind == "Blow-up") and (i > 300):
+            residual = 10.0 ** (i - 300)
+        if (kind == "NaN") and (i == 250):
+            text += residual_line(i, residual).replace("{:.4e}".format(0.1 * residual), "nan", 1)
+            continue
+        text += residual_line(i, residual)
+        if (kind == "Floating point exception") and (i == 200):
+            text += "Error at host: floating point exception\n"
+        if (kind == "AMG divergence") and (i == 180):
+            text += "Divergence detected in AMG solver: x-momentum\n"
+        if kind == "Reversed flow":
+            text += " Reversed flow in 1200 faces (out of 2000) on pressure-outlet 7.\n"
+        if kind == "Reversed flow by area":
+            text += " Reversed flow on 1200 faces (41.2% area) of pressure-outlet 7.\n"
+        if kind == "Steady outlet reversed flow":
+            text += " Reversed flow in 12 faces (out of 2000) on pressure-outlet 7.\n reversed flow in 9 faces (out of 1500) on pressure-outlet 8.\n"
+        if (kind == "Transient reversed flow") and (i % 2 == 0):
+            text += " Reversed flow in 1200 faces (out of 2000) on pressure-outlet 7.\n"
+    if kind in ["Healthy", "Steady outlet reversed flow", "Transient reversed flow"]:
+        text += "\n  solution is converged\n"
+    return(text)
+
+cases = [("Healthy", None), ("NaN", "NaN residual"), ("Blow-up", "Residual blow-up"), ("Floating point exception", "Floating point exception"), ("AMG divergence", "Divergence detected"), ("Reversed flow", "Reversed flow"), ("Reversed flow by area", "Reversed flow"), ("Steady outlet reversed flow", None), ("Transient reversed flow", None)]
+
+root = tempfile.mkdtemp()
+passed = 0
+
+for (kind, expected) in cases:
+    path = os.path.join(root, "{}.trn".format(kind))
+    text = transcript(kind)
+    monitor = Transcript_Monitor(path)
+    reason = None
+    open(path, 'w').close()
+    for start in range(0, len(text), chunk_size):
+        with open(path, 'a') as transcript_file:
+            transcript_file.write(text[start:start + chunk_size])
+        reason = transcript_poll(monitor)
+    if expected == None:
+        success = (reason == None)
+    else:
+        success = (reason != None) and reason.startswith(expected)
+    passed += success
+    print("{}: {} ({} at iteration {})".format(kind, ["FAILED", "passed"][success], reason or "Not stopped", monitor.iteration))
+
+shutil.rmtree(root)
+
+print("{} of {} transcripts passed".format(passed, len(cases)))
+
+if passed < len(cases):
+    sys.exit(1)
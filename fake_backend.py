@@ -0,0 +1,413 @@
+import os
+import re
+import math
+import random
+import time
+import zlib
+import struct
+import zipfile
+
+class Fake_Backend:
+    '''
+    Fake_Backend object stands in for Workbench and Fluent so that the workflow can be run and benchmarked without Ansys. It writes realistic transcripts, report files, force reports, Fluent files and placeholder images where the real solvers would, after configurable latencies, and fails or diverges a configurable fraction of the simulations.
+
+    Instance Variables
+    ---------------------
+    latency : Seconds taken by every project operation and Fluent or CFD-Post command. [float]
+    iteration_latency : Seconds taken by every solver iteration. [float]
+    failure_rate : Fraction of solves in which Fluent stops with an error. [float]
+    divergence_rate : Fraction of solves which diverge. [float]
+    min_iterations : Fewest iterations of a converged solve. [int]
+    max_iterations : Most iterations of a converged solve. [int]
+    data_size : Size in bytes of every case and data file written. [int]
+    random : Random number generator, seeded for repeatable runs. [random.Random]
+    project_path : Path to the .wbpj file of the project. [str]
+    systems : Systems of the project, keyed by name. [dict]
+    created : Number of systems created from each template. [dict]
+    calls : Number of calls of each operation. [dict]
+    '''
+
+    def __init__(self, latency = 0.0, iteration_latency = 0.0, failure_rate = 0.0, divergence_rate = 0.0, min_iterations = 100, max_iterations = 300, data_size = 64 * 1024, seed = None):
+        '''Define instance variables.'''
+        self.latency = latency
+        self.iteration_latency = iteration_latency
+        self.failure_rate = failure_rate
+        self.divergence_rate = divergence_rate
+        self.min_iterations = min_iterations
+        self.max_iterations = max_iterations
+        self.data_size = data_size
+        self.random = random.Random(seed)
+        self.project_path = None
+        self.systems = {}
+        self.created = {}
+        self.calls = {}
+
+    def wait(self, operation, duration = None):
+        '''Count a call of an operation and take its latency.'''
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+        if duration == None:
+            duration = self.latency
+        if duration > 0:
+            time.sleep(duration)
+
+    def GetTemplate(self, TemplateName = None):
+        '''Return a template which creates fake systems.'''
+        self.wait("GetTemplate")
+        return(Fake_Template(self, TemplateName))
+
+    def GetSystem(self, Name = None):
+        '''Return the system of the given name, which a reopened project may not have created in this session.'''
+        self.wait("GetSystem")
+        if Name not in self.systems:
+            self.systems[Name] = Fake_System(self, Name)
+        return(self.systems[Name])
+
+    def GetDesignPoint(self, Name = None):
+        '''Return the name of the design point.'''
+        self.wait("GetDesignPoint")
+        return(Name)
+
+    def UpdateAllDesignPoints(self, DesignPoints = None):
+        '''Solve every Fluent system which has not written its transcript yet, one after another as Workbench does.'''
+        self.wait("UpdateAllDesignPoints")
+        for name in sorted(self.systems, key=lambda name: self.systems[name].order):
+            system = self.systems[name]
+            if (system.fluent_dir() != None) and (os.path.isfile(system.transcript()) == False):
+                self.solve(system)
+        return(None)
+
+    def Save(self, FilePath = None, Overwrite = True):
+        '''Write the project file.'''
+        self.wait("Save")
+        if FilePath != None:
+            self.project_path = FilePath
+        if self.project_path == None:
+            return(None)
+        if os.path.exists(os.path.dirname(self.project_path)) == False:
+            os.makedirs(os.path.dirname(self.project_path))
+        with open(self.project_path, 'w') as project_file:
+            project_file.write("<Project Systems=\"{}\"/>\n".format(" ".join(sorted(self.systems))))
+        return(None)
+
+    def Open(self, FilePath = None):
+        '''Open an existing project, registering the Fluent systems found in its files.'''
+        self.wait("Open")
+        self.project_path = FilePath
+        dp0_dir = os.path.join(FilePath[:-len(".wbpj")] + "_files", "dp0")
+        if os.path.isdir(dp0_dir):
+            for dir_name in os.listdir(dp0_dir):
+                match = re.match("FLU(-(\\d+))?$", dir_name)
+                if match != None:
+                    if match.group(2) == None:
+                        name = "FLU"
+                    else:
+                        name = "FLU {}".format(match.group(2))
+                    self.systems[name] = Fake_System(self, name, int(match.group(2) or 0))
+                    self.created["FLUENT"] = max(self.created.get("FLUENT", 0), int(match.group(2) or 0) + 1)
+        return(None)
+
+    def Archive(self, FilePath = None, IncludeExternalImportedFiles = True):
+        '''Archive the project file and its files directory to a zip file.'''
+        self.wait("Archive")
+        root = os.path.dirname(self.project_path)
+        files_dir = self.project_path[:-len(".wbpj")] + "_files"
+        with zipfile.ZipFile(FilePath, 'w', zipfile.ZIP_STORED) as archive:
+            archive.write(self.project_path, os.path.basename(self.project_path))
+            for (dir_path, dir_names, file_names) in os.walk(files_dir):
+                for file_name in file_names:
+                    path = os.path.join(dir_path, file_name)
+                    archive.write(path, os.path.relpath(path, root))
+        return(None)
+
+    def Set(self, **properties):
+        '''Build a property set.'''
+        return(properties)
+
+    def placeholder(self, path, size = None):
+        '''Write a placeholder file of the given size, or a small valid image for .png paths.'''
+        if os.path.exists(os.path.dirname(path)) == False:
+            os.makedirs(os.path.dirname(path))
+        if path.lower().endswith(".png"):
+            def chunk(kind, data):
+                return(struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff))
+            content = b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)) + chunk(b"IDAT", zlib.compress(b"\x00\xff\xff\xff")) + chunk(b"IEND", b"")
+        else:
+            content = b"\x00" * (size or 1024)
+        with open(path, 'wb') as placeholder_file:
+            placeholder_file.write(content)
+
+    def solve(self, system):
+        '''Iterate a Fluent system, writing its report files, transcript and Fluent files, with the outcome drawn at random.'''
+        fluent_dir = system.fluent_dir()
+        draw = self.random.random()
+        iterations = self.random.randint(self.min_iterations, self.max_iterations)
+        if draw < self.failure_rate:
+            outcome = "Error"
+            iterations = self.random.randint(1, iterations)
+        elif draw < self.failure_rate + self.divergence_rate:
+            outcome = "Diverged"
+            iterations = self.random.randint(10, iterations)
+        else:
+            outcome = "Converged"
+
+        system.forces = (self.random.uniform(50.0, 150.0), self.random.uniform(-20.0, 20.0))
+        self.wait("Iterate", self.iteration_latency * iterations)
+
+        if os.path.exists(fluent_dir) == False:
+            os.makedirs(fluent_dir)
+        if os.path.exists(os.path.dirname(system.transcript())) == False:
+            os.makedirs(os.path.dirname(system.transcript()))
+
+        decay = iterations / 5.0
+        for (report, value) in [("drag", system.forces[0]), ("lift", system.forces[1])]:
+            with open("{}/{}-rfile.out".format(fluent_dir, report), 'w') as rfile:
+                rfile.write('"{0}-rfile"\n"Iteration" "{0}"\n("Iteration" "{0}")\n'.format(report))
+                for i in range(1, iterations + 1):
+                    rfile.write("{} {:.6f}\n".format(i, value * (1 + 0.5 * math.exp(-i / decay)) + self.random.gauss(0, 1e-4 * abs(value))))
+
+        with open(system.transcript(), 'w') as transcript:
+            transcript.write("  iter  continuity  x-velocity  y-velocity  z-velocity           k       omega     time/iter\n")
+            for i in range(1, iterations + 1):
+                if (outcome == "Diverged") and (i > iterations - 5):
+                    residual = 10.0 ** (i - iterations + 8)
+                else:
+                    residual = math.exp(-i / decay)
+                remaining = 2 * (iterations - i)
+                transcript.write("{:6d}  {:.4e}  {:.4e}  {:.4e}  {:.4e}  {:.4e}  {:.4e}  {}:{:02d}:{:02d}  {}\n".format(i, residual, 0.1 * residual, 0.1 * residual, 0.1 * residual, 0.5 * residual, 0.5 * residual, remaining // 3600, remaining // 60 % 60, remaining % 60, iterations - i))
+            if outcome == "Converged":
+                transcript.write("\n  solution is converged\n")
+            elif outcome == "Diverged":
+                transcript.write("\nDivergence detected in AMG solver: x-momentum\n")
+            else:
+                transcript.write("\nError: received a fatal signal (Segmentation fault).\nError Object: #f\n")
+
+        if outcome != "Error":
+            self.placeholder("{}/FFF-1.cas.h5".format(fluent_dir), self.data_size)
+            self.placeholder("{}/FFF-1-{:05d}.dat.h5".format(fluent_dir, iterations), self.data_size)
+
+    def command(self, container, command):
+        '''Carry out the effect of a Fluent or CFD-Post command on the files of the project.'''
+        self.wait("SendCommand")
+
+        match = re.match('/file/(write-case|write-data|write-case-data|interpolate/write-data) "([^"]+)"', command)
+        if match != None:
+            self.placeholder(match.group(2), self.data_size)
+            return
+
+        if command.startswith("/solve/iterate"):
+            self.solve(container.system)
+            return
+
+        match = re.search("cx-set-file-dialog-entries \"Select File\" '\\( \"([^\"]+)\"\\)", command)
+        if (match != None) and ("Force Reports" in command):
+            path = match.group(1)
+            if os.path.isabs(path) or (os.path.dirname(path) != ""):
+                container.dialog_dir = os.path.dirname(path)
+            else:
+                path = os.path.join(container.dialog_dir, path)
+            (drag, lift) = container.system.forces
+            with open(path, 'w') as report:
+                if os.path.basename(path).startswith("cp_"):
+                    report.write('"Center of Pressure"\n\nZone    X    Y\n-------------------------\nNet    {:.6f}    {:.6f}\n'.format(self.random.uniform(0.4, 0.6), self.random.uniform(0.2, 0.3)))
+                else:
+                    report.write('                             "Forces - Direction Vector (1 0 0)"\n')
+                    report.write('                             Forces [N]                                         Coefficients\n')
+                    report.write("Zone               Pressure         Viscous           Total          Pressure       Viscous        Total\n")
+                    for zone in ["body", "inlet", "outlet", "road", "walls", "symmetry", "interior", "default"]:
+                        report.write("{:<18} 0 0 0 0 0 0\n".format(zone))
+                    report.write("------------------------- -------------- --------------- --------------- ---------------\n")
+                    report.write("Net    {:.6f}    {:.6f}    {:.6f}    0    0    0\n".format(0.8 * drag, 0.2 * drag, drag))
+            return
+
+        for match in re.finditer("(?:Hardcopy Filename|QAnim MPEG Filename|filename)\\s*=\\s*([^,\\n]+\\.(?:png|mp4))", command):
+            self.placeholder(match.group(1).strip())
+
+    def __str__(self):
+        return("\n----FAKE BACKEND----\nLatency: {} s\nIteration latency: {} s\nFailure rate: {}\nDivergence rate: {}\nSystems: {}".format(self.latency, self.iteration_latency, self.failure_rate, self.divergence_rate, len(self.systems)))
+
+class Fake_Template:
+    '''
+    Fake_Template object creates fake systems in a Fake_Backend, named the way Workbench names the systems of a template.
+
+    Instance Variables
+    ---------------------
+    backend : Backend in which systems are created. [Fake_Backend]
+    name : Name of the template, FLUENT or Results. [str]
+    '''
+
+    def __init__(self, backend = None, name = None):
+        '''Define instance variables.'''
+        self.backend = backend
+        self.name = name
+
+    def CreateSystem(self, Position = None, RelativeTo = None):
+        '''Create a system, named FLU, FLU 1, ... or Post, Post 1, ...'''
+        self.backend.wait("CreateSystem")
+        count = self.backend.created.get(self.name, 0)
+        self.backend.created[self.name] = count + 1
+        if self.name == "FLUENT":
+            prefix = "FLU"
+        else:
+            prefix = "Post"
+        if count == 0:
+            name = prefix
+        else:
+            name = "{} {}".format(prefix, count)
+        self.backend.systems[name] = Fake_System(self.backend, name, len(self.backend.systems))
+        return(self.backend.systems[name])
+
+    def __str__(self):
+        return("\n----FAKE TEMPLATE----\nTemplate: {}".format(self.name))
+
+class Fake_System:
+    '''
+    Fake_System object stands in for a Workbench system and its containers and components.
+
+    Instance Variables
+    ---------------------
+    backend : Backend holding the system. [Fake_Backend]
+    Name : Name of the system. [str]
+    DisplayText : Label of the system on the project schematic. [str]
+    order : Position of the system in the order of creation. [int]
+    containers : Containers of the system, keyed by component name. [dict]
+    forces : Final drag and lift of the last solve. [tuple]
+    '''
+
+    def __init__(self, backend = None, Name = None, order = 0):
+        '''Define instance variables.'''
+        self.backend = backend
+        self.Name = Name
+        self.DisplayText = Name
+        self.order = order
+        self.containers = {}
+        self.forces = (0.0, 0.0)
+
+    def GetContainer(self, ComponentName = None):
+        '''Return the container of a component.'''
+        if ComponentName not in self.containers:
+            self.containers[ComponentName] = Fake_Container(self, ComponentName)
+        return(self.containers[ComponentName])
+
+    def GetComponent(self, Name = None):
+        '''Return a component, which for the fake is its container.'''
+        return(self.GetContainer(ComponentName=Name))
+
+    def fluent_dir(self):
+        '''Return the Fluent working directory of a Fluent system, or None.'''
+        match = re.match("FLU( (\\d+))?$", self.Name)
+        if (match == None) or (self.backend.project_path == None):
+            return(None)
+        if match.group(2) == None:
+            flu_dir = "FLU"
+        else:
+            flu_dir = "FLU-{}".format(match.group(2))
+        return("{}_files/dp0/{}/Fluent".format(self.backend.project_path[:-len(".wbpj")], flu_dir))
+
+    def transcript(self):
+        '''Return the path to the transcript of a Fluent system.'''
+        return(self.fluent_dir().replace("_files/dp0/", "_files/progress_files/dp0/") + "/Solution.trn")
+
+    def __str__(self):
+        return("\n----FAKE SYSTEM----\nName: {}\nContainers: {}".format(self.Name, ", ".join(sorted(self.containers))))
+
+class Fake_Container:
+    '''
+    Fake_Container object stands in for a container or component of a Workbench system, passing the commands sent to it to its backend.
+
+    Instance Variables
+    ---------------------
+    system : System holding the container. [Fake_System]
+    name : Name of the component. [str]
+    properties : Launcher properties set on the container. [dict]
+    dialog_dir : Directory last chosen in a file dialog, to which later file names are relative. [str]
+    '''
+
+    def __init__(self, system = None, name = None):
+        '''Define instance variables.'''
+        self.system = system
+        self.name = name
+        self.properties = {}
+        self.dialog_dir = ""
+
+    def Edit(self):
+        '''Launch the application of the container, creating the Fluent working directory.'''
+        self.system.backend.wait("Edit")
+        if self.system.fluent_dir() != None:
+            if os.path.exists(self.system.fluent_dir()) == False:
+                os.makedirs(self.system.fluent_dir())
+
+    def Exit(self):
+        '''Close the application of the container.'''
+        self.system.backend.wait("Exit")
+
+    def SendCommand(self, Command = None):
+        '''Send a command to the application of the container.'''
+        self.system.backend.command(self, Command)
+
+    def GetFluentLauncherSettings(self):
+        '''Return the launcher settings, which for the fake is the container.'''
+        return(self)
+
+    def SetEntityProperties(self, Properties = None):
+        '''Set launcher properties.'''
+        self.properties.update(Properties)
+
+    def TransferData(self, TargetComponent = None):
+        '''Connect the output of the component to another.'''
+        self.system.backend.wait("TransferData")
+
+    def __str__(self):
+        return("\n----FAKE CONTAINER----\nSystem: {}\nComponent: {}".format(self.system.Name, self.name))
+
+def synthetic_project(root, count, body_size = None, post_every = 10, streamlines = False, proj_name = "Benchmark", queue_dir = None):
+    '''
+    Writes a Simulation Parameters CSV and a placeholder mesh for a synthetic project of the given size, for running the workflow with Fake_Backend. Velocities are spread over the simulations such that no two are identical cases.
+    Str, Int -> Str
+
+    Parameters
+    ---------------------
+    root : str
+        Path to an empty folder in which the mesh, project and results folders are created.
+    count : int
+        Number of simulations.
+    body_size : str
+        Body size of every simulation, HB or FB, or None to alternate between the two.
+    post_every : int
+        Every simulation whose position is a multiple of post_every is post-processed, or none if 0.
+    streamlines : bool
+        Boolean variable indicating whether post-processed simulations also have streamline animations.
+    proj_name : str
+        Name of the Workbench project.
+    queue_dir : str
+        Shared directory of a job queue the simulations are published to, or None to solve them in the project.
+
+    Returns
+    ---------------------
+    csv_path : str
+        Path to the Simulation Parameters CSV.
+    '''
+
+    mesh_dir = os.path.join(root, "Mesh")
+    if os.path.exists(mesh_dir) == False:
+        os.makedirs(mesh_dir)
+    with open(os.path.join(mesh_dir, "body.cas"), 'wb') as mesh_file:
+        mesh_file.write(b"\x00" * 1024 ** 2)
+
+    csv_path = os.path.join(root, "Simulation Parameters.csv")
+
+    with open(csv_path, 'w') as csv_file:
+        csv_file.write("Simulation Name,.CAS File Name,.CAS File Directory,Body Type (HB/FB),Solution Method (K-W/T-SST),Override Velocity [m/s]\n")
+        for i in range(count):
+            if body_size == None:
+                body = ["FB", "HB"][i % 2]
+            else:
+                body = body_size
+            post = (post_every > 0) and (i % post_every == 0)
+            line = "Sim{},body,{},{},{},{:.4f},1.5,3.0,N,,,,{},{}".format(i, mesh_dir, body, ["K-W", "T-SST"][i % 2], 10.0 + 30.0 * i / count, ["N", "Y"][post], ["N", "Y"][post and streamlines])
+            if i == 0:
+                line += ",,{},{},{},4,100,100,600,0.0001,50,30,60,1,50,3,N,,50,N,N,Standard,10,,100,4,N,2,3,All".format(proj_name, os.path.join(root, "Project"), os.path.join(root, "Results"))
+                if queue_dir != None:
+                    line += ",{}".format(queue_dir)
+            csv_file.write(line + "\n")
+
+    return(csv_path)
@@ -0,0 +1,89 @@
+import os
+import re
+import sys
+import math
+import time
+import random
+
+# Stand-in for batch Fluent, accepting the same arguments (3ddp -g -t$Processes$ -i $Journal$), which carries out the journals of headless_setup:
+# the iterations are printed as a transcript, and the report files, the case and data and the exported force reports are written where Fluent would write them
+seconds = float(os.environ.get("MINERVA_FAKE_SECONDS", 2)) #Wall-clock seconds per solve
+failing = os.environ.get("MINERVA_FAKE_FAIL", "") #Pattern of the names of the simulations which fail with an error
+max_iterations = 50 #Iterations until the solution is converged
+
+journal_path = sys.argv[sys.argv.index("-i") + 1]
+with open(journal_path, 'r') as journal_file:
+    commands = journal_file.read().splitlines()
+
+match = re.search('"([^"]+)/Raw Results/', "\n".join(commands))
+sim_name = os.path.basename(match.group(1))
+generator = random.Random(sim_name)
+drag = generator.uniform(50.0, 150.0)
+lift = generator.uniform(-20.0, 20.0)
+
+if (failing != "") and (re.match(failing, sim_name) != None):
+    time.sleep(seconds / 10)
+    print("Error: received a fatal signal (Segmentation fault).")
+    print("Error Object: #f")
+    sys.exit(1)
+
+def write(path, content):
+    if os.path.exists(os.path.dirname(path)) == False:
+        os.makedirs(os.path.dirname(path))
+    with open(path, 'w') as output:
+        output.write(content)
+
+def force_report(zones, vector, total):
+    report = '                             "Forces - Direction Vector ({})"\n'.format(vector)
+    report += "                             Forces [N]                                         Coefficients\n"
+    report += "Zone               Pressure         Viscous           Total          Pressure       Viscous        Total\n"
+    for zone in zones:
+        report += "{:<18} {:.6f}    {:.6f}    {:.6f}    0    0    0\n".format(zone, 0.8 * total / len(zones), 0.2 * total / len(zones), total / len(zones))
+    report += "------------------------- -------------- --------------- --------------- ---------------\n"
+    report += "Net    {:.6f}    {:.6f}    {:.6f}    0    0    0\n".format(0.8 * total, 0.2 * total, total)
+    return(report)
+
+report_files = []
+
+for command in commands:
+    match = re.match('/solve/report-files/add \\S+ report-defs (\\S+) \\(\\) file-name "([^"]+)"', command)
+    if match != None:
+        report_files.append((match.group(1), match.group(2)))
+        continue
+
+    match = re.match("/solve/iterate (\\d+)", command)
+    if match != None:
+        iterations = min(int(match.group(1)), max_iterations)
+        histories = dict([(report, ['"{0}-rfile"\n"Iteration" "{0}"\n("Iteration" "{0}")\n'.format(report)]) for (report, path) in report_files])
+        print("  iter  continuity  x-velocity  y-velocity  z-velocity           k       omega     time/iter")
+        for i in range(1, iterations + 1):
+            time.sleep(seconds / iterations)
+            residual = math.exp(-5.0 * i / iterations)
+            remaining = int(seconds * (iterations - i) / iterations)
+            print("{:6d}  {:.4e}  {:.4e}  {:.4e}  {:.4e}  {:.4e}  {:.4e}  {}:{:02d}:{:02d}  {}".format(i, residual, 0.1 * residual, 0.1 * residual, 0.1 * residual, 0.5 * residual, 0.5 * residual, remaining // 3600, remaining // 60 % 60, remaining % 60, iterations - i))
+            sys.stdout.flush()
+            for (report, path) in report_files:
+                value = [drag, lift][report == "lift"]
+                histories[report].append("{} {:.6f}\n".format(i, value * (1 + 0.5 * math.exp(-5.0 * i / iterations))))
+                write(path, "".join(histories[report]))
+        print("\n  solution is converged")
+        continue
+
+    match = re.match('/file/write-case-data "([^"]+)"', command)
+    if match != None:
+        write(match.group(1), "\x00" * 1024)
+        continue
+
+    match = re.match('/report/forces/(wall-forces|wall-moments) no (.+) \\(\\) (.+) yes "([^"]+)"', command)
+    if match != None:
+        axis = " ".join(match.group(3).split()[-3:])
+        total = {"1 0 0": drag, "0 0 1": lift}.get(axis, 0.01 * drag)
+        if match.group(1) == "wall-moments":
+            total = 0.1 * drag
+        write(match.group(4), force_report(match.group(2).split(), axis, total))
+        continue
+
+    match = re.match('/report/forces/pressure-center no .+ yes "([^"]+)"', command)
+    if match != None:
+        write(match.group(1), '"Center of Pressure"\n\nZone    X    Y\n-------------------------\nNet    {:.6f}    {:.6f}\n'.format(generator.uniform(0.4, 0.6), generator.uniform(0.2, 0.3)))
+        continue
@@ -1,3 +1,3 @@
 with open("ANSYS Batch Archive.csv", 'w') as csvfile:
-    csvfile.write("Project Directory,Project Name (Exclude .wbpj extension),Cycle, Series,Archived Project Name\n")
+    csvfile.write("Project Directory,Project Name (Exclude .wbpj extension),Cycle, Series,Archived Project Name,,Archive Destination Root,Local Build Directory (Blank for \"Archive Builds\"),Concurrent Uploads,Bandwidth Limit [MB/s] (Blank for no limit),Compression Threads,Backend (WBPZ or Chunks)\n,,,,,,//172.16.1.12/hpc/sims/Archives,,2,,4,WBPZ")
     csvfile.close()
\ No newline at end of file
@@ -1,16 +1,28 @@
 import os
 from psutil import virtual_memory
 
+# resources.py is only needed alongside for a machine profile, which calibrate_scaling.py writes
+try:
+    from resources import scaling_profile_load, scaling_choose
+except ImportError:
+    scaling_profile_load = None
+
 tot_mem_GB = round(virtual_memory().total / (1024 ** 3))
 cores_by_mem = tot_mem_GB // 8
 
-physical_cores = os.cpu_count()/2
+physical_cores = os.cpu_count() // 2
 
 if cores_by_mem < physical_cores:
     parallel_processes = cores_by_mem
 else:
     parallel_processes = physical_cores
 
+# With a machine profile from calibrate_scaling.py, the processes are those which solve the most meshes of the calibration size per hour
+if scaling_profile_load != None:
+    profile = scaling_profile_load("Machine Profile.json")
+    if profile != None:
+        parallel_processes = scaling_choose(profile, profile.cells)[0]
+
 with open("Simulation Parameters.csv", 'w') as csvfile:
-    csvfile.write("Simulation Name,.CAS File Name (Exclude \".cas\" file extension),.CAS File Directory,Body Type (HB/FB),Solution Method (K-W/T-SST),Override Velocity [m/s] (Blank for 18 m/s),Area [m^2],Length[m],CG (Y/N),CGx [m], CGy [m],CGz [m],Post-Processing (Y/N),Streamline Animations (Y/N),,Workbench Project Name,Workbench Project Save Directory,Results Directory,Fluent Processes\n,,,,,,,,,,,,,,,,,,{}".format(parallel_processes))
+    csvfile.write("Simulation Name,.CAS File Name (Exclude \".cas\" file extension),.CAS File Directory,Body Type (HB/FB),Solution Method (K-W/T-SST),Override Velocity [m/s] (Blank for 18 m/s),Area [m^2],Length[m],CG (Y/N),CGx [m], CGy [m],CGz [m],Post-Processing (Y/N),Streamline Animations (Y/N),,Workbench Project Name,Workbench Project Save Directory,Results Directory,Fluent Processes,Statistics Window (Iterations),Minimum Iterations,Maximum Iterations,Drag and Lift Convergence Criterion,Drag and Lift Convergence Window (Iterations),Watchdog Stall Timeout [min],Watchdog Budget [min per 100 MB of .CAS],Watchdog Restart Attempts,Autosave Frequency (Iterations),Autosave Files Kept,Resume Existing Project (Y/N),Result Cache Directory (Blank for no cache),Result Cache Size Limit [GB],Cache Case and Data Files (Y/N),Warm Start (Y/N),Initialization (Standard/Hybrid/FMG),Hybrid Initialization Iterations,Local Scratch Directory (Blank for none),Local Scratch Size Limit [GB],Staging Threads,Write-Behind Results (Y/N),Upload Threads,Upload Retries,Retention Policy (All/Final/Results),Queue Directory (Blank to solve in Workbench),Residual Blow-Up Factor,Reversed Flow Fraction [% of Faces],Reversed Flow Iterations,Mesh Cache Directory (Blank for no cache),Mesh Cache Size Limit [GB]\n,,,,,,,,,,,,,,,,,,{},100,100,600,0.0001,50,30,60,1,50,3,N,,50,N,N,Standard,10,,100,4,N,2,3,All,,1000,25,50,,50".format(parallel_processes))
     csvfile.close()
\ No newline at end of file
@@ -0,0 +1,57 @@
+import os
+import argparse
+from resources import param_extract, project_open, name_check, mesh_cells, scaling_profile_load, scaling_choose, placement_benchmark, headless_run, convergence_status, results_dir, results_extract, run_report_write, staging_flush
+
+parser = argparse.ArgumentParser(description = "Run the simulations of Simulation Parameters.csv in batch Fluent processes without Workbench.")
+parser.add_argument("--solver", default = "fluent", help = "Path to the Fluent executable, or to a stand-in accepting the same arguments.")
+parser.add_argument("--version", default = "3ddp", help = "Fluent version argument.")
+parser.add_argument("--body-zones", default = "body", help = "Names of the wall zones of the aerobody, separated by spaces.")
+parser.add_argument("--concurrent", type = int, default = None, help = "Number of Fluent processes run at once, by default chosen from the machine profile, or 1 without one.")
+parser.add_argument("--order", default = "SJF", choices = ["SJF", "LPT", "CSV"], help = "Order in which the simulations are solved: shortest or longest predicted runtime first, or the order of the CSV file.")
+parser.add_argument("--profile", default = "Machine Profile.json", help = "Machine profile written by calibrate_scaling.py, used to choose the processes of each simulation instead of column S if it exists.")
+parser.add_argument("--no-pin", action = "store_true", help = "Leave the placement of the simulations on the cores to the operating system instead of pinning each to its own cores on as few NUMA nodes as possible.")
+parser.add_argument("--placement-benchmark", action = "store_true", help = "Before solving, compare scattered and pinned placement of the simulations solved at once with short solves of the first mesh, written to the run report.")
+parser.add_argument("--csv", default = "Simulation Parameters.csv")
+args = parser.parse_args()
+
+abspath = os.path.abspath(__file__)
+dir = os.path.dirname(abspath)
+os.chdir(dir)
+
+(sim_list, proj_params) = param_extract(args.csv)
+project_open(sim_list, proj_params)
+
+name_check(sim_list)
+
+solver = [args.solver, args.version, "-g", "-t{}".format(proj_params.processes)]
+if os.name == "nt":
+    solver.append("-wait")
+
+profile = scaling_profile_load(args.profile)
+
+concurrent = args.concurrent
+if concurrent == None:
+    concurrent = 1
+    if profile != None:
+        cells = sorted([mesh_cells(simulation) for simulation in sim_list])
+        concurrent = scaling_choose(profile, cells[len(cells) // 2])[1]
+
+if args.placement_benchmark:
+    slot_cores = int(proj_params.processes)
+    if profile != None:
+        slot_cores = profile.cores // concurrent
+    placement_benchmark(sim_list[0], proj_params, solver, args.body_zones.split(), concurrent, slot_cores)
+
+headless_run(sim_list, proj_params, solver, args.body_zones.split(), concurrent, args.order, profile, args.no_pin == False)
+
+sim_list = convergence_status(sim_list, proj_params)
+
+results_dir(sim_list, proj_params)
+
+results_extract(sim_list, proj_params)
+
+for simulation in sim_list:
+    if simulation.workflow.post == True:
+        run_report_write(proj_params, simulation.sim_name, "Post Skipped", "Post-processing requires CFD-Post in Workbench and is not run without it")
+
+staging_flush(proj_params)
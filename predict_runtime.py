@@ -0,0 +1,34 @@
+import os
+import time
+import argparse
+from datetime import datetime
+from resources import param_extract, ledger_load, ledger_done, runtime_model, runtime_predict, runtime_order
+
+parser = argparse.ArgumentParser(description = "Predict the runtime of each simulation of Simulation Parameters.csv which is not yet solved, and of the batch, from the runtime history of earlier solves.")
+parser.add_argument("--csv", default = "Simulation Parameters.csv")
+parser.add_argument("--processes", type = int, default = None, help = "Number of Fluent processes of each simulation, by default column S.")
+parser.add_argument("--concurrent", type = int, default = 1, help = "Number of simulations solved at once.")
+parser.add_argument("--order", default = "SJF", choices = ["SJF", "LPT", "CSV"], help = "Order in which the simulations are solved.")
+args = parser.parse_args()
+
+abspath = os.path.abspath(__file__)
+dir = os.path.dirname(abspath)
+os.chdir(dir)
+
+(sim_list, proj_params) = param_extract(args.csv)
+
+ledger = ledger_load(proj_params)
+model = runtime_model(proj_params)
+
+pending = [simulation for simulation in sim_list if ledger_done(ledger, simulation, "solve", proj_params) == False]
+
+print("Model fitted to {} solves: {:.2f} s + {:.2f} s per million cells per process per iteration".format(model.samples, model.intercept, model.slope))
+
+slots = [0.0] * max(args.concurrent, 1)
+for simulation in runtime_order(pending, proj_params, args.order):
+    (iterations, seconds_per_iteration, seconds) = runtime_predict(model, simulation, proj_params, args.processes)
+    slot = slots.index(min(slots))
+    slots[slot] += seconds
+    print("{}: {} iterations at {:.1f} s per iteration, {:.0f} min, finished around {}".format(simulation.sim_name, iterations, seconds_per_iteration, seconds / 60, datetime.fromtimestamp(time.time() + slots[slot]).strftime("%Y-%m-%d %H:%M")))
+
+print("{} of {} simulations to solve, {} at once: {:.1f} h".format(len(pending), len(sim_list), len(slots), max(slots) / 3600))
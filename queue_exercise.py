@@ -0,0 +1,143 @@
+import os
+import sys
+import json
+import time
+import shutil
+import signal
+import tempfile
+import subprocess
+import multiprocessing
+import resources
+from fake_backend import Fake_Backend, synthetic_project
+from resources import queue_dirs, queue_claim, queue_leases, queue_pending, param_extract, project_open, initialize_project, queue_publish, queue_wait, raw_results_collect, fluent_results_aggregator, staging_flush
+
+# Runs the shared-folder job queue on one machine, with a temporary folder as the share and fake_fluent.py as the solver, and checks
+# that every job is claimed by one worker, that heartbeats keep leases alive, that the job of a stopped worker is stolen, and that a failing job is given up
+claimers = 8 #Processes claiming at once
+claim_jobs = 40
+simulations = 6
+workers = 3
+lease_timeout = 4.0 #Seconds after the last heartbeat at which a lease expires
+heartbeat = 1.0 #Seconds between heartbeats
+solve_seconds = 2 * lease_timeout #Every solve outlasts its lease, which only the heartbeats keep alive
+attempts = 2
+here = os.path.dirname(os.path.abspath(__file__))
+
+def claim_all(queue_dir, worker, start):
+    while time.time() < start:
+        time.sleep(0.001)
+    claimed = []
+    job = queue_claim(queue_dir, worker, 60)
+    while job != None:
+        claimed.append(job["name"])
+        job = queue_claim(queue_dir, worker, 60)
+    return(claimed)
+
+def solver_wrapper(directory):
+    if os.name == "nt":
+        path = os.path.join(directory, "fake_fluent.cmd")
+        content = '@"{}" "{}" %*\n'.format(sys.executable, os.path.join(here, "fake_fluent.py"))
+    else:
+        path = os.path.join(directory, "fake_fluent")
+        content = '#!/bin/sh\nexec "{}" "{}" "$@"\n'.format(sys.executable, os.path.join(here, "fake_fluent.py"))
+    with open(path, 'w') as wrapper:
+        wrapper.write(content)
+    os.chmod(path, 0o755)
+    return(path)
+
+def worker_start(queue_dir, solver, name, environment):
+    command = [sys.executable, os.path.join(here, "queue_worker.py"), queue_dir, "--solver", solver, "--processes", "1", "--name", name, "--lease-timeout", str(lease_timeout / 60), "--heartbeat", str(heartbeat), "--attempts", str(attempts), "--poll", "0.5", "--exit-when-idle", "--profile", ""]
+    if os.name == "nt":
+        return(subprocess.Popen(command, env = environment, stdout = subprocess.DEVNULL))
+    return(subprocess.Popen(command, env = environment, stdout = subprocess.DEVNULL, start_new_session = True))
+
+def worker_kill(process):
+    if os.name == "nt":
+        process.kill()
+    else:
+        os.killpg(process.pid, signal.SIGKILL)
+    process.wait()
+
+def check(name, passed, detail):
+    print("{}: {} ({})".format(name, ["FAILED", "passed"][passed], detail))
+    return(passed)
+
+if __name__ == "__main__":
+    root = tempfile.mkdtemp()
+    results = []
+
+    # claims: expired leases on half of the jobs are stolen by several processes at once
+    queue_dir = os.path.join(root, "Claims")
+    (jobs_dir, leases_dir, done_dir) = queue_dirs(queue_dir)
+    for i in range(claim_jobs):
+        job_name = "Claims {:05d} Sim{}".format(i, i)
+        with open(os.path.join(jobs_dir, job_name + ".json"), 'w') as job_file:
+            json.dump({"project": "Claims", "simulation": "Sim{}".format(i)}, job_file)
+        if i % 2 == 0:
+            lease_path = os.path.join(leases_dir, job_name + ".0.lease")
+            open(lease_path, 'w').close()
+            os.utime(lease_path, (time.time() - 120, time.time() - 120))
+    start = time.time() + 1
+    pool = multiprocessing.Pool(claimers)
+    claimed = [job_name for names in pool.starmap(claim_all, [(queue_dir, "Claimer {}".format(i), start) for i in range(claimers)]) for job_name in names]
+    pool.close()
+    counts = [json.load(open(os.path.join(jobs_dir, file_name), 'r'))["attempts"] for file_name in os.listdir(jobs_dir)]
+    leases = [len(queue_leases(leases_dir, file_name[:-len(".json")])) for file_name in os.listdir(jobs_dir)]
+    results.append(check("Claim", (len(claimed) == claim_jobs) and (len(set(claimed)) == claim_jobs) and (set(counts) == set([1])) and (set(leases) == set([1])), "{} processes made {} claims of {} jobs".format(claimers, len(claimed), claim_jobs)))
+
+    # workers: one is stopped while it solves, the others solve the rest, steal its job and give up the failing one
+    queue_dir = os.path.join(root, "Queue")
+    csv_path = synthetic_project(root, simulations, "HB", 0, False, "Exercise", queue_dir)
+    resources.workbench = Fake_Backend()
+    (sim_list, proj_params) = param_extract(csv_path)
+    project_open(sim_list, proj_params)
+    initialize_project(proj_params)
+    queue_publish(sim_list, proj_params, csv_path)
+    (jobs_dir, leases_dir, done_dir) = queue_dirs(queue_dir)
+    job_names = queue_pending(queue_dir)
+    order = [json.load(open(os.path.join(jobs_dir, job_name + ".json"), 'r'))["simulation"] for job_name in job_names]
+
+    environment = dict(os.environ)
+    environment["MINERVA_FAKE_SECONDS"] = str(solve_seconds)
+    environment["MINERVA_FAKE_FAIL"] = "{}$".format(order[-1])
+    solver = solver_wrapper(root)
+
+    stopped = worker_start(queue_dir, solver, "Worker 0", environment)
+    while len([file_name for file_name in os.listdir(leases_dir) if file_name.endswith(".lease")]) == 0:
+        time.sleep(0.1)
+    time.sleep(solve_seconds / 4)
+    worker_kill(stopped)
+
+    start = time.time()
+    processes = [worker_start(queue_dir, solver, "Worker {}".format(i + 1), environment) for i in range(workers)]
+    for process in processes:
+        process.wait()
+    duration = time.time() - start
+
+    queue_wait(sim_list, proj_params)
+    staging_flush(proj_params)
+
+    with open(os.path.join(proj_params.results_dir, "Exercise Run Report.csv"), 'r') as report:
+        events = [line.rstrip("\n").split(",", 3) for line in report.readlines()[1:]]
+    def count(sim_name, event, detail = ""):
+        return(len([entry for entry in events if (entry[1] == sim_name) and (entry[2] == event) and (detail in entry[3])]))
+
+    solved = order[1:-1] + order[:1]
+    results.append(check("Solve", all([count(sim_name, "Headless Solve") == 1 for sim_name in solved]), "{} jobs solved by {} workers in {:.1f} s".format(sum([count(sim_name, "Headless Solve") for sim_name in order]), workers, duration)))
+    results.append(check("Heartbeat", all([count(sim_name, "Lease Stolen") == 0 for sim_name in order[1:-1]]), "no lease of a running solve of {:.0f} s expired with a lease timeout of {:.0f} s".format(solve_seconds, lease_timeout)))
+    results.append(check("Steal", (count(order[0], "Queue", "Claimed by Worker 0") == 1) and (count(order[0], "Lease Stolen") == 1), "{} of the stopped worker was taken over".format(order[0])))
+    done = json.load(open(os.path.join(done_dir, job_names[-1] + ".json"), 'r'))
+    results.append(check("Give up", (count(order[-1], "Failed", "given up") == 1) and (done["returncode"] == None) and (count(order[-1], "Headless Solve") == 0), "{} failing in Fluent was given up after {} attempts".format(order[-1], attempts)))
+
+    parsed = 0
+    for simulation in sim_list:
+        if simulation.sim_name in solved:
+            raw_results_collect(simulation, simulation.system_index, proj_params)
+            fluent_results_aggregator(simulation, simulation.system_index, proj_params)
+            parsed += float(simulation.results.drag_tot) > 0
+    results.append(check("Results", parsed == len(solved), "{} of {} solved simulations aggregated".format(parsed, len(solved))))
+
+    shutil.rmtree(root)
+
+    if all(results) == False:
+        sys.exit(1)
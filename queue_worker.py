@@ -0,0 +1,39 @@
+import os
+import socket
+import argparse
+from resources import queue_work, scaling_profile_load, cpu_topology, cpu_placement
+
+parser = argparse.ArgumentParser(description = "Claim simulations from a shared job queue and solve them in batch Fluent processes without Workbench.")
+parser.add_argument("queue_dir", help = "Shared directory of the job queue, entered in column AR of Simulation Parameters.csv.")
+parser.add_argument("--solver", default = "fluent", help = "Path to the Fluent executable, or to a stand-in accepting the same arguments.")
+parser.add_argument("--version", default = "3ddp", help = "Fluent version argument.")
+parser.add_argument("--processes", type = int, default = max(1, (os.cpu_count() or 2) // 2), help = "Number of Fluent processes of each simulation, by default the number of physical cores of this machine.")
+parser.add_argument("--body-zones", default = "body", help = "Names of the wall zones of the aerobody, separated by spaces.")
+parser.add_argument("--name", default = "{}-{}".format(socket.gethostname(), os.getpid()), help = "Name of the worker, unique among the workers of the queue.")
+parser.add_argument("--lease-timeout", type = float, default = 10, help = "Minutes after the last heartbeat at which the lease of a job expires and the job may be taken over by another worker.")
+parser.add_argument("--heartbeat", type = float, default = 60, help = "Seconds between heartbeats.")
+parser.add_argument("--attempts", type = int, default = 3, help = "Number of times a job is attempted, by any worker, before it is given up.")
+parser.add_argument("--poll", type = float, default = 30, help = "Seconds between looking for jobs when none can be claimed.")
+parser.add_argument("--profile", default = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Machine Profile.json"), help = "Machine profile written by calibrate_scaling.py, used to choose the processes of each job, at most --processes, if it exists.")
+parser.add_argument("--slot", type = int, default = None, help = "Number from 0 of this worker among --slots workers on this machine, which pins its jobs to its own --processes physical cores on as few NUMA nodes as possible.")
+parser.add_argument("--slots", type = int, default = 1, help = "Number of workers on this machine.")
+parser.add_argument("--exit-when-idle", action = "store_true", help = "Stop once every job of the queue is completed.")
+args = parser.parse_args()
+
+solver = [args.solver, args.version, "-g", "-t{}".format(args.processes)]
+if os.name == "nt":
+    solver.append("-wait")
+
+cpus = None
+if args.slot != None:
+    topology = cpu_topology()
+    if topology != None:
+        placements = cpu_placement(topology, args.slots, args.processes)
+        if placements != None:
+            cpus = placements[args.slot]
+    if cpus == None:
+        print("{} is not pinned, the CPU topology cannot be read or has fewer than {} physical cores".format(args.name, args.slots * args.processes))
+
+solved = queue_work(args.queue_dir, args.name, solver, args.body_zones.split(), 60 * args.lease_timeout, args.heartbeat, args.poll, args.exit_when_idle, scaling_profile_load(args.profile), cpus, args.attempts)
+
+print("{} solved {} jobs".format(args.name, solved))
@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+import argparse
+from resources import chunk_restore, archive_members, archive_extract, simulation_patterns
+
+parser = argparse.ArgumentParser(description = "Restore an archived Workbench project, or only some of its files.")
+parser.add_argument("archive", help = "Path to the .wbpz archive or to the .manifest.json of the project.")
+parser.add_argument("output", nargs = "?", help = "Output .wbpz or folder.")
+parser.add_argument("root", nargs = "?", help = "Archive root containing the chunk store, if the manifest has been moved out of it.")
+parser.add_argument("--list", action = "store_true", help = "List the files in the archive.")
+parser.add_argument("--simulation", action = "append", default = [], help = "Restore only the Fluent files of this simulation.")
+parser.add_argument("--summary", action = "store_true", help = "Restore only the project summary with its extracted results.")
+parser.add_argument("--pattern", action = "append", default = [], help = "Restore only the files matching this pattern, e.g. \"*.png\".")
+parser.add_argument("--threads", type = int, default = 4)
+args = parser.parse_args()
+
+if args.list:
+    members = archive_members(args.archive, args.root)
+    for member in members:
+        print("{},{}".format(member["name"], member["size"]))
+    sys.stderr.write("{} files, {:.1f} MB\n".format(len(members), sum([member["size"] for member in members]) / 1024.0 ** 2))
+    sys.exit(0)
+
+if args.output == None:
+    parser.error("an output .wbpz or folder is required")
+
+patterns = list(args.pattern)
+if args.summary:
+    patterns.append("*/user_files/Minerva Summary.json")
+if len(args.simulation) > 0:
+    patterns = patterns + simulation_patterns(args.archive, args.simulation, args.root)
+
+start = time.time()
+
+if len(patterns) == 0:
+    chunk_restore(args.archive, args.output, args.root, args.threads)
+    print("Restored {} to {} in {:.1f} s".format(os.path.basename(args.archive), args.output, time.time() - start))
+else:
+    paths = archive_extract(args.archive, args.output, patterns, args.root, args.threads)
+    size = sum([os.path.getsize(path) for path in paths])
+    print("Restored {} files ({:.1f} MB) from {} to {} in {:.1f} s".format(len(paths), size / 1024.0 ** 2, os.path.basename(args.archive), args.output, time.time() - start))